@@ -0,0 +1,35 @@
+"""Add stored tsvector column on chunks with a GIN index for sparse search.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add generated ``content_tsv`` column and its GIN index."""
+    op.execute(
+        "ALTER TABLE chunks ADD COLUMN content_tsv tsvector"
+        " GENERATED ALWAYS AS (to_tsvector('simple', content)) STORED"
+    )
+    op.create_index(
+        "chunks_content_tsv_gin_idx",
+        "chunks",
+        ["content_tsv"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Drop the GIN index and the generated ``content_tsv`` column."""
+    op.drop_index("chunks_content_tsv_gin_idx", table_name="chunks")
+    op.drop_column("chunks", "content_tsv")
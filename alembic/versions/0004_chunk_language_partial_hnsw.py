@@ -0,0 +1,47 @@
+"""Denormalize language onto chunks and add per-language partial HNSW indexes.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: str = "0003"
+branch_labels = None
+depends_on = None
+
+_LANGUAGES: tuple[str, ...] = ("en", "fr", "ar")
+
+
+def upgrade() -> None:
+    """Add ``chunks.language``, backfill it from documents, build partial indexes."""
+    op.add_column(
+        "chunks",
+        sa.Column("language", sa.String(8), nullable=False, server_default="en"),
+    )
+    op.execute(
+        "UPDATE chunks c SET language = d.language FROM documents d WHERE c.document_id = d.id"
+    )
+    for lang in _LANGUAGES:
+        op.create_index(
+            f"chunks_embedding_hnsw_{lang}_idx",
+            "chunks",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_where=sa.text(f"language = '{lang}'"),
+        )
+
+
+def downgrade() -> None:
+    """Drop the partial indexes and the ``chunks.language`` column."""
+    for lang in _LANGUAGES:
+        op.drop_index(f"chunks_embedding_hnsw_{lang}_idx", table_name="chunks")
+    op.drop_column("chunks", "language")
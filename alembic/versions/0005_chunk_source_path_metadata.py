@@ -0,0 +1,46 @@
+"""Denormalize source_path and chunker metadata onto chunks.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: str = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add ``chunks.source_path`` / ``chunks.metadata`` and backfill source paths."""
+    op.add_column(
+        "chunks",
+        sa.Column("source_path", sa.String(1024), nullable=False, server_default=""),
+    )
+    op.add_column(
+        "chunks",
+        sa.Column(
+            "metadata",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+    op.execute(
+        "UPDATE chunks c SET source_path = d.source_path, "
+        "metadata = jsonb_build_object('language', d.language) "
+        "FROM documents d WHERE c.document_id = d.id"
+    )
+
+
+def downgrade() -> None:
+    """Drop ``chunks.metadata`` and ``chunks.source_path``."""
+    op.drop_column("chunks", "metadata")
+    op.drop_column("chunks", "source_path")
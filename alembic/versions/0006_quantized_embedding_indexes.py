@@ -0,0 +1,40 @@
+"""Add halfvec and binary-quantized HNSW expression indexes on chunk embeddings.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: str = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Build compact HNSW indexes over ``halfvec`` / ``bit`` casts of ``embedding``.
+
+    Expression indexes quantize every existing row while they are built, so no
+    extra column or backfill pass is needed; new rows are indexed on write.
+    Requires pgvector >= 0.7 (``halfvec`` and ``binary_quantize``).
+    """
+    op.execute(
+        "CREATE INDEX chunks_embedding_halfvec_hnsw_idx ON chunks "
+        "USING hnsw ((CAST(embedding AS halfvec(384))) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+    op.execute(
+        "CREATE INDEX chunks_embedding_bit_hnsw_idx ON chunks "
+        "USING hnsw ((CAST(binary_quantize(embedding) AS bit(384))) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the quantized expression indexes."""
+    op.drop_index("chunks_embedding_bit_hnsw_idx", table_name="chunks")
+    op.drop_index("chunks_embedding_halfvec_hnsw_idx", table_name="chunks")
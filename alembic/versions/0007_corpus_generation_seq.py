@@ -0,0 +1,25 @@
+"""Add the corpus generation sequence used to version retrieval caches.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: str = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ``corpus_generation_seq``."""
+    op.execute("CREATE SEQUENCE IF NOT EXISTS corpus_generation_seq")
+
+
+def downgrade() -> None:
+    """Drop ``corpus_generation_seq``."""
+    op.execute("DROP SEQUENCE IF EXISTS corpus_generation_seq")
@@ -0,0 +1,38 @@
+"""Add per-chunk content hashes for incremental re-ingestion.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: str = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add ``chunks.content_hash`` and the lookup indexes ingestion diffs against.
+
+    Existing rows get an empty hash, so the first re-ingestion of each
+    document rewrites it once and every later run only touches changed chunks.
+    """
+    op.add_column(
+        "chunks",
+        sa.Column("content_hash", sa.String(64), nullable=False, server_default=""),
+    )
+    op.create_index("ix_chunks_document_id", "chunks", ["document_id"])
+    op.create_index("ix_documents_source_path", "documents", ["source_path"])
+
+
+def downgrade() -> None:
+    """Drop the lookup indexes and ``chunks.content_hash``."""
+    op.drop_index("ix_documents_source_path", table_name="documents")
+    op.drop_index("ix_chunks_document_id", table_name="chunks")
+    op.drop_column("chunks", "content_hash")
@@ -0,0 +1,36 @@
+"""Add BGE-M3 lexical weights as a sparsevec column with an HNSW index.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision: str = "0009"
+down_revision: str = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add nullable ``chunks.sparse_embedding`` and its inner-product HNSW index.
+
+    Rows stay NULL until they are (re-)ingested with
+    ``vector_store.sparse_mode="lexical"``; NULL rows are simply not indexed.
+    Requires pgvector >= 0.7 (``sparsevec``).
+    """
+    op.execute("ALTER TABLE chunks ADD COLUMN sparse_embedding sparsevec(250002)")
+    op.execute(
+        "CREATE INDEX chunks_sparse_embedding_hnsw_idx ON chunks "
+        "USING hnsw (sparse_embedding sparsevec_ip_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the sparse index and ``chunks.sparse_embedding``."""
+    op.drop_index("chunks_sparse_embedding_hnsw_idx", table_name="chunks")
+    op.drop_column("chunks", "sparse_embedding")
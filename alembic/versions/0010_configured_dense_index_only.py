@@ -0,0 +1,60 @@
+"""Keep only the dense HNSW index of the configured quantization mode.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from src.config.settings import get_settings
+
+revision: str = "0010"
+down_revision: str = "0009"
+branch_labels = None
+depends_on = None
+
+# Per ``vector_store.embedding_quantization``: index name and indexed expression.
+_DENSE_INDEXES: dict[str, tuple[str, str]] = {
+    "none": ("chunks_embedding_hnsw_idx", "embedding vector_cosine_ops"),
+    "halfvec": (
+        "chunks_embedding_halfvec_hnsw_idx",
+        "(CAST(embedding AS halfvec(384))) halfvec_cosine_ops",
+    ),
+    "binary": (
+        "chunks_embedding_bit_hnsw_idx",
+        "(CAST(binary_quantize(embedding) AS bit(384))) bit_hamming_ops",
+    ),
+}
+
+
+def _create(mode: str) -> None:
+    name, expression = _DENSE_INDEXES[mode]
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {name} ON chunks "
+        f"USING hnsw ({expression}) WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def upgrade() -> None:
+    """Drop the dense indexes that the configured mode never queries.
+
+    Migration 0006 built the ``halfvec`` and ``bit`` indexes next to the
+    full-precision one, so every write paid for three HNSW graphs. Only the
+    index for ``RAG_VECTORSTORE__EMBEDDING_QUANTIZATION`` (read at migration
+    time) is kept. Quantized searches re-rank their candidates with the full
+    vectors from the heap, so no full-precision index is needed for them. To
+    switch modes later, use ``rag-cli rebuild-dense-index``.
+    """
+    mode = get_settings.__wrapped__().vector_store.embedding_quantization
+    _create(mode)
+    for other, (name, _) in _DENSE_INDEXES.items():
+        if other != mode:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    """Restore the 0006 layout: all three dense indexes."""
+    for mode in _DENSE_INDEXES:
+        _create(mode)
@@ -0,0 +1,83 @@
+"""Size ``chunks.embedding`` for BGE-M3 when lexical sparse mode is configured.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+from src.config.settings import get_settings
+
+revision: str = "0011"
+down_revision: str = "0010"
+branch_labels = None
+depends_on = None
+
+_DEFAULT_DIMENSION = 384
+_LEXICAL_MODE_DIMENSION = 1024
+
+# Per ``vector_store.embedding_quantization``: index name and indexed expression.
+_DENSE_INDEXES: dict[str, tuple[str, str]] = {
+    "none": ("chunks_embedding_hnsw_idx", "embedding vector_cosine_ops"),
+    "halfvec": (
+        "chunks_embedding_halfvec_hnsw_idx",
+        "(CAST(embedding AS halfvec({dimension}))) halfvec_cosine_ops",
+    ),
+    "binary": (
+        "chunks_embedding_bit_hnsw_idx",
+        "(CAST(binary_quantize(embedding) AS bit({dimension}))) bit_hamming_ops",
+    ),
+}
+
+
+def _current_dimension() -> int:
+    # pgvector stores the declared width of a ``vector`` column as its typmod.
+    return int(
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT atttypmod FROM pg_attribute "
+                "WHERE attrelid = 'chunks'::regclass AND attname = 'embedding'"
+            )
+        )
+        .scalar_one()
+    )
+
+
+def _resize(dimension: int) -> None:
+    if _current_dimension() == dimension:
+        return
+    mode = get_settings.__wrapped__().vector_store.embedding_quantization
+    name, expression = _DENSE_INDEXES[mode]
+    op.execute(f"DROP INDEX IF EXISTS {name}")
+    # Vectors of one model cannot be cast to the other's width; clear them.
+    # The chunk hashes include the embedding model id, so the next ingest
+    # re-embeds every chunk.
+    op.execute(f"ALTER TABLE chunks ALTER COLUMN embedding TYPE vector({dimension}) USING NULL")
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {name} ON chunks "
+        f"USING hnsw ({expression.format(dimension=dimension)}) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def upgrade() -> None:
+    """Widen ``chunks.embedding`` to 1024 dimensions in lexical sparse mode.
+
+    With ``RAG_VECTORSTORE__SPARSE_MODE=lexical`` (read at migration time)
+    BGE-M3 is the only embedder, and its dense output is 1024-dimensional.
+    Other modes keep multilingual-e5-small's 384 and this is a no-op. The
+    stored vectors are cleared, so re-ingest the corpus afterwards. To switch
+    modes later, downgrade to 0010 and upgrade again with the new setting.
+    """
+    sparse_mode = get_settings.__wrapped__().vector_store.sparse_mode
+    _resize(_LEXICAL_MODE_DIMENSION if sparse_mode == "lexical" else _DEFAULT_DIMENSION)
+
+
+def downgrade() -> None:
+    """Restore the 384-dimensional column; stored vectors are cleared if resized."""
+    _resize(_DEFAULT_DIMENSION)
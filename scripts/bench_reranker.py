@@ -0,0 +1,166 @@
+"""Compare reranker modes on the golden set: latency and ranking quality.
+
+Every golden question is reranked against a fixed candidate pool: its own
+ground-truth contexts plus distractors drawn (with a fixed seed) from the
+other questions' contexts, so no database or ingestion is needed. For each
+``reranker.mode`` the script reports per-request latency (p50 / p95 / mean),
+hit@1 and MRR of the ground-truth contexts and, for every mode other than
+the first, the top-k overlap with the first mode's ranking. ColBERT passages
+are indexed before timing starts, as they would be at ingest. ``--backend``
+and ``--max-length`` set the cross-encoder runtime and pair truncation.
+
+Usage::
+
+    python scripts/bench_reranker.py --modes cross_encoder colbert --candidates 20
+    python scripts/bench_reranker.py --modes cross_encoder --backend onnx --max-length 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.config.settings import Settings  # noqa: E402
+from src.domain.ports.dto import RerankRequest, RetrievedChunk  # noqa: E402
+from src.infrastructure.reranking import BGEReranker, ColBERTReranker  # noqa: E402
+
+_GOLDEN_SET = ROOT / "evals" / "golden_set.jsonl"
+
+
+def _load_cases(path: Path, candidates: int, seed: int) -> list[tuple[str, list[RetrievedChunk]]]:
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+    rng = random.Random(seed)
+    cases = []
+    for row in rows:
+        relevant = list(dict.fromkeys(row["ground_truth_contexts"]))
+        others = sorted(
+            {c for other in rows if other is not row for c in other["ground_truth_contexts"]}
+            - set(relevant)
+        )
+        pool = relevant + rng.sample(others, max(0, min(len(others), candidates - len(relevant))))
+        rng.shuffle(pool)
+        chunks = [
+            RetrievedChunk(
+                chunk_id=uuid.uuid5(uuid.NAMESPACE_URL, text),
+                document_id=uuid.uuid5(uuid.NAMESPACE_URL, row["id"]),
+                content=text,
+                score=0.0,
+                source_path="evals/golden_set.jsonl",
+                metadata={"relevant": text in relevant},
+            )
+            for text in pool
+        ]
+        cases.append((row["query"], chunks))
+    return cases
+
+
+def _build(settings: Settings, mode: str) -> BGEReranker | ColBERTReranker:
+    reranker = settings.reranker.model_copy(
+        update={"mode": mode, "min_score": 0.0, "colbert_min_score": 0.0}
+    )
+    configured = settings.model_copy(update={"reranker": reranker})
+    if mode == "colbert":
+        return ColBERTReranker(configured)
+    return BGEReranker(configured)
+
+
+async def _run_mode(
+    settings: Settings,
+    mode: str,
+    cases: list[tuple[str, list[RetrievedChunk]]],
+    top_k: int,
+) -> tuple[dict[str, Any], list[list[uuid.UUID]]]:
+    reranker = _build(settings, mode)
+    index_s = 0.0
+    if isinstance(reranker, ColBERTReranker):
+        start = time.perf_counter()
+        await reranker.index_passages(list({c.content for _, chunks in cases for c in chunks}))
+        index_s = time.perf_counter() - start
+
+    # Warm-up request so model loading is not timed.
+    query, chunks = cases[0]
+    await reranker.rerank(RerankRequest(query=query, chunks=chunks, top_k=top_k))
+
+    latencies: list[float] = []
+    rankings: list[list[uuid.UUID]] = []
+    hits = 0
+    reciprocal_ranks: list[float] = []
+    for query, chunks in cases:
+        start = time.perf_counter()
+        ranked = await reranker.rerank(RerankRequest(query=query, chunks=chunks, top_k=len(chunks)))
+        latencies.append(time.perf_counter() - start)
+        rankings.append([c.chunk_id for c in ranked])
+        relevant = [i for i, c in enumerate(ranked) if c.metadata["relevant"]]
+        hits += bool(relevant) and relevant[0] == 0
+        reciprocal_ranks.append(1 / (relevant[0] + 1) if relevant else 0.0)
+
+    latencies.sort()
+    report = {
+        "mode": mode,
+        "backend": settings.reranker.backend if mode == "cross_encoder" else "torch",
+        "requests": len(cases),
+        "p50_ms": round(1000 * statistics.median(latencies), 2),
+        "p95_ms": round(1000 * latencies[int(0.95 * (len(latencies) - 1))], 2),
+        "mean_ms": round(1000 * statistics.fmean(latencies), 2),
+        "index_s": round(index_s, 2),
+        "hit_at_1": round(hits / len(cases), 3),
+        "mrr": round(statistics.fmean(reciprocal_ranks), 3),
+    }
+    return report, rankings
+
+
+def _overlap(reference: list[list[uuid.UUID]], other: list[list[uuid.UUID]], k: int) -> float:
+    shared = [len(set(a[:k]) & set(b[:k])) / k for a, b in zip(reference, other, strict=True)]
+    return round(statistics.fmean(shared), 3)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", nargs="+", default=["cross_encoder", "colbert"])
+    parser.add_argument("--candidates", type=int, default=20, help="Candidates per request")
+    parser.add_argument("--top-k", type=int, default=5, help="Cutoff for top-k overlap")
+    parser.add_argument("--backend", choices=["torch", "onnx"], help="Cross-encoder runtime")
+    parser.add_argument("--max-length", type=int, help="Token cap per (query, passage) pair")
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--golden-set", type=Path, default=_GOLDEN_SET)
+    parser.add_argument("--output", type=Path, help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    settings = Settings()
+    overrides = {"backend": args.backend, "max_length": args.max_length}
+    reranker = settings.reranker.model_copy(
+        update={k: v for k, v in overrides.items() if v is not None}
+    )
+    settings = settings.model_copy(update={"reranker": reranker})
+    cases = _load_cases(args.golden_set, args.candidates, args.seed)
+    reports: list[dict[str, Any]] = []
+    reference: list[list[uuid.UUID]] | None = None
+    for mode in args.modes:
+        report, rankings = await _run_mode(settings, mode, cases, args.top_k)
+        if reference is None:
+            reference = rankings
+        else:
+            report[f"overlap_at_{args.top_k}_vs_{args.modes[0]}"] = _overlap(
+                reference, rankings, args.top_k
+            )
+        reports.append(report)
+        print(json.dumps(report))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(reports, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -19,7 +19,7 @@ from langgraph.graph import END, StateGraph
 from src.application.use_cases.generate_answer import GenerateAnswerUseCase
 from src.application.use_cases.retrieve import RetrieveUseCase
 from src.domain.entities.answer import AnswerCitation, AnswerWithCitations
-from src.domain.ports.dto import GenerationRequest, RetrievedChunk
+from src.domain.ports.dto import GenerationRequest, HnswIterativeScan, RetrievedChunk
 from src.domain.ports.llm import LLMPort
 from src.shared.tracing import traced
 
@@ -35,7 +35,8 @@ class AgentState(TypedDict, total=False):
     """State carried through the agentic RAG graph.
 
     ``total=False`` lets each node return a partial dict that LangGraph merges
-    into the running state.
+    into the running state. ``ef_search`` / ``iterative_scan`` let the caller
+    trade retrieval recall against latency for one run (e.g. offline eval).
     """
 
     query: str
@@ -47,6 +48,8 @@ class AgentState(TypedDict, total=False):
     language: str
     session_id: str | None
     final_answer: AnswerWithCitations | None
+    ef_search: int | None
+    iterative_scan: HnswIterativeScan | None
 
 
 def _make_retrieve_node(retrieve_uc: RetrieveUseCase) -> object:
@@ -58,6 +61,8 @@ def _make_retrieve_node(retrieve_uc: RetrieveUseCase) -> object:
             query=state["query"],
             language=state.get("language"),
             session_id=state.get("session_id"),
+            ef_search=state.get("ef_search"),
+            iterative_scan=state.get("iterative_scan"),
         )
         return {"retrieved_chunks": chunks}
 
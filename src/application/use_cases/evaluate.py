@@ -27,6 +27,7 @@ from datasets import Dataset
 from src.config.settings import Settings
 from src.domain.entities.answer import AnswerWithCitations
 from src.domain.entities.evaluation import EvaluationReport
+from src.domain.ports.dto import HnswIterativeScan
 from src.shared.metrics import set_gauge
 from src.shared.tracing import traced
 
@@ -49,18 +50,32 @@ _log = structlog.get_logger(__name__)
 
 def default_agent_runner(
     graph: CompiledStateGraph,  # type: ignore[type-arg]
+    *,
+    ef_search: int | None = None,
+    iterative_scan: HnswIterativeScan | None = None,
 ) -> Callable[[str, str | None], Awaitable[AnswerWithCitations]]:
     """Build an ``agent_runner`` callable that wraps a compiled LangGraph.
 
     Args:
         graph: Compiled LangGraph ``StateGraph`` (returned by ``build_agent_graph``).
+        ef_search: HNSW ``ef_search`` for every retrieval of the run; None
+            keeps ``vector_store.hnsw_ef_search``.
+        iterative_scan: HNSW iterative scan mode for every retrieval of the
+            run; None keeps ``vector_store.hnsw_iterative_scan``.
 
     Returns:
         An async callable ``(query, language) -> AnswerWithCitations``.
     """
 
     async def _run(query: str, language: str | None) -> AnswerWithCitations:
-        state: dict[str, Any] = await graph.ainvoke({"query": query, "language": language or "en"})
+        state: dict[str, Any] = await graph.ainvoke(
+            {
+                "query": query,
+                "language": language or "en",
+                "ef_search": ef_search,
+                "iterative_scan": iterative_scan,
+            }
+        )
         answer: AnswerWithCitations | None = state.get("final_answer")
         if answer is None:
             return AnswerWithCitations(
@@ -38,6 +38,11 @@ def _refusal_for(language: str) -> str:
     return _REFUSAL_PHRASES.get(language.lower(), _REFUSAL_PHRASES["en"])
 
 
+def _page_of(chunk: RetrievedChunk) -> object:
+    # The chunker stores ``page_number``; ``page`` is accepted for older rows.
+    return chunk.metadata.get("page_number", chunk.metadata.get("page"))
+
+
 class GenerateAnswerUseCase:
     """Generate a grounded, multilingual answer from retrieved chunks.
 
@@ -139,7 +144,7 @@ class GenerateAnswerUseCase:
         return {
             "chunk_id": str(chunk.chunk_id),
             "source_path": chunk.source_path,
-            "page": chunk.metadata.get("page"),
+            "page": _page_of(chunk),
             "content": chunk.content,
         }
 
@@ -157,7 +162,7 @@ class GenerateAnswerUseCase:
                 continue
             seen.add(chunk_id)
             chunk = by_id[chunk_id]
-            page = chunk.metadata.get("page")
+            page = _page_of(chunk)
             citations.append(
                 AnswerCitation(
                     chunk_id=chunk_id,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import time
 import uuid
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -13,8 +15,16 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.domain.ports.chunker import ChunkerPort
 from src.domain.ports.doc_loader import DocLoaderPort
-from src.domain.ports.dto import ChunkWithEmbedding, IngestionReport
-from src.domain.ports.embedder import EmbedderPort
+from src.domain.ports.dto import (
+    ChunkContent,
+    ChunkWithEmbedding,
+    EmbeddingArray,
+    IngestionReport,
+    SparseVector,
+    StoredChunkHash,
+)
+from src.domain.ports.embedder import EmbedderPort, LexicalEmbedderPort
+from src.domain.ports.reranker import PassageIndexerPort
 from src.domain.ports.tracer import TracerPort
 from src.domain.ports.vector_store import VectorStorePort
 from src.infrastructure.persistence.models import DocumentORM, IngestionRunORM
@@ -35,6 +45,102 @@ def _hash_file(path: Path) -> str:
     return digest.hexdigest()
 
 
+def _chunk_hash(
+    chunk: ChunkContent,
+    source_path: str,
+    language: str,
+    language_hint: str | None,
+    embedding_model: str = "",
+    lexical: bool = False,
+) -> str:
+    """Hash every input that ends up in a chunk's stored row.
+
+    The position is left out, so a chunk that only moved keeps its hash.
+    *embedding_model* identifies the model that produced the stored vectors,
+    so switching models re-embeds every chunk. *lexical* marks rows that also
+    carry lexical weights, so turning on the lexical sparse leg rewrites
+    chunks stored without them.
+    """
+    fields: dict[str, object] = {
+        "content": chunk.content,
+        "token_count": chunk.token_count,
+        "metadata": chunk.metadata,
+        "source_path": source_path,
+        "language": language,
+        "language_hint": language_hint,
+        "embedding_model": embedding_model,
+    }
+    if lexical:
+        fields["lexical"] = True
+    payload = json.dumps(
+        fields,
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class _ChunkDiff:
+    """What re-ingesting a document changes relative to its stored chunks."""
+
+    # New chunks to embed and upsert, with the stored ID to overwrite if any.
+    changed: list[tuple[ChunkContent, str, uuid.UUID | None]] = field(default_factory=list)
+    # Stored chunks whose content reappears at another position.
+    moved: dict[uuid.UUID, int] = field(default_factory=dict)
+    # Stored chunks with no counterpart in the new set.
+    stale: list[uuid.UUID] = field(default_factory=list)
+
+
+def _diff_chunks(
+    stored: list[StoredChunkHash],
+    chunks: list[ChunkContent],
+    hashes: list[str],
+) -> _ChunkDiff:
+    """Match new chunks to stored ones by content hash, wherever they sit.
+
+    A chunk whose hash is stored at its own position is unchanged; failing
+    that, a stored row with the same hash elsewhere is moved to it, keeping
+    its vectors. The other chunks are embedded anew, overwriting the unmatched
+    stored row at their position when there is one; the rest of the
+    unmatched rows are stale.
+    """
+    unmatched = {s.id: s for s in stored}
+    by_hash: dict[str, list[StoredChunkHash]] = {}
+    for s in stored:
+        by_hash.setdefault(s.content_hash, []).append(s)
+
+    remaining: list[tuple[ChunkContent, str]] = []
+    for chunk, digest in zip(chunks, hashes, strict=True):
+        same = next((s for s in by_hash.get(digest, []) if s.position == chunk.position), None)
+        if same is not None:
+            del unmatched[same.id]
+            by_hash[digest].remove(same)
+        else:
+            remaining.append((chunk, digest))
+
+    diff = _ChunkDiff()
+    unplaced: list[tuple[ChunkContent, str]] = []
+    for chunk, digest in remaining:
+        candidates = by_hash.get(digest)
+        if candidates:
+            source = candidates.pop(0)
+            del unmatched[source.id]
+            diff.moved[source.id] = chunk.position
+        else:
+            unplaced.append((chunk, digest))
+
+    at_position = {s.position: s.id for s in unmatched.values()}
+    for chunk, digest in unplaced:
+        reuse = at_position.pop(chunk.position, None)
+        if reuse is not None:
+            del unmatched[reuse]
+        diff.changed.append((chunk, digest, reuse))
+    diff.stale = list(unmatched)
+    return diff
+
+
 def _detect_language(text: str) -> str:
     try:
         return str(detect(text))
@@ -59,6 +165,14 @@ class IngestDocumentsUseCase:
         session_repo: SQLAlchemy async session factory used for persistence.
         tracer: Distributed tracing adapter.
         logger: Standard-library logger instance.
+        lexical_embedder: Optional model yielding lexical weights, stored
+            with each chunk; when set, it also embeds the dense vectors in
+            the same pass and *embedder* is not called.
+        passage_indexer: Optional reranker hook that precomputes its
+            per-chunk state before the chunks are stored and drops it for
+            chunks that are replaced or deleted.
+        embedding_model: Identifier of the model behind the stored vectors;
+            part of every chunk hash, so changing it re-embeds every chunk.
     """
 
     def __init__(
@@ -70,10 +184,16 @@ class IngestDocumentsUseCase:
         session_repo: async_sessionmaker[AsyncSession],
         tracer: TracerPort,
         logger: logging.Logger,
+        lexical_embedder: LexicalEmbedderPort | None = None,
+        passage_indexer: PassageIndexerPort | None = None,
+        embedding_model: str = "",
     ) -> None:
         self._loader = loader
         self._chunker = chunker
         self._embedder = embedder
+        self._lexical_embedder = lexical_embedder
+        self._passage_indexer = passage_indexer
+        self._embedding_model = embedding_model
         self._vector_store = vector_store
         self._session_factory = session_repo
         self._tracer = tracer
@@ -91,10 +211,15 @@ class IngestDocumentsUseCase:
         Steps per file:
         1. Compute SHA-256; skip if already in ``ingestion_runs``.
         2. Load raw documents via the loader adapter.
-        3. Chunk each document; detect language per chunk (or use *language_hint*).
-        4. Embed all chunks in one batch call.
-        5. Upsert :class:`ChunkWithEmbedding` objects into the vector store.
-        6. Record an :class:`IngestionRunORM` row with status / chunk count.
+        3. Chunk each document and match the chunks' content hashes against
+           the ones stored for that document, regardless of position.
+        4. Detect language (or use *language_hint*) and embed changed chunks
+           in one batch call.
+        5. Upsert changed :class:`ChunkWithEmbedding` objects into the vector
+           store, move chunks that changed position and delete the stored
+           chunks left unmatched.
+        6. Flush the vector store's buffered writes, then record an
+           :class:`IngestionRunORM` row with status / chunk count.
 
         Per-file errors are caught and appended to the report; processing
         continues for remaining files.
@@ -110,6 +235,7 @@ class IngestDocumentsUseCase:
         files_processed = 0
         files_skipped = 0
         chunks_created = 0
+        chunks_unchanged = 0
         errors: list[tuple[str, str]] = []
 
         source_files = self._collect_files(path)
@@ -122,8 +248,9 @@ class IngestDocumentsUseCase:
                     files_skipped += 1
                     continue
 
-                file_chunks = await self._process_file(file_path, file_hash, language_hint)
-                chunks_created += file_chunks
+                written, unchanged = await self._process_file(file_path, file_hash, language_hint)
+                chunks_created += written
+                chunks_unchanged += unchanged
                 files_processed += 1
 
                 inc_counter("ingestion_files_total")
@@ -132,7 +259,11 @@ class IngestDocumentsUseCase:
                 self._logger.error("Ingestion failed for %s: %s", file_path, exc)
                 errors.append((str(file_path), str(exc)))
 
+        # Writes of a file that failed after some of its documents were stored.
+        await self._vector_store.flush()
+
         inc_counter("ingestion_chunks_total", amount=chunks_created)
+        inc_counter("ingestion_chunks_unchanged_total", amount=chunks_unchanged)
 
         duration = time.perf_counter() - start
         observe_histogram("ingestion_duration_seconds", duration)
@@ -141,6 +272,7 @@ class IngestDocumentsUseCase:
             files_processed=files_processed,
             files_skipped=files_skipped,
             chunks_created=chunks_created,
+            chunks_unchanged=chunks_unchanged,
             duration_seconds=duration,
             errors=errors,
         )
@@ -169,58 +301,119 @@ class IngestDocumentsUseCase:
         file_path: Path,
         file_hash: str,
         language_hint: str | None,
-    ) -> int:
+    ) -> tuple[int, int]:
         """Load, chunk, embed and upsert a single file; record ingestion run.
 
+        Each chunk carries a content hash (see :func:`_chunk_hash`). The new
+        chunk set is matched by hash against what the vector store holds for
+        the document (see :func:`_diff_chunks`): unchanged chunks are neither
+        embedded nor written, chunks that only moved get their stored row's
+        position updated, new content is embedded and upserted, and stored
+        chunks left unmatched are deleted. The passage indexer, if any, indexes
+        the new content before the upsert and forgets overwritten or deleted
+        content after it.
+
         Args:
             file_path: Absolute path to the source file.
             file_hash: Pre-computed SHA-256 hex digest.
             language_hint: Optional language override for every chunk.
 
         Returns:
-            Total number of chunks created across all documents in the file.
+            Number of chunks written and number left unchanged, across all
+            documents in the file.
         """
         documents = await self._loader.load(str(file_path))
-        total_chunks = 0
+        source_path = str(file_path)
+        total_written = 0
+        total_unchanged = 0
 
         for doc in documents:
             chunks = await self._chunker.chunk([doc])  # type: ignore[misc, arg-type]
             if not chunks:
                 continue
 
-            langs = [language_hint or _detect_language(c.content) for c in chunks]
-            texts = [c.content for c in chunks]
-            embeddings = await self._embedder.embed_texts(texts)
-
-            doc_id = uuid.uuid5(uuid.NAMESPACE_URL, doc.content_hash)
-
-            doc_language = language_hint or langs[0] if langs else "en"
-            await self._upsert_document(
-                doc_id=doc_id,
-                source_path=str(file_path),
+            doc_language = language_hint or _detect_language(chunks[0].content)
+            doc_id = await self._resolve_document(
+                source_path=source_path,
                 content_hash=doc.content_hash,
                 language=doc_language,
             )
 
-            chunks_with_emb: list[ChunkWithEmbedding] = [
-                ChunkWithEmbedding(
-                    id=uuid.uuid5(uuid.NAMESPACE_URL, f"{doc.content_hash}-{chunk.position}"),
-                    document_id=doc_id,
-                    content=chunk.content,
-                    embedding=emb,
-                    position=chunk.position,
-                    token_count=chunk.token_count,
-                    source_path=str(file_path),
-                    metadata={**chunk.metadata, "language": lang},
+            lexical = self._lexical_embedder is not None
+            hashes = [
+                _chunk_hash(
+                    c, source_path, doc_language, language_hint, self._embedding_model, lexical
                 )
-                for chunk, emb, lang in zip(chunks, embeddings, langs, strict=True)
+                for c in chunks
             ]
-
-            await self._vector_store.upsert(chunks_with_emb)
-            total_chunks += len(chunks)
-
-        await self._record_ingestion_run(file_path, file_hash, total_chunks)
-        return total_chunks
+            diff = _diff_chunks(await self._vector_store.chunk_hashes(doc_id), chunks, hashes)
+            changed = diff.changed
+            forgotten = await self._forgotten_passages(diff, chunks)
+
+            if changed:
+                # The first chunk's language was already detected as doc_language.
+                langs = [
+                    doc_language
+                    if chunk is chunks[0]
+                    else language_hint or _detect_language(chunk.content)
+                    for chunk, _, _ in changed
+                ]
+                embeddings, sparse = await self._embed([c.content for c, _, _ in changed])
+                if self._passage_indexer is not None:
+                    await self._passage_indexer.index_passages([c.content for c, _, _ in changed])
+                await self._vector_store.upsert(
+                    [
+                        ChunkWithEmbedding(
+                            # The digest keeps a fresh ID from colliding with a
+                            # row that moved away from this position.
+                            id=reuse
+                            or uuid.uuid5(
+                                uuid.NAMESPACE_URL,
+                                f"{doc.content_hash}-{chunk.position}-{digest}",
+                            ),
+                            document_id=doc_id,
+                            content=chunk.content,
+                            embedding=emb,
+                            position=chunk.position,
+                            token_count=chunk.token_count,
+                            source_path=source_path,
+                            language=doc_language,
+                            metadata={**chunk.metadata, "language": lang},
+                            content_hash=digest,
+                            sparse_embedding=weights,
+                        )
+                        for (chunk, digest, reuse), emb, weights, lang in zip(
+                            changed, embeddings, sparse, langs, strict=True
+                        )
+                    ]
+                )
+            if diff.moved:
+                await self._vector_store.reposition(diff.moved)
+            if diff.stale:
+                await self._vector_store.delete(diff.stale)
+            if forgotten and self._passage_indexer is not None:
+                await self._passage_indexer.forget_passages(forgotten)
+
+            total_written += len(changed)
+            total_unchanged += len(chunks) - len(changed)
+
+        # Persist before the run is recorded, so a skipped file is never missing chunks.
+        await self._vector_store.flush()
+        await self._record_ingestion_run(file_path, file_hash, total_written)
+        return total_written, total_unchanged
+
+    async def _forgotten_passages(self, diff: _ChunkDiff, chunks: list[ChunkContent]) -> list[str]:
+        """Return the stored contents that *diff* overwrites or deletes for good.
+
+        Read before the write, since overwritten rows lose their content;
+        contents that stay in the document's new chunk set are kept.
+        """
+        removed = diff.stale + [reuse for _, _, reuse in diff.changed if reuse is not None]
+        if self._passage_indexer is None or not removed:
+            return []
+        kept = {c.content for c in chunks}
+        stored = await self._vector_store.contents(removed)
+        return [c for c in dict.fromkeys(stored.values()) if c not in kept]
 
     async def _record_ingestion_run(
         self,
@@ -239,30 +432,55 @@ class IngestDocumentsUseCase:
             session.add(run)
             await session.commit()
 
-    async def _upsert_document(
+    async def _embed(
+        self, texts: list[str]
+    ) -> tuple[EmbeddingArray, list[SparseVector] | list[None]]:
+        """Embed *texts*, plus their lexical weights when a lexical embedder is set."""
+        if self._lexical_embedder is None:
+            return await self._embedder.embed_texts(texts), [None] * len(texts)
+        return await self._lexical_embedder.embed_texts_with_lexical(texts)
+
+    async def _resolve_document(
         self,
         *,
-        doc_id: uuid.UUID,
         source_path: str,
         content_hash: str,
         language: str,
-    ) -> None:
-        """Ensure a parent :class:`DocumentORM` row exists for *doc_id*.
+    ) -> uuid.UUID:
+        """Return the :class:`DocumentORM` ID for a loaded document, creating it if needed.
 
         Chunks reference documents via a foreign key, so the parent row must
-        be persisted before any chunk upsert. Re-ingestion of the same content
-        hash is a no-op.
+        be persisted before any chunk upsert. A document whose content hash is
+        already stored maps to that row. Otherwise a row for the same
+        *source_path* is reused and its hash/language updated, so an edited
+        file keeps its document ID and its stored chunks can be diffed.
+        New files get a row keyed by ``uuid5(content_hash)``.
         """
         async with self._session_factory() as session:
-            existing = await session.execute(select(DocumentORM).where(DocumentORM.id == doc_id))
-            if existing.scalar_one_or_none() is not None:
-                return
-            session.add(
-                DocumentORM(
-                    id=doc_id,
+            by_hash = await session.execute(
+                select(DocumentORM).where(DocumentORM.content_hash == content_hash)
+            )
+            document = by_hash.scalar_one_or_none()
+            if document is not None:
+                return document.id
+
+            by_path = await session.execute(
+                select(DocumentORM)
+                .where(DocumentORM.source_path == source_path)
+                .order_by(DocumentORM.created_at.desc())
+                .limit(1)
+            )
+            document = by_path.scalar_one_or_none()
+            if document is None:
+                document = DocumentORM(
+                    id=uuid.uuid5(uuid.NAMESPACE_URL, content_hash),
                     source_path=source_path,
                     content_hash=content_hash,
                     language=language,
                 )
-            )
+                session.add(document)
+            else:
+                document.content_hash = content_hash
+                document.language = language
             await session.commit()
+            return document.id
@@ -1,21 +1,73 @@
-"""Retrieve use case — embed query, hybrid search, and optional reranking."""
+"""Retrieve use case — embed query, hybrid search, optional MMR and reranking."""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+
+import numpy as np
 import structlog
 from langdetect import LangDetectException, detect  # type: ignore[import-untyped]
 
 from src.config.settings import Settings
-from src.domain.ports.dto import RerankRequest, RetrievedChunk
-from src.domain.ports.embedder import EmbedderPort
+from src.domain.ports.cache import RetrievalCachePort
+from src.domain.ports.dto import (
+    EmbeddingArray,
+    HnswIterativeScan,
+    HybridSearchQuery,
+    RerankRequest,
+    RetrievedChunk,
+    SparseVector,
+)
+from src.domain.ports.embedder import EmbedderPort, LexicalEmbedderPort
 from src.domain.ports.reranker import RerankerPort
 from src.domain.ports.vector_store import VectorStorePort
+from src.shared.diversity import cosine_similarity_matrix, mmr_select
+from src.shared.metrics import observe_histogram
 from src.shared.tracing import traced
+from src.shared.utils.text import query_digest
 
 __all__ = ["RetrieveUseCase"]
 
 _UNKNOWN_LANG = "unknown"
 
+# Settings that change which chunks come back, or in what order, per section.
+# Their digest is part of every cache key, so workers configured differently
+# (or one restarted after a config change) never share ranked results.
+_RETRIEVAL_SETTINGS: dict[str, tuple[str, ...]] = {
+    "embedding": ("model", "lexical_model", "backend", "onnx_quantization"),
+    "vector_store": (
+        "backend",
+        "hybrid_mode",
+        "sparse_mode",
+        "embedding_quantization",
+        "rescore_oversample",
+        "hnsw_ef_search",
+        "hnsw_iterative_scan",
+        "top_k_dense",
+        "top_k_sparse",
+        "top_k_rerank",
+        "mmr_enabled",
+        "mmr_top_k",
+        "mmr_lambda",
+        "mmr_duplicate_threshold",
+    ),
+    "reranker": (
+        "model",
+        "mode",
+        "backend",
+        "onnx_quantization",
+        "max_length",
+        "min_score",
+        "cascade_enabled",
+        "cascade_max_candidates",
+        "cascade_exit_margin",
+        "colbert_model",
+        "colbert_min_score",
+    ),
+}
+
 log = structlog.get_logger(__name__)
 
 
@@ -27,14 +79,37 @@ def _detect_language(text: str) -> str:
         return _UNKNOWN_LANG
 
 
+def _settings_digest(settings: Settings) -> str:
+    """Return a short digest of the retrieval-affecting settings (``_RETRIEVAL_SETTINGS``)."""
+    values = {
+        f"{section}.{name}": getattr(getattr(settings, section), name)
+        for section, names in _RETRIEVAL_SETTINGS.items()
+        for name in names
+    }
+    payload = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
 class RetrieveUseCase:
     """Orchestrates query embedding, hybrid vector search, and optional reranking.
 
+    With ``vector_store.mmr_enabled`` the hybrid candidates are first cut to
+    ``mmr_top_k`` by maximal marginal relevance over their stored embeddings
+    (returned by the hybrid search itself), which also drops near-duplicates
+    (e.g. overlapping chunks of one section), so the reranker scores fewer,
+    more diverse pairs.
+
     Args:
         embedder: Adapter that embeds query text into dense vectors.
         vector_store: Adapter that performs hybrid dense+sparse retrieval.
         reranker: Adapter that reranks retrieved chunks via cross-encoder.
         settings: Application settings for top-k configuration.
+        cache: Optional cache for final results, keyed by normalized query,
+            language, the vector store's corpus generation and a digest of
+            the settings that affect ranking.
+        lexical_embedder: Optional model yielding query lexical weights for
+            the sparse search leg; when set, it embeds the query dense vector
+            in the same pass and *embedder* is not called.
     """
 
     def __init__(
@@ -43,12 +118,17 @@ class RetrieveUseCase:
         vector_store: VectorStorePort,
         reranker: RerankerPort,
         settings: Settings,
+        cache: RetrievalCachePort | None = None,
+        lexical_embedder: LexicalEmbedderPort | None = None,
     ) -> None:
         """Store injected dependencies."""
         self._embedder = embedder
+        self._lexical_embedder = lexical_embedder
         self._vector_store = vector_store
         self._reranker = reranker
         self._settings = settings
+        self._cache = cache
+        self._settings_digest = _settings_digest(settings)
 
     @traced("use_case.retrieve")
     async def execute(
@@ -56,19 +136,28 @@ class RetrieveUseCase:
         query: str,
         language: str | None = None,
         session_id: str | None = None,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
     ) -> list[RetrievedChunk]:
         """Execute retrieval pipeline: detect language, embed, search, rerank.
 
         Steps:
         1. Detect language via langdetect if ``language`` is None.
-        2. Embed query via the embedder adapter.
-        3. Perform hybrid search using the vector store.
-        4. Rerank results if count exceeds ``top_k_rerank``.
+        2. Return the cached result when a cache is configured and hits.
+        3. Embed query via the embedder adapter.
+        4. Perform hybrid search using the vector store.
+        5. Diversify the candidates by MMR when enabled.
+        6. Rerank results if count exceeds ``top_k_rerank``, then cache them.
 
         Args:
             query: Natural-language question to answer.
             language: BCP-47 language code; auto-detected when None.
             session_id: Optional session identifier for tracing context.
+            ef_search: HNSW ``ef_search`` for this query; None keeps
+                ``vector_store.hnsw_ef_search``.
+            iterative_scan: HNSW iterative scan mode for this query; None keeps
+                ``vector_store.hnsw_iterative_scan``.
 
         Returns:
             List of retrieved (and optionally reranked) chunks.
@@ -76,7 +165,16 @@ class RetrieveUseCase:
         lang = language if language is not None else _detect_language(query)
         log.debug("retrieve.language_detected", language=lang, query_len=len(query))
 
-        query_vector = await self._embedder.embed_query(query)
+        key: str | None = None
+        if self._cache is not None:
+            generation = await self._vector_store.generation()
+            key = self._cache_key(query, lang, generation, ef_search, iterative_scan)
+            cached = await self._cache.get(key)
+            if cached is not None:
+                log.debug("retrieve.cache_hit", chunks=len(cached))
+                return cached
+
+        query_vector, query_sparse = await self._embed_query(query)
 
         vs = self._settings.vector_store
         chunks = await self._vector_store.hybrid_search(
@@ -84,17 +182,154 @@ class RetrieveUseCase:
             query_text=query,
             top_k=vs.top_k_dense,
             filters={"language": lang},
+            query_sparse=query_sparse,
+            ef_search=ef_search,
+            iterative_scan=iterative_scan,
+            with_embeddings=vs.mmr_enabled,
         )
 
         log.debug("retrieve.hybrid_search_done", chunks_found=len(chunks))
 
-        if not chunks:
+        chunks = await self._rerank(query, self._diversify(chunks))
+        if self._cache is not None and key is not None:
+            await self._cache.set(key, chunks)
+        return chunks
+
+    @traced("use_case.retrieve_many")
+    async def execute_many(
+        self,
+        queries: list[str],
+        language: str | None = None,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+    ) -> list[list[RetrievedChunk]]:
+        """Run the retrieval pipeline for a batch of queries.
+
+        Embeds the queries concurrently and retrieves all of them with a
+        single :meth:`VectorStorePort.hybrid_search_many` call, so evaluation
+        runs and batch endpoints pay a handful of database round-trips rather
+        than one per query. Reranking and caching are applied per query as in
+        :meth:`execute`; only cache misses are embedded and searched.
+
+        Args:
+            queries: Natural-language questions.
+            language: BCP-47 language code applied to every query; detected
+                per query when None.
+            ef_search: HNSW ``ef_search`` for the batch; None keeps
+                ``vector_store.hnsw_ef_search``.
+            iterative_scan: HNSW iterative scan mode for the batch; None keeps
+                ``vector_store.hnsw_iterative_scan``.
+
+        Returns:
+            One list of retrieved (and optionally reranked) chunks per query,
+            in input order.
+        """
+        if not queries:
+            return []
+        languages = [language if language is not None else _detect_language(q) for q in queries]
+
+        results: list[list[RetrievedChunk] | None] = [None] * len(queries)
+        keys: list[str] = []
+        if self._cache is not None:
+            generation = await self._vector_store.generation()
+            keys = [
+                self._cache_key(q, lang, generation, ef_search, iterative_scan)
+                for q, lang in zip(queries, languages, strict=True)
+            ]
+            results = list(await asyncio.gather(*(self._cache.get(k) for k in keys)))
+        pending = [i for i, cached in enumerate(results) if cached is None]
+
+        if pending:
+            embedded = await asyncio.gather(*(self._embed_query(queries[i]) for i in pending))
+            vs = self._settings.vector_store
+            batches = await self._vector_store.hybrid_search_many(
+                [
+                    HybridSearchQuery(
+                        query_vector=vector,
+                        query_text=queries[i],
+                        filters={"language": languages[i]},
+                        query_sparse=sparse,
+                    )
+                    for i, (vector, sparse) in zip(pending, embedded, strict=True)
+                ],
+                top_k=vs.top_k_dense,
+                ef_search=ef_search,
+                iterative_scan=iterative_scan,
+                with_embeddings=vs.mmr_enabled,
+            )
+            log.debug("retrieve.hybrid_search_many_done", queries=len(pending))
+            candidates = [self._diversify(chunks) for chunks in batches]
+            reranked = await asyncio.gather(
+                *(
+                    self._rerank(queries[i], chunks)
+                    for i, chunks in zip(pending, candidates, strict=True)
+                )
+            )
+            for i, chunks in zip(pending, reranked, strict=True):
+                results[i] = chunks
+                if self._cache is not None:
+                    await self._cache.set(keys[i], chunks)
+
+        return [chunks or [] for chunks in results]
+
+    async def _embed_query(self, query: str) -> tuple[EmbeddingArray, SparseVector | None]:
+        """Embed *query*, plus its lexical weights when a lexical embedder is set."""
+        if self._lexical_embedder is None:
+            return await self._embedder.embed_query(query), None
+        return await self._lexical_embedder.embed_query_with_lexical(query)
+
+    def _cache_key(
+        self,
+        query: str,
+        language: str,
+        generation: int,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+    ) -> str:
+        """Build the cache key for *query*; ranking settings and scan overrides are part of it."""
+        digest = query_digest(query)
+        key = f"retrieval:{generation}:{language}:{self._settings_digest}"
+        if ef_search is not None or iterative_scan is not None:
+            key += f":hnsw{ef_search}-{iterative_scan}"
+        return f"{key}:{digest}"
+
+    def _diversify(self, candidates: list[RetrievedChunk]) -> list[RetrievedChunk]:
+        """Keep the MMR selection of *candidates* when ``vector_store.mmr_enabled``.
+
+        Relevance is the hybrid score scaled to the best candidate; redundancy
+        is the cosine similarity between the embeddings the hybrid search
+        returned with the candidates, compared as one similarity matrix. The
+        kept chunks are returned without their embeddings.
+        """
+        vs = self._settings.vector_store
+        if not vs.mmr_enabled:
+            return candidates
+        chunks = [c.model_copy(update={"embedding": None}) for c in candidates]
+        if len(chunks) < 2:
             return chunks
+        embeddings = [c.embedding for c in candidates if c.embedding is not None]
+        if len(embeddings) != len(candidates):
+            raise ValueError("Hybrid search returned MMR candidates without embeddings")
+        scores = np.array([c.score for c in chunks], dtype=np.float32)
+        top = float(scores.max())
+        picked = mmr_select(
+            cosine_similarity_matrix(embeddings),
+            scores / top if top > 0 else scores,
+            vs.mmr_top_k,
+            vs.mmr_lambda,
+            vs.mmr_duplicate_threshold,
+        )
+        observe_histogram("retrieval_mmr_dropped", float(len(chunks) - len(picked)))
+        log.debug("retrieve.diversified", candidates=len(chunks), kept=len(picked))
+        return [chunks[i] for i in picked]
 
-        if len(chunks) > vs.top_k_rerank:
+    async def _rerank(self, query: str, chunks: list[RetrievedChunk]) -> list[RetrievedChunk]:
+        """Rerank *chunks* when there are more than ``top_k_rerank`` of them."""
+        top_k_rerank = self._settings.vector_store.top_k_rerank
+        if len(chunks) > top_k_rerank:
             chunks = await self._reranker.rerank(
-                RerankRequest(query=query, chunks=chunks, top_k=vs.top_k_rerank)
+                RerankRequest(query=query, chunks=chunks, top_k=top_k_rerank)
             )
             log.debug("retrieve.reranked", chunks_kept=len(chunks))
-
         return chunks
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Literal
 
-from pydantic import Field, SecretStr
+from pydantic import Field, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+HnswIterativeScan = Literal["off", "relaxed_order", "strict_order"]
+EmbeddingQuantization = Literal["none", "halfvec", "binary"]
+EmbeddingBackend = Literal["torch", "onnx"]
+OnnxQuantization = Literal["none", "avx2", "avx512", "avx512_vnni", "arm64"]
+
 
 class LLMSettings(BaseSettings):
     """LLM provider configuration."""
@@ -42,8 +48,64 @@ class EmbeddingSettings(BaseSettings):
         default="intfloat/multilingual-e5-small",
         description="HuggingFace embedding model ID",
     )
+    lexical_model: str = Field(
+        default="BAAI/bge-m3",
+        description=(
+            "BGE-M3 model of vector_store.sparse_mode='lexical', where it replaces model "
+            "as the only embedder: dense vectors (1024-dim) and learned lexical weights "
+            "come from one forward pass; always runs on PyTorch"
+        ),
+    )
     batch_size: int = Field(default=32, gt=0, description="Batch size for encoding")
+    max_batch_tokens: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Padded-token budget per length-bucketed batch; inputs are sorted by token "
+            "length and packed under it (0 = fixed batch_size in arrival order)"
+        ),
+    )
     cache_dir: str = Field(default="/tmp/hf_cache", description="HuggingFace model cache directory")
+    backend: EmbeddingBackend = Field(
+        default="torch",
+        description=(
+            "torch (PyTorch on CPU) | onnx (ONNX Runtime, opt-in; needs the 'onnx' extra). "
+            "Changing it re-embeds every chunk on the next ingest"
+        ),
+    )
+    onnx_quantization: OnnxQuantization = Field(
+        default="none",
+        description=(
+            "Dynamic int8 quantization target for the onnx backend: "
+            "none | avx2 | avx512 | avx512_vnni | arm64. Opt in to int8 only once "
+            "`rag-cli embedding-parity` passes"
+        ),
+    )
+    onnx_dir: str = Field(
+        default="data/onnx_models", description="Directory for exported/quantized ONNX models"
+    )
+    pool_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for embedding, each with its own model (0 = in-process)",
+    )
+    pool_threads_per_worker: int = Field(
+        default=1, gt=0, le=64, description="torch intra-op threads pinned in each pool worker"
+    )
+    micro_batch_enabled: bool = Field(
+        default=False,
+        description="Coalesce concurrent embed calls into shared forward passes",
+    )
+    micro_batch_max_size: int = Field(
+        default=64, gt=0, le=1024, description="Maximum texts per micro-batched forward pass"
+    )
+    micro_batch_max_wait_ms: float = Field(
+        default=5.0,
+        ge=0,
+        le=1000,
+        description="How long the first queued text waits for others before a pass starts",
+    )
 
 
 class VectorStoreSettings(BaseSettings):
@@ -62,9 +124,110 @@ class VectorStoreSettings(BaseSettings):
     hnsw_ef_construction: int = Field(
         default=64, gt=0, description="HNSW ef_construction parameter"
     )
+    hnsw_ef_search: int | None = Field(
+        default=None,
+        gt=0,
+        le=1000,
+        description="HNSW ef_search applied per search transaction (None = server default)",
+    )
+    hnsw_iterative_scan: HnswIterativeScan = Field(
+        default="off",
+        description=(
+            "pgvector >= 0.8 iterative index scan: off | relaxed_order | strict_order. "
+            "Keeps scanning the HNSW graph until filtered queries fill top_k"
+        ),
+    )
+    embedding_quantization: EmbeddingQuantization = Field(
+        default="none",
+        description=(
+            "Dense search index: none (full-precision vector HNSW) | halfvec (float16 "
+            "expression index, 2x smaller) | binary (binary_quantize bit index, 32x "
+            "smaller). Quantized modes re-score candidates with exact cosine distance. "
+            "Only this mode's index is built; run `rag-cli rebuild-dense-index` after "
+            "changing it"
+        ),
+    )
+    rescore_oversample: int = Field(
+        default=4,
+        ge=1,
+        le=50,
+        description="Quantized modes fetch top_k * this many candidates before re-scoring",
+    )
     top_k_dense: int = Field(default=20, gt=0, description="Dense retrieval top-k")
     top_k_sparse: int = Field(default=20, gt=0, description="Sparse (BM25) retrieval top-k")
     top_k_rerank: int = Field(default=5, gt=0, description="After-rerank top-k returned")
+    mmr_enabled: bool = Field(
+        default=False,
+        description=(
+            "Diversify hybrid candidates by MMR over their stored embeddings before reranking, "
+            "dropping near-duplicates"
+        ),
+    )
+    mmr_top_k: int = Field(
+        default=10, gt=0, description="Candidates kept by MMR and passed on to the reranker"
+    )
+    mmr_lambda: float = Field(
+        default=0.7,
+        ge=0.0,
+        le=1.0,
+        description="MMR weight of hybrid relevance against diversity (1 = hybrid order only)",
+    )
+    mmr_duplicate_threshold: float = Field(
+        default=0.95,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity to a kept candidate at which a candidate is dropped",
+    )
+    hybrid_mode: Literal["sequential", "concurrent", "sql"] = Field(
+        default="sequential",
+        description=(
+            "Hybrid search execution: sequential (dense, sparse and hydration queries "
+            "fused with RRF in Python) | concurrent (dense and sparse legs run at once "
+            "on separate connections) | sql (single CTE statement with in-database RRF)"
+        ),
+    )
+    sparse_mode: Literal["tsvector", "lexical"] = Field(
+        default="tsvector",
+        description=(
+            "Sparse leg of hybrid search: tsvector (ts_rank full-text search, 'simple' "
+            "dictionary) | lexical (BGE-M3 learned lexical weights stored as sparsevec, "
+            "ranked by inner product; embedding.lexical_model then yields both weights and "
+            "dense vectors, so chunks.embedding is 1024-dim (migration 0011, re-ingest "
+            "required); not combinable with embedding.pool_workers, "
+            "embedding.micro_batch_enabled or cache.embedding_enabled)"
+        ),
+    )
+    upsert_mode: Literal["insert", "copy"] = Field(
+        default="insert",
+        description=(
+            "Chunk write path, both with binary vectors on an unpooled connection: insert "
+            "(prepared INSERT ... ON CONFLICT via executemany) | copy (binary COPY into a "
+            "temp staging table, then one set-based merge; for bulk re-ingests)"
+        ),
+    )
+    upsert_batch_size: int = Field(
+        default=1000,
+        gt=0,
+        le=3000,
+        description="Chunks written per executemany / COPY batch",
+    )
+    hybrid_batch_size: int = Field(
+        default=64,
+        gt=0,
+        le=1000,
+        description="Queries per statement in hybrid_search_many",
+    )
+    backend: Literal["pgvector", "numpy"] = Field(
+        default="pgvector",
+        description=(
+            "Vector store adapter: pgvector (PostgreSQL) | numpy (in-process matrix and "
+            "inverted index, for single-node deployments, CI and local benchmarks)"
+        ),
+    )
+    numpy_path: str = Field(
+        default="data/vector_index",
+        description="Directory the numpy backend persists to (empty = in-memory only)",
+    )
 
 
 class RerankerSettings(BaseSettings):
@@ -73,13 +236,104 @@ class RerankerSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="RAG_RERANKER__", env_file=".env", extra="ignore")
 
     model: str = Field(default="BAAI/bge-reranker-v2-m3", description="Reranker model ID")
+    mode: Literal["cross_encoder", "colbert"] = Field(
+        default="cross_encoder",
+        description=(
+            "cross_encoder (one forward pass per (query, chunk) pair) | colbert (MaxSim over "
+            "token vectors precomputed at ingest; one query forward pass per request)"
+        ),
+    )
     batch_size: int = Field(default=16, gt=0, description="Batch size for reranking")
+    backend: EmbeddingBackend = Field(
+        default="torch",
+        description=(
+            "Cross-encoder runtime: torch (FlagReranker on CPU) | onnx (ONNX Runtime; "
+            "needs the 'onnx' extra)"
+        ),
+    )
+    onnx_quantization: OnnxQuantization = Field(
+        default="none",
+        description=(
+            "Dynamic int8 quantization target for the onnx backend: "
+            "none | avx2 | avx512 | avx512_vnni | arm64. Opt in to int8 only once "
+            "`rag-cli reranker-parity` passes"
+        ),
+    )
+    max_length: int = Field(
+        default=512,
+        ge=32,
+        le=8192,
+        description=(
+            "Token cap per (query, chunk) pair; longer chunk content is truncated token-wise"
+        ),
+    )
+    max_batch_tokens: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Padded-token budget per length-bucketed batch of (query, passage) pairs "
+            "(0 = fixed batch_size in retrieval order)"
+        ),
+    )
     min_score: float = Field(
         default=0.3,
         ge=0.0,
         le=1.0,
         description="Minimum relevance score; chunks below this are discarded",
     )
+    batching_enabled: bool = Field(
+        default=False,
+        description="Merge the pairs of concurrent rerank calls into shared forward passes",
+    )
+    batching_max_tokens: int = Field(
+        default=8192,
+        gt=0,
+        description="Padded-token budget per merged forward pass",
+    )
+    batching_max_wait_ms: float = Field(
+        default=10.0,
+        ge=0,
+        le=1000,
+        description="How long the first queued pair waits for others before a pass starts",
+    )
+    cascade_enabled: bool = Field(
+        default=False,
+        description=(
+            "Prune candidates by their hybrid (RRF) score first, so the reranker "
+            "scores fewer of them"
+        ),
+    )
+    cascade_max_candidates: int = Field(
+        default=10,
+        gt=0,
+        description="Best first-stage candidates that may reach the reranker; the rest are pruned",
+    )
+    cascade_exit_margin: float = Field(
+        default=0.3,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Lead over the best candidate outside the top-k, as a fraction of the top "
+            "score, that makes a candidate a clear winner (all top-k clear = only they "
+            "are reranked)"
+        ),
+    )
+    colbert_model: str = Field(
+        default="BAAI/bge-m3", description="Model producing ColBERT token vectors (colbert mode)"
+    )
+    colbert_path: str = Field(
+        default="data/colbert_index",
+        description=(
+            "Directory of the int8-compressed per-chunk token vectors (colbert mode); "
+            "local to each node, filled at ingest or on first rerank"
+        ),
+    )
+    colbert_min_score: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Minimum mean-MaxSim score in colbert mode; chunks below are discarded",
+    )
 
 
 class LangfuseSettings(BaseSettings):
@@ -105,7 +359,7 @@ class PrometheusSettings(BaseSettings):
 
 
 class EvalSettings(BaseSettings):
-    """Ragas evaluation quality thresholds."""
+    """Ragas evaluation quality thresholds and offline retrieval tuning."""
 
     model_config = SettingsConfigDict(env_prefix="RAG_EVAL__", env_file=".env", extra="ignore")
 
@@ -124,6 +378,18 @@ class EvalSettings(BaseSettings):
     answer_correctness: float = Field(
         default=0.70, ge=0.0, le=1.0, description="Minimum answer correctness score"
     )
+    hnsw_ef_search: int | None = Field(
+        default=None,
+        gt=0,
+        le=1000,
+        description="HNSW ef_search for eval retrievals (None = vector_store.hnsw_ef_search)",
+    )
+    hnsw_iterative_scan: HnswIterativeScan | None = Field(
+        default=None,
+        description=(
+            "HNSW iterative scan for eval retrievals (None = vector_store.hnsw_iterative_scan)"
+        ),
+    )
 
 
 class AgentSettings(BaseSettings):
@@ -149,6 +415,47 @@ class ChunkingSettings(BaseSettings):
     chunk_overlap: int = Field(default=100, ge=0, description="Overlap between consecutive chunks")
 
 
+class CacheSettings(BaseSettings):
+    """Retrieval result and embedding cache configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="RAG_CACHE__", env_file=".env", extra="ignore")
+
+    retrieval_enabled: bool = Field(
+        default=False, description="Cache final reranked retrieval results per query"
+    )
+    retrieval_backend: Literal["memory", "redis"] = Field(
+        default="memory",
+        description="memory (per-process LRU) | redis (shared by all API workers)",
+    )
+    retrieval_max_entries: int = Field(
+        default=1024, gt=0, description="LRU capacity of the in-process retrieval cache"
+    )
+    retrieval_ttl_seconds: int = Field(
+        default=600, gt=0, description="Time-to-live of a cached retrieval result"
+    )
+    redis_url: str = Field(
+        default="redis://localhost:6379/0", description="Redis URL for shared cache backends"
+    )
+    rerank_scores_enabled: bool = Field(
+        default=False,
+        description="Reuse cross-encoder scores of (query, chunk) pairs scored before",
+    )
+    rerank_scores_max_entries: int = Field(
+        default=100_000, gt=0, description="LRU capacity of the in-process reranker score cache"
+    )
+    embedding_enabled: bool = Field(
+        default=False, description="Serve repeated texts from the on-disk embedding cache"
+    )
+    embedding_path: str = Field(
+        default="data/embedding_cache", description="Directory of the on-disk embedding cache"
+    )
+    embedding_max_entries: int = Field(
+        default=200_000,
+        gt=0,
+        description="Embedding cache capacity; least recently used vectors are evicted beyond it",
+    )
+
+
 class Settings(BaseSettings):
     """Root settings — aggregates all sub-settings with RAG_ prefix."""
 
@@ -168,6 +475,7 @@ class Settings(BaseSettings):
     agent: AgentSettings = Field(default_factory=AgentSettings)
     chunking: ChunkingSettings = Field(default_factory=ChunkingSettings)
     eval: EvalSettings = Field(default_factory=EvalSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     api_url: str = Field(
         default="http://localhost:8000",
         description="RAG API base URL used by the Chainlit web UI",
@@ -177,6 +485,34 @@ class Settings(BaseSettings):
         description="Langfuse UI base URL for trace deep-links in the web UI",
     )
 
+    @model_validator(mode="after")
+    def _check_lexical_embedding(self) -> Settings:
+        """Reject embedder wrappers that the BGE-M3 lexical pass would bypass.
+
+        BGE-M3 returns dense vectors and lexical weights from one in-process
+        model call per request; the worker pool, micro-batching and the
+        embedding cache carry dense vectors only, so they would drop the
+        weights.
+        """
+        if self.vector_store.sparse_mode != "lexical":
+            return self
+        bypassed = [
+            name
+            for name, enabled in (
+                ("embedding.pool_workers", self.embedding.pool_workers > 0),
+                ("embedding.micro_batch_enabled", self.embedding.micro_batch_enabled),
+                ("cache.embedding_enabled", self.cache.embedding_enabled),
+            )
+            if enabled
+        ]
+        if bypassed:
+            raise ValueError(
+                f"vector_store.sparse_mode='lexical' cannot be combined with "
+                f"{', '.join(bypassed)}: they carry dense vectors only, while BGE-M3 "
+                "returns dense vectors and lexical weights from one in-process pass"
+            )
+        return self
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
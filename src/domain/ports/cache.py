@@ -0,0 +1,19 @@
+"""Cache port — contract for retrieval result cache adapters."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from src.domain.ports.dto import RetrievedChunk
+
+
+class RetrievalCachePort(Protocol):
+    """Protocol for caches holding final (reranked) retrieval results by key."""
+
+    async def get(self, key: str) -> list[RetrievedChunk] | None:
+        """Return the cached chunk list for *key*, or None on a miss."""
+        ...
+
+    async def set(self, key: str, chunks: list[RetrievedChunk]) -> None:
+        """Store *chunks* under *key*, subject to the adapter's eviction policy."""
+        ...
@@ -2,10 +2,38 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, WithJsonSchema
+
+EmbeddingArray = npt.NDArray[np.float32]
+"""A float32 embedding: one ``(dim,)`` vector or an ``(n, dim)`` matrix of them."""
+
+
+def _as_embedding_vector(value: Any) -> EmbeddingArray:  # noqa: ANN401
+    """Coerce *value* to a 1-D float32 array; float32 arrays pass through uncopied."""
+    array = np.asarray(value, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D embedding vector, got shape {array.shape}")
+    return array
+
+
+EmbeddingVector = Annotated[
+    EmbeddingArray,
+    PlainValidator(_as_embedding_vector),
+    PlainSerializer(lambda vector: vector.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+"""DTO field type holding an embedding as a float32 array instead of boxed floats."""
+
+SparseVector = dict[int, float]
+"""Learned lexical weights: vocabulary token ID → weight, non-zero entries only."""
+
+HnswIterativeScan = Literal["off", "relaxed_order", "strict_order"]
+"""pgvector ``hnsw.iterative_scan`` mode a caller may request for one search."""
 
 
 class EmbeddingRequest(BaseModel):
@@ -40,6 +68,17 @@ class RetrievalQuery(BaseModel):
     filters: dict[str, Any] = Field(default_factory=dict)
 
 
+class HybridSearchQuery(BaseModel):
+    """One query of a batched hybrid search: embedding, raw text and filters."""
+
+    model_config = ConfigDict(frozen=True)
+
+    query_vector: EmbeddingVector
+    query_text: str
+    filters: dict[str, str] = Field(default_factory=dict)
+    query_sparse: SparseVector | None = None
+
+
 class RetrievedChunk(BaseModel):
     """A chunk returned from the vector store with an associated relevance score."""
 
@@ -51,6 +90,8 @@ class RetrievedChunk(BaseModel):
     score: float
     source_path: str
     metadata: dict[str, Any] = Field(default_factory=dict)
+    # Set only when a hybrid search is asked for candidate embeddings (MMR).
+    embedding: EmbeddingVector | None = Field(default=None, exclude=True, repr=False)
 
 
 class RerankRequest(BaseModel):
@@ -128,11 +169,24 @@ class ChunkWithEmbedding(BaseModel):
     id: UUID
     document_id: UUID
     content: str
-    embedding: list[float]
+    embedding: EmbeddingVector
     position: int
     token_count: int = 0
     source_path: str = ""
+    language: str = "en"
     metadata: dict[str, Any] = Field(default_factory=dict)
+    content_hash: str = ""
+    sparse_embedding: SparseVector | None = None
+
+
+class StoredChunkHash(BaseModel):
+    """Identity and content hash of a chunk already in the vector store."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: UUID
+    position: int
+    content_hash: str
 
 
 class EvalRequest(BaseModel):
@@ -166,4 +220,5 @@ class IngestionReport(BaseModel):
     files_skipped: int
     chunks_created: int
     duration_seconds: float
+    chunks_unchanged: int = 0
     errors: list[tuple[str, str]] = Field(default_factory=list)
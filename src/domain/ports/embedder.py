@@ -4,19 +4,45 @@ from __future__ import annotations
 
 from typing import Protocol
 
+from src.domain.ports.dto import EmbeddingArray, SparseVector
+
 
 class EmbedderPort(Protocol):
-    """Protocol for text embedding model adapters."""
+    """Protocol for text embedding model adapters.
+
+    Embeddings are float32 NumPy arrays end to end, so a batch is one
+    contiguous buffer rather than millions of boxed Python floats.
+    """
 
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        """Embed a batch of texts and return their dense vector representations."""
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
+        """Embed a batch of texts and return a ``(len(texts), dimension)`` float32 matrix."""
         ...
 
-    async def embed_query(self, text: str) -> list[float]:
-        """Embed a single query text and return its dense vector representation."""
+    async def embed_query(self, text: str) -> EmbeddingArray:
+        """Embed a single query text and return its ``(dimension,)`` float32 vector."""
         ...
 
     @property
     def dimension(self) -> int:
         """Return the embedding vector dimension produced by this model."""
         ...
+
+
+class LexicalEmbedderPort(EmbedderPort, Protocol):
+    """Embedder that also yields learned lexical (sparse) weights for texts.
+
+    Use cases given one of these store the weights with each chunk and send
+    them with each query, so the vector store's sparse leg ranks by them
+    instead of full-text search. Dense vectors and weights come from one
+    forward pass, and the model is then the only embedder.
+    """
+
+    async def embed_texts_with_lexical(
+        self, texts: list[str]
+    ) -> tuple[EmbeddingArray, list[SparseVector]]:
+        """Return the dense matrix and one sparse vector of lexical weights per text."""
+        ...
+
+    async def embed_query_with_lexical(self, text: str) -> tuple[EmbeddingArray, SparseVector]:
+        """Return the dense vector and lexical weights of a single query text."""
+        ...
@@ -13,3 +13,19 @@ class RerankerPort(Protocol):
     async def rerank(self, request: RerankRequest) -> list[RetrievedChunk]:
         """Rerank retrieved chunks by cross-encoder relevance and return top-k results."""
         ...
+
+    async def warm_up(self) -> None:
+        """Load the model ahead of the first request."""
+        ...
+
+
+class PassageIndexerPort(Protocol):
+    """Protocol for rerankers that precompute per-passage state at ingest time."""
+
+    async def index_passages(self, passages: list[str]) -> None:
+        """Precompute and store whatever the reranker needs for *passages*."""
+        ...
+
+    async def forget_passages(self, passages: list[str]) -> None:
+        """Drop the state stored for *passages*, which are no longer retrievable."""
+        ...
@@ -5,7 +5,15 @@ from __future__ import annotations
 from typing import Protocol
 from uuid import UUID
 
-from src.domain.ports.dto import ChunkWithEmbedding, RetrievedChunk
+from src.domain.ports.dto import (
+    ChunkWithEmbedding,
+    EmbeddingArray,
+    HnswIterativeScan,
+    HybridSearchQuery,
+    RetrievedChunk,
+    SparseVector,
+    StoredChunkHash,
+)
 
 
 class VectorStorePort(Protocol):
@@ -17,23 +25,82 @@ class VectorStorePort(Protocol):
 
     async def search(
         self,
-        query_vector: list[float],
+        query_vector: EmbeddingArray,
         top_k: int,
         filters: dict[str, str] | None = None,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
     ) -> list[RetrievedChunk]:
-        """Perform dense ANN search and return ranked chunks."""
+        """Perform dense ANN search and return ranked chunks.
+
+        *ef_search* and *iterative_scan* override the configured HNSW scan
+        parameters for this call only; adapters without an ANN index ignore them.
+        """
         ...
 
     async def hybrid_search(
         self,
-        query_vector: list[float],
+        query_vector: EmbeddingArray,
         query_text: str,
         top_k: int,
         filters: dict[str, str] | None = None,
+        *,
+        query_sparse: SparseVector | None = None,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
     ) -> list[RetrievedChunk]:
-        """Perform a hybrid dense+sparse search and return ranked chunks."""
+        """Perform a hybrid dense+sparse search and return ranked chunks.
+
+        With *query_sparse* (learned lexical weights) the sparse leg ranks by
+        them instead of full-text search over *query_text*. *ef_search* and
+        *iterative_scan* override the HNSW scan parameters of the dense leg.
+        With *with_embeddings* every chunk also carries its stored embedding,
+        read by the same query.
+        """
+        ...
+
+    async def hybrid_search_many(
+        self,
+        queries: list[HybridSearchQuery],
+        top_k: int,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
+    ) -> list[list[RetrievedChunk]]:
+        """Run hybrid search for several queries at once; one ranked list per query.
+
+        *ef_search* and *iterative_scan* apply to the dense legs of every query;
+        *with_embeddings* is as in :meth:`hybrid_search`.
+        """
+        ...
+
+    async def flush(self) -> None:
+        """Persist buffered writes; stores that write through return immediately."""
         ...
 
     async def delete_by_document(self, document_id: UUID) -> int:
         """Delete all chunks belonging to the given document and return the count removed."""
         ...
+
+    async def delete(self, chunk_ids: list[UUID]) -> None:
+        """Delete the chunks with the given IDs."""
+        ...
+
+    async def reposition(self, positions: dict[UUID, int]) -> None:
+        """Move stored chunks to new positions, keeping their content and vectors."""
+        ...
+
+    async def contents(self, chunk_ids: list[UUID]) -> dict[UUID, str]:
+        """Return the stored content of whichever of *chunk_ids* exist."""
+        ...
+
+    async def chunk_hashes(self, document_id: UUID) -> list[StoredChunkHash]:
+        """Return ID, position and content hash of every stored chunk of a document."""
+        ...
+
+    async def generation(self) -> int:
+        """Return the corpus generation, bumped after every write to the store."""
+        ...
@@ -0,0 +1,297 @@
+"""Persistent content-addressed embedding cache wrapping any EmbedderPort."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+
+from src.domain.ports.dto import EmbeddingArray
+from src.domain.ports.embedder import EmbedderPort
+from src.shared.metrics import inc_counter, observe_histogram, set_gauge
+from src.shared.tracing import traced
+
+__all__ = ["CachingEmbedder", "DiskEmbeddingStore"]
+
+log = structlog.get_logger(__name__)
+
+_INDEX_FILE = "index.sqlite3"
+_VECTORS_FILE = "vectors.npy"
+# Stay well below SQLite's bound-parameter limit.
+_SQL_BATCH = 500
+
+_FloatMatrix = npt.NDArray[np.float32]
+
+
+def _placeholders(batch: Sequence[str]) -> str:
+    return ",".join("?" * len(batch))
+
+
+def _batched(items: Sequence[str]) -> Iterator[Sequence[str]]:
+    for i in range(0, len(items), _SQL_BATCH):
+        yield items[i : i + _SQL_BATCH]
+
+
+class DiskEmbeddingStore:
+    """Fixed-capacity on-disk vector store keyed by opaque strings.
+
+    Vectors live in one preallocated ``(max_entries, dimension)`` float32
+    ``.npy`` file that is memory-mapped, so lookups copy rows straight out of
+    the page cache. A SQLite index maps each key to its slot and tracks last
+    use; once every slot is taken, the least recently used entries are evicted
+    and their slots reused. Changing ``dimension`` or ``max_entries`` resets
+    the store.
+
+    Slot reuse is ordered so that concurrent processes sharing *path* never
+    read a half-overwritten vector: evictions are committed before the slot is
+    rewritten, and readers copy vectors while holding SQLite's shared lock.
+
+    Args:
+        path: Directory holding the index and vector files.
+        dimension: Length of every stored vector.
+        max_entries: Maximum number of vectors kept on disk.
+    """
+
+    def __init__(self, path: Path | str, dimension: int, max_entries: int) -> None:
+        self._path = Path(path)
+        self._dimension = dimension
+        self._capacity = max_entries
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._vectors: _FloatMatrix | None = None
+
+    def _open(self) -> tuple[sqlite3.Connection, _FloatMatrix]:
+        if self._db is not None and self._vectors is not None:
+            return self._db, self._vectors
+        self._path.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly below. The
+        # default rollback journal (not WAL) is what makes shared read locks
+        # block eviction commits.
+        db = sqlite3.connect(
+            self._path / _INDEX_FILE, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, slot INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS entries_last_used_idx ON entries (last_used)")
+
+        vectors_file = self._path / _VECTORS_FILE
+        shape = (self._capacity, self._dimension)
+        meta = dict(db.execute("SELECT name, value FROM meta").fetchall())
+        if vectors_file.exists() and (meta.get("capacity"), meta.get("dimension")) == shape:
+            vectors: _FloatMatrix = np.load(vectors_file, mmap_mode="r+")
+        else:
+            with self._transaction(db):
+                db.execute("DELETE FROM entries")
+                db.executemany(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                    [("capacity", shape[0]), ("dimension", shape[1]), ("next_slot", 0)],
+                )
+                vectors = np.lib.format.open_memmap(
+                    vectors_file, mode="w+", dtype=np.float32, shape=shape
+                )
+            log.info("embedding_cache.created", path=str(self._path), capacity=self._capacity)
+        self._db, self._vectors = db, vectors
+        return db, vectors
+
+    @staticmethod
+    @contextmanager
+    def _transaction(db: sqlite3.Connection, mode: str = "IMMEDIATE") -> Iterator[None]:
+        db.execute(f"BEGIN {mode}")
+        try:
+            yield
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, _FloatMatrix]:
+        """Return the stored vectors for whichever of *keys* are present.
+
+        Args:
+            keys: Cache keys to look up.
+
+        Returns:
+            Mapping of found keys to copies of their vectors.
+        """
+        if not keys:
+            return {}
+        with self._lock:
+            db, vectors = self._open()
+            found: dict[str, _FloatMatrix] = {}
+            with self._transaction(db, "DEFERRED"):
+                for batch in _batched(keys):
+                    rows = db.execute(
+                        f"SELECT key, slot FROM entries WHERE key IN ({_placeholders(batch)})",
+                        batch,
+                    ).fetchall()
+                    if rows:
+                        copies = vectors[[slot for _, slot in rows]]
+                        found.update(zip((key for key, _ in rows), copies, strict=True))
+            if found:
+                now = time.time()
+                with self._transaction(db):
+                    for batch in _batched(list(found)):
+                        db.execute(
+                            "UPDATE entries SET last_used = ? "
+                            f"WHERE key IN ({_placeholders(batch)})",
+                            [now, *batch],
+                        )
+            return found
+
+    def put_many(self, items: Sequence[tuple[str, EmbeddingArray]]) -> None:
+        """Store vectors, evicting least recently used entries when full.
+
+        Args:
+            items: ``(key, vector)`` pairs; keys already present are skipped.
+        """
+        if not items:
+            return
+        with self._lock:
+            db, vectors = self._open()
+            with self._transaction(db):
+                present: set[str] = set()
+                for batch in _batched([key for key, _ in items]):
+                    present.update(
+                        row[0]
+                        for row in db.execute(
+                            f"SELECT key FROM entries WHERE key IN ({_placeholders(batch)})",
+                            batch,
+                        )
+                    )
+                new = list({key: vec for key, vec in items if key not in present}.items())
+                new = new[-self._capacity :]
+                if not new:
+                    return
+
+                next_slot = int(
+                    db.execute("SELECT value FROM meta WHERE name = 'next_slot'").fetchone()[0]
+                )
+                fresh = min(len(new), self._capacity - next_slot)
+                slots = list(range(next_slot, next_slot + fresh))
+                db.execute(
+                    "UPDATE meta SET value = ? WHERE name = 'next_slot'", (next_slot + fresh,)
+                )
+                if len(new) > fresh:
+                    victims = db.execute(
+                        "SELECT key, slot FROM entries ORDER BY last_used LIMIT ?",
+                        (len(new) - fresh,),
+                    ).fetchall()
+                    db.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k, _ in victims])
+                    slots.extend(slot for _, slot in victims)
+                    inc_counter("embedding_cache_evictions", amount=len(victims))
+
+            vectors[slots] = np.stack([vec for _, vec in new])
+            vectors.flush()  # type: ignore[attr-defined]
+
+            now = time.time()
+            with self._transaction(db):
+                db.executemany(
+                    "INSERT OR REPLACE INTO entries (key, slot, last_used) VALUES (?, ?, ?)",
+                    [(key, slot, now) for (key, _), slot in zip(new, slots, strict=True)],
+                )
+                entries = int(db.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+            set_gauge("embedding_cache_entries", float(entries))
+
+
+class CachingEmbedder:
+    """EmbedderPort decorator that serves repeated texts from a disk cache.
+
+    Entries are keyed by ``(model_id, prefix, sha256(text))``, where the
+    prefix is the instruction the wrapped model prepends for that call type
+    (E5's ``"passage: "`` / ``"query: "``), so documents and queries never
+    share a vector. Only misses reach the wrapped embedder, and duplicate
+    texts within a batch are embedded once. Cache I/O failures degrade to
+    calling the wrapped embedder.
+
+    Emits ``embedding_cache_lookups{result}`` counters and an
+    ``embedding_cache_hit_ratio`` histogram observed per call.
+
+    Args:
+        inner: Embedder that computes vectors on a miss.
+        store: On-disk vector store backing the cache.
+        model_id: Identifier of the wrapped model, part of every key.
+        passage_prefix: Key prefix for :meth:`embed_texts`.
+        query_prefix: Key prefix for :meth:`embed_query`.
+    """
+
+    def __init__(
+        self,
+        inner: EmbedderPort,
+        store: DiskEmbeddingStore,
+        model_id: str,
+        passage_prefix: str = "passage: ",
+        query_prefix: str = "query: ",
+    ) -> None:
+        self._inner = inner
+        self._store = store
+        self._model_id = model_id
+        self._passage_prefix = passage_prefix
+        self._query_prefix = query_prefix
+
+    @property
+    def dimension(self) -> int:
+        return self._inner.dimension
+
+    def _key(self, prefix: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        return f"{self._model_id}|{prefix}|{digest}"
+
+    @traced("embedder.cached_embed_texts")
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        keys = [self._key(self._passage_prefix, t) for t in texts]
+        try:
+            found = await asyncio.to_thread(self._store.get_many, keys)
+        except (OSError, sqlite3.Error, ValueError) as exc:
+            log.warning("embedding_cache.read_failed", error=str(exc))
+            found = {}
+        vectors: dict[str, EmbeddingArray] = dict(found)
+
+        misses = {key: text for key, text in zip(keys, texts, strict=True) if key not in vectors}
+        if misses:
+            computed = await self._inner.embed_texts(list(misses.values()))
+            fresh = list(zip(misses, computed, strict=True))
+            vectors.update(fresh)
+            try:
+                await asyncio.to_thread(self._store.put_many, fresh)
+            except (OSError, sqlite3.Error, ValueError) as exc:
+                log.warning("embedding_cache.write_failed", error=str(exc))
+
+        hits = len(texts) - sum(1 for key in keys if key in misses)
+        inc_counter("embedding_cache_lookups", {"result": "hit"}, amount=hits)
+        inc_counter("embedding_cache_lookups", {"result": "miss"}, amount=len(texts) - hits)
+        observe_histogram("embedding_cache_hit_ratio", hits / len(texts))
+        return np.stack([vectors[key] for key in keys])
+
+    @traced("embedder.cached_embed_query")
+    async def embed_query(self, text: str) -> EmbeddingArray:
+        key = self._key(self._query_prefix, text)
+        try:
+            found = await asyncio.to_thread(self._store.get_many, [key])
+        except (OSError, sqlite3.Error, ValueError) as exc:
+            log.warning("embedding_cache.read_failed", error=str(exc))
+            found = {}
+        if key in found:
+            inc_counter("embedding_cache_lookups", {"result": "hit"})
+            return found[key]
+
+        inc_counter("embedding_cache_lookups", {"result": "miss"})
+        vector = await self._inner.embed_query(text)
+        try:
+            await asyncio.to_thread(self._store.put_many, [(key, vector)])
+        except (OSError, sqlite3.Error, ValueError) as exc:
+            log.warning("embedding_cache.write_failed", error=str(exc))
+        return vector
@@ -0,0 +1,106 @@
+"""Bounded in-process cache of cross-encoder scores per (query, chunk) pair."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+
+from src.domain.ports.dto import RetrievedChunk
+from src.shared.metrics import inc_counter, set_gauge
+from src.shared.utils.text import query_digest
+
+__all__ = ["RerankScoreCache", "ScoreKey"]
+
+# (reranker model, normalized query digest, chunk id, chunk content digest)
+ScoreKey = tuple[str, str, str, str]
+
+
+class RerankScoreCache:
+    """Thread-safe LRU map from (query, chunk) pairs to reranker scores.
+
+    Keys combine the reranker model, the normalized query and both the id and
+    the content hash of the chunk, so a re-ingested chunk or a model change
+    never serves a stale score. Exports ``reranker_score_cache_lookups``
+    (counter, ``result`` label), ``reranker_score_cache_saved_pairs``
+    (counter), ``reranker_score_cache_hit_ratio`` (gauge, since start) and
+    ``reranker_score_cache_entries`` (gauge).
+
+    Args:
+        max_entries: Maximum number of cached scores.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._scores: OrderedDict[ScoreKey, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._lookups = 0
+
+    @staticmethod
+    def keys(model: str, query: str, chunks: Sequence[RetrievedChunk]) -> list[ScoreKey]:
+        """Build the cache key of every (query, chunk) pair.
+
+        Args:
+            model: Reranker model ID.
+            query: Raw query; normalized before hashing.
+            chunks: Candidate chunks.
+
+        Returns:
+            One key per chunk, in order.
+        """
+        digest = query_digest(query)
+        return [
+            (
+                model,
+                digest,
+                str(chunk.chunk_id),
+                hashlib.sha256(chunk.content.encode()).hexdigest(),
+            )
+            for chunk in chunks
+        ]
+
+    def get_many(self, keys: Sequence[ScoreKey]) -> dict[ScoreKey, float]:
+        """Return the cached scores for whichever of *keys* are present.
+
+        Args:
+            keys: Pair keys from :meth:`keys`.
+
+        Returns:
+            Mapping of found keys to their scores.
+        """
+        with self._lock:
+            found: dict[ScoreKey, float] = {}
+            for key in keys:
+                score = self._scores.get(key)
+                if score is not None:
+                    self._scores.move_to_end(key)
+                    found[key] = score
+            self._hits += len(found)
+            self._lookups += len(keys)
+            ratio = self._hits / self._lookups if self._lookups else 0.0
+        if found:
+            inc_counter("reranker_score_cache_lookups", {"result": "hit"}, amount=len(found))
+            inc_counter("reranker_score_cache_saved_pairs", amount=len(found))
+        if len(keys) > len(found):
+            inc_counter(
+                "reranker_score_cache_lookups", {"result": "miss"}, amount=len(keys) - len(found)
+            )
+        set_gauge("reranker_score_cache_hit_ratio", ratio)
+        return found
+
+    def put_many(self, items: Iterable[tuple[ScoreKey, float]]) -> None:
+        """Store scores, evicting the least recently used overflow.
+
+        Args:
+            items: ``(key, score)`` pairs.
+        """
+        with self._lock:
+            for key, score in items:
+                self._scores[key] = score
+                self._scores.move_to_end(key)
+            while len(self._scores) > self._max_entries:
+                self._scores.popitem(last=False)
+            size = len(self._scores)
+        set_gauge("reranker_score_cache_entries", float(size))
@@ -0,0 +1,130 @@
+"""Retrieval result caches — in-process LRU/TTL and shared key-value backends."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Protocol
+
+import structlog
+
+from src.domain.ports.dto import RetrievedChunk
+from src.shared.metrics import inc_counter, set_gauge
+
+__all__ = ["InMemoryRetrievalCache", "SharedCacheClient", "SharedRetrievalCache"]
+
+log = structlog.get_logger(__name__)
+
+
+class InMemoryRetrievalCache:
+    """Per-process LRU cache with a time-to-live, implementing RetrievalCachePort.
+
+    Entries are evicted least-recently-used once ``max_entries`` is exceeded,
+    and lazily on lookup once older than ``ttl_seconds``. Keys are expected to
+    embed the corpus generation, so writes to the vector store make old entries
+    unreachable and LRU pressure reclaims them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results.
+            ttl_seconds: Seconds after which an entry is treated as a miss.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, list[RetrievedChunk]]] = OrderedDict()
+
+    async def get(self, key: str) -> list[RetrievedChunk] | None:
+        """Return the cached chunks for *key*, refreshing its LRU position."""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry[0] > self._ttl:
+            del self._entries[key]
+            _record_eviction("memory", "ttl", len(self._entries))
+            entry = None
+        if entry is None:
+            inc_counter("retrieval_cache_lookups", {"backend": "memory", "result": "miss"})
+            return None
+        self._entries.move_to_end(key)
+        inc_counter("retrieval_cache_lookups", {"backend": "memory", "result": "hit"})
+        return entry[1]
+
+    async def set(self, key: str, chunks: list[RetrievedChunk]) -> None:
+        """Store *chunks* under *key*, evicting the least recently used overflow."""
+        self._entries[key] = (self._clock(), chunks)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            _record_eviction("memory", "lru", len(self._entries))
+        set_gauge("retrieval_cache_entries", float(len(self._entries)), {"backend": "memory"})
+
+
+class SharedCacheClient(Protocol):
+    """Minimal async key-value client; ``redis.asyncio.Redis`` satisfies it."""
+
+    async def get(self, name: str) -> bytes | str | None:
+        """Return the value stored at *name*, or None."""
+        ...
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> object:
+        """Store *value* at *name*, expiring after *ex* seconds."""
+        ...
+
+
+class SharedRetrievalCache:
+    """Retrieval cache on a shared key-value store, implementing RetrievalCachePort.
+
+    Lets every API worker reuse results computed by any other. Expiry is
+    delegated to the store through per-key TTLs (and its own memory policy,
+    e.g. Redis ``allkeys-lru``). Backend failures are logged and treated as
+    misses so an unavailable cache never fails retrieval.
+    """
+
+    def __init__(self, client: SharedCacheClient, ttl_seconds: int, namespace: str = "rag") -> None:
+        """Wrap *client*.
+
+        Args:
+            client: Async key-value client (e.g. ``redis.asyncio.Redis``).
+            ttl_seconds: Expiry applied to every stored entry.
+            namespace: Prefix keeping these keys apart from other users of the store.
+        """
+        self._client = client
+        self._ttl = ttl_seconds
+        self._namespace = namespace
+
+    async def get(self, key: str) -> list[RetrievedChunk] | None:
+        """Return the cached chunks for *key*, or None on a miss or backend error."""
+        try:
+            raw = await self._client.get(f"{self._namespace}:{key}")
+        except Exception:
+            log.warning("retrieval_cache.get_failed", exc_info=True)
+            inc_counter("retrieval_cache_lookups", {"backend": "shared", "result": "error"})
+            return None
+        if raw is None:
+            inc_counter("retrieval_cache_lookups", {"backend": "shared", "result": "miss"})
+            return None
+        inc_counter("retrieval_cache_lookups", {"backend": "shared", "result": "hit"})
+        return [RetrievedChunk.model_validate(item) for item in json.loads(raw)]
+
+    async def set(self, key: str, chunks: list[RetrievedChunk]) -> None:
+        """Store *chunks* under *key* with the configured TTL (best effort)."""
+        payload = json.dumps([c.model_dump(mode="json") for c in chunks]).encode()
+        try:
+            await self._client.set(f"{self._namespace}:{key}", payload, ex=self._ttl)
+        except Exception:
+            log.warning("retrieval_cache.set_failed", exc_info=True)
+
+
+def _record_eviction(backend: str, reason: str, size: int) -> None:
+    inc_counter("retrieval_cache_evictions", {"backend": backend, "reason": reason})
+    set_gauge("retrieval_cache_entries", float(size), {"backend": backend})
@@ -5,9 +5,10 @@ principle).  Each ``build_*`` function takes an optional ``Settings`` argument
 so callers can supply a custom settings object; when omitted, the module-level
 ``build_settings()`` singleton is used.
 
-Stateful singletons (engine, embedder, reranker) are cached via ``@lru_cache``
-on private no-arg helpers that call ``build_settings()`` internally, making them
-hashable and safe to use with ``lru_cache``.
+Stateful singletons (engine, embedder, reranker, NumPy vector store, retrieval
+cache) are cached via ``@lru_cache`` on private no-arg helpers that call
+``build_settings()`` internally, making them hashable and safe to use with
+``lru_cache``.
 
 Call :func:`_reset_caches` in tests before changing environment variables so
 the next ``build_*`` call picks up the new values.
@@ -17,7 +18,7 @@ from __future__ import annotations
 
 import logging
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -29,9 +30,19 @@ from src.application.use_cases.generate_answer import GenerateAnswerUseCase
 from src.application.use_cases.ingest_documents import IngestDocumentsUseCase
 from src.application.use_cases.retrieve import RetrieveUseCase
 from src.config.settings import Settings
+from src.domain.ports.cache import RetrievalCachePort
+from src.domain.ports.embedder import EmbedderPort, LexicalEmbedderPort
 from src.domain.ports.llm import LLMPort
+from src.domain.ports.reranker import PassageIndexerPort
+from src.domain.ports.vector_store import VectorStorePort
+from src.infrastructure.cache.embedding_cache import CachingEmbedder, DiskEmbeddingStore
+from src.infrastructure.cache.rerank_score_cache import RerankScoreCache
+from src.infrastructure.cache.retrieval_cache import InMemoryRetrievalCache, SharedRetrievalCache
 from src.infrastructure.chunking.semantic_chunker import SemanticChunker
+from src.infrastructure.embeddings.bge_m3 import BGEM3Embedder
+from src.infrastructure.embeddings.micro_batching import BatchEncoder, MicroBatchingEmbedder
 from src.infrastructure.embeddings.multilingual_e5_embedder import MultilingualE5Embedder
+from src.infrastructure.embeddings.process_pool import ProcessPoolEmbedder
 from src.infrastructure.llm.gemini import GeminiLLM
 from src.infrastructure.llm.openai import OpenAILLM
 from src.infrastructure.loading.docling_loader import DoclingLoader
@@ -40,6 +51,9 @@ from src.infrastructure.persistence.engine import create_engine, create_session_
 from src.infrastructure.persistence.session_repo import SessionRepository
 from src.infrastructure.persistence.vector_store import PGVectorStore
 from src.infrastructure.reranking.bge_reranker import BGEReranker
+from src.infrastructure.reranking.cascade import CascadeReranker
+from src.infrastructure.reranking.colbert_reranker import ColBERTReranker
+from src.infrastructure.vector_store.numpy_store import NumPyVectorStore
 
 if TYPE_CHECKING:
     from langgraph.graph.state import CompiledStateGraph
@@ -53,10 +67,13 @@ __all__ = [
     "build_evaluate_use_case",
     "build_generate_use_case",
     "build_ingest_use_case",
+    "build_lexical_embedder",
     "build_llm",
     "build_loader",
     "build_logger",
+    "build_passage_indexer",
     "build_reranker",
+    "build_retrieval_cache",
     "build_retrieve_use_case",
     "build_session_repo",
     "build_settings",
@@ -102,54 +119,171 @@ def build_engine(settings: Settings | None = None) -> AsyncEngine:
     return _cached_engine()
 
 
+def _embedding_model_id(settings: Settings) -> str:
+    """Identify the vectors ``embedding`` settings produce: model, backend and quantization."""
+    embedding = settings.embedding
+    if settings.vector_store.sparse_mode == "lexical":
+        return embedding.lexical_model
+    if embedding.backend == "torch":
+        return embedding.model
+    return f"{embedding.model}@onnx-{embedding.onnx_quantization}"
+
+
 @lru_cache(maxsize=1)
-def _cached_embedder() -> MultilingualE5Embedder:
+def _cached_embedder() -> EmbedderPort:
     """Build and cache the multilingual-e5-small embedder (internal)."""
     settings = build_settings()
-    return MultilingualE5Embedder(settings)
+    if settings.vector_store.sparse_mode == "lexical":
+        return _cached_lexical_embedder()
+    e5 = MultilingualE5Embedder(settings)
+    encoder: BatchEncoder = e5
+    if settings.embedding.pool_workers:
+        encoder = ProcessPoolEmbedder(
+            settings.embedding,
+            workers=settings.embedding.pool_workers,
+            threads_per_worker=settings.embedding.pool_threads_per_worker,
+            dimension=e5.dimension,
+            query_prefix=e5.query_prefix,
+            passage_prefix=e5.passage_prefix,
+        )
+    embedder: EmbedderPort = cast(EmbedderPort, encoder)
+    if settings.embedding.micro_batch_enabled:
+        embedder = MicroBatchingEmbedder(
+            encoder,
+            max_batch_size=settings.embedding.micro_batch_max_size,
+            max_wait_ms=settings.embedding.micro_batch_max_wait_ms,
+        )
+    cache = settings.cache
+    if not cache.embedding_enabled:
+        return embedder
+    store = DiskEmbeddingStore(
+        cache.embedding_path,
+        dimension=embedder.dimension,
+        max_entries=cache.embedding_max_entries,
+    )
+    return CachingEmbedder(embedder, store, model_id=_embedding_model_id(settings))
 
 
-def build_embedder(settings: Settings | None = None) -> MultilingualE5Embedder:
-    """Return the singleton multilingual-e5-small dense embedder.
+def build_embedder(settings: Settings | None = None) -> EmbedderPort:
+    """Return the singleton dense embedder, multilingual-e5-small by default.
 
     The model is loaded lazily on the first :meth:`embed_texts` call and then
-    reused for the lifetime of the process.
+    reused for the lifetime of the process. With ``embedding.pool_workers``
+    inference is sharded across a :class:`ProcessPoolEmbedder` of worker
+    processes instead. With ``embedding.micro_batch_enabled`` concurrent
+    calls share forward passes through a :class:`MicroBatchingEmbedder`.
+    With ``cache.embedding_enabled`` the result is wrapped in a persistent
+    :class:`CachingEmbedder`, so text embedded before is read back from disk
+    instead of re-encoded.
+
+    In ``vector_store.sparse_mode="lexical"`` this is the BGE-M3 model of
+    :func:`build_lexical_embedder` instead, so one model embeds everything.
 
     Args:
         settings: Accepted but unused; embedder uses ``build_settings()``
             internally.
 
     Returns:
-        Singleton ``MultilingualE5Embedder`` instance.
+        Singleton embedder instance.
     """
     del settings
     return _cached_embedder()
 
 
 @lru_cache(maxsize=1)
-def _cached_reranker() -> BGEReranker:
-    """Build and cache the BGE cross-encoder reranker (internal)."""
+def _cached_lexical_embedder() -> BGEM3Embedder:
+    """Build and cache the BGE-M3 dense + lexical-weight model (internal)."""
     settings = build_settings()
-    return BGEReranker(settings)
+    # The ONNX export of BGE-M3 has no lexical head, whatever embedding.backend is.
+    return BGEM3Embedder(settings, model=settings.embedding.lexical_model, backend="torch")
 
 
-def build_reranker(settings: Settings | None = None) -> BGEReranker:
-    """Return the singleton BGE cross-encoder reranker.
+def build_lexical_embedder(settings: Settings | None = None) -> LexicalEmbedderPort | None:
+    """Return the singleton BGE-M3 model when the sparse leg uses lexical weights.
 
-    The model is loaded lazily on the first :meth:`rerank` call and then
-    reused for the lifetime of the process.
+    It loads ``embedding.lexical_model`` on PyTorch and is then also the
+    dense embedder (:func:`build_embedder` returns it too): dense vectors and
+    lexical weights come from one forward pass. It is not wrapped in the
+    worker pool, micro-batcher or embedding cache, which carry dense vectors
+    only; :class:`Settings` rejects lexical mode when any of them is enabled.
+
+    Args:
+        settings: Application settings. Defaults to ``build_settings()``.
+
+    Returns:
+        Singleton ``BGEM3Embedder``, or None unless
+        ``vector_store.sparse_mode`` is ``"lexical"``.
+    """
+    s = settings or build_settings()
+    if s.vector_store.sparse_mode != "lexical":
+        return None
+    return _cached_lexical_embedder()
+
+
+@lru_cache(maxsize=1)
+def _cached_base_reranker() -> BGEReranker | ColBERTReranker:
+    """Build and cache the reranker for ``reranker.mode`` (internal)."""
+    settings = build_settings()
+    if settings.reranker.mode == "colbert":
+        return ColBERTReranker(settings)
+    cache = settings.cache
+    score_cache = (
+        RerankScoreCache(cache.rerank_scores_max_entries) if cache.rerank_scores_enabled else None
+    )
+    return BGEReranker(settings, score_cache=score_cache)
+
+
+@lru_cache(maxsize=1)
+def _cached_reranker() -> BGEReranker | ColBERTReranker | CascadeReranker:
+    """Build and cache the configured reranker, cascaded if enabled (internal)."""
+    settings = build_settings()
+    reranker = _cached_base_reranker()
+    if settings.reranker.cascade_enabled:
+        return CascadeReranker(reranker, settings)
+    return reranker
+
+
+def build_reranker(
+    settings: Settings | None = None,
+) -> BGEReranker | ColBERTReranker | CascadeReranker:
+    """Return the singleton reranker for ``reranker.mode``.
+
+    ``cross_encoder`` builds the BGE cross-encoder; ``colbert`` builds the
+    BGE-M3 late-interaction :class:`ColBERTReranker`. With
+    ``cache.rerank_scores_enabled`` the cross-encoder reuses the scores of
+    (query, chunk) pairs it has scored before, and with
+    ``reranker.batching_enabled`` the pairs of concurrent requests share
+    forward passes. With ``reranker.cascade_enabled`` it sits behind a
+    :class:`CascadeReranker`. The model is loaded
+    lazily on the first :meth:`rerank` call and then reused for the lifetime
+    of the process.
 
     Args:
         settings: Accepted but unused; reranker uses ``build_settings()``
             internally.
 
     Returns:
-        Singleton ``BGEReranker`` instance.
+        Singleton reranker instance.
     """
     del settings
     return _cached_reranker()
 
 
+def build_passage_indexer(settings: Settings | None = None) -> PassageIndexerPort | None:
+    """Return the reranker as an ingest-time passage indexer, if it is one.
+
+    Args:
+        settings: Accepted but unused; reranker uses ``build_settings()``
+            internally.
+
+    Returns:
+        The singleton :class:`ColBERTReranker` in ``colbert`` mode, else None.
+    """
+    del settings
+    reranker = _cached_base_reranker()
+    return reranker if isinstance(reranker, ColBERTReranker) else None
+
+
 def build_llm(settings: Settings | None = None) -> LLMPort:
     """Return a fresh LLM adapter for the configured provider.
 
@@ -238,16 +372,29 @@ def build_chunker(settings: Settings | None = None) -> SemanticChunker:
     return SemanticChunker(s)
 
 
-def build_vector_store(settings: Settings | None = None) -> PGVectorStore:
-    """Return a PGVector store adapter bound to the singleton engine.
+@lru_cache(maxsize=1)
+def _cached_numpy_store() -> NumPyVectorStore:
+    """Build and cache the in-process NumPy vector store (internal)."""
+    settings = build_settings()
+    return NumPyVectorStore(settings)
+
+
+def build_vector_store(settings: Settings | None = None) -> VectorStorePort:
+    """Return the vector store adapter selected by ``vector_store.backend``.
+
+    ``pgvector`` (default) returns a ``PGVectorStore`` bound to the singleton
+    engine.  ``numpy`` returns the process-level ``NumPyVectorStore``
+    singleton, which must be shared so every use case sees the same matrix.
 
     Args:
         settings: Application settings. Defaults to ``build_settings()``.
 
     Returns:
-        ``PGVectorStore`` instance backed by the singleton engine.
+        Vector store adapter implementing ``VectorStorePort``.
     """
     s = settings or build_settings()
+    if s.vector_store.backend == "numpy":
+        return _cached_numpy_store()
     engine = _cached_engine()
     session_factory = create_session_factory(engine)
     return PGVectorStore(session_factory, s)
@@ -289,9 +436,45 @@ def build_ingest_use_case(settings: Settings | None = None) -> IngestDocumentsUs
         session_repo=session_factory,
         tracer=build_tracer(s),
         logger=build_logger(),
+        lexical_embedder=build_lexical_embedder(s),
+        passage_indexer=build_passage_indexer(s),
+        embedding_model=_embedding_model_id(s),
     )
 
 
+@lru_cache(maxsize=1)
+def _cached_retrieval_cache() -> RetrievalCachePort:
+    """Build and cache the configured retrieval result cache (internal)."""
+    cache = build_settings().cache
+    if cache.retrieval_backend == "redis":
+        from redis.asyncio import Redis
+
+        return SharedRetrievalCache(
+            Redis.from_url(cache.redis_url), ttl_seconds=cache.retrieval_ttl_seconds
+        )
+    return InMemoryRetrievalCache(
+        max_entries=cache.retrieval_max_entries, ttl_seconds=cache.retrieval_ttl_seconds
+    )
+
+
+def build_retrieval_cache(settings: Settings | None = None) -> RetrievalCachePort | None:
+    """Return the process-wide retrieval cache, or None when caching is disabled.
+
+    The ``memory`` backend is an LRU/TTL map private to this process; the
+    ``redis`` backend (``pip install redis``) is shared by all API workers.
+
+    Args:
+        settings: Application settings. Defaults to ``build_settings()``.
+
+    Returns:
+        Singleton cache adapter, or None if ``cache.retrieval_enabled`` is false.
+    """
+    s = settings or build_settings()
+    if not s.cache.retrieval_enabled:
+        return None
+    return _cached_retrieval_cache()
+
+
 def build_retrieve_use_case(settings: Settings | None = None) -> RetrieveUseCase:
     """Build the retrieval use case with all dependencies wired.
 
@@ -307,6 +490,8 @@ def build_retrieve_use_case(settings: Settings | None = None) -> RetrieveUseCase
         vector_store=build_vector_store(s),
         reranker=build_reranker(s),
         settings=s,
+        cache=build_retrieval_cache(s),
+        lexical_embedder=build_lexical_embedder(s),
     )
 
 
@@ -339,7 +524,11 @@ def build_evaluate_use_case(settings: Settings | None = None) -> EvaluateUseCase
     """
     s = settings or build_settings()
     graph = build_agent(s)
-    runner = default_agent_runner(graph)
+    runner = default_agent_runner(
+        graph,
+        ef_search=s.eval.hnsw_ef_search,
+        iterative_scan=s.eval.hnsw_iterative_scan,
+    )
     return EvaluateUseCase(agent_runner=runner, settings=s)
 
 
@@ -378,4 +567,8 @@ def _reset_caches() -> None:
     build_settings.cache_clear()
     _cached_engine.cache_clear()
     _cached_embedder.cache_clear()
+    _cached_lexical_embedder.cache_clear()
+    _cached_base_reranker.cache_clear()
     _cached_reranker.cache_clear()
+    _cached_numpy_store.cache_clear()
+    _cached_retrieval_cache.cache_clear()
@@ -5,11 +5,16 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
-from typing import Any
+from typing import Any, Literal
 
+import numpy as np
 import structlog
 
 from src.config.settings import Settings
+from src.domain.ports.dto import EmbeddingArray, SparseVector
+from src.infrastructure.embeddings.multilingual_e5_embedder import encode_length_bucketed
+from src.infrastructure.embeddings.onnx_runtime import load_sentence_transformer
+from src.shared.batching import run_length_bucketed
 from src.shared.metrics import observe_histogram
 from src.shared.tracing import traced
 
@@ -21,16 +26,31 @@ _DIMENSION = 1024
 
 
 class BGEM3Embedder:
-    """BGE-M3 multilingual embedding adapter implementing EmbedderPort.
+    """BGE-M3 multilingual embedding adapter implementing LexicalEmbedderPort.
 
     Loads BGEM3FlagModel lazily on first embed call using thread-safe
     double-checked locking. Inference runs CPU-only (use_fp16=False) inside
     asyncio.to_thread to avoid blocking the event loop. Produces 1024-dim
-    dense vectors.
+    dense vectors; the ``*_with_lexical`` methods also return BGE-M3's learned
+    lexical weights (token ID → weight) from the same forward pass, for the
+    sparse leg. ``backend="onnx"`` loads the model through sentence-transformers
+    on ONNX Runtime (optionally int8-quantized), which yields dense vectors only.
+
+    Args:
+        settings: Application settings (embedding batching and cache options).
+        model: HuggingFace model ID; defaults to ``embedding.model``.
+        backend: Inference backend; defaults to ``embedding.backend``.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        model: str | None = None,
+        backend: Literal["torch", "onnx"] | None = None,
+    ) -> None:
         self._settings = settings
+        self._model_id = model or settings.embedding.model
+        self._backend = backend or settings.embedding.backend
         self._model: Any = None
         self._lock = threading.Lock()
         self._inference_lock = threading.Lock()
@@ -45,35 +65,107 @@ class BGEM3Embedder:
         with self._lock:
             if self._model is not None:
                 return
+            if self._backend == "onnx":
+                embedding = self._settings.embedding.model_copy(update={"model": self._model_id})
+                self._model = load_sentence_transformer(embedding)
+                log.info("bge_m3_embedder.model_loaded", model=self._model_id)
+                return
+
             from FlagEmbedding import BGEM3FlagModel
 
-            model_id = self._settings.embedding.model
             cache_dir = self._settings.embedding.cache_dir
             self._model = BGEM3FlagModel(
-                model_id,
+                self._model_id,
                 use_fp16=False,
                 devices=["cpu"],
                 cache_dir=cache_dir,
             )
-            log.info("bge_m3_embedder.model_loaded", model=model_id)
+            log.info("bge_m3_embedder.model_loaded", model=self._model_id)
 
-    def _sync_embed(self, texts: list[str]) -> list[list[float]]:
+    def _sync_embed(self, texts: list[str]) -> EmbeddingArray:
+        if not texts:
+            return np.empty((0, _DIMENSION), dtype=np.float32)
         self._ensure_model_loaded()
         batch_size = self._settings.embedding.batch_size
+        max_batch_tokens = self._settings.embedding.max_batch_tokens
         with self._inference_lock:
-            raw: Any = self._model.encode(
-                texts,
-                batch_size=batch_size,
-                return_dense=True,
-                return_sparse=False,
-                return_colbert_vecs=False,
-            )
-        dense: list[list[float]] = raw["dense_vecs"].tolist()
+            if self._backend == "onnx":
+                # sentence-transformers config of BGE-M3: CLS pooling + L2 norm,
+                # i.e. the same vectors as BGEM3FlagModel's ``dense_vecs``.
+                if max_batch_tokens:
+                    return encode_length_bucketed(self._model, texts, max_batch_tokens)
+                vectors: Any = self._model.encode(
+                    texts, batch_size=batch_size, convert_to_numpy=True
+                )
+                return np.asarray(vectors, dtype=np.float32)
+            if max_batch_tokens:
+                input_ids = self._model.tokenizer(texts, truncation=True)["input_ids"]
+                rows = run_length_bucketed(
+                    texts,
+                    [len(ids) for ids in input_ids],
+                    max_batch_tokens,
+                    self._encode_dense,
+                    "embedder",
+                )
+                return np.stack(rows)
+            return self._encode_dense(texts, batch_size)
+
+    def _encode_dense(self, texts: list[str], batch_size: int = 0) -> EmbeddingArray:
+        dense, _ = self._encode(texts, batch_size, lexical=False)
         return dense
 
+    def _sync_embed_with_lexical(
+        self, texts: list[str]
+    ) -> tuple[EmbeddingArray, list[SparseVector]]:
+        if not texts:
+            return np.empty((0, _DIMENSION), dtype=np.float32), []
+        if self._backend == "onnx":
+            raise RuntimeError("BGE-M3 lexical weights need the torch backend")
+        self._ensure_model_loaded()
+        max_batch_tokens = self._settings.embedding.max_batch_tokens
+        with self._inference_lock:
+            if max_batch_tokens:
+                input_ids = self._model.tokenizer(texts, truncation=True)["input_ids"]
+                pairs = run_length_bucketed(
+                    texts,
+                    [len(ids) for ids in input_ids],
+                    max_batch_tokens,
+                    self._encode_pairs,
+                    "embedder",
+                )
+                return np.stack([row for row, _ in pairs]), [weights for _, weights in pairs]
+            dense, sparse = self._encode(texts, self._settings.embedding.batch_size, lexical=True)
+            return dense, sparse
+
+    def _encode_pairs(self, texts: list[str]) -> list[tuple[EmbeddingArray, SparseVector]]:
+        dense, sparse = self._encode(texts, lexical=True)
+        return list(zip(dense, sparse, strict=True))
+
+    def _encode(
+        self, texts: list[str], batch_size: int = 0, *, lexical: bool
+    ) -> tuple[EmbeddingArray, list[SparseVector]]:
+        # One forward pass yields both outputs; the sparse head is skipped
+        # unless *lexical* is set.
+        raw: Any = self._model.encode(
+            texts,
+            batch_size=batch_size or len(texts),
+            return_dense=True,
+            return_sparse=lexical,
+            return_colbert_vecs=False,
+        )
+        dense = np.asarray(raw["dense_vecs"], dtype=np.float32)
+        if not lexical:
+            return dense, []
+        # FlagEmbedding keys lexical weights by the token ID rendered as a string.
+        sparse: list[SparseVector] = [
+            {int(token): float(weight) for token, weight in weights.items()}
+            for weights in raw["lexical_weights"]
+        ]
+        return dense, sparse
+
     @traced("embedder.embed_texts")
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        model_id = self._settings.embedding.model
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
+        model_id = self._model_id
         batch_size = self._settings.embedding.batch_size
         start = time.perf_counter()
 
@@ -95,6 +187,36 @@ class BGEM3Embedder:
         return result
 
     @traced("embedder.embed_query")
-    async def embed_query(self, text: str) -> list[float]:
+    async def embed_query(self, text: str) -> EmbeddingArray:
         results = await self.embed_texts([text])
-        return results[0]
+        vector: EmbeddingArray = results[0]
+        return vector
+
+    @traced("embedder.embed_texts_with_lexical")
+    async def embed_texts_with_lexical(
+        self, texts: list[str]
+    ) -> tuple[EmbeddingArray, list[SparseVector]]:
+        batch_size = self._settings.embedding.batch_size
+        start = time.perf_counter()
+
+        dense, sparse = await asyncio.to_thread(self._sync_embed_with_lexical, texts)
+
+        duration = time.perf_counter() - start
+        observe_histogram(
+            "embedding_request_duration_seconds",
+            duration,
+            {"model": self._model_id, "batch_size": str(batch_size)},
+        )
+        log.info(
+            "bge_m3_embedder.embed_complete",
+            count=len(texts),
+            duration_s=round(duration, 4),
+            lexical=True,
+        )
+        return dense, sparse
+
+    @traced("embedder.embed_query_with_lexical")
+    async def embed_query_with_lexical(self, text: str) -> tuple[EmbeddingArray, SparseVector]:
+        dense, sparse = await self.embed_texts_with_lexical([text])
+        vector: EmbeddingArray = dense[0]
+        return vector, sparse[0]
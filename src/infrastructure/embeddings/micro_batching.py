@@ -0,0 +1,146 @@
+"""Cross-request micro-batching embedder — coalesces concurrent calls into one forward pass."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Protocol
+
+import numpy as np
+import structlog
+
+from src.domain.ports.dto import EmbeddingArray
+from src.shared.metrics import observe_histogram, set_gauge
+from src.shared.tracing import traced
+
+__all__ = ["BatchEncoder", "MicroBatchingEmbedder"]
+
+log = structlog.get_logger(__name__)
+
+_Pending = tuple[str, "asyncio.Future[EmbeddingArray]"]
+
+
+class BatchEncoder(Protocol):
+    """Synchronous encoder over prefixed texts; ``MultilingualE5Embedder`` satisfies it."""
+
+    query_prefix: str
+    passage_prefix: str
+
+    @property
+    def dimension(self) -> int:
+        """Return the embedding vector dimension produced by this model."""
+        ...
+
+    def encode(self, prefixed_texts: list[str]) -> EmbeddingArray:
+        """Run one blocking forward pass and return a ``(len(texts), dim)`` matrix."""
+        ...
+
+
+class MicroBatchingEmbedder:
+    """EmbedderPort that merges concurrent requests into shared forward passes.
+
+    Every ``embed_query`` / ``embed_texts`` call enqueues its prefixed texts
+    and awaits per-text futures. A batch is dispatched once ``max_batch_size``
+    texts are waiting or ``max_wait_ms`` after the first one arrived, and is
+    encoded in one ``encode`` call off the event loop. Only one forward pass
+    runs at a time; texts arriving meanwhile form the next batch, which is
+    dispatched as soon as the pass finishes. Queries are dequeued before
+    passages so chat latency does not sit behind a bulk ingestion.
+
+    Emits ``embedding_batcher_queue_depth`` (gauge) and
+    ``embedding_batcher_batch_size`` (histogram).
+
+    Args:
+        encoder: Model adapter exposing a blocking batched ``encode``.
+        max_batch_size: Maximum number of texts per forward pass.
+        max_wait_ms: How long the first queued text waits for company.
+    """
+
+    def __init__(
+        self,
+        encoder: BatchEncoder,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        self._encoder = encoder
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queries: deque[_Pending] = deque()
+        self._passages: deque[_Pending] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def dimension(self) -> int:
+        return self._encoder.dimension
+
+    @traced("embedder.batched_embed_texts")
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
+        prefix = self._encoder.passage_prefix
+        rows = await self._submit(self._passages, [prefix + t for t in texts])
+        if not rows:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.stack(rows)
+
+    @traced("embedder.batched_embed_query")
+    async def embed_query(self, text: str) -> EmbeddingArray:
+        results = await self._submit(self._queries, [self._encoder.query_prefix + text])
+        return results[0]
+
+    def _queue_depth(self) -> int:
+        return len(self._queries) + len(self._passages)
+
+    async def _submit(self, lane: deque[_Pending], prefixed: list[str]) -> list[EmbeddingArray]:
+        if not prefixed:
+            return []
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[EmbeddingArray]] = [loop.create_future() for _ in prefixed]
+        lane.extend(zip(prefixed, futures, strict=True))
+        set_gauge("embedding_batcher_queue_depth", float(self._queue_depth()))
+
+        if self._queue_depth() >= self._max_batch_size:
+            self._dispatch()
+        elif self._timer is None and not self._in_flight:
+            self._timer = loop.call_later(self._max_wait, self._dispatch)
+        return list(await asyncio.gather(*futures))
+
+    def _dispatch(self) -> None:
+        """Start a forward pass over up to ``max_batch_size`` queued texts."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._in_flight or not self._queue_depth():
+            return
+
+        batch: list[_Pending] = []
+        for lane in (self._queries, self._passages):
+            while lane and len(batch) < self._max_batch_size:
+                text, future = lane.popleft()
+                if not future.cancelled():
+                    batch.append((text, future))
+        set_gauge("embedding_batcher_queue_depth", float(self._queue_depth()))
+
+        if not batch:
+            return
+        self._in_flight = True
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[_Pending]) -> None:
+        observe_histogram("embedding_batcher_batch_size", float(len(batch)))
+        try:
+            vectors = await asyncio.to_thread(self._encoder.encode, [text for text, _ in batch])
+        except Exception as exc:
+            log.warning("micro_batching_embedder.batch_failed", size=len(batch), error=str(exc))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for (_, future), vector in zip(batch, vectors, strict=True):
+                if not future.done():
+                    future.set_result(vector)
+        finally:
+            self._in_flight = False
+            self._dispatch()
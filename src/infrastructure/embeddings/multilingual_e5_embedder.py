@@ -5,33 +5,76 @@ from __future__ import annotations
 import asyncio
 import threading
 import time
-from typing import Any, cast
+from typing import Any
 
+import numpy as np
 import structlog
 
 from src.config.settings import Settings
+from src.domain.ports.dto import EmbeddingArray
+from src.infrastructure.embeddings.onnx_runtime import load_sentence_transformer
+from src.shared.batching import run_length_bucketed
 from src.shared.metrics import observe_histogram
 from src.shared.tracing import traced
 
-__all__ = ["MultilingualE5Embedder"]
+__all__ = ["MultilingualE5Embedder", "encode_length_bucketed"]
 
 log = structlog.get_logger(__name__)
 
 _DIMENSION = 384
 
 
+def encode_length_bucketed(
+    model: Any,  # noqa: ANN401
+    texts: list[str],
+    max_batch_tokens: int,
+) -> EmbeddingArray:
+    """Encode with a ``SentenceTransformer`` in length-homogeneous batches.
+
+    Texts are tokenized once to measure them, grouped by length under
+    *max_batch_tokens* padded tokens per forward pass, and returned in input
+    order.
+
+    Args:
+        model: Loaded ``SentenceTransformer`` (PyTorch or ONNX backend).
+        texts: Already-prefixed texts; at least one.
+        max_batch_tokens: Padded-token budget per batch.
+
+    Returns:
+        ``(len(texts), dim)`` float32 matrix, rows in the order of *texts*.
+    """
+    input_ids = model.tokenizer(texts, truncation=True, max_length=model.max_seq_length)[
+        "input_ids"
+    ]
+
+    def run(batch: list[str]) -> EmbeddingArray:
+        return np.asarray(
+            model.encode(batch, batch_size=len(batch), convert_to_numpy=True), dtype=np.float32
+        )
+
+    rows = run_length_bucketed(
+        texts, [len(ids) for ids in input_ids], max_batch_tokens, run, "embedder"
+    )
+    return np.stack(rows)
+
+
 class MultilingualE5Embedder:
     """multilingual-E5-small embedding adapter implementing EmbedderPort.
 
     Loads SentenceTransformer lazily on first embed call using thread-safe
     double-checked locking. Inference runs CPU-only inside asyncio.to_thread
     to avoid blocking the event loop. Produces 384-dim dense vectors.
+    ``embedding.backend="onnx"`` runs the model on ONNX Runtime (optionally
+    int8-quantized) instead of PyTorch.
 
     Prefix rules (required by the E5 family):
     - ``embed_query`` prepends ``"query: "`` before encoding.
     - ``embed_texts`` prepends ``"passage: "`` to every text before encoding.
     """
 
+    query_prefix = "query: "
+    passage_prefix = "passage: "
+
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._model: Any = None
@@ -48,32 +91,47 @@ class MultilingualE5Embedder:
         with self._lock:
             if self._model is not None:
                 return
-            from sentence_transformers import SentenceTransformer
+            embedding = self._settings.embedding
+            self._model = load_sentence_transformer(embedding)
+            log.info(
+                "multilingual_e5_embedder.model_loaded",
+                model=embedding.model,
+                backend=embedding.backend,
+            )
+
+    def encode(self, prefixed_texts: list[str]) -> EmbeddingArray:
+        """Run one blocking forward pass over texts that already carry their prefix.
 
-            model_id = self._settings.embedding.model
-            cache_dir = self._settings.embedding.cache_dir
-            self._model = SentenceTransformer(model_id, cache_folder=cache_dir, device="cpu")
-            log.info("multilingual_e5_embedder.model_loaded", model=model_id)
+        With ``embedding.max_batch_tokens`` set, texts are length-bucketed under
+        that padded-token budget instead of split into fixed-size batches.
 
-    def _sync_embed(self, prefixed_texts: list[str]) -> list[list[float]]:
+        Returns:
+            ``(len(prefixed_texts), 384)`` float32 matrix.
+        """
+        if not prefixed_texts:
+            return np.empty((0, _DIMENSION), dtype=np.float32)
         self._ensure_model_loaded()
-        batch_size = self._settings.embedding.batch_size
+        embedding = self._settings.embedding
         with self._inference_lock:
+            if embedding.max_batch_tokens:
+                return encode_length_bucketed(
+                    self._model, prefixed_texts, embedding.max_batch_tokens
+                )
             raw: Any = self._model.encode(
                 prefixed_texts,
-                batch_size=batch_size,
+                batch_size=embedding.batch_size,
                 convert_to_numpy=True,
             )
-        return cast(list[list[float]], raw.tolist())
+        return np.asarray(raw, dtype=np.float32)
 
     @traced("embedder.embed_texts")
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
         model_id = self._settings.embedding.model
         batch_size = self._settings.embedding.batch_size
         start = time.perf_counter()
 
-        prefixed = ["passage: " + t for t in texts]
-        result = await asyncio.to_thread(self._sync_embed, prefixed)
+        prefixed = [self.passage_prefix + t for t in texts]
+        result = await asyncio.to_thread(self.encode, prefixed)
 
         duration = time.perf_counter() - start
         observe_histogram(
@@ -91,13 +149,13 @@ class MultilingualE5Embedder:
         return result
 
     @traced("embedder.embed_query")
-    async def embed_query(self, text: str) -> list[float]:
+    async def embed_query(self, text: str) -> EmbeddingArray:
         model_id = self._settings.embedding.model
         batch_size = self._settings.embedding.batch_size
         start = time.perf_counter()
 
-        prefixed = ["query: " + text]
-        results = await asyncio.to_thread(self._sync_embed, prefixed)
+        prefixed = [self.query_prefix + text]
+        results = await asyncio.to_thread(self.encode, prefixed)
 
         duration = time.perf_counter() - start
         observe_histogram(
@@ -112,4 +170,5 @@ class MultilingualE5Embedder:
             duration_s=round(duration, 4),
         )
 
-        return results[0]
+        vector: EmbeddingArray = results[0]
+        return vector
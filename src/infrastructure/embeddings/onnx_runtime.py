@@ -0,0 +1,179 @@
+"""ONNX Runtime backend for the embedders — export, int8 quantization and parity check."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+from pydantic import BaseModel, ConfigDict
+
+from src.config.settings import EmbeddingSettings
+
+__all__ = [
+    "DEFAULT_PARITY_TEXTS",
+    "ParityReport",
+    "check_embedding_parity",
+    "cosine_drift",
+    "ensure_onnx_export",
+    "load_sentence_transformer",
+]
+
+log = structlog.get_logger(__name__)
+
+_ONNX_FILE = "onnx/model.onnx"
+
+# Multilingual sample used when no texts are supplied to the parity check.
+DEFAULT_PARITY_TEXTS = [
+    "passage: How do I apply to the 1337 piscine?",
+    "passage: La piscine dure quatre semaines et se déroule sur le campus.",
+    "passage: يمكن التسجيل في المدرسة عبر الموقع الإلكتروني.",
+    "query: what are the campus opening hours",
+    "query: quels documents faut-il fournir pour l'inscription ?",
+]
+
+
+class ParityReport(BaseModel):
+    """Cosine agreement between reference and candidate embeddings of the same texts."""
+
+    model_config = ConfigDict(frozen=True)
+
+    texts: int
+    mean_cosine: float
+    min_cosine: float
+    max_abs_diff: float
+
+
+def _onnx_file_name(quantization: str) -> str:
+    if quantization == "none":
+        return _ONNX_FILE
+    return f"onnx/model_qint8_{quantization}.onnx"
+
+
+def ensure_onnx_export(
+    model_cls: Any,  # noqa: ANN401
+    model_id: str,
+    onnx_dir: str,
+    quantization: str,
+    cache_dir: str,
+) -> tuple[Path, str]:
+    """Export *model_id* to ONNX and quantize it, unless the files already exist.
+
+    The model is exported under ``onnx_dir/<model>`` on first use and, unless
+    *quantization* is ``"none"``, dynamically quantized to int8 for that CPU
+    instruction set.
+
+    Args:
+        model_cls: ``SentenceTransformer`` or ``CrossEncoder``.
+        model_id: HuggingFace model ID.
+        onnx_dir: Root directory of exported models.
+        quantization: ``"none"`` or a dynamic int8 quantization target.
+        cache_dir: HuggingFace model cache directory.
+
+    Returns:
+        ``(export_dir, file_name)`` to load with ``backend="onnx"``.
+    """
+    export_dir = Path(onnx_dir) / model_id.replace("/", "__")
+    if not (export_dir / _ONNX_FILE).exists():
+        exported = model_cls(model_id, backend="onnx", cache_folder=cache_dir, device="cpu")
+        exported.save_pretrained(str(export_dir))
+        log.info("onnx_backend.exported", model=model_id, path=str(export_dir))
+
+    file_name = _onnx_file_name(quantization)
+    if not (export_dir / file_name).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        export_dynamic_quantized_onnx_model(
+            model_cls(str(export_dir), backend="onnx", device="cpu"),
+            quantization_config=quantization,
+            model_name_or_path=str(export_dir),
+        )
+        log.info("onnx_backend.quantized", model=model_id, file=file_name)
+    return export_dir, file_name
+
+
+def load_sentence_transformer(settings: EmbeddingSettings) -> Any:  # noqa: ANN401
+    """Load ``settings.model`` as a CPU ``SentenceTransformer`` on the configured backend.
+
+    For ``backend="onnx"`` the model is exported and quantized on first use
+    (:func:`ensure_onnx_export`); later loads reuse the files on disk.
+
+    Args:
+        settings: Embedding settings (model, cache dir, backend, ONNX options).
+
+    Returns:
+        A ``sentence_transformers.SentenceTransformer`` instance.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if settings.backend == "torch":
+        return SentenceTransformer(settings.model, cache_folder=settings.cache_dir, device="cpu")
+
+    export_dir, file_name = ensure_onnx_export(
+        SentenceTransformer,
+        settings.model,
+        settings.onnx_dir,
+        settings.onnx_quantization,
+        settings.cache_dir,
+    )
+    return SentenceTransformer(
+        str(export_dir), backend="onnx", device="cpu", model_kwargs={"file_name": file_name}
+    )
+
+
+def cosine_drift(
+    reference: npt.ArrayLike,
+    candidate: npt.ArrayLike,
+) -> ParityReport:
+    """Compare two embedding matrices row by row.
+
+    Args:
+        reference: ``(n, dim)`` embeddings from the reference backend.
+        candidate: ``(n, dim)`` embeddings of the same texts from the candidate.
+
+    Returns:
+        :class:`ParityReport` with per-row cosine statistics and the largest
+        element-wise difference after L2 normalisation.
+    """
+    # Copies: the rows are normalised in place below, never the caller's arrays.
+    ref = np.array(reference, dtype=np.float64)
+    cand = np.array(candidate, dtype=np.float64)
+    if ref.shape != cand.shape:
+        raise ValueError(f"Shape mismatch: {ref.shape} vs {cand.shape}")
+    ref /= np.maximum(np.linalg.norm(ref, axis=1, keepdims=True), 1e-12)
+    cand /= np.maximum(np.linalg.norm(cand, axis=1, keepdims=True), 1e-12)
+    cosines = np.einsum("ij,ij->i", ref, cand)
+    return ParityReport(
+        texts=len(cosines),
+        mean_cosine=float(cosines.mean()),
+        min_cosine=float(cosines.min()),
+        max_abs_diff=float(np.abs(ref - cand).max()),
+    )
+
+
+def check_embedding_parity(
+    settings: EmbeddingSettings,
+    texts: list[str] | None = None,
+) -> ParityReport:
+    """Embed *texts* with PyTorch and with the ONNX backend and report the drift.
+
+    Exports/quantizes the ONNX model first if needed, so running this once
+    per deployment also warms the on-disk ONNX files.
+
+    Args:
+        settings: Embedding settings; ``backend`` is overridden for each side.
+        texts: Already-prefixed sample texts; a small multilingual set by default.
+
+    Returns:
+        :class:`ParityReport` of ONNX against PyTorch.
+    """
+    sample = texts or DEFAULT_PARITY_TEXTS
+    torch_model = load_sentence_transformer(settings.model_copy(update={"backend": "torch"}))
+    onnx_model = load_sentence_transformer(settings.model_copy(update={"backend": "onnx"}))
+    reference = torch_model.encode(sample, convert_to_numpy=True)
+    candidate = onnx_model.encode(sample, convert_to_numpy=True)
+    report = cosine_drift(reference, candidate)
+    log.info("onnx_backend.parity", model=settings.model, **report.model_dump())
+    return report
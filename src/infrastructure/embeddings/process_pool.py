@@ -0,0 +1,191 @@
+"""Multi-process embedder — shards batches across worker processes, one model each."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+import structlog
+
+from src.config.settings import EmbeddingSettings
+from src.domain.ports.dto import EmbeddingArray
+from src.infrastructure.embeddings.multilingual_e5_embedder import encode_length_bucketed
+from src.infrastructure.embeddings.onnx_runtime import load_sentence_transformer
+from src.shared.metrics import observe_histogram
+from src.shared.tracing import traced
+
+__all__ = ["ProcessPoolEmbedder"]
+
+log = structlog.get_logger(__name__)
+
+ModelFactory = Callable[[EmbeddingSettings], Any]
+
+# Per-process model, set by ``_init_worker`` in each pool worker.
+_worker_model: Any = None
+_worker_batch_size = 32
+_worker_max_batch_tokens = 0
+
+
+def _init_worker(
+    settings_data: dict[str, Any],
+    threads: int,
+    model_factory: ModelFactory,
+) -> None:
+    """Pin the worker's intra-op thread count and load its model copy."""
+    global _worker_model, _worker_batch_size, _worker_max_batch_tokens
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    os.environ["MKL_NUM_THREADS"] = str(threads)
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    settings = EmbeddingSettings.model_validate(settings_data)
+    _worker_model = model_factory(settings)
+    _worker_batch_size = settings.batch_size
+    _worker_max_batch_tokens = settings.max_batch_tokens
+
+
+def _encode_shard(shm_name: str, offset: int, dimension: int, texts: list[str]) -> int:
+    """Encode *texts* and write them into rows ``offset…`` of the shared result buffer."""
+    if _worker_max_batch_tokens:
+        encoded: Any = encode_length_bucketed(_worker_model, texts, _worker_max_batch_tokens)
+    else:
+        encoded = _worker_model.encode(texts, batch_size=_worker_batch_size, convert_to_numpy=True)
+    vectors = np.asarray(encoded, dtype=np.float32)
+    shm = SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((offset + len(texts), dimension), dtype=np.float32, buffer=shm.buf)
+        out[offset:] = vectors
+        del out
+    finally:
+        shm.close()
+    return len(texts)
+
+
+class ProcessPoolEmbedder:
+    """EmbedderPort backed by a pool of worker processes, each with its own model.
+
+    A batch is split into one contiguous shard per worker (never smaller than
+    ``embedding.batch_size`` texts). Workers write their float32 vectors
+    straight into a shared-memory buffer sized for the whole batch, so only
+    texts and row offsets are pickled. Each worker pins torch (and OpenMP/MKL)
+    to ``threads_per_worker`` threads so the pool does not oversubscribe the
+    CPU. Workers are spawned on first use.
+
+    ``encode`` is the blocking, already-prefixed entry point, which lets a
+    :class:`~src.infrastructure.embeddings.micro_batching.MicroBatchingEmbedder`
+    feed the pool.
+
+    Args:
+        settings: Embedding settings; the model is loaded per worker from these.
+        workers: Number of worker processes.
+        threads_per_worker: Intra-op thread count inside each worker.
+        dimension: Embedding dimension produced by the model.
+        query_prefix: Prefix prepended by :meth:`embed_query`.
+        passage_prefix: Prefix prepended by :meth:`embed_texts`.
+        model_factory: Picklable callable loading the model in a worker.
+    """
+
+    def __init__(
+        self,
+        settings: EmbeddingSettings,
+        workers: int,
+        threads_per_worker: int = 1,
+        dimension: int = 384,
+        query_prefix: str = "query: ",
+        passage_prefix: str = "passage: ",
+        model_factory: ModelFactory = load_sentence_transformer,
+    ) -> None:
+        self._settings = settings
+        self._workers = workers
+        self._threads = threads_per_worker
+        self._dimension = dimension
+        self.query_prefix = query_prefix
+        self.passage_prefix = passage_prefix
+        self._model_factory = model_factory
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is not None:
+            return self._pool
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self._settings.model_dump(), self._threads, self._model_factory),
+                )
+                log.info(
+                    "process_pool_embedder.started",
+                    workers=self._workers,
+                    threads_per_worker=self._threads,
+                )
+            return self._pool
+
+    def _shards(self, count: int) -> list[tuple[int, int]]:
+        size = max(-(-count // self._workers), self._settings.batch_size)
+        return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+    def encode(self, prefixed_texts: list[str]) -> EmbeddingArray:
+        """Embed already-prefixed texts across the worker pool (blocking)."""
+        if not prefixed_texts:
+            return np.empty((0, self._dimension), dtype=np.float32)
+        pool = self._ensure_pool()
+        count = len(prefixed_texts)
+        shm = SharedMemory(create=True, size=count * self._dimension * 4)
+        try:
+            futures = [
+                pool.submit(
+                    _encode_shard, shm.name, start, self._dimension, prefixed_texts[start:end]
+                )
+                for start, end in self._shards(count)
+            ]
+            for future in futures:
+                future.result()
+            result = np.ndarray((count, self._dimension), dtype=np.float32, buffer=shm.buf)
+            vectors = result.copy()  # the shared block is unlinked below
+            del result
+        finally:
+            shm.close()
+            shm.unlink()
+        return vectors
+
+    @traced("embedder.pool_embed_texts")
+    async def embed_texts(self, texts: list[str]) -> EmbeddingArray:
+        start = time.perf_counter()
+        vectors = await asyncio.to_thread(self.encode, [self.passage_prefix + t for t in texts])
+        observe_histogram(
+            "embedding_request_duration_seconds",
+            time.perf_counter() - start,
+            {"model": self._settings.model, "batch_size": str(self._settings.batch_size)},
+        )
+        return vectors
+
+    @traced("embedder.pool_embed_query")
+    async def embed_query(self, text: str) -> EmbeddingArray:
+        vectors = await asyncio.to_thread(self.encode, [self.query_prefix + text])
+        vector: EmbeddingArray = vectors[0]
+        return vector
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+                self._pool = None
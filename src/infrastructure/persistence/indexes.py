@@ -0,0 +1,161 @@
+"""Admin helpers for the dense and per-language partial HNSW indexes on ``chunks``."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config.settings import Settings
+from src.domain.ports.dto import EmbeddingArray
+from src.domain.value_objects.language import Language
+from src.infrastructure.persistence.models import (
+    DENSE_INDEX_NAMES,
+    embedding_dimension,
+    language_hnsw_index_name,
+)
+from src.infrastructure.persistence.vector_store import PGVectorStore
+
+__all__ = [
+    "RecallReport",
+    "check_dense_recall",
+    "create_language_index",
+    "rebuild_dense_index",
+    "recall_at_k",
+]
+
+# Indexed expression and operator class per ``embedding_quantization`` mode;
+# must match the expressions the search queries order by. ``{dimension}`` is
+# the configured width of ``chunks.embedding``.
+_DENSE_INDEX_EXPRESSIONS: dict[str, str] = {
+    "none": "embedding vector_cosine_ops",
+    "halfvec": "(CAST(embedding AS halfvec({dimension}))) halfvec_cosine_ops",
+    "binary": "(CAST(binary_quantize(embedding) AS bit({dimension}))) bit_hamming_ops",
+}
+
+
+class RecallReport(BaseModel):
+    """Overlap of the configured dense search with exact search, over sample queries."""
+
+    model_config = ConfigDict(frozen=True)
+
+    queries: int
+    top_k: int
+    mean_recall: float
+    min_recall: float
+
+
+async def create_language_index(engine: AsyncEngine, language: str, settings: Settings) -> str:
+    """Build the partial HNSW index for *language* if it does not exist yet.
+
+    Migration 0004 covers the languages in ``PARTIAL_INDEX_LANGUAGES``; this
+    adds one for any other language once its chunks start arriving. The index
+    is built ``CONCURRENTLY`` (outside a transaction) so ingestion and search
+    keep running while it is created.
+
+    Args:
+        engine: Async engine connected to the vector store database.
+        language: ISO 639-1 code; validated before being inlined into DDL.
+        settings: Application settings providing the HNSW build parameters.
+
+    Returns:
+        Name of the (possibly pre-existing) index.
+
+    Raises:
+        pydantic.ValidationError: If *language* is not a known ISO 639-1 code.
+    """
+    code = Language(code=language).code
+    name = language_hnsw_index_name(code)
+    vs = settings.vector_store
+    ddl = text(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON chunks "
+        "USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {int(vs.hnsw_m)}, ef_construction = {int(vs.hnsw_ef_construction)}) "
+        f"WHERE language = '{code}'"
+    )
+    async with engine.connect() as conn:
+        autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await autocommit.execute(ddl)
+    return name
+
+
+async def rebuild_dense_index(engine: AsyncEngine, settings: Settings) -> str:
+    """Build the dense HNSW index for ``vector_store.embedding_quantization`` and drop the others.
+
+    Only one global dense index is kept: the full-precision one for ``none``,
+    or the ``halfvec`` / ``bit`` expression index, whose searches re-rank
+    their candidates with the full vectors read from the heap. Run after
+    changing the quantization mode. The new index is built ``CONCURRENTLY``
+    before the old ones are dropped, so search keeps an index throughout.
+
+    Args:
+        engine: Async engine connected to the vector store database.
+        settings: Application settings providing the mode and HNSW build parameters.
+
+    Returns:
+        Name of the (possibly pre-existing) index for the configured mode.
+    """
+    vs = settings.vector_store
+    mode = vs.embedding_quantization
+    name = DENSE_INDEX_NAMES[mode]
+    expression = _DENSE_INDEX_EXPRESSIONS[mode].format(
+        dimension=embedding_dimension(vs.sparse_mode)
+    )
+    create = text(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON chunks "
+        f"USING hnsw ({expression}) "
+        f"WITH (m = {int(vs.hnsw_m)}, ef_construction = {int(vs.hnsw_ef_construction)})"
+    )
+    async with engine.connect() as conn:
+        autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await autocommit.execute(create)
+        for other in DENSE_INDEX_NAMES.values():
+            if other != name:
+                await autocommit.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {other}"))
+    return name
+
+
+def recall_at_k(approximate: Sequence[object], exact: Sequence[object]) -> float:
+    """Return the share of the *exact* top-k that *approximate* also found (1.0 when empty)."""
+    if not exact:
+        return 1.0
+    return len(set(approximate) & set(exact)) / len(exact)
+
+
+async def check_dense_recall(
+    store: PGVectorStore,
+    queries: Sequence[EmbeddingArray],
+    top_k: int,
+) -> RecallReport:
+    """Compare the configured dense search with an exact scan, query by query.
+
+    The configured search is whatever ``vector_store.embedding_quantization``
+    and the HNSW settings select (for ``binary``: Hamming candidates re-ranked
+    with the full vectors); the baseline is :meth:`PGVectorStore.exact_search`.
+
+    Args:
+        store: Vector store under test.
+        queries: Query embeddings, e.g. the golden-set questions.
+        top_k: Result depth to compare.
+
+    Returns:
+        :class:`RecallReport` with the mean and worst recall@k.
+
+    Raises:
+        ValueError: If *queries* is empty.
+    """
+    if not queries:
+        raise ValueError("No queries to compare")
+    recalls: list[float] = []
+    for query in queries:
+        approximate = await store.search(query, top_k)
+        exact = await store.exact_search(query, top_k)
+        recalls.append(recall_at_k([c.chunk_id for c in approximate], [c.chunk_id for c in exact]))
+    return RecallReport(
+        queries=len(recalls),
+        top_k=top_k,
+        mean_recall=sum(recalls) / len(recalls),
+        min_recall=min(recalls),
+    )
@@ -4,12 +4,65 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
-
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from typing import Any
+
+from pgvector.sqlalchemy import SPARSEVEC, Vector
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+# Width of ``chunks.embedding``: multilingual-e5-small's 384 by default;
+# BGE-M3's 1024 when ``vector_store.sparse_mode`` is ``"lexical"``, where BGE-M3
+# is the only embedder (see migration 0011). The ORM column declares the
+# default; queries take the configured width from ``embedding_dimension``.
+EMBEDDING_DIMENSION = 384
+LEXICAL_MODE_EMBEDDING_DIMENSION = 1024
+
+# BGE-M3 vocabulary size: the dimension of its learned lexical weight vectors
+# (see migration 0009). HNSW on ``sparsevec`` indexes up to 1000 non-zero
+# entries per row, more than any chunk's distinct tokens.
+LEXICAL_DIMENSION = 250002
+SPARSE_INDEX_NAME = "chunks_sparse_embedding_hnsw_idx"
+
+# Global dense HNSW index, one per ``vector_store.embedding_quantization``
+# mode: full precision, or an expression index over a compact copy of
+# ``chunks.embedding`` — half-precision (2x smaller) or sign-bit (32x smaller).
+# Only the configured mode's index exists (see migration 0010 and
+# ``rag-cli rebuild-dense-index``); queries must repeat these exact
+# expressions for the planner to use them.
+EMBEDDING_INDEX_NAME = "chunks_embedding_hnsw_idx"
+HALFVEC_INDEX_NAME = "chunks_embedding_halfvec_hnsw_idx"
+BINARY_INDEX_NAME = "chunks_embedding_bit_hnsw_idx"
+DENSE_INDEX_NAMES: dict[str, str] = {
+    "none": EMBEDDING_INDEX_NAME,
+    "halfvec": HALFVEC_INDEX_NAME,
+    "binary": BINARY_INDEX_NAME,
+}
+
+# Languages that get their own partial HNSW index (see migration 0004). Others
+# can be added at runtime with ``rag-cli create-language-index <code>``.
+PARTIAL_INDEX_LANGUAGES: tuple[str, ...] = ("en", "fr", "ar")
+
+
+def embedding_dimension(sparse_mode: str) -> int:
+    """Return the width of ``chunks.embedding`` for ``vector_store.sparse_mode``."""
+    return LEXICAL_MODE_EMBEDDING_DIMENSION if sparse_mode == "lexical" else EMBEDDING_DIMENSION
+
+
+def language_hnsw_index_name(language: str) -> str:
+    """Return the name of the partial HNSW index covering *language* chunks."""
+    return f"chunks_embedding_hnsw_{language}_idx"
+
 
 class Base(DeclarativeBase):
     """Shared declarative base for all ORM models."""
@@ -21,7 +74,7 @@ class DocumentORM(Base):
     __tablename__ = "documents"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    source_path: Mapped[str] = mapped_column(String(1024), nullable=False)
+    source_path: Mapped[str] = mapped_column(String(1024), nullable=False, index=True)
     content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)  # SHA256
     language: Mapped[str] = mapped_column(String(8), nullable=False, default="en")
     created_at: Mapped[datetime] = mapped_column(
@@ -39,24 +92,75 @@ class ChunkORM(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     document_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     token_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    embedding: Mapped[list[float]] = mapped_column(Vector(384), nullable=True)
+    # Copies of the parent document's source_path / language plus the chunker's
+    # per-chunk metadata, so search is served from this table alone. ``language``
+    # also lets filtered ANN queries hit a per-language partial HNSW index.
+    source_path: Mapped[str] = mapped_column(String(1024), nullable=False, default="")
+    language: Mapped[str] = mapped_column(String(8), nullable=False, default="en")
+    # ``metadata`` is reserved on declarative classes, hence the attribute name.
+    chunk_metadata: Mapped[dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, default=dict
+    )
+    embedding: Mapped[list[float]] = mapped_column(Vector(EMBEDDING_DIMENSION), nullable=True)
+    # SHA-256 of everything that feeds the row (content, chunker metadata,
+    # language, source path); re-ingestion skips chunks whose hash is unchanged.
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, default="")
+    # BGE-M3 lexical weights, filled when ``vector_store.sparse_mode="lexical"``.
+    sparse_embedding: Mapped[Any] = mapped_column(SPARSEVEC(LEXICAL_DIMENSION), nullable=True)
+    # Stored generated column: the lexer runs once per write, not once per query.
+    content_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', content)", persisted=True),
+        nullable=True,
+    )
     document: Mapped[DocumentORM] = relationship("DocumentORM", back_populates="chunks")
 
     __table_args__ = (
+        # The default (full-precision) dense index; quantized deployments
+        # replace it with the matching expression index (see DENSE_INDEX_NAMES).
         Index(
-            "chunks_embedding_hnsw_idx",
+            EMBEDDING_INDEX_NAME,
             "embedding",
             postgresql_using="hnsw",
             postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        Index("chunks_content_tsv_gin_idx", "content_tsv", postgresql_using="gin"),
+        Index(
+            SPARSE_INDEX_NAME,
+            "sparse_embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"sparse_embedding": "sparsevec_ip_ops"},
+        ),
+        *(
+            Index(
+                language_hnsw_index_name(lang),
+                "embedding",
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding": "vector_cosine_ops"},
+                postgresql_where=text(f"language = '{lang}'"),
+            )
+            for lang in PARTIAL_INDEX_LANGUAGES
         ),
     )
 
 
+# Bumped after every committed write to ``chunks`` (see migration 0007).
+# Retrieval cache keys include its value, so a write invalidates every cached
+# result at once across all workers without any explicit purge.
+corpus_generation_seq = Sequence("corpus_generation_seq", metadata=Base.metadata)
+
+
 class SessionORM(Base):
     """Chat session (groups messages)."""
 
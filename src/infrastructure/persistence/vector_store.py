@@ -2,22 +2,276 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import time
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, text
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+import asyncpg  # type: ignore[import-untyped]
+from pgvector import SparseVector as PgSparseVector
+from pgvector.asyncpg import register_vector
+from pgvector.sqlalchemy import BIT, HALFVEC
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    Select,
+    TextClause,
+    bindparam,
+    delete,
+    func,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.config.settings import Settings
-from src.domain.ports.dto import ChunkWithEmbedding, RetrievedChunk
-from src.infrastructure.persistence.models import ChunkORM, DocumentORM
+from src.config.settings import HnswIterativeScan, Settings
+from src.domain.ports.dto import (
+    ChunkWithEmbedding,
+    EmbeddingArray,
+    HybridSearchQuery,
+    RetrievedChunk,
+    SparseVector,
+    StoredChunkHash,
+)
+from src.infrastructure.persistence.models import (
+    LEXICAL_DIMENSION,
+    ChunkORM,
+    corpus_generation_seq,
+    embedding_dimension,
+)
+from src.infrastructure.vector_store.fusion import RRF_K, rrf_fuse
 from src.shared.metrics import inc_counter, observe_histogram
 from src.shared.tracing import traced
 
 __all__ = ["PGVectorStore"]
 
-_RRF_K: int = 60
+# Chunk-language filter. On dense paths ``:lang`` is bound with
+# ``literal_execute`` so the value is inlined at execution time: the planner
+# can then prove ``language = '<code>'`` and use the matching partial HNSW index,
+# which a generic-plan bound parameter would hide.
+_LANG_CLAUSE = "AND c.language = :lang"
+
+_T = TypeVar("_T")
+
+# pgvector's ``hnsw.ef_search`` default and upper bound.
+_PG_DEFAULT_EF_SEARCH = 40
+_MAX_EF_SEARCH = 1000
+
+# Columns needed to build a RetrievedChunk — everything comes from ``chunks``
+# (no documents join). The embedding is shipped back only when a caller asks
+# for it (``with_embeddings``, used by MMR); otherwise it stays in the heap.
+_RESULT_COLUMNS = (
+    ChunkORM.id,
+    ChunkORM.document_id,
+    ChunkORM.content,
+    ChunkORM.source_path,
+    ChunkORM.chunk_metadata,
+)
+
+# Extra hydrated column of the raw-SQL result rows when embeddings are requested.
+_EMBEDDING_COLUMN = ", c.embedding"
+
+# Query vector of the single-query statements.
+_QUERY_VECTOR_PARAM = "CAST(:query_vector AS vector)"
+
+# Dense-leg bodies for the SQL hybrid paths, keyed by ``embedding_quantization``.
+# Quantized variants rank ``:k_candidates`` rows on the compact expression
+# index, then re-score them exactly against the full-precision column.
+# ``{query_vector}`` is the SQL expression yielding the query ``vector`` and
+# ``{dimension}`` the configured width of ``chunks.embedding``.
+_DENSE_HITS_SQL: dict[str, str] = {
+    "none": """
+        SELECT c.id, c.embedding <=> {query_vector} AS distance
+        FROM chunks c
+        WHERE TRUE {lang_clause}
+        ORDER BY distance
+        LIMIT :k_dense
+    """,
+    "halfvec": """
+        SELECT id, embedding <=> {query_vector} AS distance
+        FROM (
+            SELECT c.id, c.embedding
+            FROM chunks c
+            WHERE TRUE {lang_clause}
+            ORDER BY CAST(c.embedding AS halfvec({dimension}))
+                <=> CAST({query_vector} AS halfvec({dimension}))
+            LIMIT :k_candidates
+        ) AS candidates
+        ORDER BY distance
+        LIMIT :k_dense
+    """,
+    "binary": """
+        SELECT id, embedding <=> {query_vector} AS distance
+        FROM (
+            SELECT c.id, c.embedding
+            FROM chunks c
+            WHERE TRUE {lang_clause}
+            ORDER BY CAST(binary_quantize(c.embedding) AS bit({dimension}))
+                <~> binary_quantize({query_vector})
+            LIMIT :k_candidates
+        ) AS candidates
+        ORDER BY distance
+        LIMIT :k_dense
+    """,
+}
+
+# Sparse-leg bodies, keyed by ``sparse_mode``; both yield ``(id, ts)`` with
+# higher ``ts`` better. ``{query}`` is the SQL expression yielding the query
+# text (tsvector) or the query's ``sparsevec`` (lexical). The lexical leg
+# orders by negative inner product ``<#>`` so the HNSW index serves it, and
+# drops rows sharing no token with the query.
+_SPARSE_HITS_SQL: dict[str, str] = {
+    "tsvector": """
+        SELECT c.id, ts_rank(c.content_tsv, plainto_tsquery('simple', {query})) AS ts
+        FROM chunks c
+        WHERE c.content_tsv @@ plainto_tsquery('simple', {query}) {lang_clause}
+        ORDER BY ts DESC
+        LIMIT :k_sparse
+    """,
+    "lexical": """
+        SELECT id, ts
+        FROM (
+            SELECT c.id, (c.sparse_embedding <#> {query}) * -1 AS ts
+            FROM chunks c
+            WHERE c.sparse_embedding IS NOT NULL {lang_clause}
+            ORDER BY c.sparse_embedding <#> {query}
+            LIMIT :k_sparse
+        ) AS lexical_hits
+        WHERE ts > 0
+    """,
+}
+
+# Query sparse vector of the single-query statements.
+_QUERY_SPARSE_PARAM = "CAST(:query_sparse AS sparsevec)"
+
+# Dense leg, sparse leg, RRF fusion and row hydration in a single statement.
+# ``{dense_hits}``, ``{sparse_hits}`` and ``{embedding_column}`` are fixed SQL
+# fragments chosen in code, never user input.
+_HYBRID_RRF_SQL = """
+WITH dense AS (
+    SELECT id, ROW_NUMBER() OVER (ORDER BY distance) AS rank
+    FROM ({dense_hits}) AS dense_hits
+),
+sparse AS (
+    SELECT id, ROW_NUMBER() OVER (ORDER BY ts DESC) AS rank
+    FROM ({sparse_hits}) AS sparse_hits
+),
+fused AS (
+    SELECT id, SUM(1.0 / (:rrf_k + rank)) AS score
+    FROM (
+        SELECT id, rank FROM dense
+        UNION ALL
+        SELECT id, rank FROM sparse
+    ) AS legs
+    GROUP BY id
+    ORDER BY score DESC
+    LIMIT :limit
+)
+SELECT c.id, c.document_id, c.content, c.source_path, c.metadata AS chunk_metadata, f.score
+       {embedding_column}
+FROM fused f
+JOIN chunks c ON c.id = f.id
+ORDER BY f.score DESC
+"""
+
+
+# Batched variant of ``_HYBRID_RRF_SQL``: the ``q`` CTE unnests one row per
+# query (vectors travel as pgvector text literals) and each leg runs as a
+# ``LATERAL`` subquery per row, so every query keeps its own index scan and
+# ``LIMIT``. Fusion and ranking are partitioned by the query ordinal.
+_MANY_LANG_CLAUSE = "AND (q.lang IS NULL OR c.language = q.lang)"
+_HYBRID_RRF_MANY_SQL = """
+WITH q AS (
+    SELECT u.ord, CAST(u.vec AS vector) AS query_vector, u.query, u.lang,
+           CAST(u.sparse AS sparsevec) AS query_sparse
+    FROM unnest(
+        CAST(:vectors AS text[]),
+        CAST(:queries AS text[]),
+        CAST(:langs AS text[]),
+        CAST(:sparse AS text[])
+    ) WITH ORDINALITY AS u(vec, query, lang, sparse, ord)
+),
+dense AS (
+    SELECT q.ord, d.id, ROW_NUMBER() OVER (PARTITION BY q.ord ORDER BY d.distance) AS rank
+    FROM q CROSS JOIN LATERAL ({dense_hits}) AS d
+),
+sparse AS (
+    SELECT q.ord, s.id, ROW_NUMBER() OVER (PARTITION BY q.ord ORDER BY s.ts DESC) AS rank
+    FROM q CROSS JOIN LATERAL ({sparse_hits}) AS s
+),
+fused AS (
+    SELECT ord, id, SUM(1.0 / (:rrf_k + rank)) AS score
+    FROM (
+        SELECT ord, id, rank FROM dense
+        UNION ALL
+        SELECT ord, id, rank FROM sparse
+    ) AS legs
+    GROUP BY ord, id
+),
+ranked AS (
+    SELECT ord, id, score, ROW_NUMBER() OVER (PARTITION BY ord ORDER BY score DESC) AS pos
+    FROM fused
+)
+SELECT r.ord, c.id, c.document_id, c.content, c.source_path, c.metadata AS chunk_metadata,
+       r.score {embedding_column}
+FROM ranked r
+JOIN chunks c ON c.id = r.id
+WHERE r.pos <= :limit
+ORDER BY r.ord, r.pos
+"""
+
+
+# Chunk writes go through asyncpg with pgvector's binary codecs, one record
+# per chunk in this column order (see ``_upsert_record``).
+_UPSERT_COLUMNS = [
+    "id",
+    "document_id",
+    "content",
+    "position",
+    "token_count",
+    "source_path",
+    "language",
+    "metadata",
+    "content_hash",
+    "sparse_embedding",
+    "embedding",
+]
+_UPSERT_SET_SQL = ", ".join(f"{col} = EXCLUDED.{col}" for col in _UPSERT_COLUMNS[2:])
+# ``upsert_mode="insert"``: one prepared statement run with ``executemany``.
+_INSERT_UPSERT_SQL = f"""
+INSERT INTO chunks ({", ".join(_UPSERT_COLUMNS)})
+VALUES ({", ".join(f"${i}" for i in range(1, len(_UPSERT_COLUMNS) + 1))})
+ON CONFLICT (id) DO UPDATE SET {_UPSERT_SET_SQL}
+"""
+# ``upsert_mode="copy"``: rows are streamed into a connection-local staging
+# table with binary COPY, then merged into ``chunks`` set-based.
+_STAGING_TABLE = "chunks_staging"
+_CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE {_STAGING_TABLE} (
+    id uuid NOT NULL,
+    document_id uuid NOT NULL,
+    content text NOT NULL,
+    position integer NOT NULL,
+    token_count integer NOT NULL,
+    source_path varchar(1024) NOT NULL,
+    language varchar(8) NOT NULL,
+    metadata jsonb NOT NULL,
+    content_hash varchar(64) NOT NULL,
+    sparse_embedding sparsevec({LEXICAL_DIMENSION}),
+    embedding vector({{dimension}})
+) ON COMMIT DROP
+"""
+_MERGE_STAGING_SQL = f"""
+INSERT INTO chunks ({", ".join(_UPSERT_COLUMNS)})
+SELECT {", ".join(_UPSERT_COLUMNS)} FROM {_STAGING_TABLE}
+ON CONFLICT (id) DO UPDATE SET {_UPSERT_SET_SQL}
+"""
 
 
 class PGVectorStore:
@@ -40,11 +294,22 @@ class PGVectorStore:
         """
         self._session_factory = session_factory
         self._settings = settings
+        self._dimension = embedding_dimension(settings.vector_store.sparse_mode)
 
     async def upsert(self, chunks: list[ChunkWithEmbedding]) -> int:
         """Insert or update chunks in the vector store.
 
-        Uses ``INSERT … ON CONFLICT (id) DO UPDATE`` for idempotent writes.
+        Writes go out in batches of ``vector_store.upsert_batch_size`` inside
+        one transaction, on a dedicated asyncpg connection with pgvector's
+        binary codecs, so embeddings travel as packed float4 arrays rather
+        than text. The connection is opened outside the session pool and
+        closed afterwards: once the codecs are installed, the text-bound
+        vector parameters of the search paths would fail on it.
+        ``vector_store.upsert_mode`` picks how each batch is sent:
+        ``"insert"`` runs one prepared ``INSERT … ON CONFLICT (id) DO UPDATE``
+        per chunk through ``executemany``; ``"copy"`` streams rows into a
+        temporary staging table with binary ``COPY`` and merges them into
+        ``chunks`` with one set-based ``INSERT … SELECT … ON CONFLICT``.
 
         Args:
             chunks: Chunks with precomputed embeddings to persist.
@@ -55,64 +320,109 @@ class PGVectorStore:
         if not chunks:
             return 0
 
-        rows = [
-            {
-                "id": c.id,
-                "document_id": c.document_id,
-                "content": c.content,
-                "position": c.position,
-                "token_count": c.token_count,
-                "embedding": c.embedding,
-            }
-            for c in chunks
+        start = time.perf_counter()
+        vs = self._settings.vector_store
+        batches = [
+            chunks[i : i + vs.upsert_batch_size]
+            for i in range(0, len(chunks), vs.upsert_batch_size)
         ]
-        stmt = pg_insert(ChunkORM).values(rows)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["id"],
-            set_={
-                "content": stmt.excluded.content,
-                "position": stmt.excluded.position,
-                "token_count": stmt.excluded.token_count,
-                "embedding": stmt.excluded.embedding,
-            },
-        )
+        async with _vector_connection(vs.database_url) as driver, driver.transaction():
+            if vs.upsert_mode == "copy":
+                await self._copy_upsert(driver, batches, self._dimension)
+            else:
+                await self._insert_upsert(driver, batches)
         async with self._session_factory() as session:
-            await session.execute(stmt)
-            await session.commit()
+            await self._bump_generation(session)
 
+        observe_histogram(
+            "vector_store_upsert_duration_seconds",
+            time.perf_counter() - start,
+            {"mode": vs.upsert_mode},
+        )
         return len(chunks)
 
+    @staticmethod
+    async def _insert_upsert(
+        driver: asyncpg.Connection,
+        batches: list[list[ChunkWithEmbedding]],
+    ) -> None:
+        """Write *batches* with a prepared ``INSERT … ON CONFLICT`` per chunk.
+
+        The statement runs through asyncpg's ``executemany`` in the caller's
+        transaction, bypassing the ORM's ``Vector`` type, which would render
+        every embedding as a ``[x1,x2,...]`` string.
+        """
+        for batch in batches:
+            await driver.executemany(_INSERT_UPSERT_SQL, [_upsert_record(c) for c in batch])
+
+    @staticmethod
+    async def _copy_upsert(
+        driver: asyncpg.Connection,
+        batches: list[list[ChunkWithEmbedding]],
+        dimension: int,
+    ) -> None:
+        """Bulk-load *batches* through a binary ``COPY`` staging table.
+
+        The staging table is created ``ON COMMIT DROP`` in the caller's
+        transaction, so staging, merge and commit are atomic.
+        """
+        await driver.execute(_CREATE_STAGING_SQL.format(dimension=dimension))
+        for batch in batches:
+            await driver.copy_records_to_table(
+                _STAGING_TABLE,
+                records=[_upsert_record(c) for c in batch],
+                columns=_UPSERT_COLUMNS,
+            )
+            await driver.execute(_MERGE_STAGING_SQL)
+            await driver.execute(f"TRUNCATE {_STAGING_TABLE}")
+
     @traced("vector_store.search")
     async def search(
         self,
-        query_vector: list[float],
+        query_vector: EmbeddingArray,
         top_k: int,
         filters: dict[str, str] | None = None,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
     ) -> list[RetrievedChunk]:
         """Perform HNSW ANN dense search using cosine distance.
 
+        With ``vector_store.embedding_quantization`` set to ``halfvec`` or
+        ``binary`` the search is two-phase: ``top_k * rescore_oversample``
+        candidates come from the compact expression index, then are re-ranked
+        by exact cosine distance on the full-precision embedding.
+
         Args:
             query_vector: Query embedding vector (1024-dim).
             top_k: Maximum number of results to return.
-            filters: Optional key-value filters; ``"language"`` filters by
-                the parent document's ISO 639-1 language code.
+            filters: Optional key-value filters; ``"language"`` filters on the
+                chunk's denormalized ISO 639-1 language code.
+            ef_search: Per-call ``hnsw.ef_search`` override; falls back to
+                ``vector_store.hnsw_ef_search``.
+            iterative_scan: Per-call ``hnsw.iterative_scan`` override; falls
+                back to ``vector_store.hnsw_iterative_scan``.
+            with_embeddings: Also select each chunk's stored embedding.
 
         Returns:
             List of retrieved chunks sorted by descending cosine similarity.
         """
         start = time.perf_counter()
+        vs = self._settings.vector_store
+        language = (filters or {}).get("language")
 
-        distance_expr = ChunkORM.embedding.cosine_distance(query_vector)
-        stmt = (
-            select(ChunkORM, DocumentORM.source_path, distance_expr.label("distance"))
-            .join(DocumentORM, ChunkORM.document_id == DocumentORM.id)
-            .order_by(distance_expr)
-            .limit(top_k)
-        )
-        if filters and filters.get("language"):
-            stmt = stmt.where(DocumentORM.language == filters["language"])
+        if vs.embedding_quantization == "none":
+            stmt = self._exact_search_stmt(query_vector, top_k, language, with_embeddings)
+            min_ef_search = None
+        else:
+            min_ef_search = top_k * vs.rescore_oversample
+            stmt = self._rescored_search_stmt(
+                query_vector, top_k, min_ef_search, language, with_embeddings
+            )
 
         async with self._session_factory() as session:
+            await self._apply_hnsw_params(session, ef_search, iterative_scan, min_ef_search)
             result = await session.execute(stmt)
             rows = result.all()
 
@@ -124,55 +434,203 @@ class PGVectorStore:
         inc_counter("vector_search_results_count", {"search_type": "dense"})
 
         return [
-            RetrievedChunk(
-                chunk_id=chunk_orm.id,
-                document_id=chunk_orm.document_id,
-                content=chunk_orm.content,
-                score=max(0.0, 1.0 - float(distance)),
-                source_path=source_path,
-                metadata={},
-            )
-            for chunk_orm, source_path, distance in rows
+            _row_to_chunk(row, max(0.0, 1.0 - float(row.distance)), with_embeddings) for row in rows
         ]
 
+    async def exact_search(
+        self,
+        query_vector: EmbeddingArray,
+        top_k: int,
+        filters: dict[str, str] | None = None,
+    ) -> list[RetrievedChunk]:
+        """Exact cosine search by sequential scan, the baseline for recall checks.
+
+        Index scans are disabled for the transaction, so every row's full
+        vector is compared whatever dense index exists.
+
+        Args:
+            query_vector: Query embedding vector.
+            top_k: Maximum number of results to return.
+            filters: Optional key-value filters; ``"language"`` supported.
+
+        Returns:
+            List of retrieved chunks sorted by descending cosine similarity.
+        """
+        stmt = self._exact_search_stmt(query_vector, top_k, (filters or {}).get("language"))
+        async with self._session_factory() as session:
+            await session.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+            result = await session.execute(stmt)
+            rows = result.all()
+        return [_row_to_chunk(row, max(0.0, 1.0 - float(row.distance))) for row in rows]
+
+    @staticmethod
+    def _exact_search_stmt(
+        query_vector: EmbeddingArray,
+        top_k: int,
+        language: str | None,
+        with_embeddings: bool = False,
+    ) -> Select[Any]:
+        """Build the single-phase search over the full-precision HNSW index."""
+        distance_expr = ChunkORM.embedding.cosine_distance(query_vector)
+        stmt = (
+            select(*_result_columns(with_embeddings), distance_expr.label("distance"))
+            .order_by(distance_expr)
+            .limit(top_k)
+        )
+        if language:
+            stmt = stmt.where(ChunkORM.language == literal(language, literal_execute=True))
+        return stmt
+
+    def _rescored_search_stmt(
+        self,
+        query_vector: EmbeddingArray,
+        top_k: int,
+        n_candidates: int,
+        language: str | None,
+        with_embeddings: bool = False,
+    ) -> Select[Any]:
+        """Build the two-phase search over a quantized expression index.
+
+        The inner query walks the compact ``halfvec`` / ``bit`` HNSW index for
+        ``n_candidates`` approximate neighbours; the outer query re-scores only
+        those rows with exact cosine distance on the full ``vector`` column,
+        which is read from the heap rather than from any index. The inner
+        ``LIMIT`` stops the planner from flattening the two phases together.
+        That column is also what *with_embeddings* passes on to the caller.
+        """
+        candidates = (
+            select(*_RESULT_COLUMNS, ChunkORM.embedding)
+            .order_by(self._approximate_distance(query_vector))
+            .limit(n_candidates)
+        )
+        if language:
+            candidates = candidates.where(
+                ChunkORM.language == literal(language, literal_execute=True)
+            )
+        sub = candidates.subquery("candidates")
+        distance_expr = sub.c.embedding.cosine_distance(query_vector)
+        return (
+            select(
+                *(sub.c[col.key].label(col.key) for col in _result_columns(with_embeddings)),
+                distance_expr.label("distance"),
+            )
+            .order_by(distance_expr)
+            .limit(top_k)
+        )
+
+    def _approximate_distance(self, query_vector: EmbeddingArray) -> ColumnElement[float]:
+        """Return the ordering expression matching the configured quantized index."""
+        distance: ColumnElement[float]
+        if self._settings.vector_store.embedding_quantization == "halfvec":
+            distance = func.cast(ChunkORM.embedding, HALFVEC(self._dimension)).cosine_distance(
+                query_vector
+            )
+        else:
+            # ``binary_quantize`` keeps the sign bit of each dimension; quantize
+            # the query the same way client-side and rank by Hamming distance.
+            query_bits = "".join("1" if x > 0 else "0" for x in query_vector)
+            distance = func.cast(
+                func.binary_quantize(ChunkORM.embedding), BIT(self._dimension)
+            ).hamming_distance(literal(query_bits, BIT(self._dimension)))
+        return distance
+
+    async def _apply_hnsw_params(
+        self,
+        session: AsyncSession,
+        ef_search: int | None,
+        iterative_scan: HnswIterativeScan | None,
+        min_ef_search: int | None = None,
+    ) -> None:
+        """Set HNSW scan GUCs for the current transaction only.
+
+        Uses ``set_config(..., is_local => true)`` — the parameterisable form
+        of ``SET LOCAL`` — so the values apply to the search statement that
+        follows on the same session and are discarded when the transaction
+        ends, never leaking onto the pooled connection. Nothing is sent when
+        both knobs resolve to the server defaults.
+
+        Args:
+            session: Session the search statement will run on.
+            ef_search: Per-call override of ``vector_store.hnsw_ef_search``.
+            iterative_scan: Per-call override of ``vector_store.hnsw_iterative_scan``.
+            min_ef_search: Lower bound for ``ef_search``. An HNSW scan returns
+                at most ``ef_search`` rows, so quantized searches raise it to
+                their candidate count (capped at pgvector's maximum of 1000).
+        """
+        vs = self._settings.vector_store
+        ef = ef_search if ef_search is not None else vs.hnsw_ef_search
+        scan = iterative_scan if iterative_scan is not None else vs.hnsw_iterative_scan
+        if min_ef_search is not None and (ef or _PG_DEFAULT_EF_SEARCH) < min_ef_search:
+            ef = min(min_ef_search, _MAX_EF_SEARCH)
+
+        clauses: list[str] = []
+        params: dict[str, object] = {}
+        if ef is not None:
+            clauses.append("set_config('hnsw.ef_search', :ef_search, true)")
+            params["ef_search"] = str(ef)
+        if scan != "off":
+            clauses.append("set_config('hnsw.iterative_scan', :iterative_scan, true)")
+            params["iterative_scan"] = scan
+        if clauses:
+            await session.execute(text("SELECT " + ", ".join(clauses)), params)
+
     async def _sparse_search(
         self,
         query_text: str,
         top_k: int,
         language: str | None,
+        query_sparse: SparseVector | None = None,
     ) -> list[tuple[UUID, float]]:
-        """Run PostgreSQL tsvector full-text search (BM25-ish via ts_rank).
+        """Run the sparse leg: tsvector full-text search, or lexical weights if given.
 
-        Uses ``plainto_tsquery`` with the ``simple`` dictionary so no stemming
-        is applied — consistent across all document languages.
+        Full-text search matches against the stored ``content_tsv`` generated
+        column, which is backed by a GIN index, so neither the match nor the
+        rank recomputes ``to_tsvector`` per row. ``plainto_tsquery`` uses the
+        ``simple`` dictionary so no stemming is applied — consistent across all
+        document languages and identical to the dictionary the column is built
+        with. With *query_sparse*, chunks are instead ranked by the inner
+        product of their stored BGE-M3 lexical weights with the query's.
 
         Args:
             query_text: Raw text to search.
             top_k: Maximum rows to return.
             language: Optional ISO 639-1 code; when set, restricts results to
-                chunks whose parent document matches that language.
+                chunks in that language.
+            query_sparse: Optional query lexical weights selecting the
+                ``sparsevec`` leg.
 
         Returns:
-            List of ``(chunk_id, ts_rank_score)`` pairs ordered by descending rank.
+            List of ``(chunk_id, score)`` pairs ordered by descending score.
         """
+        if query_sparse is not None:
+            raw_sql = text(
+                _SPARSE_HITS_SQL["lexical"].format(
+                    query=_QUERY_SPARSE_PARAM, lang_clause=_LANG_CLAUSE if language else ""
+                )
+            )
+            params: dict[str, object] = {
+                "query_sparse": _sparsevec_literal(query_sparse),
+                "k_sparse": top_k,
+            }
+            if language:
+                params["lang"] = language
+            async with self._session_factory() as session:
+                result = await session.execute(raw_sql, params)
+                return [(UUID(str(row.id)), float(row.ts)) for row in result]
+
         if language:
             raw_sql = text(
                 """
                 SELECT c.id,
-                       ts_rank(
-                           to_tsvector('simple', c.content),
-                           plainto_tsquery('simple', :query)
-                       ) AS rank
+                       ts_rank(c.content_tsv, plainto_tsquery('simple', :query)) AS rank
                 FROM chunks c
-                JOIN documents d ON c.document_id = d.id
-                WHERE to_tsvector('simple', c.content)
-                      @@ plainto_tsquery('simple', :query)
-                  AND d.language = :lang
+                WHERE c.content_tsv @@ plainto_tsquery('simple', :query)
+                  AND c.language = :lang
                 ORDER BY rank DESC
                 LIMIT :limit
                 """
             )
-            params: dict[str, object] = {
+            params = {
                 "query": query_text,
                 "limit": top_k,
                 "lang": language,
@@ -181,13 +639,9 @@ class PGVectorStore:
             raw_sql = text(
                 """
                 SELECT id,
-                       ts_rank(
-                           to_tsvector('simple', content),
-                           plainto_tsquery('simple', :query)
-                       ) AS rank
+                       ts_rank(content_tsv, plainto_tsquery('simple', :query)) AS rank
                 FROM chunks
-                WHERE to_tsvector('simple', content)
-                      @@ plainto_tsquery('simple', :query)
+                WHERE content_tsv @@ plainto_tsquery('simple', :query)
                 ORDER BY rank DESC
                 LIMIT :limit
                 """
@@ -198,11 +652,14 @@ class PGVectorStore:
             result = await session.execute(raw_sql, params)
             return [(UUID(str(row.id)), float(row.rank)) for row in result]
 
-    async def _fetch_chunks_by_ids(self, chunk_ids: list[UUID]) -> dict[UUID, RetrievedChunk]:
+    async def _fetch_chunks_by_ids(
+        self, chunk_ids: list[UUID], with_embeddings: bool = False
+    ) -> dict[UUID, RetrievedChunk]:
         """Fetch full chunk rows for a set of IDs (used to fill RRF gaps).
 
         Args:
             chunk_ids: Chunk UUIDs to fetch.
+            with_embeddings: Also select each chunk's stored embedding.
 
         Returns:
             Mapping of ``chunk_id → RetrievedChunk`` (score set to 0.0).
@@ -210,102 +667,449 @@ class PGVectorStore:
         if not chunk_ids:
             return {}
 
-        stmt = (
-            select(ChunkORM, DocumentORM.source_path)
-            .join(DocumentORM, ChunkORM.document_id == DocumentORM.id)
-            .where(ChunkORM.id.in_(chunk_ids))
-        )
+        stmt = select(*_result_columns(with_embeddings)).where(ChunkORM.id.in_(chunk_ids))
         async with self._session_factory() as session:
             result = await session.execute(stmt)
             rows = result.all()
 
-        return {
-            chunk_orm.id: RetrievedChunk(
-                chunk_id=chunk_orm.id,
-                document_id=chunk_orm.document_id,
-                content=chunk_orm.content,
-                score=0.0,
-                source_path=source_path,
-                metadata={},
-            )
-            for chunk_orm, source_path in rows
-        }
+        chunks = [_row_to_chunk(row, 0.0, with_embeddings) for row in rows]
+        return {c.chunk_id: c for c in chunks}
+
+    async def _sparse_search_chunks(
+        self,
+        query_text: str,
+        top_k: int,
+        language: str | None,
+        query_sparse: SparseVector | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Run the sparse leg and return hydrated rows instead of bare IDs.
+
+        Same ranking as :meth:`_sparse_search`, but the row data needed for
+        fusion comes back with the ranked IDs so sparse-only hits need no
+        follow-up fetch.
+
+        Args:
+            query_text: Raw text to search.
+            top_k: Maximum rows to return.
+            language: Optional ISO 639-1 code restricting the chunk language.
+            query_sparse: Optional query lexical weights selecting the
+                ``sparsevec`` leg.
+            with_embeddings: Also select each chunk's stored embedding.
+
+        Returns:
+            Chunks ordered by descending sparse score, ``score`` set to it.
+        """
+        lang_clause = _LANG_CLAUSE if language else ""
+        mode = "lexical" if query_sparse is not None else "tsvector"
+        hits = _SPARSE_HITS_SQL[mode].format(
+            query=_QUERY_SPARSE_PARAM if query_sparse is not None else ":query",
+            lang_clause=lang_clause,
+        )
+        embedding_column = _EMBEDDING_COLUMN if with_embeddings else ""
+        raw_sql = _typed_embedding(
+            text(
+                f"""
+                SELECT c.id, c.document_id, c.content, c.source_path,
+                       c.metadata AS chunk_metadata, h.ts AS rank {embedding_column}
+                FROM ({hits}) AS h
+                JOIN chunks c ON c.id = h.id
+                ORDER BY h.ts DESC
+                """
+            ),
+            with_embeddings,
+        )
+        params: dict[str, object] = {"k_sparse": top_k}
+        if query_sparse is not None:
+            params["query_sparse"] = _sparsevec_literal(query_sparse)
+        else:
+            params["query"] = query_text
+        if language:
+            params["lang"] = language
+
+        async with self._session_factory() as session:
+            result = await session.execute(raw_sql, params)
+            rows = result.all()
+
+        return [_row_to_chunk(row, float(row.rank), with_embeddings) for row in rows]
 
     @traced("vector_store.hybrid_search")
     async def hybrid_search(
         self,
-        query_vector: list[float],
+        query_vector: EmbeddingArray,
         query_text: str,
         top_k: int,
         filters: dict[str, str] | None = None,
+        *,
+        query_sparse: SparseVector | None = None,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
     ) -> list[RetrievedChunk]:
         """Dense + sparse search fused via Reciprocal Rank Fusion.
 
         Runs HNSW cosine-distance search and tsvector FTS independently,
         then combines scores using RRF (k=60):
         ``score = 1 / (60 + rank_dense) + 1 / (60 + rank_sparse)``.
+        With *query_sparse* the sparse leg ranks by BGE-M3 lexical weights on
+        the ``sparsevec`` HNSW index instead of full-text search.
+
+        ``vector_store.hybrid_mode`` selects how the legs execute:
+        ``"sequential"`` issues the dense, sparse and hydration queries one
+        after another and fuses in Python; ``"concurrent"`` runs the dense leg
+        and a self-hydrating sparse leg at once on separate pooled connections;
+        ``"sql"`` runs both legs and the fusion as a single CTE statement.
 
         Args:
             query_vector: Dense query embedding (1024-dim).
             query_text: Raw query text for full-text search.
             top_k: Final number of chunks to return after fusion.
             filters: Optional key-value filters; ``"language"`` key supported.
+            query_sparse: Optional query lexical weights for the sparse leg.
+            ef_search: Per-call ``hnsw.ef_search`` override for the dense leg.
+            iterative_scan: Per-call ``hnsw.iterative_scan`` override for the
+                dense leg.
+            with_embeddings: Select each chunk's stored embedding along with
+                its row, in the same queries.
 
         Returns:
             Re-ranked list of retrieved chunks with RRF score.
         """
         start = time.perf_counter()
-        vs = self._settings.vector_store
         language: str | None = (filters or {}).get("language")
 
-        dense_chunks = await self.search(
-            query_vector=query_vector,
-            top_k=vs.top_k_dense,
-            filters=filters,
-        )
-        sparse_pairs = await self._sparse_search(
-            query_text=query_text,
-            top_k=vs.top_k_sparse,
-            language=language,
+        mode = self._settings.vector_store.hybrid_mode
+        if mode == "sql":
+            results = await self._hybrid_search_sql(
+                query_vector,
+                query_text,
+                top_k,
+                language,
+                ef_search,
+                iterative_scan,
+                query_sparse,
+                with_embeddings,
+            )
+        elif mode == "concurrent":
+            results = await self._hybrid_search_concurrent(
+                query_vector,
+                query_text,
+                top_k,
+                filters,
+                ef_search,
+                iterative_scan,
+                query_sparse,
+                with_embeddings,
+            )
+        else:
+            results = await self._hybrid_search_sequential(
+                query_vector,
+                query_text,
+                top_k,
+                filters,
+                ef_search,
+                iterative_scan,
+                query_sparse,
+                with_embeddings,
+            )
+
+        observe_histogram(
+            "vector_search_duration_seconds",
+            time.perf_counter() - start,
+            {"search_type": "hybrid"},
         )
+        inc_counter("vector_search_results_count", {"search_type": "hybrid"})
 
-        rrf_scores: dict[UUID, float] = {}
-        chunk_data: dict[UUID, RetrievedChunk] = {}
+        return results
 
-        for rank, chunk in enumerate(dense_chunks, start=1):
-            cid = chunk.chunk_id
-            rrf_scores[cid] = rrf_scores.get(cid, 0.0) + 1.0 / (_RRF_K + rank)
-            chunk_data[cid] = chunk
+    async def _hybrid_search_sequential(
+        self,
+        query_vector: EmbeddingArray,
+        query_text: str,
+        top_k: int,
+        filters: dict[str, str] | None,
+        ef_search: int | None,
+        iterative_scan: HnswIterativeScan | None,
+        query_sparse: SparseVector | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Run dense, sparse and gap-filling queries in turn and fuse in Python."""
+        vs = self._settings.vector_store
+        language: str | None = (filters or {}).get("language")
 
+        dense_chunks = await self._timed_leg(
+            "dense",
+            self.search(
+                query_vector=query_vector,
+                top_k=vs.top_k_dense,
+                filters=filters,
+                ef_search=ef_search,
+                iterative_scan=iterative_scan,
+                with_embeddings=with_embeddings,
+            ),
+        )
+        sparse_pairs = await self._timed_leg(
+            "sparse",
+            self._sparse_search(
+                query_text=query_text,
+                top_k=vs.top_k_sparse,
+                language=language,
+                query_sparse=query_sparse,
+            ),
+        )
+
+        chunk_data = {c.chunk_id: c for c in dense_chunks}
         missing_ids = {cid for cid, _ in sparse_pairs} - set(chunk_data)
         if missing_ids:
-            fetched = await self._fetch_chunks_by_ids(list(missing_ids))
+            fetched = await self._fetch_chunks_by_ids(list(missing_ids), with_embeddings)
             chunk_data.update(fetched)
 
-        for rank, (cid, _) in enumerate(sparse_pairs, start=1):
-            rrf_scores[cid] = rrf_scores.get(cid, 0.0) + 1.0 / (_RRF_K + rank)
+        return rrf_fuse(
+            [[c.chunk_id for c in dense_chunks], [cid for cid, _ in sparse_pairs]],
+            chunk_data,
+            top_k,
+        )
+
+    async def _hybrid_search_concurrent(
+        self,
+        query_vector: EmbeddingArray,
+        query_text: str,
+        top_k: int,
+        filters: dict[str, str] | None,
+        ef_search: int | None,
+        iterative_scan: HnswIterativeScan | None,
+        query_sparse: SparseVector | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Run the dense and sparse legs concurrently and fuse in Python.
+
+        Each leg opens its own session, so the two queries execute on
+        separate pooled connections. The sparse leg returns full rows, which
+        removes the follow-up ``_fetch_chunks_by_ids`` round-trip: latency is
+        ``max(dense, sparse)`` instead of ``dense + sparse + hydration``.
+        """
+        vs = self._settings.vector_store
+        language: str | None = (filters or {}).get("language")
+
+        dense_chunks, sparse_chunks = await asyncio.gather(
+            self._timed_leg(
+                "dense",
+                self.search(
+                    query_vector=query_vector,
+                    top_k=vs.top_k_dense,
+                    filters=filters,
+                    ef_search=ef_search,
+                    iterative_scan=iterative_scan,
+                    with_embeddings=with_embeddings,
+                ),
+            ),
+            self._timed_leg(
+                "sparse",
+                self._sparse_search_chunks(
+                    query_text=query_text,
+                    top_k=vs.top_k_sparse,
+                    language=language,
+                    query_sparse=query_sparse,
+                    with_embeddings=with_embeddings,
+                ),
+            ),
+        )
+
+        chunk_data = {c.chunk_id: c for c in sparse_chunks}
+        chunk_data.update({c.chunk_id: c for c in dense_chunks})
+
+        return rrf_fuse(
+            [[c.chunk_id for c in dense_chunks], [c.chunk_id for c in sparse_chunks]],
+            chunk_data,
+            top_k,
+        )
+
+    @staticmethod
+    async def _timed_leg(leg: str, awaitable: Awaitable[_T]) -> _T:
+        """Await one hybrid-search leg and record its duration by ``leg`` label."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            observe_histogram(
+                "hybrid_search_leg_duration_seconds",
+                time.perf_counter() - start,
+                {"leg": leg},
+            )
+
+    async def _hybrid_search_sql(
+        self,
+        query_vector: EmbeddingArray,
+        query_text: str,
+        top_k: int,
+        language: str | None,
+        ef_search: int | None,
+        iterative_scan: HnswIterativeScan | None,
+        query_sparse: SparseVector | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Run dense top-k, sparse top-k, RRF and hydration in one statement.
+
+        Both legs rank inside their own CTE (the inner ``ORDER BY … LIMIT``
+        keeps the HNSW and GIN indexes usable), the ``fused`` CTE sums the
+        reciprocal ranks, and the final ``SELECT`` joins back to ``chunks``
+        for the winning rows only — one round-trip, one pooled
+        connection.
+
+        Args:
+            query_vector: Dense query embedding.
+            query_text: Raw query text for full-text search.
+            top_k: Final number of chunks to return after fusion.
+            language: Optional ISO 639-1 code restricting both legs.
+            ef_search: Per-call ``hnsw.ef_search`` override.
+            iterative_scan: Per-call ``hnsw.iterative_scan`` override.
+            query_sparse: Optional query lexical weights for the sparse leg.
+            with_embeddings: Also select each winning chunk's stored embedding.
+
+        Returns:
+            Fused chunks ordered by descending RRF score.
+        """
+        vs = self._settings.vector_store
+        lang_clause = _LANG_CLAUSE if language else ""
+        dense_hits = _DENSE_HITS_SQL[vs.embedding_quantization].format(
+            query_vector=_QUERY_VECTOR_PARAM, lang_clause=lang_clause, dimension=self._dimension
+        )
+        if query_sparse is not None:
+            sparse_hits = _SPARSE_HITS_SQL["lexical"].format(
+                query=_QUERY_SPARSE_PARAM, lang_clause=lang_clause
+            )
+        else:
+            sparse_hits = _SPARSE_HITS_SQL["tsvector"].format(
+                query=":query", lang_clause=lang_clause
+            )
+        stmt = text(
+            _HYBRID_RRF_SQL.format(
+                dense_hits=dense_hits,
+                sparse_hits=sparse_hits,
+                embedding_column=_EMBEDDING_COLUMN if with_embeddings else "",
+            )
+        )
+        stmt = stmt.bindparams(bindparam("query_vector", type_=ChunkORM.embedding.type))
+        if language:
+            stmt = stmt.bindparams(bindparam("lang", literal_execute=True))
+        params: dict[str, object] = {
+            "query_vector": query_vector,
+            "k_dense": vs.top_k_dense,
+            "k_sparse": vs.top_k_sparse,
+            "rrf_k": RRF_K,
+            "limit": top_k,
+        }
+        if query_sparse is not None:
+            params["query_sparse"] = _sparsevec_literal(query_sparse)
+        else:
+            params["query"] = query_text
+        if language:
+            params["lang"] = language
+        min_ef_search = None
+        if vs.embedding_quantization != "none":
+            min_ef_search = params["k_candidates"] = vs.top_k_dense * vs.rescore_oversample
+
+        async with self._session_factory() as session:
+            await self._apply_hnsw_params(session, ef_search, iterative_scan, min_ef_search)
+            result = await session.execute(_typed_embedding(stmt, with_embeddings), params)
+            rows = result.all()
+
+        return [_row_to_chunk(row, float(row.score), with_embeddings) for row in rows]
 
-        ranked = sorted(rrf_scores.items(), key=lambda kv: kv[1], reverse=True)[:top_k]
+    @traced("vector_store.hybrid_search_many")
+    async def hybrid_search_many(
+        self,
+        queries: list[HybridSearchQuery],
+        top_k: int,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
+    ) -> list[list[RetrievedChunk]]:
+        """Hybrid search for many queries with one statement per batch.
+
+        Queries are sent ``vector_store.hybrid_batch_size`` at a time; each
+        batch runs every dense leg, sparse leg and the per-query RRF fusion
+        server-side (see ``_HYBRID_RRF_MANY_SQL``), so N queries cost
+        ``ceil(N / hybrid_batch_size)`` round-trips instead of N. Ranking
+        matches :meth:`hybrid_search` in ``"sql"`` mode, except that the
+        language filter is evaluated per row and so cannot use the partial
+        per-language indexes. The lexical sparse leg is used when every query
+        carries ``query_sparse``; otherwise all of them use full-text search.
+
+        Args:
+            queries: Query embeddings, texts and optional ``"language"`` filters.
+            top_k: Number of chunks to return per query after fusion.
+            ef_search: Per-call ``hnsw.ef_search`` override for every dense leg.
+            iterative_scan: Per-call ``hnsw.iterative_scan`` override for every
+                dense leg.
+            with_embeddings: Also select each returned chunk's stored embedding.
+
+        Returns:
+            One fused, RRF-scored chunk list per query, in input order.
+        """
+        if not queries:
+            return []
+        start = time.perf_counter()
+        vs = self._settings.vector_store
+        dense_hits = _DENSE_HITS_SQL[vs.embedding_quantization].format(
+            query_vector="q.query_vector",
+            lang_clause=_MANY_LANG_CLAUSE,
+            dimension=self._dimension,
+        )
+        lexical = all(q.query_sparse is not None for q in queries)
+        sparse_hits = _SPARSE_HITS_SQL["lexical" if lexical else "tsvector"].format(
+            query="q.query_sparse" if lexical else "q.query", lang_clause=_MANY_LANG_CLAUSE
+        )
+        stmt = _typed_embedding(
+            text(
+                _HYBRID_RRF_MANY_SQL.format(
+                    dense_hits=dense_hits,
+                    sparse_hits=sparse_hits,
+                    embedding_column=_EMBEDDING_COLUMN if with_embeddings else "",
+                )
+            ),
+            with_embeddings,
+        )
+        min_ef_search = None
+        if vs.embedding_quantization != "none":
+            min_ef_search = vs.top_k_dense * vs.rescore_oversample
+
+        results: list[list[RetrievedChunk]] = [[] for _ in queries]
+        async with self._session_factory() as session:
+            await self._apply_hnsw_params(session, ef_search, iterative_scan, min_ef_search)
+            for offset in range(0, len(queries), vs.hybrid_batch_size):
+                batch = queries[offset : offset + vs.hybrid_batch_size]
+                params: dict[str, object] = {
+                    "vectors": [_vector_literal(q.query_vector) for q in batch],
+                    "queries": [q.query_text for q in batch],
+                    "langs": [q.filters.get("language") for q in batch],
+                    "sparse": [
+                        _sparsevec_literal(q.query_sparse) if lexical else None for q in batch
+                    ],
+                    "k_dense": vs.top_k_dense,
+                    "k_sparse": vs.top_k_sparse,
+                    "rrf_k": RRF_K,
+                    "limit": top_k,
+                }
+                if min_ef_search is not None:
+                    params["k_candidates"] = min_ef_search
+                result = await session.execute(stmt, params)
+                for row in result.all():
+                    results[offset + int(row.ord) - 1].append(
+                        _row_to_chunk(row, float(row.score), with_embeddings)
+                    )
 
         observe_histogram(
             "vector_search_duration_seconds",
             time.perf_counter() - start,
-            {"search_type": "hybrid"},
+            {"search_type": "hybrid_many"},
         )
-        inc_counter("vector_search_results_count", {"search_type": "hybrid"})
+        inc_counter("vector_search_results_count", {"search_type": "hybrid_many"})
+        return results
 
-        return [
-            RetrievedChunk(
-                chunk_id=cid,
-                document_id=chunk_data[cid].document_id,
-                content=chunk_data[cid].content,
-                score=rrf_score,
-                source_path=chunk_data[cid].source_path,
-                metadata=chunk_data[cid].metadata,
-            )
-            for cid, rrf_score in ranked
-            if cid in chunk_data
-        ]
+    async def flush(self) -> None:
+        """No-op: every write commits its own transaction."""
 
     async def delete_by_document(self, document_id: UUID) -> int:
         """Delete all chunks belonging to a document.
@@ -320,7 +1124,10 @@ class PGVectorStore:
         async with self._session_factory() as session:
             result = await session.execute(stmt)
             await session.commit()
-        return result.rowcount or 0  # type: ignore[attr-defined]
+            deleted: int = result.rowcount or 0  # type: ignore[attr-defined]
+            if deleted:
+                await self._bump_generation(session)
+        return deleted
 
     async def delete(self, chunk_ids: list[UUID]) -> None:
         """Delete specific chunks by ID.
@@ -334,6 +1141,84 @@ class PGVectorStore:
         async with self._session_factory() as session:
             await session.execute(stmt)
             await session.commit()
+            await self._bump_generation(session)
+
+    async def reposition(self, positions: dict[UUID, int]) -> None:
+        """Update the position of stored chunks in one bulk ``UPDATE`` by primary key.
+
+        Args:
+            positions: New position per chunk ID.
+        """
+        if not positions:
+            return
+        async with self._session_factory() as session:
+            await session.execute(
+                update(ChunkORM),
+                [{"id": chunk_id, "position": pos} for chunk_id, pos in positions.items()],
+            )
+            await session.commit()
+            await self._bump_generation(session)
+
+    async def contents(self, chunk_ids: list[UUID]) -> dict[UUID, str]:
+        """Fetch the stored content of *chunk_ids* in one primary-key lookup.
+
+        Args:
+            chunk_ids: Chunk UUIDs, typically rows about to be replaced or deleted.
+
+        Returns:
+            Mapping of the IDs still stored to their content.
+        """
+        if not chunk_ids:
+            return {}
+        stmt = select(ChunkORM.id, ChunkORM.content).where(ChunkORM.id.in_(chunk_ids))
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            return {UUID(str(row.id)): row.content for row in result}
+
+    async def chunk_hashes(self, document_id: UUID) -> list[StoredChunkHash]:
+        """Return the stored ID, position and content hash of a document's chunks.
+
+        Args:
+            document_id: UUID of the parent document.
+
+        Returns:
+            One entry per stored chunk, ordered by position.
+        """
+        stmt = (
+            select(ChunkORM.id, ChunkORM.position, ChunkORM.content_hash)
+            .where(ChunkORM.document_id == document_id)
+            .order_by(ChunkORM.position)
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            return [
+                StoredChunkHash(id=row.id, position=row.position, content_hash=row.content_hash)
+                for row in result
+            ]
+
+    async def generation(self) -> int:
+        """Return the current corpus generation.
+
+        Reads ``corpus_generation_seq`` without advancing it; the value is
+        shared by every process using the database.
+
+        Returns:
+            Monotonically increasing generation number.
+        """
+        stmt = text("SELECT last_value FROM corpus_generation_seq")
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            return int(result.scalar_one())
+
+    @staticmethod
+    async def _bump_generation(session: AsyncSession) -> None:
+        """Advance the corpus generation once the write is committed.
+
+        Runs after ``commit`` on purpose: a reader that sees the new value
+        also sees the new rows, so no stale result is cached under it.
+        """
+        await session.execute(select(corpus_generation_seq.next_value()))
+        await session.commit()
 
     async def count(self) -> int:
         """Return total number of chunks stored.
@@ -345,3 +1230,81 @@ class PGVectorStore:
         async with self._session_factory() as session:
             result = await session.execute(stmt)
             return result.scalar_one()
+
+
+@asynccontextmanager
+async def _vector_connection(database_url: str) -> AsyncIterator[asyncpg.Connection]:
+    """Open an unpooled asyncpg connection with pgvector's binary codecs, then close it.
+
+    The codecs stay installed for the connection's lifetime and reject the
+    text the ORM binds vectors as, so they must never reach a pooled one.
+    """
+    url = make_url(database_url).set(drivername="postgresql")
+    driver = await asyncpg.connect(url.render_as_string(hide_password=False))
+    try:
+        await register_vector(driver)
+        yield driver
+    finally:
+        await driver.close()
+
+
+def _upsert_record(chunk: ChunkWithEmbedding) -> tuple[Any, ...]:
+    """Return *chunk* as a driver-level record in ``_UPSERT_COLUMNS`` order."""
+    return (
+        chunk.id,
+        chunk.document_id,
+        chunk.content,
+        chunk.position,
+        chunk.token_count,
+        chunk.source_path,
+        chunk.language,
+        json.dumps(chunk.metadata),
+        chunk.content_hash,
+        _to_pg_sparse(chunk.sparse_embedding),
+        chunk.embedding,
+    )
+
+
+def _vector_literal(vector: EmbeddingArray) -> str:
+    """Render *vector* in pgvector's text input format (``[x1,x2,...]``)."""
+    return "[" + ",".join(map(str, vector)) + "]"
+
+
+def _to_pg_sparse(weights: SparseVector | None) -> PgSparseVector | None:
+    """Wrap lexical weights for pgvector's ``sparsevec`` codecs (None stays NULL)."""
+    if weights is None:
+        return None
+    return PgSparseVector(weights, LEXICAL_DIMENSION)
+
+
+def _sparsevec_literal(weights: SparseVector | None) -> str | None:
+    """Render *weights* in pgvector's ``sparsevec`` text format (``{i:w,...}/dim``)."""
+    sparse = _to_pg_sparse(weights)
+    return sparse.to_text() if sparse is not None else None
+
+
+def _result_columns(with_embeddings: bool) -> tuple[Any, ...]:
+    """Return :data:`_RESULT_COLUMNS`, plus the embedding column when requested."""
+    return (*_RESULT_COLUMNS, ChunkORM.embedding) if with_embeddings else _RESULT_COLUMNS
+
+
+def _typed_embedding(stmt: TextClause, with_embeddings: bool) -> Executable:
+    """Type a raw statement's ``embedding`` result column so rows hold vectors, not text."""
+    return stmt.columns(embedding=ChunkORM.embedding.type) if with_embeddings else stmt
+
+
+def _row_to_chunk(
+    row: Any,  # noqa: ANN401
+    score: float,
+    with_embedding: bool = False,
+) -> RetrievedChunk:
+    """Build a :class:`RetrievedChunk` from a ``chunks`` result row."""
+    return RetrievedChunk(
+        chunk_id=UUID(str(row.id)),
+        document_id=UUID(str(row.document_id)),
+        content=row.content,
+        score=score,
+        source_path=row.source_path,
+        metadata=row.chunk_metadata or {},
+        embedding=row.embedding if with_embedding else None,
+    )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
 from src.infrastructure.reranking.bge_reranker import BGEReranker
+from src.infrastructure.reranking.cascade import CascadeReranker
+from src.infrastructure.reranking.colbert_reranker import ColBERTReranker
 
-__all__ = ["BGEReranker"]
+__all__ = ["BGEReranker", "CascadeReranker", "ColBERTReranker"]
@@ -0,0 +1,163 @@
+"""Cross-request pair batching for the cross-encoder — merges concurrent reranks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Protocol
+
+import structlog
+
+from src.shared.batching import plan_token_batches
+from src.shared.metrics import observe_histogram, set_gauge
+
+__all__ = ["PairBatcher", "PairScorer"]
+
+log = structlog.get_logger(__name__)
+
+
+class PairScorer(Protocol):
+    """Synchronous cross-encoder over (query, passage) pairs; ``BGEReranker`` satisfies it."""
+
+    def pair_lengths(self, pairs: list[list[str]]) -> list[int]:
+        """Return the truncated token length of every pair."""
+        ...
+
+    def score_batch(self, pairs: list[list[str]]) -> list[float]:
+        """Score *pairs* in one blocking forward pass."""
+        ...
+
+
+@dataclass(eq=False)
+class _Pending:
+    pair: list[str]
+    future: asyncio.Future[float]
+    enqueued: float
+    # 0 until the pair has been tokenized by a pass.
+    tokens: int = 0
+
+
+class PairBatcher:
+    """Merges the pairs of concurrent rerank requests into shared forward passes.
+
+    Every :meth:`score` call enqueues its pairs and awaits per-pair futures. A
+    pass starts ``max_wait_ms`` after the first pair arrived, as soon as the
+    queue could fill ``max_batch_tokens`` even at ``max_length`` tokens per
+    pair, or right after the previous pass. Each pass tokenizes the queued
+    pairs it has not seen yet, packs them into length-homogeneous batches
+    under the padded-token budget (:func:`plan_token_batches`) and scores the
+    batch holding the oldest pair; the rest wait for the next pass, so no
+    request starves. Only one pass runs at a time.
+
+    Emits ``reranker_batcher_queue_wait_seconds`` (histogram, per pair),
+    ``reranker_batcher_batch_pairs`` and ``reranker_batcher_batch_occupancy``
+    (histograms, padded tokens over the budget) and
+    ``reranker_batcher_queue_depth`` (gauge).
+
+    Args:
+        scorer: Cross-encoder exposing blocking ``pair_lengths`` / ``score_batch``.
+        max_batch_tokens: Padded-token budget per forward pass.
+        max_wait_ms: How long the first queued pair waits for company.
+        max_length: Token cap per pair, used to tell when the queue is full.
+    """
+
+    def __init__(
+        self,
+        scorer: PairScorer,
+        max_batch_tokens: int,
+        max_wait_ms: float,
+        max_length: int,
+    ) -> None:
+        self._scorer = scorer
+        self._max_batch_tokens = max_batch_tokens
+        self._max_wait = max_wait_ms / 1000
+        self._max_length = max_length
+        self._queue: list[_Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def score(self, pairs: list[list[str]]) -> list[float]:
+        """Score *pairs* as part of whichever passes they are merged into.
+
+        Args:
+            pairs: ``[query, passage]`` pairs of one request.
+
+        Returns:
+            One score per pair, in order.
+        """
+        if not pairs:
+            return []
+        loop = asyncio.get_running_loop()
+        now = time.perf_counter()
+        items = [_Pending(pair, loop.create_future(), now) for pair in pairs]
+        self._queue.extend(items)
+        set_gauge("reranker_batcher_queue_depth", float(len(self._queue)))
+
+        if len(self._queue) * self._max_length >= self._max_batch_tokens:
+            self._dispatch()
+        elif self._timer is None and not self._in_flight:
+            self._timer = loop.call_later(self._max_wait, self._dispatch)
+        return list(await asyncio.gather(*(item.future for item in items)))
+
+    def _dispatch(self) -> None:
+        """Start a pass over the pairs queued so far."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._in_flight:
+            return
+        self._queue = [item for item in self._queue if not item.future.cancelled()]
+        set_gauge("reranker_batcher_queue_depth", float(len(self._queue)))
+        if not self._queue:
+            return
+
+        self._in_flight = True
+        task = asyncio.get_running_loop().create_task(self._run(list(self._queue)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _sync_pass(
+        self, pairs: list[list[str]], lengths: list[int]
+    ) -> tuple[list[int], list[int], list[float]]:
+        """Tokenize unseen pairs, then score the budgeted batch holding the oldest one."""
+        unseen = [i for i, n in enumerate(lengths) if not n]
+        if unseen:
+            measured = self._scorer.pair_lengths([pairs[i] for i in unseen])
+            for i, n in zip(unseen, measured, strict=True):
+                lengths[i] = n
+        batch = next(b for b in plan_token_batches(lengths, self._max_batch_tokens) if 0 in b)
+        return lengths, batch, self._scorer.score_batch([pairs[i] for i in batch])
+
+    async def _run(self, snapshot: list[_Pending]) -> None:
+        started = time.perf_counter()
+        try:
+            lengths, batch, scores = await asyncio.to_thread(
+                self._sync_pass, [item.pair for item in snapshot], [i.tokens for i in snapshot]
+            )
+        except Exception as exc:
+            log.warning("pair_batcher.pass_failed", pairs=len(snapshot), error=str(exc))
+            failed = set(snapshot)
+            self._queue = [item for item in self._queue if item not in failed]
+            for item in snapshot:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+        else:
+            for item, tokens in zip(snapshot, lengths, strict=True):
+                item.tokens = tokens
+            done = [snapshot[i] for i in batch]
+            finished = set(done)
+            padded = len(batch) * max(lengths[i] for i in batch)
+            observe_histogram("reranker_batcher_batch_pairs", float(len(batch)))
+            observe_histogram(
+                "reranker_batcher_batch_occupancy", min(1.0, padded / self._max_batch_tokens)
+            )
+            self._queue = [item for item in self._queue if item not in finished]
+            for item, score in zip(done, scores, strict=True):
+                observe_histogram("reranker_batcher_queue_wait_seconds", started - item.enqueued)
+                if not item.future.done():
+                    item.future.set_result(score)
+        finally:
+            self._in_flight = False
+            self._dispatch()
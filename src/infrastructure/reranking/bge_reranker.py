@@ -9,6 +9,10 @@ import structlog
 
 from src.config.settings import Settings
 from src.domain.ports.dto import RerankRequest, RetrievedChunk
+from src.infrastructure.cache.rerank_score_cache import RerankScoreCache, ScoreKey
+from src.infrastructure.reranking.batching import PairBatcher
+from src.infrastructure.reranking.onnx_runtime import load_cross_encoder
+from src.shared.batching import run_length_bucketed
 from src.shared.metrics import observe_histogram, set_gauge
 from src.shared.tracing import traced
 
@@ -20,38 +24,60 @@ log = structlog.get_logger(__name__)
 class BGEReranker:
     """BGE-Reranker-v2-m3 cross-encoder reranker adapter implementing RerankerPort.
 
-    Loads the FlagReranker model lazily (on first rerank call) using thread-safe
-    double-checked locking. All inference runs CPU-only (use_fp16=False) inside
-    asyncio.to_thread to avoid blocking the event loop.
+    Loads the model lazily (on first rerank call) using thread-safe
+    double-checked locking: FlagReranker for ``reranker.backend="torch"``, an
+    ONNX Runtime (optionally int8-quantized) CrossEncoder for ``"onnx"``. All
+    inference runs CPU-only (use_fp16=False) inside asyncio.to_thread to avoid
+    blocking the event loop, on pairs truncated to ``reranker.max_length``
+    tokens. With a :class:`RerankScoreCache`, only pairs without a cached
+    score reach the model. With ``reranker.batching_enabled``, those pairs go
+    through a :class:`PairBatcher` that merges them with the pairs of
+    concurrent requests into shared forward passes.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, score_cache: RerankScoreCache | None = None) -> None:
         """Store settings; model is NOT loaded at construction time.
 
         Args:
             settings: Application settings providing reranker configuration.
+            score_cache: Optional cache of scores of pairs seen before.
         """
         self._settings = settings
+        self._score_cache = score_cache
         self._model: Any = None
         self._lock = threading.Lock()
         self._inference_lock = threading.Lock()
+        rs = settings.reranker
+        self._batcher = (
+            PairBatcher(self, rs.batching_max_tokens, rs.batching_max_wait_ms, rs.max_length)
+            if rs.batching_enabled
+            else None
+        )
 
     def _ensure_model_loaded(self) -> None:
-        """Load FlagReranker thread-safely via double-checked locking.
+        """Load the cross-encoder thread-safely via double-checked locking.
 
-        Imports FlagEmbedding and creates the model instance on the very first
-        call. Subsequent calls return immediately without acquiring the lock.
+        Imports FlagEmbedding (or exports/loads the ONNX model) and creates the
+        model instance on the very first call. Subsequent calls return
+        immediately without acquiring the lock.
         """
         if self._model is not None:
             return
         with self._lock:
             if self._model is not None:
                 return
-            from FlagEmbedding import FlagReranker
+            reranker = self._settings.reranker
+            if reranker.backend == "onnx":
+                self._model = load_cross_encoder(self._settings)
+            else:
+                from FlagEmbedding import FlagReranker
+
+                self._model = FlagReranker(reranker.model, use_fp16=False)
+            log.info("bge_reranker.model_loaded", model=reranker.model, backend=reranker.backend)
 
-            model_id = self._settings.reranker.model
-            self._model = FlagReranker(model_id, use_fp16=False)
-            log.info("bge_reranker.model_loaded", model=model_id)
+    async def warm_up(self) -> None:
+        """Load the model ahead of the first request."""
+        await asyncio.to_thread(self._ensure_model_loaded)
 
     @traced("reranker.rerank")
     async def rerank(self, request: RerankRequest) -> list[RetrievedChunk]:
@@ -69,7 +95,10 @@ class BGEReranker:
         start = time.perf_counter()
         set_gauge("reranker_candidates_count", float(len(request.chunks)))
 
-        result = await asyncio.to_thread(self._sync_rerank, request)
+        if self._batcher is None:
+            result = await asyncio.to_thread(self._sync_rerank, request)
+        else:
+            result = await self._batched_rerank(request, self._batcher)
 
         duration = time.perf_counter() - start
         observe_histogram("reranker_request_duration_seconds", duration)
@@ -90,6 +119,9 @@ class BGEReranker:
 
         Runs inside a thread-pool worker (via asyncio.to_thread). Handles the
         edge case where compute_score returns a bare float for a single pair.
+        With ``reranker.max_batch_tokens`` set, pairs are scored in
+        length-bucketed batches under that padded-token budget. Pairs found
+        in the score cache are not sent to the model.
 
         Args:
             request: Query, candidate chunks, and desired top_k cutoff.
@@ -100,16 +132,43 @@ class BGEReranker:
         if not request.chunks:
             return []
 
-        self._ensure_model_loaded()
+        keys, scores = self._cached_scores(request)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        fresh = self._score_all([[request.query, request.chunks[i].content] for i in missing])
+        return self._select(request, keys, scores, dict(zip(missing, fresh, strict=True)))
 
-        pairs = [[request.query, chunk.content] for chunk in request.chunks]
-        with self._inference_lock:
-            raw: list[float] | float = self._model.compute_score(
-                pairs,
-                batch_size=self._settings.reranker.batch_size,
-                normalize=True,
-            )
-        scores: list[float] = [raw] if isinstance(raw, float) else raw
+    async def _batched_rerank(
+        self, request: RerankRequest, batcher: PairBatcher
+    ) -> list[RetrievedChunk]:
+        """Score the uncached pairs through the cross-request batcher and sort results."""
+        if not request.chunks:
+            return []
+
+        keys, scores = self._cached_scores(request)
+        missing = [i for i, score in enumerate(scores) if score is None]
+        observe_histogram("reranker_pairs_scored", float(len(missing)))
+        fresh = await batcher.score([[request.query, request.chunks[i].content] for i in missing])
+        return self._select(request, keys, scores, dict(zip(missing, fresh, strict=True)))
+
+    def _cached_scores(self, request: RerankRequest) -> tuple[list[ScoreKey], list[float | None]]:
+        """Return the score-cache keys of the pairs and their cached scores, if any."""
+        if self._score_cache is None:
+            return [], [None] * len(request.chunks)
+        keys = self._score_cache.keys(self._settings.reranker.model, request.query, request.chunks)
+        cached = self._score_cache.get_many(keys)
+        return keys, [cached.get(key) for key in keys]
+
+    def _select(
+        self,
+        request: RerankRequest,
+        keys: list[ScoreKey],
+        cached: list[float | None],
+        fresh: dict[int, float],
+    ) -> list[RetrievedChunk]:
+        """Cache the *fresh* scores and return the top-k chunks above the threshold."""
+        if self._score_cache is not None:
+            self._score_cache.put_many((keys[i], score) for i, score in fresh.items())
+        scores = [fresh[i] if score is None else score for i, score in enumerate(cached)]
 
         scored = sorted(
             zip(scores, request.chunks, strict=True),
@@ -123,3 +182,59 @@ class BGEReranker:
         # generate node can emit a graceful "not found" reply without an LLM call.
         top = above[: request.top_k]
         return [chunk.model_copy(update={"score": score}) for score, chunk in top]
+
+    def _score_all(self, pairs: list[list[str]]) -> list[float]:
+        """Score *pairs* in retrieval order, or length-bucketed under the token budget."""
+        observe_histogram("reranker_pairs_scored", float(len(pairs)))
+        if not pairs:
+            return []
+        self._ensure_model_loaded()
+        max_batch_tokens = self._settings.reranker.max_batch_tokens
+        with self._inference_lock:
+            if max_batch_tokens:
+                return run_length_bucketed(
+                    pairs,
+                    self._pair_lengths(pairs),
+                    max_batch_tokens,
+                    self._score_pairs,
+                    "reranker",
+                )
+            return self._score_pairs(pairs, self._settings.reranker.batch_size)
+
+    def pair_lengths(self, pairs: list[list[str]]) -> list[int]:
+        """Return the truncated token length of every pair (blocking; for the batcher)."""
+        self._ensure_model_loaded()
+        with self._inference_lock:
+            return self._pair_lengths(pairs)
+
+    def score_batch(self, pairs: list[list[str]]) -> list[float]:
+        """Score *pairs* in one forward pass (blocking; for the batcher)."""
+        self._ensure_model_loaded()
+        with self._inference_lock:
+            return self._score_pairs(pairs)
+
+    def _pair_lengths(self, pairs: list[list[str]]) -> list[int]:
+        """Return the truncated token length of every (query, passage) pair."""
+        encoded = self._model.tokenizer(
+            [query for query, _ in pairs],
+            [passage for _, passage in pairs],
+            truncation=True,
+            max_length=self._settings.reranker.max_length,
+        )
+        return [len(ids) for ids in encoded["input_ids"]]
+
+    def _score_pairs(self, pairs: list[list[str]], batch_size: int = 0) -> list[float]:
+        """Score *pairs* with the cross-encoder; a single pair yields a bare float."""
+        reranker = self._settings.reranker
+        if reranker.backend == "onnx":
+            scores = self._model.predict(
+                pairs, batch_size=batch_size or len(pairs), convert_to_numpy=True
+            )
+            return [float(s) for s in scores]
+        raw: list[float] | float = self._model.compute_score(
+            pairs,
+            batch_size=batch_size or len(pairs),
+            max_length=reranker.max_length,
+            normalize=True,
+        )
+        return [raw] if isinstance(raw, float) else raw
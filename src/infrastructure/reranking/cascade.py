@@ -0,0 +1,108 @@
+"""Cascade reranker — first-stage candidate pruning in front of an expensive reranker."""
+
+from __future__ import annotations
+
+import structlog
+
+from src.config.settings import Settings
+from src.domain.ports.dto import RerankRequest, RetrievedChunk
+from src.domain.ports.reranker import RerankerPort
+from src.shared.metrics import inc_counter, observe_histogram
+from src.shared.tracing import traced
+
+__all__ = ["CascadeReranker", "plan_cascade"]
+
+log = structlog.get_logger(__name__)
+
+
+def plan_cascade(
+    scores: list[float],
+    top_k: int,
+    max_candidates: int,
+    exit_margin: float,
+) -> tuple[int, int]:
+    """Split candidates, sorted by first-stage score, into head, middle and tail.
+
+    A candidate belongs to the head when its score beats the best candidate
+    outside the top-k by at least ``exit_margin`` of the top score: no
+    reordering of the rest is expected to push it out. The middle is
+    everything after the head up to ``max_candidates``; the tail beyond it is
+    pruned.
+
+    Args:
+        scores: First-stage scores, descending.
+        top_k: Number of results wanted.
+        max_candidates: Most candidates (head included) kept past the first stage.
+        exit_margin: Required lead over the first excluded candidate, as a
+            fraction of the top score.
+
+    Returns:
+        ``(head, end)`` — candidates ``[0, head)`` are clear winners and
+        ``[head, end)`` still compete for the remaining slots.
+    """
+    end = min(len(scores), max(max_candidates, top_k))
+    if len(scores) <= top_k or scores[0] <= 0:
+        return 0, end
+    bar = scores[top_k] + exit_margin * scores[0]
+    head = 0
+    while head < top_k and scores[head] >= bar:
+        head += 1
+    return head, end
+
+
+class CascadeReranker:
+    """RerankerPort that prunes the candidates an expensive reranker has to score.
+
+    Candidates are ranked by the score they arrive with (the hybrid search's
+    RRF score) and those below ``reranker.cascade_max_candidates`` are
+    dropped. When the whole top-k is clearly ahead of the rest (see
+    :func:`plan_cascade`) only those top-k go on; this early exit spares the
+    scoring of every other candidate. Whatever is left is reranked by
+    *inner*, so every returned chunk carries an *inner* score and has passed
+    its minimum-score threshold.
+
+    Emits ``reranker_cascade_candidates{stage}`` (histogram of head /
+    scored / pruned sizes per request) and ``reranker_cascade_early_exits``.
+
+    Args:
+        inner: The expensive reranker (cross-encoder or ColBERT).
+        settings: Application settings providing the cascade policy.
+    """
+
+    def __init__(self, inner: RerankerPort, settings: Settings) -> None:
+        self._inner = inner
+        self._settings = settings
+
+    async def warm_up(self) -> None:
+        """Load the inner reranker's model ahead of the first request."""
+        await self._inner.warm_up()
+
+    @traced("reranker.cascade_rerank")
+    async def rerank(self, request: RerankRequest) -> list[RetrievedChunk]:
+        """Rerank via the cascade and return at most ``request.top_k`` chunks.
+
+        Args:
+            request: Query, candidate chunks, and desired top_k cutoff.
+
+        Returns:
+            The inner reranker's picks among the candidates that survive
+            pruning, with its scores.
+        """
+        rs = self._settings.reranker
+        ranked = sorted(request.chunks, key=lambda c: c.score, reverse=True)
+        head, end = plan_cascade(
+            [c.score for c in ranked],
+            request.top_k,
+            rs.cascade_max_candidates,
+            rs.cascade_exit_margin,
+        )
+        if head >= request.top_k:
+            inc_counter("reranker_cascade_early_exits")
+            log.debug("cascade_reranker.early_exit", candidates=len(ranked), top_k=request.top_k)
+            end = head
+        for stage, size in (("head", head), ("scored", end), ("pruned", len(ranked) - end)):
+            observe_histogram("reranker_cascade_candidates", float(size), {"stage": stage})
+
+        return await self._inner.rerank(
+            RerankRequest(query=request.query, chunks=ranked[:end], top_k=request.top_k)
+        )
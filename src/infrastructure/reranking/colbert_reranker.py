@@ -0,0 +1,208 @@
+"""ColBERT late-interaction reranker — MaxSim over precomputed BGE-M3 token vectors."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+
+from src.config.settings import Settings
+from src.domain.ports.dto import RerankRequest, RetrievedChunk
+from src.infrastructure.reranking.token_store import TokenVectorStore
+from src.shared.metrics import inc_counter, observe_histogram, set_gauge
+from src.shared.tracing import traced
+
+__all__ = ["ColBERTReranker", "maxsim_scores", "passage_key"]
+
+log = structlog.get_logger(__name__)
+
+_DIMENSION = 1024
+# Passages and queries are truncated to this many tokens (the cross-encoder default).
+_MAX_LENGTH = 512
+
+_FloatMatrix = npt.NDArray[np.float32]
+
+
+def passage_key(passage: str) -> str:
+    """Content address of a passage in the token store."""
+    return hashlib.sha256(passage.encode("utf-8")).hexdigest()
+
+
+def maxsim_scores(query: npt.ArrayLike, passages: Sequence[npt.ArrayLike]) -> _FloatMatrix:
+    """Score passages against a query by ColBERT MaxSim, in one matrix product.
+
+    Every passage's token vectors are concatenated into one matrix, so the
+    query/passage token similarities of all candidates come from a single
+    ``(query tokens, total passage tokens)`` product; ``np.maximum.reduceat``
+    then takes each query token's best match within every passage.
+
+    Args:
+        query: ``(query tokens, dim)`` normalized token vectors.
+        passages: ``(passage tokens, dim)`` normalized token vectors per passage.
+
+    Returns:
+        ``(len(passages),)`` mean over query tokens of the best passage-token
+        similarity; 0.0 for passages without tokens.
+    """
+    q = np.asarray(query, dtype=np.float32)
+    matrices = [np.asarray(p, dtype=np.float32).reshape(-1, q.shape[1]) for p in passages]
+    scores = np.zeros(len(matrices), dtype=np.float32)
+    present = [i for i, m in enumerate(matrices) if len(m)]
+    if not present or not len(q):
+        return scores
+    tokens = np.concatenate([matrices[i] for i in present])
+    offsets = np.cumsum([0] + [len(matrices[i]) for i in present[:-1]])
+    similarities = q @ tokens.T
+    scores[present] = np.maximum.reduceat(similarities, offsets, axis=1).mean(axis=0)
+    return scores
+
+
+class ColBERTReranker:
+    """BGE-M3 ColBERT late-interaction reranker implementing RerankerPort.
+
+    Each passage's token vectors are computed once — at ingest through
+    :meth:`index_passages`, or on the first rerank that meets the passage —
+    and kept int8-compressed in a :class:`TokenVectorStore` keyed by content
+    hash. A rerank then needs one forward pass for the query and a single
+    vectorized MaxSim over the candidates' stored vectors, instead of one
+    cross-encoder pass per (query, chunk) pair. Chunks replaced or deleted by
+    an ingest are dropped through :meth:`forget_passages`.
+
+    The store is a SQLite file on the local node, not a table next to
+    ``chunks``: ingest-time indexing and forgetting reach only the store of
+    the node running the ingest, and every other API node fills (and keeps)
+    its own copy lazily on rerank.
+
+    Loads BGEM3FlagModel lazily with thread-safe double-checked locking; all
+    inference runs CPU-only inside asyncio.to_thread.
+
+    Args:
+        settings: Application settings providing reranker configuration.
+        store: Token vector store; defaults to one at ``reranker.colbert_path``.
+    """
+
+    def __init__(self, settings: Settings, store: TokenVectorStore | None = None) -> None:
+        self._settings = settings
+        self._store = store or TokenVectorStore(settings.reranker.colbert_path, _DIMENSION)
+        self._model: Any = None
+        self._lock = threading.Lock()
+        self._inference_lock = threading.Lock()
+
+    def _ensure_model_loaded(self) -> None:
+        if self._model is not None:
+            return
+        with self._lock:
+            if self._model is not None:
+                return
+            from FlagEmbedding import BGEM3FlagModel
+
+            model_id = self._settings.reranker.colbert_model
+            self._model = BGEM3FlagModel(
+                model_id,
+                use_fp16=False,
+                devices=["cpu"],
+                cache_dir=self._settings.embedding.cache_dir,
+            )
+            log.info("colbert_reranker.model_loaded", model=model_id)
+
+    async def warm_up(self) -> None:
+        """Load the model ahead of the first request."""
+        await asyncio.to_thread(self._ensure_model_loaded)
+
+    def _encode(self, texts: list[str]) -> list[_FloatMatrix]:
+        """Return the normalized ColBERT token vectors of every text."""
+        self._ensure_model_loaded()
+        with self._inference_lock:
+            raw: Any = self._model.encode(
+                texts,
+                batch_size=self._settings.reranker.batch_size,
+                max_length=_MAX_LENGTH,
+                return_dense=False,
+                return_sparse=False,
+                return_colbert_vecs=True,
+            )
+        return [np.asarray(vecs, dtype=np.float32) for vecs in raw["colbert_vecs"]]
+
+    def _sync_index(self, passages: list[str]) -> dict[str, _FloatMatrix]:
+        """Encode and store whichever of *passages* are not stored yet."""
+        keys = [passage_key(p) for p in passages]
+        stored = self._store.get_many(keys)
+        missing = {k: p for k, p in zip(keys, passages, strict=True) if k not in stored}
+        if missing:
+            encoded = self._encode(list(missing.values()))
+            self._store.put_many(list(zip(missing, encoded, strict=True)))
+            stored.update(zip(missing, encoded, strict=True))
+            inc_counter("colbert_passages_encoded", amount=len(missing))
+        return stored
+
+    @traced("reranker.colbert_index_passages")
+    async def index_passages(self, passages: list[str]) -> None:
+        """Precompute and store the token vectors of *passages*.
+
+        Args:
+            passages: Chunk contents about to become retrievable.
+        """
+        if passages:
+            await asyncio.to_thread(self._sync_index, passages)
+
+    @traced("reranker.colbert_forget_passages")
+    async def forget_passages(self, passages: list[str]) -> None:
+        """Delete the stored token vectors of *passages*.
+
+        A passage that is still retrievable through another chunk is simply
+        re-encoded on the next rerank that meets it.
+
+        Args:
+            passages: Contents of chunks that were replaced or deleted.
+        """
+        if passages:
+            await asyncio.to_thread(self._store.delete_many, [passage_key(p) for p in passages])
+
+    @traced("reranker.rerank")
+    async def rerank(self, request: RerankRequest) -> list[RetrievedChunk]:
+        """Rerank candidate chunks by MaxSim against the query and return top-k.
+
+        Args:
+            request: Query, candidate chunks, and desired top_k cutoff.
+
+        Returns:
+            Chunks sorted by MaxSim score descending, limited to top_k.
+        """
+        start = time.perf_counter()
+        set_gauge("reranker_candidates_count", float(len(request.chunks)))
+
+        result = await asyncio.to_thread(self._sync_rerank, request)
+
+        duration = time.perf_counter() - start
+        observe_histogram("reranker_request_duration_seconds", duration)
+        log.info(
+            "colbert_reranker.rerank_complete",
+            query_length=len(request.query),
+            candidates=len(request.chunks),
+            top_k=request.top_k,
+            returned=len(result),
+            duration_s=round(duration, 4),
+        )
+        return result
+
+    def _sync_rerank(self, request: RerankRequest) -> list[RetrievedChunk]:
+        if not request.chunks:
+            return []
+
+        stored = self._sync_index([chunk.content for chunk in request.chunks])
+        (query,) = self._encode([request.query])
+        scores = maxsim_scores(
+            query, [stored[passage_key(chunk.content)] for chunk in request.chunks]
+        )
+
+        order = np.argsort(-scores, kind="stable")
+        threshold = self._settings.reranker.colbert_min_score
+        top = [i for i in order if scores[i] >= threshold][: request.top_k]
+        return [request.chunks[i].model_copy(update={"score": float(scores[i])}) for i in top]
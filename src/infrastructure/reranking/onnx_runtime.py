@@ -0,0 +1,161 @@
+"""ONNX Runtime backend for the cross-encoder reranker — loading and score-parity check."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+from pydantic import BaseModel, ConfigDict
+
+from src.config.settings import Settings
+from src.infrastructure.embeddings.onnx_runtime import ensure_onnx_export
+
+__all__ = [
+    "ScoreParityReport",
+    "check_reranker_parity",
+    "load_cross_encoder",
+    "score_drift",
+]
+
+log = structlog.get_logger(__name__)
+
+
+class ScoreParityReport(BaseModel):
+    """Agreement between reference and candidate reranker scores of the same pairs."""
+
+    model_config = ConfigDict(frozen=True)
+
+    queries: int
+    pairs: int
+    mean_abs_diff: float
+    max_abs_diff: float
+    top1_agreement: float
+    mean_rank_correlation: float
+
+
+def load_cross_encoder(settings: Settings) -> Any:  # noqa: ANN401
+    """Load ``reranker.model`` as a CPU ``CrossEncoder`` on ONNX Runtime.
+
+    The model is exported under ``embedding.onnx_dir`` on first use and, unless
+    ``reranker.onnx_quantization`` is ``"none"``, dynamically quantized to
+    int8. Pairs are truncated to ``reranker.max_length`` tokens.
+
+    Args:
+        settings: Application settings (reranker model and ONNX options,
+            embedding cache and ONNX directories).
+
+    Returns:
+        A ``sentence_transformers.CrossEncoder`` instance whose ``predict``
+        returns sigmoid scores, like ``FlagReranker.compute_score(normalize=True)``.
+    """
+    from sentence_transformers import CrossEncoder
+
+    reranker = settings.reranker
+    export_dir, file_name = ensure_onnx_export(
+        CrossEncoder,
+        reranker.model,
+        settings.embedding.onnx_dir,
+        reranker.onnx_quantization,
+        settings.embedding.cache_dir,
+    )
+    return CrossEncoder(
+        str(export_dir),
+        backend="onnx",
+        device="cpu",
+        max_length=reranker.max_length,
+        model_kwargs={"file_name": file_name},
+    )
+
+
+def _ranks(scores: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    ranks = np.empty(len(scores))
+    ranks[np.argsort(scores, kind="stable")] = np.arange(len(scores))
+    return ranks
+
+
+def score_drift(
+    reference: Sequence[npt.ArrayLike],
+    candidate: Sequence[npt.ArrayLike],
+) -> ScoreParityReport:
+    """Compare two backends' scores of the same candidates, query by query.
+
+    Args:
+        reference: Per query, the reference backend's scores of its candidates.
+        candidate: Per query, the candidate backend's scores of the same candidates.
+
+    Returns:
+        :class:`ScoreParityReport` with absolute score differences, the share
+        of queries whose best candidate is the same, and the mean Spearman
+        correlation of the two rankings.
+    """
+    if len(reference) != len(candidate):
+        raise ValueError(f"Query count mismatch: {len(reference)} vs {len(candidate)}")
+    diffs: list[npt.NDArray[np.float64]] = []
+    top1: list[bool] = []
+    correlations: list[float] = []
+    for ref_scores, cand_scores in zip(reference, candidate, strict=True):
+        ref = np.asarray(ref_scores, dtype=np.float64)
+        cand = np.asarray(cand_scores, dtype=np.float64)
+        if ref.shape != cand.shape:
+            raise ValueError(f"Shape mismatch: {ref.shape} vs {cand.shape}")
+        if not len(ref):
+            continue
+        diffs.append(np.abs(ref - cand))
+        top1.append(bool(np.argmax(ref) == np.argmax(cand)))
+        if len(ref) > 1:
+            correlations.append(float(np.corrcoef(_ranks(ref), _ranks(cand))[0, 1]))
+    if not diffs:
+        raise ValueError("No scores to compare")
+    all_diffs = np.concatenate(diffs)
+    return ScoreParityReport(
+        queries=len(diffs),
+        pairs=len(all_diffs),
+        mean_abs_diff=float(all_diffs.mean()),
+        max_abs_diff=float(all_diffs.max()),
+        top1_agreement=float(np.mean(top1)),
+        mean_rank_correlation=float(np.mean(correlations)) if correlations else 1.0,
+    )
+
+
+def check_reranker_parity(
+    settings: Settings,
+    cases: Sequence[tuple[str, Sequence[str]]],
+) -> ScoreParityReport:
+    """Score *cases* with the PyTorch FlagReranker and with ONNX Runtime and report the drift.
+
+    Both sides truncate pairs to ``reranker.max_length`` tokens. Exports and
+    quantizes the ONNX model first if needed, so running this once per
+    deployment also warms the on-disk ONNX files.
+
+    Args:
+        settings: Application settings; the configured ``reranker.backend`` is ignored.
+        cases: ``(query, candidate passages)`` per query, e.g. from the golden set.
+
+    Returns:
+        :class:`ScoreParityReport` of ONNX against PyTorch.
+    """
+    from FlagEmbedding import FlagReranker
+
+    reranker = settings.reranker
+    torch_model = FlagReranker(reranker.model, use_fp16=False)
+    onnx_model = load_cross_encoder(settings)
+    reference: list[list[float]] = []
+    candidate: list[npt.NDArray[np.float32]] = []
+    for query, passages in cases:
+        pairs = [[query, passage] for passage in passages]
+        raw = torch_model.compute_score(
+            pairs,
+            batch_size=reranker.batch_size,
+            max_length=reranker.max_length,
+            normalize=True,
+        )
+        reference.append([raw] if isinstance(raw, float) else raw)
+        candidate.append(
+            onnx_model.predict(pairs, batch_size=reranker.batch_size, convert_to_numpy=True)
+        )
+    report = score_drift(reference, candidate)
+    log.info("onnx_backend.reranker_parity", model=reranker.model, **report.model_dump())
+    return report
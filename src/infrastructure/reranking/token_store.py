@@ -0,0 +1,172 @@
+"""On-disk, int8-compressed store of per-passage token vectors for late interaction."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+
+__all__ = ["TokenVectorStore", "dequantize_int8", "quantize_int8"]
+
+log = structlog.get_logger(__name__)
+
+_INDEX_FILE = "tokens.sqlite3"
+# Stay well below SQLite's bound-parameter limit.
+_SQL_BATCH = 500
+
+_FloatMatrix = npt.NDArray[np.float32]
+_Int8Matrix = npt.NDArray[np.int8]
+
+
+def quantize_int8(tokens: npt.ArrayLike) -> tuple[_Int8Matrix, _FloatMatrix]:
+    """Quantize a ``(tokens, dim)`` matrix to int8 with one max-abs scale per token.
+
+    Args:
+        tokens: Token vectors, one row per token.
+
+    Returns:
+        ``(codes, scales)`` where ``codes * scales[:, None] / 127`` approximates
+        *tokens*.
+    """
+    matrix = np.asarray(tokens, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) if matrix.size else np.zeros(len(matrix), np.float32)
+    safe = np.where(scales > 0, scales, 1.0)[:, None]
+    codes = np.rint(matrix / safe * 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize_int8(codes: npt.ArrayLike, scales: npt.ArrayLike) -> _FloatMatrix:
+    """Invert :func:`quantize_int8`.
+
+    Args:
+        codes: ``(tokens, dim)`` int8 codes.
+        scales: ``(tokens,)`` per-token scales.
+
+    Returns:
+        ``(tokens, dim)`` float32 token vectors.
+    """
+    factor = np.asarray(scales, dtype=np.float32)[:, None] / 127
+    return (np.asarray(codes, dtype=np.float32) * factor).astype(np.float32, copy=False)
+
+
+def _batched(items: Sequence[str]) -> Iterator[Sequence[str]]:
+    for i in range(0, len(items), _SQL_BATCH):
+        yield items[i : i + _SQL_BATCH]
+
+
+class TokenVectorStore:
+    """SQLite-backed map from opaque keys to variable-length token-vector matrices.
+
+    Every matrix is stored as int8 codes plus one float32 scale per token
+    (:func:`quantize_int8`), about a quarter of its float32 size. Changing
+    ``dimension`` resets the store. The file is local to the process's node:
+    every node running the API keeps its own store, filled on first use.
+
+    Args:
+        path: Directory holding the SQLite file.
+        dimension: Width of every token vector.
+    """
+
+    def __init__(self, path: Path | str, dimension: int) -> None:
+        self._path = Path(path)
+        self._dimension = dimension
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    def _open(self) -> sqlite3.Connection:
+        if self._db is not None:
+            return self._db
+        self._path.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self._path / _INDEX_FILE, timeout=30.0, check_same_thread=False)
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS passages ("
+            "key TEXT PRIMARY KEY, tokens INTEGER NOT NULL, scales BLOB NOT NULL, "
+            "codes BLOB NOT NULL)"
+        )
+        row = db.execute("SELECT value FROM meta WHERE name = 'dimension'").fetchone()
+        if row is None or row[0] != self._dimension:
+            with db:
+                db.execute("DELETE FROM passages")
+                db.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('dimension', ?)",
+                    (self._dimension,),
+                )
+            log.info("token_store.created", path=str(self._path), dimension=self._dimension)
+        self._db = db
+        return db
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, _FloatMatrix]:
+        """Return the dequantized token vectors for whichever of *keys* are present.
+
+        Args:
+            keys: Passage keys to look up.
+
+        Returns:
+            Mapping of found keys to ``(tokens, dimension)`` float32 matrices.
+        """
+        if not keys:
+            return {}
+        found: dict[str, _FloatMatrix] = {}
+        with self._lock:
+            db = self._open()
+            for batch in _batched(list(dict.fromkeys(keys))):
+                placeholders = ",".join("?" * len(batch))
+                for key, tokens, scales, codes in db.execute(
+                    "SELECT key, tokens, scales, codes FROM passages "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ):
+                    found[key] = dequantize_int8(
+                        np.frombuffer(codes, dtype=np.int8).reshape(tokens, self._dimension),
+                        np.frombuffer(scales, dtype=np.float32),
+                    )
+        return found
+
+    def put_many(self, items: Sequence[tuple[str, npt.ArrayLike]]) -> None:
+        """Quantize and store token vectors, replacing existing entries.
+
+        Args:
+            items: ``(key, (tokens, dimension) matrix)`` pairs.
+        """
+        if not items:
+            return
+        rows = []
+        for key, matrix in items:
+            codes, scales = quantize_int8(matrix)
+            rows.append((key, len(codes), scales.tobytes(), codes.tobytes()))
+        with self._lock:
+            db = self._open()
+            with db:
+                db.executemany(
+                    "INSERT OR REPLACE INTO passages (key, tokens, scales, codes) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        """Remove the entries of *keys*; absent keys are ignored.
+
+        Args:
+            keys: Passage keys to drop.
+        """
+        if not keys:
+            return
+        with self._lock:
+            db = self._open()
+            with db:
+                for batch in _batched(list(dict.fromkeys(keys))):
+                    placeholders = ",".join("?" * len(batch))
+                    db.execute(f"DELETE FROM passages WHERE key IN ({placeholders})", batch)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
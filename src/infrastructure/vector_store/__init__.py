@@ -1 +1 @@
-"""Vector store adapters (pgvector + pgvectorscale)."""
+"""Vector store adapters (in-process NumPy store) and shared rank fusion."""
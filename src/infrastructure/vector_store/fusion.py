@@ -0,0 +1,41 @@
+"""Reciprocal Rank Fusion shared by the hybrid vector store adapters."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from src.domain.ports.dto import RetrievedChunk
+
+__all__ = ["RRF_K", "rrf_fuse"]
+
+RRF_K: int = 60
+
+
+def rrf_fuse(
+    rankings: list[list[UUID]],
+    chunk_data: dict[UUID, RetrievedChunk],
+    top_k: int,
+) -> list[RetrievedChunk]:
+    """Fuse ranked ID lists with Reciprocal Rank Fusion (k=60).
+
+    ``score = sum(1 / (60 + rank))`` over every leg the chunk appears in.
+
+    Args:
+        rankings: One best-first list of chunk IDs per retrieval leg.
+        chunk_data: Row data for every ID that can appear in the output.
+        top_k: Number of fused results to keep.
+
+    Returns:
+        Chunks ordered by descending RRF score; IDs without row data are dropped.
+    """
+    rrf_scores: dict[UUID, float] = {}
+    for ranking in rankings:
+        for rank, cid in enumerate(ranking, start=1):
+            rrf_scores[cid] = rrf_scores.get(cid, 0.0) + 1.0 / (RRF_K + rank)
+
+    ranked = sorted(rrf_scores.items(), key=lambda kv: kv[1], reverse=True)[:top_k]
+    return [
+        chunk_data[cid].model_copy(update={"score": rrf_score})
+        for cid, rrf_score in ranked
+        if cid in chunk_data
+    ]
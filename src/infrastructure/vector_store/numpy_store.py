@@ -0,0 +1,632 @@
+"""In-process NumPy hybrid (dense matmul + BM25 inverted index + RRF) vector store."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+
+from src.config.settings import Settings
+from src.domain.ports.dto import (
+    ChunkWithEmbedding,
+    EmbeddingArray,
+    HnswIterativeScan,
+    HybridSearchQuery,
+    RetrievedChunk,
+    SparseVector,
+    StoredChunkHash,
+)
+from src.infrastructure.vector_store.fusion import rrf_fuse
+from src.shared.metrics import inc_counter, observe_histogram
+from src.shared.tracing import traced
+
+__all__ = ["NumPyVectorStore"]
+
+log = structlog.get_logger(__name__)
+
+_EMBEDDINGS_FILE = "embeddings.npy"
+_CHUNKS_FILE = "chunks.json"
+_GENERATION_FILE = "generation"
+# Same behaviour as PostgreSQL's ``simple`` text-search config: lowercase word
+# tokens, no stemming, no stop words — language-agnostic across en/fr/ar.
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# Rebuild arrays and postings once tombstoned rows exceed this share.
+_COMPACT_DEAD_RATIO = 0.25
+
+_FloatMatrix = npt.NDArray[np.float32]
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _normalize_rows(matrix: _FloatMatrix) -> _FloatMatrix:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    normalized: _FloatMatrix = (matrix / norms).astype(np.float32, copy=False)
+    return normalized
+
+
+def _top_k(scores: npt.NDArray[np.float32], k: int) -> npt.NDArray[np.intp]:
+    """Return indices of the *k* highest finite scores, best first."""
+    k = min(k, int(np.isfinite(scores).sum()))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _fuse(
+    dense: list[RetrievedChunk], sparse: list[RetrievedChunk], top_k: int
+) -> list[RetrievedChunk]:
+    chunk_data = {c.chunk_id: c for c in sparse}
+    chunk_data.update({c.chunk_id: c for c in dense})
+    return rrf_fuse(
+        [[c.chunk_id for c in dense], [c.chunk_id for c in sparse]],
+        chunk_data,
+        top_k,
+    )
+
+
+def _disk_generation(path: Path) -> int | None:
+    """Return the generation of the snapshot under *path*, or None if there is none."""
+    try:
+        return int((path / _GENERATION_FILE).read_text(encoding="ascii"))
+    except FileNotFoundError:
+        # Snapshots written before the generation file existed count as 0.
+        return 0 if (path / _CHUNKS_FILE).exists() else None
+
+
+class NumPyVectorStore:
+    """Single-process vector store implementing VectorStorePort.
+
+    Chunk embeddings live in one L2-normalised float32 matrix, so dense search
+    is a single matrix-vector product followed by ``argpartition``. The sparse
+    leg is BM25 over a compact inverted index (``term → array('I')`` postings)
+    and the two legs are fused with the same RRF as :class:`PGVectorStore`.
+    Chunks stored with BGE-M3 lexical weights also get a ``token ID → (rows,
+    weights)`` index; queries carrying ``query_sparse`` rank by inner product
+    over it instead of BM25.
+
+    When ``vector_store.numpy_path`` is set, :meth:`flush` persists the
+    buffered mutations atomically to ``embeddings.npy`` + ``chunks.json`` and
+    then the snapshot's generation number to ``generation`` in that directory;
+    writers call it once per batch (ingestion flushes once per file). The
+    matrix is opened with ``mmap_mode="r"`` on load so start-up cost and
+    resident memory stay flat for read-mostly workers. A worker compares the
+    on-disk generation with the one it loaded on its next search and reloads
+    the snapshot when another process (e.g. ``rag-cli ingest``) has flushed a
+    newer one; it never reloads over its own unflushed writes.
+
+    Deletes tombstone rows; storage is compacted once more than a quarter of
+    the rows are dead, and always before persisting.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialise an empty store, loading the on-disk snapshot if present.
+
+        Args:
+            settings: Application settings (top-k defaults and ``numpy_path``).
+        """
+        self._settings = settings
+        configured = settings.vector_store.numpy_path
+        self._path: Path | None = Path(configured) if configured else None
+        self._snapshot_generation: int | None = None
+        self._generation = 0
+        self._dirty = False
+        self._reset(np.empty((0, 0), dtype=np.float32), [])
+        self._maybe_reload()
+
+    # ── state management ────────────────────────────────────────────────
+
+    def _reset(self, matrix: _FloatMatrix, rows: list[dict[str, Any]]) -> None:
+        self._matrix: _FloatMatrix = matrix
+        self._rows: list[dict[str, Any]] = rows
+        self._row_of: dict[UUID, int] = {r["id"]: i for i, r in enumerate(rows)}
+        self._alive = np.ones(len(rows), dtype=bool)
+        self._languages = np.array([r["language"] for r in rows], dtype=object)
+        self._postings: dict[str, tuple[array[int], array[int]]] = {}
+        self._lexical: dict[int, tuple[array[int], array[float]]] = {}
+        self._doc_len = np.zeros(len(rows), dtype=np.float32)
+        for i, row in enumerate(rows):
+            self._index_row(i, row["content"], row.get("sparse_embedding"))
+
+    def _index_row(
+        self, row: int, content: str, sparse: SparseVector | dict[str, float] | None
+    ) -> None:
+        terms = Counter(_tokenize(content))
+        self._doc_len[row] = sum(terms.values())
+        for term, tf in terms.items():
+            rows, tfs = self._postings.setdefault(term, (array("I"), array("I")))
+            rows.append(row)
+            tfs.append(tf)
+        for token, weight in (sparse or {}).items():
+            rows, weights = self._lexical.setdefault(int(token), (array("I"), array("f")))
+            rows.append(row)
+            weights.append(weight)
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive)
+        if len(keep) == len(self._rows):
+            return
+        matrix = np.ascontiguousarray(self._matrix[keep]) if len(keep) else self._matrix[:0]
+        self._reset(matrix, [self._rows[i] for i in keep])
+
+    def _maybe_reload(self) -> None:
+        """Load the snapshot on disk if another process flushed a different generation."""
+        if self._path is None or self._dirty:
+            return
+        generation = _disk_generation(self._path)
+        if generation is None or generation == self._snapshot_generation:
+            return
+
+        chunks_file = self._path / _CHUNKS_FILE
+        embeddings_file = self._path / _EMBEDDINGS_FILE
+        raw_rows = json.loads(chunks_file.read_text(encoding="utf-8"))
+        rows = [{**r, "id": UUID(r["id"]), "document_id": UUID(r["document_id"])} for r in raw_rows]
+        matrix: _FloatMatrix = np.load(embeddings_file, mmap_mode="r")
+        self._reset(matrix, rows)
+        self._snapshot_generation = generation
+        self._generation = max(self._generation + 1, generation)
+        log.info(
+            "numpy_vector_store.loaded",
+            path=str(self._path),
+            chunks=len(rows),
+            generation=generation,
+        )
+
+    async def flush(self) -> None:
+        """Persist buffered writes to ``numpy_path``; no-op when clean or unset."""
+        if self._dirty:
+            self.save()
+
+    def save(self) -> None:
+        """Persist the compacted store to ``numpy_path`` (no-op when unset).
+
+        Every file is written to a temporary name and swapped in with
+        ``os.replace`` so concurrent readers never observe a torn snapshot;
+        ``generation`` is replaced last because readers key reloads on it.
+        """
+        if self._path is None:
+            return
+        self._compact()
+        self._path.mkdir(parents=True, exist_ok=True)
+
+        tmp_embeddings = self._path / f".{_EMBEDDINGS_FILE}.tmp"
+        with tmp_embeddings.open("wb") as fh:
+            np.save(fh, np.asarray(self._matrix, dtype=np.float32))
+        os.replace(tmp_embeddings, self._path / _EMBEDDINGS_FILE)
+
+        tmp_chunks = self._path / f".{_CHUNKS_FILE}.tmp"
+        serialisable = [
+            {**r, "id": str(r["id"]), "document_id": str(r["document_id"])} for r in self._rows
+        ]
+        tmp_chunks.write_text(json.dumps(serialisable, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_chunks, self._path / _CHUNKS_FILE)
+
+        tmp_generation = self._path / f".{_GENERATION_FILE}.tmp"
+        tmp_generation.write_text(str(self._generation), encoding="ascii")
+        os.replace(tmp_generation, self._path / _GENERATION_FILE)
+        self._snapshot_generation = self._generation
+        self._dirty = False
+
+    def _commit(self) -> None:
+        self._generation += 1
+        self._dirty = True
+
+    def _tombstone(self, rows: list[int]) -> None:
+        for row in rows:
+            self._alive[row] = False
+            del self._row_of[self._rows[row]["id"]]
+        dead = len(self._rows) - int(self._alive.sum())
+        if self._rows and dead / len(self._rows) > _COMPACT_DEAD_RATIO:
+            self._compact()
+
+    # ── VectorStorePort ─────────────────────────────────────────────────
+
+    async def upsert(self, chunks: list[ChunkWithEmbedding]) -> int:
+        """Insert or replace chunks by ID; persisted on the next :meth:`flush`.
+
+        Args:
+            chunks: Chunks with precomputed embeddings to store.
+
+        Returns:
+            Number of chunks processed.
+        """
+        if not chunks:
+            return 0
+        self._maybe_reload()
+
+        replaced = [self._row_of[c.id] for c in chunks if c.id in self._row_of]
+        if replaced:
+            self._tombstone(replaced)
+
+        new_vectors = _normalize_rows(np.stack([c.embedding for c in chunks]))
+        matrix = np.concatenate([self._matrix, new_vectors]) if len(self._rows) else new_vectors
+        base = len(self._rows)
+        new_rows = [
+            {
+                "id": c.id,
+                "document_id": c.document_id,
+                "content": c.content,
+                "position": c.position,
+                "token_count": c.token_count,
+                "source_path": c.source_path,
+                "language": c.language,
+                "metadata": c.metadata,
+                "content_hash": c.content_hash,
+                # String keys so the row round-trips through chunks.json unchanged.
+                "sparse_embedding": (
+                    {str(t): w for t, w in c.sparse_embedding.items()}
+                    if c.sparse_embedding is not None
+                    else None
+                ),
+            }
+            for c in chunks
+        ]
+        self._matrix = matrix
+        self._rows.extend(new_rows)
+        self._alive = np.concatenate([self._alive, np.ones(len(new_rows), dtype=bool)])
+        self._languages = np.concatenate(
+            [self._languages, np.array([r["language"] for r in new_rows], dtype=object)]
+        )
+        self._doc_len = np.concatenate([self._doc_len, np.zeros(len(new_rows), np.float32)])
+        for offset, chunk in enumerate(chunks):
+            self._row_of[chunk.id] = base + offset
+            self._index_row(base + offset, chunk.content, chunk.sparse_embedding)
+
+        self._commit()
+        return len(chunks)
+
+    def _candidate_mask(self, filters: dict[str, str] | None) -> npt.NDArray[np.bool_]:
+        mask = self._alive.copy()
+        language = (filters or {}).get("language")
+        if language:
+            mask &= self._languages == language
+        return mask
+
+    def _to_chunk(self, row: int, score: float) -> RetrievedChunk:
+        data = self._rows[row]
+        return RetrievedChunk(
+            chunk_id=data["id"],
+            document_id=data["document_id"],
+            content=data["content"],
+            score=score,
+            source_path=data["source_path"],
+            metadata=data["metadata"],
+        )
+
+    def _attach_embeddings(self, chunks: list[RetrievedChunk]) -> list[RetrievedChunk]:
+        """Return *chunks* carrying their stored (L2-normalised) embeddings."""
+        vectors = self._matrix[[self._row_of[c.chunk_id] for c in chunks]]
+        return [
+            chunk.model_copy(update={"embedding": vector})
+            for chunk, vector in zip(chunks, vectors, strict=True)
+        ]
+
+    @traced("vector_store.search")
+    async def search(
+        self,
+        query_vector: EmbeddingArray,
+        top_k: int,
+        filters: dict[str, str] | None = None,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+    ) -> list[RetrievedChunk]:
+        """Exact cosine search via one matmul over the embedding matrix.
+
+        Args:
+            query_vector: Query embedding vector.
+            top_k: Maximum number of results to return.
+            filters: Optional key-value filters; ``"language"`` supported.
+            ef_search: Ignored; the matmul is already exact.
+            iterative_scan: Ignored; filters never truncate an exact scan.
+
+        Returns:
+            Chunks sorted by descending cosine similarity.
+        """
+        start = time.perf_counter()
+        self._maybe_reload()
+        results = self._dense(query_vector, top_k, filters)
+        observe_histogram(
+            "vector_search_duration_seconds",
+            time.perf_counter() - start,
+            {"search_type": "dense"},
+        )
+        inc_counter("vector_search_results_count", {"search_type": "dense"})
+        return results
+
+    def _dense(
+        self,
+        query_vector: EmbeddingArray,
+        top_k: int,
+        filters: dict[str, str] | None,
+    ) -> list[RetrievedChunk]:
+        if not self._rows:
+            return []
+        return self._rank_dense(self._dense_scores([query_vector])[0], top_k, filters)
+
+    def _dense_scores(self, query_vectors: list[EmbeddingArray]) -> _FloatMatrix:
+        """Cosine similarity of every query against every row, as one matmul."""
+        queries = _normalize_rows(np.stack(query_vectors))
+        scores: _FloatMatrix = queries @ self._matrix.T
+        return scores
+
+    def _rank_dense(
+        self,
+        scores: npt.NDArray[np.float32],
+        top_k: int,
+        filters: dict[str, str] | None,
+    ) -> list[RetrievedChunk]:
+        scores = scores.copy()
+        scores[~self._candidate_mask(filters)] = -np.inf
+        return [self._to_chunk(int(i), max(0.0, float(scores[i]))) for i in _top_k(scores, top_k)]
+
+    def _sparse(
+        self,
+        query_text: str,
+        top_k: int,
+        filters: dict[str, str] | None,
+    ) -> list[RetrievedChunk]:
+        """BM25 over the inverted index, restricted to live, filtered rows."""
+        mask = self._candidate_mask(filters)
+        n_live = int(self._alive.sum())
+        if n_live == 0:
+            return []
+        avg_len = float(self._doc_len[self._alive].mean()) or 1.0
+
+        scores = np.zeros(len(self._rows), dtype=np.float32)
+        for term in set(_tokenize(query_text)):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            rows = np.frombuffer(posting[0], dtype=np.uint32).astype(np.intp)
+            tfs = np.frombuffer(posting[1], dtype=np.uint32).astype(np.float32)
+            live = self._alive[rows]
+            rows, tfs = rows[live], tfs[live]
+            if not len(rows):
+                continue
+            idf = math.log(1.0 + (n_live - len(rows) + 0.5) / (len(rows) + 0.5))
+            norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * self._doc_len[rows] / avg_len)
+            np.add.at(scores, rows, idf * tfs * (_BM25_K1 + 1.0) / (tfs + norm))
+
+        scores[~mask | (scores <= 0.0)] = -np.inf
+        return [self._to_chunk(int(i), float(scores[i])) for i in _top_k(scores, top_k)]
+
+    def _lexical_sparse(
+        self,
+        query_sparse: SparseVector,
+        top_k: int,
+        filters: dict[str, str] | None,
+    ) -> list[RetrievedChunk]:
+        """Inner product of the query's lexical weights with every indexed row."""
+        scores = np.zeros(len(self._rows), dtype=np.float32)
+        for token, weight in query_sparse.items():
+            posting = self._lexical.get(token)
+            if posting is None:
+                continue
+            rows = np.frombuffer(posting[0], dtype=np.uint32).astype(np.intp)
+            weights = np.frombuffer(posting[1], dtype=np.float32)
+            np.add.at(scores, rows, weight * weights)
+
+        scores[~self._candidate_mask(filters) | (scores <= 0.0)] = -np.inf
+        return [self._to_chunk(int(i), float(scores[i])) for i in _top_k(scores, top_k)]
+
+    def _sparse_leg(
+        self,
+        query_text: str,
+        query_sparse: SparseVector | None,
+        top_k: int,
+        filters: dict[str, str] | None,
+    ) -> list[RetrievedChunk]:
+        if query_sparse is not None:
+            return self._lexical_sparse(query_sparse, top_k, filters)
+        return self._sparse(query_text, top_k, filters)
+
+    @traced("vector_store.hybrid_search")
+    async def hybrid_search(
+        self,
+        query_vector: EmbeddingArray,
+        query_text: str,
+        top_k: int,
+        filters: dict[str, str] | None = None,
+        *,
+        query_sparse: SparseVector | None = None,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
+    ) -> list[RetrievedChunk]:
+        """Dense matmul + BM25 legs fused via Reciprocal Rank Fusion.
+
+        Args:
+            query_vector: Dense query embedding.
+            query_text: Raw query text for the BM25 leg.
+            top_k: Final number of chunks to return after fusion.
+            filters: Optional key-value filters; ``"language"`` supported.
+            query_sparse: Optional query lexical weights; replaces BM25 as the
+                sparse leg when given.
+            ef_search: Ignored; the dense leg is an exact matmul.
+            iterative_scan: Ignored; the dense leg is an exact matmul.
+            with_embeddings: Attach each chunk's row of the embedding matrix.
+
+        Returns:
+            Fused chunks with RRF score.
+        """
+        start = time.perf_counter()
+        self._maybe_reload()
+        vs = self._settings.vector_store
+
+        dense = self._dense(query_vector, vs.top_k_dense, filters)
+        sparse = self._sparse_leg(query_text, query_sparse, vs.top_k_sparse, filters)
+        results = _fuse(dense, sparse, top_k)
+        if with_embeddings:
+            results = self._attach_embeddings(results)
+
+        observe_histogram(
+            "vector_search_duration_seconds",
+            time.perf_counter() - start,
+            {"search_type": "hybrid"},
+        )
+        inc_counter("vector_search_results_count", {"search_type": "hybrid"})
+        return results
+
+    @traced("vector_store.hybrid_search_many")
+    async def hybrid_search_many(
+        self,
+        queries: list[HybridSearchQuery],
+        top_k: int,
+        *,
+        ef_search: int | None = None,
+        iterative_scan: HnswIterativeScan | None = None,
+        with_embeddings: bool = False,
+    ) -> list[list[RetrievedChunk]]:
+        """Hybrid search for many queries, scoring all dense legs in one matmul.
+
+        Args:
+            queries: Query embeddings, texts and optional ``"language"`` filters.
+            top_k: Number of chunks to return per query after fusion.
+            ef_search: Ignored; the dense legs are an exact matmul.
+            iterative_scan: Ignored; the dense legs are an exact matmul.
+            with_embeddings: Attach each chunk's row of the embedding matrix.
+
+        Returns:
+            One fused, RRF-scored chunk list per query, in input order.
+        """
+        if not queries:
+            return []
+        start = time.perf_counter()
+        self._maybe_reload()
+        vs = self._settings.vector_store
+
+        results: list[list[RetrievedChunk]] = [[] for _ in queries]
+        if self._rows:
+            scores = self._dense_scores([q.query_vector for q in queries])
+            for i, query in enumerate(queries):
+                dense = self._rank_dense(scores[i], vs.top_k_dense, query.filters)
+                sparse = self._sparse_leg(
+                    query.query_text, query.query_sparse, vs.top_k_sparse, query.filters
+                )
+                results[i] = _fuse(dense, sparse, top_k)
+                if with_embeddings:
+                    results[i] = self._attach_embeddings(results[i])
+
+        observe_histogram(
+            "vector_search_duration_seconds",
+            time.perf_counter() - start,
+            {"search_type": "hybrid_many"},
+        )
+        inc_counter("vector_search_results_count", {"search_type": "hybrid_many"})
+        return results
+
+    async def delete_by_document(self, document_id: UUID) -> int:
+        """Delete all chunks belonging to a document; persisted on the next :meth:`flush`.
+
+        Args:
+            document_id: UUID of the parent document.
+
+        Returns:
+            Number of chunks deleted.
+        """
+        self._maybe_reload()
+        rows = [
+            i
+            for i, r in enumerate(self._rows)
+            if self._alive[i] and r["document_id"] == document_id
+        ]
+        if rows:
+            self._tombstone(rows)
+            self._commit()
+        return len(rows)
+
+    async def delete(self, chunk_ids: list[UUID]) -> None:
+        """Delete specific chunks by ID; persisted on the next :meth:`flush`.
+
+        Args:
+            chunk_ids: UUIDs of chunks to delete.
+        """
+        self._maybe_reload()
+        rows = [self._row_of[cid] for cid in chunk_ids if cid in self._row_of]
+        if rows:
+            self._tombstone(rows)
+            self._commit()
+
+    async def reposition(self, positions: dict[UUID, int]) -> None:
+        """Update the position of stored chunks; persisted on the next :meth:`flush`.
+
+        Args:
+            positions: New position per chunk ID; unknown IDs are ignored.
+        """
+        self._maybe_reload()
+        moved = [(self._row_of[cid], pos) for cid, pos in positions.items() if cid in self._row_of]
+        for row, pos in moved:
+            self._rows[row]["position"] = pos
+        if moved:
+            self._commit()
+
+    async def contents(self, chunk_ids: list[UUID]) -> dict[UUID, str]:
+        """Return the stored content of *chunk_ids*.
+
+        Args:
+            chunk_ids: Chunk UUIDs, typically rows about to be replaced or deleted.
+
+        Returns:
+            Mapping of the IDs still stored to their content.
+        """
+        self._maybe_reload()
+        rows = {chunk_id: self._row_of.get(chunk_id) for chunk_id in chunk_ids}
+        return {
+            chunk_id: self._rows[row]["content"]
+            for chunk_id, row in rows.items()
+            if row is not None and self._alive[row]
+        }
+
+    async def chunk_hashes(self, document_id: UUID) -> list[StoredChunkHash]:
+        """Return the stored ID, position and content hash of a document's chunks.
+
+        Args:
+            document_id: UUID of the parent document.
+
+        Returns:
+            One entry per stored chunk, ordered by position.
+        """
+        self._maybe_reload()
+        stored = [
+            StoredChunkHash(
+                id=r["id"], position=r["position"], content_hash=r.get("content_hash", "")
+            )
+            for i, r in enumerate(self._rows)
+            if self._alive[i] and r["document_id"] == document_id
+        ]
+        return sorted(stored, key=lambda s: s.position)
+
+    async def generation(self) -> int:
+        """Return the corpus generation, bumped by every write or snapshot reload.
+
+        Returns:
+            Monotonically increasing generation number for this process.
+        """
+        self._maybe_reload()
+        return self._generation
+
+    async def count(self) -> int:
+        """Return the number of live chunks.
+
+        Returns:
+            Total chunk count.
+        """
+        self._maybe_reload()
+        return int(self._alive.sum())
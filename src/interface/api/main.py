@@ -67,7 +67,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     reranker = di.build_reranker()
     try:
         await embedder.embed_query("warmup")
-        await asyncio.to_thread(reranker._ensure_model_loaded)
+        await reranker.warm_up()
     except Exception as _warmup_err:
         log.warning("api.startup.warmup_failed", error=str(_warmup_err))
     log.info("api.startup: ready")
@@ -6,11 +6,20 @@ Commands:
     evaluate <dataset>  — Run Ragas evaluation over a JSONL golden-set.
     sessions            — Manage chat sessions (subcommands: list, show).
     health              — Check database connectivity.
+    create-language-index <code>
+                        — Build the partial HNSW index for a new language.
+    rebuild-dense-index — Keep only the dense HNSW index of the configured quantization.
+    dense-recall [dataset]
+                        — Compare configured dense search against an exact scan.
+    embedding-parity    — Compare ONNX embedder output against PyTorch.
+    reranker-parity [dataset]
+                        — Compare ONNX reranker scores against PyTorch on the golden set.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -22,12 +31,23 @@ from sqlalchemy import text
 from src.application.use_cases.evaluate import check_thresholds
 from src.infrastructure.di import (
     build_agent,
+    build_embedder,
     build_engine,
     build_evaluate_use_case,
     build_ingest_use_case,
     build_session_repo,
     build_settings,
+    build_vector_store,
 )
+from src.infrastructure.embeddings.onnx_runtime import check_embedding_parity
+from src.infrastructure.persistence.indexes import (
+    RecallReport,
+    check_dense_recall,
+    create_language_index,
+    rebuild_dense_index,
+)
+from src.infrastructure.persistence.vector_store import PGVectorStore
+from src.infrastructure.reranking.onnx_runtime import check_reranker_parity
 from src.interface.cli._render import (
     console,
     make_eval_table,
@@ -230,6 +250,183 @@ def health() -> None:
         raise typer.Exit(code=1) from exc
 
 
+@app.command("create-language-index")
+def create_language_index_cmd(
+    language: str = typer.Argument(..., help="ISO 639-1 code, e.g. 'es'."),
+) -> None:
+    """Build the partial HNSW index for [cyan]LANGUAGE[/cyan] chunks.
+
+    Run once when documents in a new language are ingested so filtered dense
+    search uses a per-language index instead of post-filtering the global one.
+    Exits with code [bold]1[/bold] on failure.
+    """
+    settings = build_settings()
+    engine = build_engine()
+
+    try:
+        name = asyncio.run(create_language_index(engine, language, settings))
+        render_success(f"Index {name} is ready.")
+    except Exception as exc:
+        render_error(f"Index creation failed: {exc}")
+        raise typer.Exit(code=1) from exc
+
+
+@app.command("rebuild-dense-index")
+def rebuild_dense_index_cmd() -> None:
+    """Build the dense HNSW index for the configured quantization and drop the others.
+
+    Run after changing [bold]RAG_VECTORSTORE__EMBEDDING_QUANTIZATION[/bold];
+    check recall afterwards with [bold]dense-recall[/bold]. Exits with code
+    [bold]1[/bold] on failure.
+    """
+    settings = build_settings()
+    engine = build_engine()
+
+    try:
+        name = asyncio.run(rebuild_dense_index(engine, settings))
+        render_success(f"Index {name} is the only dense index.")
+    except Exception as exc:
+        render_error(f"Index rebuild failed: {exc}")
+        raise typer.Exit(code=1) from exc
+
+
+@app.command("dense-recall")
+def dense_recall_cmd(
+    dataset: Path = typer.Argument(  # noqa: B008
+        Path("evals/golden_set.jsonl"), help="JSONL golden set."
+    ),
+    top_k: int = typer.Option(20, "--top-k", help="Result depth compared per query."),
+    min_recall: float = typer.Option(
+        0.95, "--min-recall", help="Fail when mean recall@k is lower."
+    ),
+) -> None:
+    """Measure recall@k of the configured dense search against an exact scan.
+
+    Embeds the golden-set queries and compares the search selected by
+    [bold]RAG_VECTORSTORE__EMBEDDING_QUANTIZATION[/bold] and the HNSW settings
+    with a sequential scan over the full vectors. Exits with code [bold]1[/bold]
+    when mean recall@k is below [bold]--min-recall[/bold].
+    """
+    settings = build_settings()
+    store = build_vector_store(settings)
+    if not isinstance(store, PGVectorStore):
+        render_error("dense-recall needs the pgvector backend.")
+        raise typer.Exit(code=1)
+    rows = [json.loads(line) for line in dataset.read_text(encoding="utf-8").splitlines() if line]
+    embedder = build_embedder(settings)
+
+    async def _run() -> RecallReport:
+        queries = [await embedder.embed_query(row["query"]) for row in rows]
+        return await check_dense_recall(store, queries, top_k)
+
+    try:
+        report = asyncio.run(_run())
+    except Exception as exc:
+        render_error(f"Recall check failed: {exc}")
+        raise typer.Exit(code=1) from exc
+
+    console.print(
+        f"{report.queries} queries — recall@{report.top_k} mean {report.mean_recall:.4f}, "
+        f"min {report.min_recall:.4f}"
+    )
+    if report.mean_recall < min_recall:
+        render_error(f"mean recall {report.mean_recall:.4f} < {min_recall:.4f}")
+        raise typer.Exit(code=1)
+    render_success("Dense search recall is within tolerance.")
+
+
+@app.command("embedding-parity")
+def embedding_parity_cmd(
+    min_cosine: float = typer.Option(
+        0.99, "--min-cosine", help="Fail when any sample's cosine similarity is lower."
+    ),
+) -> None:
+    """Embed a multilingual sample with PyTorch and with ONNX Runtime and report drift.
+
+    Uses the configured model and [bold]RAG_EMBEDDING__ONNX_QUANTIZATION[/bold];
+    exports and quantizes the ONNX model first if needed. Exits with code
+    [bold]1[/bold] when the minimum cosine similarity is below
+    [bold]--min-cosine[/bold].
+    """
+    settings = build_settings()
+
+    try:
+        report = check_embedding_parity(settings.embedding)
+    except Exception as exc:
+        render_error(f"Parity check failed: {exc}")
+        raise typer.Exit(code=1) from exc
+
+    console.print(
+        f"{report.texts} texts — mean cosine {report.mean_cosine:.5f}, "
+        f"min cosine {report.min_cosine:.5f}, max |diff| {report.max_abs_diff:.5f}"
+    )
+    if report.min_cosine < min_cosine:
+        render_error(f"min cosine {report.min_cosine:.5f} < {min_cosine:.5f}")
+        raise typer.Exit(code=1)
+    render_success("ONNX embeddings match PyTorch within tolerance.")
+
+
+def _parity_cases(dataset: Path, candidates: int) -> list[tuple[str, list[str]]]:
+    """Pair every golden query with its contexts plus the following rows' as distractors."""
+    rows = [json.loads(line) for line in dataset.read_text(encoding="utf-8").splitlines() if line]
+    cases = []
+    for i, row in enumerate(rows):
+        passages = list(dict.fromkeys(row["ground_truth_contexts"]))
+        for other in rows[i + 1 :] + rows[:i]:
+            if len(passages) >= candidates:
+                break
+            passages.extend(c for c in other["ground_truth_contexts"] if c not in passages)
+        cases.append((row["query"], passages[:candidates]))
+    return cases
+
+
+@app.command("reranker-parity")
+def reranker_parity_cmd(
+    dataset: Path = typer.Argument(  # noqa: B008
+        Path("evals/golden_set.jsonl"), help="JSONL golden set."
+    ),
+    candidates: int = typer.Option(10, "--candidates", help="Passages scored per query."),
+    max_abs_diff: float = typer.Option(
+        0.05, "--max-abs-diff", help="Fail when any score differs by more than this."
+    ),
+    min_top1: float = typer.Option(
+        0.95, "--min-top1", help="Fail when fewer queries keep the same best passage."
+    ),
+) -> None:
+    """Score the golden set with the PyTorch and the ONNX reranker and report drift.
+
+    Uses the configured model, [bold]RAG_RERANKER__ONNX_QUANTIZATION[/bold] and
+    [bold]RAG_RERANKER__MAX_LENGTH[/bold]; exports and quantizes the ONNX
+    model first if needed. Exits with code [bold]1[/bold] when the largest
+    score difference exceeds [bold]--max-abs-diff[/bold] or the top-1
+    agreement is below [bold]--min-top1[/bold].
+    """
+    settings = build_settings()
+
+    try:
+        report = check_reranker_parity(settings, _parity_cases(dataset, candidates))
+    except Exception as exc:
+        render_error(f"Parity check failed: {exc}")
+        raise typer.Exit(code=1) from exc
+
+    console.print(
+        f"{report.queries} queries / {report.pairs} pairs — mean |diff| "
+        f"{report.mean_abs_diff:.5f}, max |diff| {report.max_abs_diff:.5f}, "
+        f"top-1 agreement {report.top1_agreement:.3f}, "
+        f"rank correlation {report.mean_rank_correlation:.4f}"
+    )
+    failed = False
+    if report.max_abs_diff > max_abs_diff:
+        render_error(f"max |diff| {report.max_abs_diff:.5f} > {max_abs_diff:.5f}")
+        failed = True
+    if report.top1_agreement < min_top1:
+        render_error(f"top-1 agreement {report.top1_agreement:.3f} < {min_top1:.3f}")
+        failed = True
+    if failed:
+        raise typer.Exit(code=1)
+    render_success("ONNX reranker scores match PyTorch within tolerance.")
+
+
 @sessions_app.command("list")
 def sessions_list(
     user_id: str | None = typer.Option(
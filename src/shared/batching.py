@@ -0,0 +1,84 @@
+"""Length-bucketed batching under a padded-token budget."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+
+from src.shared.metrics import observe_histogram
+
+__all__ = ["padding_ratio", "plan_token_batches", "run_length_bucketed"]
+
+
+def plan_token_batches(lengths: Sequence[int], max_batch_tokens: int) -> list[list[int]]:
+    """Group item indices into length-homogeneous batches.
+
+    Items are sorted by length and packed greedily while the padded size of
+    the batch (``items * longest item``) stays within *max_batch_tokens*; an
+    item longer than the budget gets a batch of its own.
+
+    Args:
+        lengths: Token length of every item.
+        max_batch_tokens: Padded-token budget per batch.
+
+    Returns:
+        Batches of indices into *lengths*, shortest items first.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        # Sorted ascending, so the newcomer is the longest item in the batch.
+        if current and (len(current) + 1) * lengths[index] > max_batch_tokens:
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def padding_ratio(lengths: Sequence[int], batches: Sequence[Sequence[int]]) -> float:
+    """Return the fraction of padded positions that are padding.
+
+    Args:
+        lengths: Token length of every item.
+        batches: Batches of indices into *lengths*.
+
+    Returns:
+        ``1 - real tokens / padded tokens``; 0.0 for empty input.
+    """
+    padded = sum(len(batch) * max(lengths[i] for i in batch) for batch in batches if batch)
+    if not padded:
+        return 0.0
+    return 1.0 - sum(lengths) / padded
+
+
+def run_length_bucketed[T, R](
+    items: Sequence[T],
+    lengths: Sequence[int],
+    max_batch_tokens: int,
+    run: Callable[[list[T]], Iterable[R]],
+    component: str,
+) -> list[R]:
+    """Run *run* over length-bucketed batches of *items* and restore input order.
+
+    Records the plan's padding ratio in the ``batch_padding_ratio{component}``
+    histogram.
+
+    Args:
+        items: Inputs to process.
+        lengths: Token length of every item.
+        max_batch_tokens: Padded-token budget per batch.
+        run: Processes one batch and returns one result per item, in order.
+        component: Metric label naming the caller (``embedder``, ``reranker``).
+
+    Returns:
+        One result per item, in the order of *items*.
+    """
+    batches = plan_token_batches(lengths, max_batch_tokens)
+    observe_histogram(
+        "batch_padding_ratio", padding_ratio(lengths, batches), {"component": component}
+    )
+    results: dict[int, R] = {}
+    for batch in batches:
+        results.update(zip(batch, run([items[i] for i in batch]), strict=True))
+    return [results[i] for i in range(len(items))]
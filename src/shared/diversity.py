@@ -0,0 +1,65 @@
+"""Maximal marginal relevance over a candidate similarity matrix."""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+__all__ = ["cosine_similarity_matrix", "mmr_select"]
+
+
+def cosine_similarity_matrix(embeddings: npt.ArrayLike) -> npt.NDArray[np.float32]:
+    """Return the ``(n, n)`` cosine similarities of the rows of *embeddings*.
+
+    Args:
+        embeddings: ``(n, dim)`` candidate embeddings; all-zero rows are
+            similar to nothing.
+
+    Returns:
+        Symmetric float32 matrix, from one matrix product.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    unit = (matrix / np.where(norms > 0, norms, 1.0)).astype(np.float32, copy=False)
+    return unit @ unit.T
+
+
+def mmr_select(
+    similarity: npt.ArrayLike,
+    relevance: npt.ArrayLike,
+    k: int,
+    lambda_: float,
+    duplicate_threshold: float,
+) -> list[int]:
+    """Pick up to *k* candidates by maximal marginal relevance.
+
+    Each step takes the candidate maximising
+    ``lambda_ * relevance - (1 - lambda_) * max similarity to those already
+    picked``; the running maximum is one ``np.maximum`` over a matrix row per
+    step. Candidates whose similarity to a picked one reaches
+    *duplicate_threshold* are dropped as near-duplicates, so fewer than *k*
+    may come back.
+
+    Args:
+        similarity: ``(n, n)`` candidate similarity matrix.
+        relevance: ``(n,)`` relevance of every candidate, higher is better.
+        k: Maximum number of candidates to pick.
+        lambda_: Weight of relevance against diversity, in ``[0, 1]``.
+        duplicate_threshold: Similarity at which a candidate is a near-duplicate.
+
+    Returns:
+        Indices of the picked candidates, in pick order.
+    """
+    sim = np.asarray(similarity, dtype=np.float32)
+    rel = np.asarray(relevance, dtype=np.float32)
+    available = np.ones(len(rel), dtype=bool)
+    redundancy = np.zeros(len(rel), dtype=np.float32)
+    picked: list[int] = []
+    while len(picked) < k and available.any():
+        gains = np.where(available, lambda_ * rel - (1 - lambda_) * redundancy, -np.inf)
+        best = int(np.argmax(gains))
+        picked.append(best)
+        available[best] = False
+        available &= sim[best] < duplicate_threshold
+        redundancy = np.maximum(redundancy, sim[best])
+    return picked
@@ -0,0 +1,24 @@
+"""Text normalization shared by the query-keyed caches."""
+
+from __future__ import annotations
+
+import hashlib
+import unicodedata
+
+__all__ = ["query_digest"]
+
+
+def query_digest(query: str) -> str:
+    """Return the SHA-256 hex digest of *query* after normalization.
+
+    Normalization applies NFKC, case-folds and collapses whitespace, so
+    trivially different spellings of the same question share a digest.
+
+    Args:
+        query: Raw user query.
+
+    Returns:
+        64-character hex digest.
+    """
+    normalized = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+    return hashlib.sha256(normalized.encode()).hexdigest()
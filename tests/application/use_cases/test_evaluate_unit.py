@@ -158,3 +158,15 @@ async def test_default_agent_runner_no_answer_returns_fallback() -> None:
     runner = default_agent_runner(mock_graph)
     result = await runner("What is 1337?", "en")
     assert result.text == "No answer generated."
+
+
+async def test_default_agent_runner_passes_hnsw_overrides() -> None:
+    mock_graph = AsyncMock()
+    mock_graph.ainvoke.return_value = {"final_answer": None}
+
+    runner = default_agent_runner(mock_graph, ef_search=400, iterative_scan="strict_order")
+    await runner("What is 1337?", "en")
+
+    (state,), _ = mock_graph.ainvoke.call_args
+    assert state["ef_search"] == 400
+    assert state["iterative_scan"] == "strict_order"
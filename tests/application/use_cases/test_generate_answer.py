@@ -129,6 +129,23 @@ async def test_citations_are_grounded_only(loader: PromptTemplateLoader) -> None
     llm.generate.assert_called_once()
 
 
+async def test_citation_page_read_from_chunker_page_number(
+    loader: PromptTemplateLoader,
+) -> None:
+    chunk = _chunk(page=None).model_copy(update={"metadata": {"page_number": 7}})
+    cid = str(chunk.chunk_id)
+    uc = GenerateAnswerUseCase(llm=_make_llm(text=f"42 [{cid}]."), prompt_template_loader=loader)
+
+    answer = await uc.execute(
+        query="What is the answer?",
+        retrieved_chunks=[chunk],
+        history=[],
+        language="en",
+    )
+
+    assert answer.citations[0].page == 7
+
+
 async def test_duplicate_markers_deduplicated(loader: PromptTemplateLoader) -> None:
     chunk = _chunk()
     cid = str(chunk.chunk_id)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import logging
+import uuid
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.application.use_cases.ingest_documents import IngestDocumentsUseCase, _detect_language
-from src.domain.ports.dto import ChunkContent, IngestionReport, RawDocument
+from src.application.use_cases.ingest_documents import (
+    IngestDocumentsUseCase,
+    _chunk_hash,
+    _detect_language,
+    _diff_chunks,
+)
+from src.domain.ports.dto import ChunkContent, IngestionReport, RawDocument, StoredChunkHash
+from src.infrastructure.persistence.models import DocumentORM
 
 
 def _make_raw_doc(
@@ -68,6 +75,10 @@ def embedder() -> MagicMock:
 def vector_store() -> MagicMock:
     m = MagicMock()
     m.upsert = AsyncMock(return_value=2)
+    m.chunk_hashes = AsyncMock(return_value=[])
+    m.delete = AsyncMock()
+    m.reposition = AsyncMock()
+    m.flush = AsyncMock()
     return m
 
 
@@ -316,3 +327,254 @@ def test_detect_language_returns_code() -> None:
     with patch("src.application.use_cases.ingest_documents.detect", return_value="en"):
         result = _detect_language("This is English")
     assert result == "en"
+
+
+async def test_unchanged_chunks_are_not_reembedded_or_rewritten(
+    use_case: IngestDocumentsUseCase,
+    chunker: MagicMock,
+    embedder: MagicMock,
+    vector_store: MagicMock,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"edited content")
+    first, second = chunker.chunk.return_value
+    kept_id, edited_id, stale_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    vector_store.chunk_hashes.return_value = [
+        StoredChunkHash(
+            id=kept_id, position=0, content_hash=_chunk_hash(first, str(pdf), "en", None)
+        ),
+        StoredChunkHash(id=edited_id, position=1, content_hash="outdated"),
+        StoredChunkHash(id=stale_id, position=2, content_hash="removed"),
+    ]
+    embedder.embed_texts.return_value = [[0.2] * 1024]
+
+    with patch("src.application.use_cases.ingest_documents._detect_language", return_value="en"):
+        report = await use_case.execute(pdf)
+
+    embedder.embed_texts.assert_awaited_once_with(["Second chunk"])
+    (written,) = vector_store.upsert.call_args.args[0]
+    assert written.id == edited_id
+    assert written.content_hash == _chunk_hash(second, str(pdf), "en", None)
+    vector_store.delete.assert_awaited_once_with([stale_id])
+    assert report.chunks_created == 1
+    assert report.chunks_unchanged == 1
+
+
+async def test_fully_unchanged_document_skips_embedding_and_writes(
+    use_case: IngestDocumentsUseCase,
+    chunker: MagicMock,
+    embedder: MagicMock,
+    vector_store: MagicMock,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"re-exported content")
+    vector_store.chunk_hashes.return_value = [
+        StoredChunkHash(
+            id=uuid.uuid4(), position=c.position, content_hash=_chunk_hash(c, str(pdf), "ar", "ar")
+        )
+        for c in chunker.chunk.return_value
+    ]
+
+    report = await use_case.execute(pdf, language_hint="ar")
+
+    embedder.embed_texts.assert_not_called()
+    vector_store.upsert.assert_not_called()
+    vector_store.delete.assert_not_called()
+    assert report.chunks_created == 0
+    assert report.chunks_unchanged == 2
+
+
+async def test_moved_chunk_reuses_its_stored_row(
+    use_case: IngestDocumentsUseCase,
+    chunker: MagicMock,
+    embedder: MagicMock,
+    vector_store: MagicMock,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"paragraph inserted at the top")
+    inserted, moved = _make_chunk("New intro"), _make_chunk("First chunk", 1)
+    chunker.chunk.return_value = [inserted, moved]
+    moved_id, replaced_id = uuid.uuid4(), uuid.uuid4()
+    vector_store.chunk_hashes.return_value = [
+        StoredChunkHash(
+            id=moved_id, position=0, content_hash=_chunk_hash(moved, str(pdf), "en", "en")
+        ),
+        StoredChunkHash(id=replaced_id, position=1, content_hash="outdated"),
+    ]
+    embedder.embed_texts.return_value = [[0.2] * 1024]
+
+    report = await use_case.execute(pdf, language_hint="en")
+
+    embedder.embed_texts.assert_awaited_once_with(["New intro"])
+    vector_store.reposition.assert_awaited_once_with({moved_id: 1})
+    (written,) = vector_store.upsert.call_args.args[0]
+    assert written.position == 0
+    vector_store.delete.assert_awaited_once_with([replaced_id])
+    assert (report.chunks_created, report.chunks_unchanged) == (1, 1)
+
+
+def test_chunk_hash_changes_with_embedding_model() -> None:
+    chunk = _make_chunk("same text")
+
+    assert _chunk_hash(chunk, "/kb/a.pdf", "en", None, "model-a") != _chunk_hash(
+        chunk, "/kb/a.pdf", "en", None, "model-b"
+    )
+
+
+def test_diff_reuses_stale_row_at_position_for_new_content() -> None:
+    chunks = [_make_chunk("a"), _make_chunk("b", 1), _make_chunk("c", 2)]
+    ids = [uuid.uuid4() for _ in range(3)]
+    stored = [
+        StoredChunkHash(id=ids[0], position=0, content_hash="ha"),
+        StoredChunkHash(id=ids[1], position=1, content_hash="hc"),
+        StoredChunkHash(id=ids[2], position=5, content_hash="gone"),
+    ]
+
+    diff = _diff_chunks(stored, chunks, ["ha", "hb", "hc"])
+
+    assert diff.moved == {ids[1]: 2}
+    assert [(c.content, reuse) for c, _, reuse in diff.changed] == [("b", None)]
+    assert diff.stale == [ids[2]]
+
+
+async def test_edited_file_keeps_document_id_of_its_source_path(
+    use_case: IngestDocumentsUseCase,
+    session_factory: MagicMock,
+    vector_store: MagicMock,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"edited content")
+    existing = DocumentORM(
+        id=uuid.uuid4(), source_path=str(pdf), content_hash="previous", language="en"
+    )
+    session = session_factory.return_value.__aenter__.return_value
+    no_row, path_row = MagicMock(), MagicMock()
+    no_row.scalar_one_or_none.return_value = None
+    path_row.scalar_one_or_none.return_value = existing
+    session.execute.side_effect = [no_row, no_row, path_row, no_row]
+
+    await use_case.execute(pdf, language_hint="en")
+
+    vector_store.chunk_hashes.assert_awaited_once_with(existing.id)
+    assert existing.content_hash == "abc123"
+    assert {c.document_id for c in vector_store.upsert.call_args.args[0]} == {existing.id}
+
+
+async def test_passage_indexer_sees_changed_chunks_before_upsert(
+    loader: MagicMock,
+    chunker: MagicMock,
+    embedder: MagicMock,
+    vector_store: MagicMock,
+    session_factory: MagicMock,
+    tracer: MagicMock,
+    logger: logging.Logger,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"fake pdf content")
+    calls: list[str] = []
+    indexer = MagicMock()
+    indexer.index_passages = AsyncMock(side_effect=lambda _: calls.append("index"))
+    vector_store.upsert = AsyncMock(side_effect=lambda _: calls.append("upsert") or 2)
+    uc = IngestDocumentsUseCase(
+        loader=loader,
+        chunker=chunker,
+        embedder=embedder,
+        vector_store=vector_store,
+        session_repo=session_factory,
+        tracer=tracer,
+        logger=logger,
+        passage_indexer=indexer,
+    )
+
+    await uc.execute(pdf)
+
+    indexer.index_passages.assert_awaited_once_with(["First chunk", "Second chunk"])
+    assert calls == ["index", "upsert"]
+
+
+async def test_lexical_embedder_embeds_dense_and_weights_in_one_pass(
+    loader: MagicMock,
+    chunker: MagicMock,
+    embedder: MagicMock,
+    vector_store: MagicMock,
+    session_factory: MagicMock,
+    tracer: MagicMock,
+    logger: logging.Logger,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"fake pdf content")
+    lexical = MagicMock()
+    lexical.embed_texts_with_lexical = AsyncMock(
+        return_value=([[0.2] * 1024, [0.3] * 1024], [{6: 0.3}, {9: 0.1}])
+    )
+    uc = IngestDocumentsUseCase(
+        loader=loader,
+        chunker=chunker,
+        embedder=embedder,
+        vector_store=vector_store,
+        session_repo=session_factory,
+        tracer=tracer,
+        logger=logger,
+        lexical_embedder=lexical,
+    )
+
+    await uc.execute(pdf)
+
+    embedder.embed_texts.assert_not_awaited()
+    lexical.embed_texts_with_lexical.assert_awaited_once_with(["First chunk", "Second chunk"])
+    stored = vector_store.upsert.call_args.args[0]
+    assert [c.sparse_embedding for c in stored] == [{6: 0.3}, {9: 0.1}]
+    assert list(stored[0].embedding) == pytest.approx([0.2] * 1024)
+
+
+async def test_passage_indexer_forgets_overwritten_and_stale_content(
+    loader: MagicMock,
+    chunker: MagicMock,
+    embedder: MagicMock,
+    vector_store: MagicMock,
+    session_factory: MagicMock,
+    tracer: MagicMock,
+    logger: logging.Logger,
+    tmp_path: Path,
+) -> None:
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"fake pdf content")
+    reused_id, stale_id, kept_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    vector_store.chunk_hashes.return_value = [
+        StoredChunkHash(id=reused_id, position=0, content_hash="outdated"),
+        StoredChunkHash(id=stale_id, position=7, content_hash="outdated"),
+        StoredChunkHash(id=kept_id, position=9, content_hash="outdated"),
+    ]
+    calls: list[str] = []
+    vector_store.contents = AsyncMock(
+        side_effect=lambda _: (
+            calls.append("contents")
+            or {reused_id: "Old intro", stale_id: "Gone", kept_id: "Second chunk"}
+        )
+    )
+    vector_store.upsert = AsyncMock(side_effect=lambda _: calls.append("upsert") or 2)
+    indexer = MagicMock()
+    indexer.index_passages = AsyncMock()
+    indexer.forget_passages = AsyncMock()
+    uc = IngestDocumentsUseCase(
+        loader=loader,
+        chunker=chunker,
+        embedder=embedder,
+        vector_store=vector_store,
+        session_repo=session_factory,
+        tracer=tracer,
+        logger=logger,
+        passage_indexer=indexer,
+    )
+
+    await uc.execute(pdf)
+
+    assert calls == ["contents", "upsert"]
+    assert set(vector_store.contents.call_args.args[0]) == {reused_id, stale_id, kept_id}
+    indexer.forget_passages.assert_awaited_once_with(["Old intro", "Gone"])
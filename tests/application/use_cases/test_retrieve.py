@@ -3,9 +3,11 @@ from __future__ import annotations
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from src.application.use_cases.retrieve import RetrieveUseCase
+from src.config.settings import Settings
 from src.domain.ports.dto import RetrievedChunk
 
 
@@ -23,6 +25,7 @@ def _make_settings(top_k_dense: int = 20, top_k_rerank: int = 5) -> MagicMock:
     settings = MagicMock()
     settings.vector_store.top_k_dense = top_k_dense
     settings.vector_store.top_k_rerank = top_k_rerank
+    settings.vector_store.mmr_enabled = False
     return settings
 
 
@@ -31,6 +34,7 @@ def _make_use_case(
     reranked: list[RetrievedChunk] | None = None,
     top_k_dense: int = 20,
     top_k_rerank: int = 5,
+    lexical_embedder: MagicMock | None = None,
 ) -> tuple[RetrieveUseCase, MagicMock, MagicMock, MagicMock]:
     embedder = MagicMock()
     embedder.embed_query = AsyncMock(return_value=[0.1] * 1024)
@@ -48,6 +52,7 @@ def _make_use_case(
         vector_store=vector_store,
         reranker=reranker,
         settings=settings,
+        lexical_embedder=lexical_embedder,
     )
     return uc, embedder, vector_store, reranker
 
@@ -120,3 +125,190 @@ async def test_embedder_failure_propagates() -> None:
 
     with pytest.raises(RuntimeError, match="embed failed"):
         await uc.execute("Query", language="en")
+
+
+async def test_lexical_embedder_embeds_query_in_one_pass() -> None:
+    lexical = MagicMock()
+    lexical.embed_query_with_lexical = AsyncMock(return_value=([0.2] * 1024, {6: 0.3}))
+    uc, embedder, vector_store, _ = _make_use_case(chunks=[_chunk()], lexical_embedder=lexical)
+
+    await uc.execute("piscine", language="fr")
+
+    lexical.embed_query_with_lexical.assert_awaited_once_with("piscine")
+    embedder.embed_query.assert_not_awaited()
+    assert vector_store.hybrid_search.call_args.kwargs["query_vector"] == [0.2] * 1024
+    assert vector_store.hybrid_search.call_args.kwargs["query_sparse"] == {6: 0.3}
+
+
+async def test_execute_many_issues_one_batched_search() -> None:
+    first = [_chunk() for _ in range(8)]
+    second = [_chunk()]
+    reranked = [_chunk(score=0.95)]
+    uc, embedder, vector_store, reranker = _make_use_case(reranked=reranked, top_k_rerank=5)
+    vector_store.hybrid_search_many = AsyncMock(return_value=[first, second])
+
+    results = await uc.execute_many(["q1", "q2"], language="fr")
+
+    assert results == [reranked, second]
+    assert embedder.embed_query.await_count == 2
+    vector_store.hybrid_search.assert_not_called()
+    (batch,), kwargs = vector_store.hybrid_search_many.call_args
+    assert [q.query_text for q in batch] == ["q1", "q2"]
+    assert all(q.filters == {"language": "fr"} for q in batch)
+    assert kwargs == {
+        "top_k": 20,
+        "ef_search": None,
+        "iterative_scan": None,
+        "with_embeddings": False,
+    }
+    reranker.rerank.assert_called_once()
+
+
+async def test_hnsw_overrides_reach_the_vector_store() -> None:
+    uc, _, vector_store, _ = _make_use_case(chunks=[_chunk()])
+    vector_store.hybrid_search_many = AsyncMock(return_value=[[_chunk()]])
+
+    await uc.execute("q", language="en", ef_search=400, iterative_scan="strict_order")
+    await uc.execute_many(["q"], language="en", ef_search=200, iterative_scan="relaxed_order")
+
+    single = vector_store.hybrid_search.call_args.kwargs
+    assert (single["ef_search"], single["iterative_scan"]) == (400, "strict_order")
+    many = vector_store.hybrid_search_many.call_args.kwargs
+    assert (many["ef_search"], many["iterative_scan"]) == (200, "relaxed_order")
+
+
+async def test_execute_many_empty_input_skips_search() -> None:
+    uc, _, vector_store, _ = _make_use_case()
+    vector_store.hybrid_search_many = AsyncMock()
+
+    assert await uc.execute_many([]) == []
+    vector_store.hybrid_search_many.assert_not_called()
+
+
+class _DictCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, list[RetrievedChunk]] = {}
+
+    async def get(self, key: str) -> list[RetrievedChunk] | None:
+        return self.entries.get(key)
+
+    async def set(self, key: str, chunks: list[RetrievedChunk]) -> None:
+        self.entries[key] = chunks
+
+
+def _make_cached_use_case(
+    chunks: list[RetrievedChunk], generation: int = 1
+) -> tuple[RetrieveUseCase, MagicMock, MagicMock, _DictCache]:
+    _, embedder, vector_store, reranker = _make_use_case(chunks=chunks)
+    vector_store.generation = AsyncMock(return_value=generation)
+    cache = _DictCache()
+    uc = RetrieveUseCase(
+        embedder=embedder,
+        vector_store=vector_store,
+        reranker=reranker,
+        settings=_make_settings(),
+        cache=cache,
+    )
+    return uc, embedder, vector_store, cache
+
+
+async def test_cache_hit_skips_embedding_and_search() -> None:
+    chunks = [_chunk()]
+    uc, embedder, vector_store, _ = _make_cached_use_case(chunks)
+
+    first = await uc.execute("How do I apply to the Piscine?", language="en")
+    second = await uc.execute("  how do I apply to the   piscine? ", language="en")
+
+    assert first == second == chunks
+    embedder.embed_query.assert_awaited_once()
+    vector_store.hybrid_search.assert_awaited_once()
+
+
+async def test_cache_keys_include_language_and_corpus_generation() -> None:
+    uc, _, vector_store, cache = _make_cached_use_case([_chunk()], generation=1)
+
+    await uc.execute("q", language="en")
+    await uc.execute("q", language="fr")
+    vector_store.generation = AsyncMock(return_value=2)
+    await uc.execute("q", language="en")
+
+    assert vector_store.hybrid_search.await_count == 3
+    assert len(cache.entries) == 3
+
+
+async def test_cache_keys_include_hnsw_overrides() -> None:
+    uc, _, vector_store, cache = _make_cached_use_case([_chunk()])
+
+    await uc.execute("q", language="en")
+    await uc.execute("q", language="en", ef_search=400)
+
+    assert vector_store.hybrid_search.await_count == 2
+    assert len(cache.entries) == 2
+
+
+async def test_cache_keys_include_ranking_settings() -> None:
+    cache = _DictCache()
+    cascade = Settings(llm={"api_key": "test"}, reranker={"cascade_enabled": True})  # type: ignore[arg-type]
+    for settings in (Settings(llm={"api_key": "test"}), cascade, cascade):  # type: ignore[arg-type]
+        _, embedder, vector_store, reranker = _make_use_case(chunks=[_chunk()])
+        vector_store.generation = AsyncMock(return_value=1)
+        uc = RetrieveUseCase(embedder, vector_store, reranker, settings, cache=cache)
+        await uc.execute("q", language="en")
+
+    assert len(cache.entries) == 2
+
+
+async def test_execute_many_only_searches_cache_misses() -> None:
+    cached = [_chunk()]
+    fresh = [_chunk()]
+    uc, embedder, vector_store, _ = _make_cached_use_case(cached)
+    await uc.execute("cached question", language="en")
+    vector_store.hybrid_search_many = AsyncMock(return_value=[fresh])
+
+    results = await uc.execute_many(["cached question", "new question"], language="en")
+
+    assert results == [cached, fresh]
+    (batch,), _ = vector_store.hybrid_search_many.call_args
+    assert [q.query_text for q in batch] == ["new question"]
+    assert embedder.embed_query.await_count == 2
+
+
+async def test_mmr_drops_near_duplicates_before_rerank() -> None:
+    # Chunks 0 and 1 are overlapping chunks of one section; the rest are distinct.
+    embeddings = np.eye(7, dtype=np.float32)
+    embeddings[1] = embeddings[0]
+    chunks = [
+        _chunk(score=s).model_copy(update={"embedding": e})
+        for s, e in zip((0.05, 0.049, 0.04, 0.03, 0.02, 0.01, 0.009), embeddings, strict=True)
+    ]
+    uc, _, vector_store, reranker = _make_use_case(chunks=chunks, top_k_rerank=2)
+    vs = uc._settings.vector_store
+    vs.mmr_enabled = True
+    vs.mmr_top_k = 5
+    vs.mmr_lambda = 0.7
+    vs.mmr_duplicate_threshold = 0.95
+
+    await uc.execute("What is 1337?", language="en")
+
+    assert vector_store.hybrid_search.call_args.kwargs["with_embeddings"] is True
+    request = reranker.rerank.call_args.args[0]
+    assert [c.chunk_id for c in request.chunks] == [chunks[i].chunk_id for i in (0, 2, 3, 4, 5)]
+    assert all(c.embedding is None for c in request.chunks)
+
+
+async def test_mmr_disabled_does_not_request_embeddings() -> None:
+    chunks = [_chunk() for _ in range(10)]
+    uc, _, vector_store, reranker = _make_use_case(chunks=chunks)
+
+    await uc.execute("What is 1337?", language="en")
+
+    assert vector_store.hybrid_search.call_args.kwargs["with_embeddings"] is False
+    assert reranker.rerank.call_args.args[0].chunks == chunks
+
+
+async def test_mmr_rejects_candidates_without_embeddings() -> None:
+    uc, _, _, _ = _make_use_case(chunks=[_chunk(), _chunk()])
+    uc._settings.vector_store.mmr_enabled = True
+
+    with pytest.raises(ValueError, match="without embeddings"):
+        await uc.execute("What is 1337?", language="en")
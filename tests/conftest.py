@@ -3,6 +3,7 @@ from __future__ import annotations
 import importlib
 from collections.abc import AsyncIterator
 
+import numpy as np
 import pytest
 
 
@@ -22,11 +23,11 @@ class FakeLLM:
 
 
 class FakeEmbedder:
-    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        return [[0.0] * 1024 for _ in texts]
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return np.zeros((len(texts), 1024), dtype=np.float32)
 
-    async def embed_query(self, text: str) -> list[float]:
-        return [0.0] * 1024
+    async def embed_query(self, text: str) -> np.ndarray:
+        return np.zeros(1024, dtype=np.float32)
 
     @property
     def dimension(self) -> int:
@@ -43,9 +44,21 @@ class FakeVectorStore:
     async def hybrid_search(self, query_vector, query_text, top_k, filters=None):
         return []
 
+    async def hybrid_search_many(self, queries, top_k):
+        return [[] for _ in queries]
+
     async def delete_by_document(self, document_id):
         return 0
 
+    async def delete(self, chunk_ids):
+        return None
+
+    async def chunk_hashes(self, document_id):
+        return []
+
+    async def generation(self):
+        return 0
+
     async def count(self):
         return 0
 
@@ -54,6 +67,9 @@ class FakeReranker:
     async def rerank(self, request):
         return request.chunks
 
+    async def warm_up(self):
+        return None
+
 
 @pytest.fixture(autouse=True)
 def _set_test_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -0,0 +1,128 @@
+"""Unit tests for the persistent embedding cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.infrastructure.cache.embedding_cache import CachingEmbedder, DiskEmbeddingStore
+from src.shared.metrics import REGISTRY
+
+
+def _counter(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(f"{name}_total", labels) or 0.0
+
+
+class _CountingEmbedder:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+        self.queries: list[str] = []
+
+    @property
+    def dimension(self) -> int:
+        return 3
+
+    @staticmethod
+    def _vector(text: str) -> list[float]:
+        return [float(len(text)), 0.5, -1.0]
+
+    async def embed_texts(self, texts: list[str]) -> np.ndarray:
+        self.texts.extend(texts)
+        return np.array([self._vector(t) for t in texts], dtype=np.float32)
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        self.queries.append(text)
+        return np.array([*self._vector(text)[:2], 1.0], dtype=np.float32)
+
+
+def _make(path: Path, max_entries: int = 16) -> tuple[CachingEmbedder, _CountingEmbedder]:
+    inner = _CountingEmbedder()
+    store = DiskEmbeddingStore(path, dimension=inner.dimension, max_entries=max_entries)
+    return CachingEmbedder(inner, store, model_id="e5-small"), inner
+
+
+async def test_repeated_texts_are_served_from_cache(tmp_path: Path) -> None:
+    embedder, inner = _make(tmp_path)
+    hits_before = _counter("embedding_cache_lookups", result="hit")
+
+    first = await embedder.embed_texts(["alpha", "beta", "alpha"])
+    second = await embedder.embed_texts(["beta", "gamma", "alpha"])
+
+    assert inner.texts == ["alpha", "beta", "gamma"]
+    assert first.tolist() == [[5.0, 0.5, -1.0], [4.0, 0.5, -1.0], [5.0, 0.5, -1.0]]
+    assert second.tolist() == [[4.0, 0.5, -1.0], [5.0, 0.5, -1.0], [5.0, 0.5, -1.0]]
+    assert _counter("embedding_cache_lookups", result="hit") == hits_before + 2
+
+
+async def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    warm, _ = _make(tmp_path)
+    await warm.embed_texts(["persisted passage"])
+
+    cold, inner = _make(tmp_path)
+
+    assert (await cold.embed_texts(["persisted passage"])).tolist() == [[17.0, 0.5, -1.0]]
+    assert inner.texts == []
+
+
+async def test_queries_and_passages_do_not_share_entries(tmp_path: Path) -> None:
+    embedder, inner = _make(tmp_path)
+    await embedder.embed_texts(["same text"])
+
+    assert (await embedder.embed_query("same text")).tolist() == [9.0, 0.5, 1.0]
+    assert (await embedder.embed_query("same text")).tolist() == [9.0, 0.5, 1.0]
+    assert inner.queries == ["same text"]
+
+
+async def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    embedder, inner = _make(tmp_path, max_entries=2)
+    await embedder.embed_texts(["a", "b"])
+    await embedder.embed_texts(["a"])  # refresh "a"; "b" is now least recent
+
+    await embedder.embed_texts(["c"])
+    inner.texts.clear()
+    await embedder.embed_texts(["a", "b", "c"])
+
+    assert inner.texts == ["b"]
+
+
+def test_shape_change_resets_store(tmp_path: Path) -> None:
+    DiskEmbeddingStore(tmp_path, dimension=3, max_entries=4).put_many([("k", [1.0, 2.0, 3.0])])
+
+    assert DiskEmbeddingStore(tmp_path, dimension=2, max_entries=4).get_many(["k"]) == {}
+
+
+async def test_store_failure_falls_back_to_inner_embedder(tmp_path: Path) -> None:
+    inner = _CountingEmbedder()
+    store = MagicMock(spec=DiskEmbeddingStore)
+    store.get_many.side_effect = sqlite3.OperationalError("database is locked")
+    store.put_many.side_effect = OSError("disk full")
+    embedder = CachingEmbedder(inner, store, model_id="e5-small")
+
+    assert (await embedder.embed_texts(["x"])).tolist() == [[1.0, 0.5, -1.0]]
+    assert inner.texts == ["x"]
+
+
+async def test_batch_is_returned_as_float32_matrix(tmp_path: Path) -> None:
+    embedder, _ = _make(tmp_path)
+    await embedder.embed_texts(["cached"])
+
+    vectors = await embedder.embed_texts(["cached", "fresh"])
+
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (2, 3)
+    assert (await embedder.embed_texts([])).shape == (0, 3)
+
+
+@pytest.mark.parametrize("model_id", ["e5-small", "e5-large"])
+async def test_model_id_is_part_of_the_key(tmp_path: Path, model_id: str) -> None:
+    inner = _CountingEmbedder()
+    store = DiskEmbeddingStore(tmp_path, dimension=3, max_entries=4)
+    await CachingEmbedder(inner, store, model_id="e5-base").embed_texts(["shared"])
+
+    await CachingEmbedder(inner, store, model_id=model_id).embed_texts(["shared"])
+
+    assert inner.texts == ["shared", "shared"]
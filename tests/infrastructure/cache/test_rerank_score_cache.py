@@ -0,0 +1,50 @@
+"""Unit tests for the reranker score cache."""
+
+from __future__ import annotations
+
+import uuid
+
+from src.domain.ports.dto import RetrievedChunk
+from src.infrastructure.cache.rerank_score_cache import RerankScoreCache
+from src.shared.metrics import REGISTRY
+
+
+def _chunk(content: str = "Apply to the piscine online.") -> RetrievedChunk:
+    return RetrievedChunk(
+        chunk_id=uuid.uuid4(),
+        document_id=uuid.uuid4(),
+        content=content,
+        score=0.5,
+        source_path="/kb/admissions.pdf",
+    )
+
+
+def _counter(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(f"{name}_total", labels) or 0.0
+
+
+def test_keys_normalize_query_and_track_chunk_content() -> None:
+    chunk = _chunk()
+    edited = chunk.model_copy(update={"content": "Apply on site."})
+
+    (key,) = RerankScoreCache.keys("m", "How to APPLY?", [chunk])
+
+    assert RerankScoreCache.keys("m", "  how to apply? ", [chunk]) == [key]
+    assert RerankScoreCache.keys("m", "How to apply?", [edited]) != [key]
+    assert RerankScoreCache.keys("other-model", "How to apply?", [chunk]) != [key]
+
+
+def test_lru_bound_and_saved_pair_counters() -> None:
+    cache = RerankScoreCache(max_entries=2)
+    first, second, third = RerankScoreCache.keys("m", "q", [_chunk(), _chunk(), _chunk()])
+    saved = _counter("reranker_score_cache_saved_pairs")
+    misses = _counter("reranker_score_cache_lookups", result="miss")
+
+    cache.put_many([(first, 0.1), (second, 0.2)])
+    assert cache.get_many([first]) == {first: 0.1}
+    cache.put_many([(third, 0.3)])
+
+    assert cache.get_many([first, second, third]) == {first: 0.1, third: 0.3}
+    assert _counter("reranker_score_cache_saved_pairs") == saved + 3
+    assert _counter("reranker_score_cache_lookups", result="miss") == misses + 1
+    assert REGISTRY.get_sample_value("reranker_score_cache_hit_ratio") == 0.75
@@ -0,0 +1,121 @@
+"""Unit tests for the retrieval result caches."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from src.domain.ports.dto import RetrievedChunk
+from src.infrastructure.cache.retrieval_cache import InMemoryRetrievalCache, SharedRetrievalCache
+from src.shared.metrics import REGISTRY
+
+
+def _chunk() -> RetrievedChunk:
+    return RetrievedChunk(
+        chunk_id=uuid.uuid4(),
+        document_id=uuid.uuid4(),
+        content="Apply to the piscine online.",
+        score=0.8,
+        source_path="/kb/admissions.pdf",
+        metadata={"page_number": 2},
+    )
+
+
+def _counter(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(f"{name}_total", labels) or 0.0
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeKeyValue:
+    def __init__(self, fail: bool = False) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.fail = fail
+
+    async def get(self, name: str) -> bytes | None:
+        if self.fail:
+            raise ConnectionError("down")
+        return self.data.get(name)
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        if self.fail:
+            raise ConnectionError("down")
+        self.data[name] = value
+        self.ttls[name] = ex
+        return True
+
+
+async def test_memory_cache_hit_and_miss_metrics() -> None:
+    cache = InMemoryRetrievalCache(max_entries=4, ttl_seconds=60)
+    chunks = [_chunk()]
+    hits = _counter("retrieval_cache_lookups", backend="memory", result="hit")
+    misses = _counter("retrieval_cache_lookups", backend="memory", result="miss")
+
+    assert await cache.get("k") is None
+    await cache.set("k", chunks)
+    assert await cache.get("k") == chunks
+
+    assert _counter("retrieval_cache_lookups", backend="memory", result="hit") == hits + 1
+    assert _counter("retrieval_cache_lookups", backend="memory", result="miss") == misses + 1
+
+
+async def test_memory_cache_evicts_least_recently_used() -> None:
+    cache = InMemoryRetrievalCache(max_entries=2, ttl_seconds=60)
+    evictions = _counter("retrieval_cache_evictions", backend="memory", reason="lru")
+    await cache.set("a", [_chunk()])
+    await cache.set("b", [_chunk()])
+    await cache.get("a")
+
+    await cache.set("c", [_chunk()])
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    assert await cache.get("c") is not None
+    assert _counter("retrieval_cache_evictions", backend="memory", reason="lru") == evictions + 1
+
+
+async def test_memory_cache_expires_after_ttl() -> None:
+    clock = _Clock()
+    cache = InMemoryRetrievalCache(max_entries=2, ttl_seconds=10, clock=clock)
+    await cache.set("k", [_chunk()])
+
+    clock.now = 10.0
+    assert await cache.get("k") is not None
+    clock.now = 10.5
+    assert await cache.get("k") is None
+
+
+async def test_shared_cache_round_trips_through_client() -> None:
+    client = _FakeKeyValue()
+    cache = SharedRetrievalCache(client, ttl_seconds=30)
+    chunks = [_chunk(), _chunk()]
+
+    await cache.set("k", chunks)
+
+    assert client.ttls == {"rag:k": 30}
+    assert await cache.get("k") == chunks
+    assert await cache.get("other") is None
+
+
+async def test_shared_cache_backend_errors_degrade_to_miss() -> None:
+    cache = SharedRetrievalCache(_FakeKeyValue(fail=True), ttl_seconds=30)
+
+    await cache.set("k", [_chunk()])
+
+    assert await cache.get("k") is None
+
+
+@pytest.mark.parametrize("ttl", [1, 600])
+async def test_shared_cache_passes_configured_ttl(ttl: int) -> None:
+    client = _FakeKeyValue()
+    await SharedRetrievalCache(client, ttl_seconds=ttl, namespace="ns").set("k", [])
+
+    assert client.ttls == {"ns:k": ttl}
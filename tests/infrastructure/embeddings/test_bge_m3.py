@@ -65,9 +65,9 @@ async def test_embed_query_returns_single_vector(embedder: BGEM3Embedder) -> Non
 
     result = await embedder.embed_query("What is 1337?")
 
-    assert isinstance(result, list)
-    assert len(result) == 1024
-    assert all(isinstance(v, float) for v in result)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float32
+    assert result.shape == (1024,)
 
 
 async def test_embed_texts_empty_list(embedder: BGEM3Embedder) -> None:
@@ -77,7 +77,8 @@ async def test_embed_texts_empty_list(embedder: BGEM3Embedder) -> None:
 
     result = await embedder.embed_texts([])
 
-    assert result == []
+    assert result.shape == (0, 1024)
+    mock_model.encode.assert_not_called()
 
 
 async def test_embed_texts_emits_histogram(embedder: BGEM3Embedder) -> None:
@@ -93,6 +94,85 @@ async def test_embed_texts_emits_histogram(embedder: BGEM3Embedder) -> None:
     assert "embedding_request_duration_seconds" in output
 
 
+async def test_embed_texts_with_lexical_uses_one_forward_pass(embedder: BGEM3Embedder) -> None:
+    mock_model = MagicMock()
+    mock_model.encode.return_value = {
+        "dense_vecs": np.ones((2, 1024), dtype=np.float32),
+        "lexical_weights": [{"6": 0.3, "1284": 0.12}, {}],
+    }
+    embedder._model = mock_model
+
+    dense, sparse = await embedder.embed_texts_with_lexical(["hello", "world"])
+
+    mock_model.encode.assert_called_once()
+    assert mock_model.encode.call_args.kwargs.get("return_dense") is True
+    assert mock_model.encode.call_args.kwargs.get("return_sparse") is True
+    assert dense.shape == (2, 1024)
+    assert dense.dtype == np.float32
+    assert sparse == [{6: pytest.approx(0.3), 1284: pytest.approx(0.12)}, {}]
+
+
+async def test_embed_texts_with_lexical_buckets_by_length(settings: Settings) -> None:
+    settings.embedding.max_batch_tokens = 4
+    embedder = BGEM3Embedder(settings)
+    mock_model = MagicMock()
+    mock_model.tokenizer.return_value = {"input_ids": [[1, 2, 3], [1], [1, 2]]}
+
+    def encode(texts: list[str], **_: object) -> dict[str, object]:
+        return {
+            "dense_vecs": np.array([[float(len(t))] * 1024 for t in texts], dtype=np.float32),
+            "lexical_weights": [{str(len(t)): 1.0} for t in texts],
+        }
+
+    mock_model.encode.side_effect = encode
+    embedder._model = mock_model
+
+    dense, sparse = await embedder.embed_texts_with_lexical(["ccc", "a", "bb"])
+
+    assert mock_model.encode.call_count > 1
+    assert [row[0] for row in dense] == [3.0, 1.0, 2.0]
+    assert sparse == [{3: 1.0}, {1: 1.0}, {2: 1.0}]
+
+
+async def test_embed_query_with_lexical_returns_single_pair(embedder: BGEM3Embedder) -> None:
+    mock_model = MagicMock()
+    mock_model.encode.return_value = {
+        "dense_vecs": np.ones((1, 1024), dtype=np.float32),
+        "lexical_weights": [{"42": 0.5}],
+    }
+    embedder._model = mock_model
+
+    dense, sparse = await embedder.embed_query_with_lexical("1337")
+
+    assert dense.shape == (1024,)
+    assert sparse == {42: 0.5}
+
+
+async def test_lexical_weights_on_torch_override_with_onnx_settings(settings: Settings) -> None:
+    settings.embedding.backend = "onnx"
+    embedder = BGEM3Embedder(settings, model="BAAI/bge-m3", backend="torch")
+    mock_model = MagicMock()
+    mock_model.encode.return_value = {
+        "dense_vecs": np.zeros((1, 1024), dtype=np.float32),
+        "lexical_weights": [{"7": 0.25}],
+    }
+    embedder._model = mock_model
+
+    _, sparse = await embedder.embed_query_with_lexical("hello")
+
+    assert sparse == {7: 0.25}
+    assert embedder._model_id == "BAAI/bge-m3"
+
+
+async def test_embed_texts_with_lexical_rejects_onnx_backend(settings: Settings) -> None:
+    settings.embedding.backend = "onnx"
+    embedder = BGEM3Embedder(settings)
+    embedder._model = MagicMock()
+
+    with pytest.raises(RuntimeError, match="torch"):
+        await embedder.embed_texts_with_lexical(["hello"])
+
+
 @pytest.mark.skipif(
     not os.getenv("RUN_INTEGRATION"),
     reason="Integration: requires FlagEmbedding + model download (set RUN_INTEGRATION=1)",
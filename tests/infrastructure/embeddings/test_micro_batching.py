@@ -0,0 +1,104 @@
+"""Unit tests for the cross-request micro-batching embedder."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from src.infrastructure.embeddings.micro_batching import MicroBatchingEmbedder
+from src.shared.metrics import REGISTRY
+
+
+class _RecordingEncoder:
+    query_prefix = "query: "
+    passage_prefix = "passage: "
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[str]] = []
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    def encode(self, prefixed_texts: list[str]) -> np.ndarray:
+        self.release.wait(timeout=5)
+        self.batches.append(prefixed_texts)
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return np.array([[float(len(t)), 1.0] for t in prefixed_texts], dtype=np.float32)
+
+
+async def test_concurrent_queries_share_one_forward_pass() -> None:
+    encoder = _RecordingEncoder()
+    embedder = MicroBatchingEmbedder(encoder, max_batch_size=64, max_wait_ms=20)
+
+    results = await asyncio.gather(*(embedder.embed_query(q) for q in ["a", "bb", "ccc"]))
+
+    assert encoder.batches == [["query: a", "query: bb", "query: ccc"]]
+    assert [r.tolist() for r in results] == [[8.0, 1.0], [9.0, 1.0], [10.0, 1.0]]
+
+
+async def test_full_batch_dispatches_without_waiting() -> None:
+    encoder = _RecordingEncoder()
+    embedder = MicroBatchingEmbedder(encoder, max_batch_size=2, max_wait_ms=10_000)
+
+    vectors = await asyncio.wait_for(embedder.embed_texts(["x", "y", "z", "w"]), timeout=2)
+
+    assert encoder.batches == [["passage: x", "passage: y"], ["passage: z", "passage: w"]]
+    assert vectors.shape == (4, 2)
+
+
+async def test_queries_jump_ahead_of_queued_passages() -> None:
+    encoder = _RecordingEncoder()
+    encoder.release.clear()
+    embedder = MicroBatchingEmbedder(encoder, max_batch_size=2, max_wait_ms=0)
+
+    first = asyncio.ensure_future(embedder.embed_texts(["p1"]))
+    await asyncio.sleep(0.01)  # "p1" is now being encoded
+    bulk = asyncio.ensure_future(embedder.embed_texts(["p2", "p3", "p4"]))
+    query = asyncio.ensure_future(embedder.embed_query("q"))
+    await asyncio.sleep(0)
+    encoder.release.set()
+    await asyncio.gather(first, bulk, query)
+
+    assert encoder.batches[1] == ["query: q", "passage: p2"]
+
+
+async def test_encoder_failure_propagates_to_every_caller() -> None:
+    embedder = MicroBatchingEmbedder(_RecordingEncoder(fail=True), max_wait_ms=1)
+
+    results = await asyncio.gather(
+        embedder.embed_query("a"), embedder.embed_query("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_batch_size_metric_observed() -> None:
+    before = REGISTRY.get_sample_value("embedding_batcher_batch_size_count") or 0.0
+    embedder = MicroBatchingEmbedder(_RecordingEncoder(), max_wait_ms=1)
+
+    await asyncio.gather(embedder.embed_query("a"), embedder.embed_query("b"))
+
+    assert REGISTRY.get_sample_value("embedding_batcher_batch_size_count") == before + 1
+    assert REGISTRY.get_sample_value("embedding_batcher_queue_depth") == 0.0
+
+
+async def test_empty_input_skips_encoder() -> None:
+    encoder = _RecordingEncoder()
+    assert (await MicroBatchingEmbedder(encoder).embed_texts([])).shape == (0, 2)
+    assert encoder.batches == []
+
+
+@pytest.mark.parametrize("wait_ms", [0, 5])
+async def test_sequential_calls_still_complete(wait_ms: float) -> None:
+    embedder = MicroBatchingEmbedder(_RecordingEncoder(), max_wait_ms=wait_ms)
+
+    assert (await embedder.embed_query("a")).tolist() == [8.0, 1.0]
+    assert (await embedder.embed_query("b")).tolist() == [8.0, 1.0]
@@ -0,0 +1,50 @@
+"""Unit tests for the ONNX backend helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.infrastructure.embeddings.onnx_runtime import _onnx_file_name, cosine_drift
+
+
+def test_identical_embeddings_have_no_drift() -> None:
+    vectors = np.random.default_rng(0).normal(size=(4, 8))
+
+    report = cosine_drift(vectors, vectors * 3.0)
+
+    assert report.texts == 4
+    assert report.min_cosine == pytest.approx(1.0)
+    assert report.max_abs_diff == pytest.approx(0.0, abs=1e-12)
+
+
+def test_quantization_noise_lowers_min_cosine() -> None:
+    rng = np.random.default_rng(1)
+    reference = rng.normal(size=(16, 384))
+    candidate = reference + rng.normal(scale=0.05, size=reference.shape)
+    candidate[3] = -reference[3]
+
+    report = cosine_drift(reference, candidate)
+
+    assert report.min_cosine == pytest.approx(-1.0, abs=1e-2)
+    assert 0.8 < report.mean_cosine < 1.0
+
+
+def test_drift_leaves_caller_arrays_untouched() -> None:
+    reference = np.array([[3.0, 4.0], [1.0, 0.0]])
+    candidate = np.array([[6.0, 8.0], [0.0, 2.0]])
+
+    cosine_drift(reference, candidate)
+
+    np.testing.assert_array_equal(reference, [[3.0, 4.0], [1.0, 0.0]])
+    np.testing.assert_array_equal(candidate, [[6.0, 8.0], [0.0, 2.0]])
+
+
+def test_shape_mismatch_raises() -> None:
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        cosine_drift(np.zeros((2, 4)), np.zeros((2, 3)))
+
+
+def test_quantized_file_name_follows_sentence_transformers_convention() -> None:
+    assert _onnx_file_name("none") == "onnx/model.onnx"
+    assert _onnx_file_name("avx512_vnni") == "onnx/model_qint8_avx512_vnni.onnx"
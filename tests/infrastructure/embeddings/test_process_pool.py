@@ -0,0 +1,64 @@
+"""Unit tests for the multi-process embedder pool."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from src.config.settings import EmbeddingSettings
+from src.infrastructure.embeddings.process_pool import ProcessPoolEmbedder
+
+
+class _FakeModel:
+    def encode(self, texts: list[str], **_: object) -> list[list[float]]:
+        time.sleep(0.2)  # long enough for the other worker to pick up its shard
+        return [[float(len(t)), float(os.getpid())] for t in texts]
+
+
+def _fake_model_factory(settings: EmbeddingSettings) -> _FakeModel:
+    del settings
+    return _FakeModel()
+
+
+@pytest.fixture()
+def pool() -> Iterator[ProcessPoolEmbedder]:
+    embedder = ProcessPoolEmbedder(
+        EmbeddingSettings(batch_size=2),
+        workers=2,
+        dimension=2,
+        model_factory=_fake_model_factory,
+    )
+    yield embedder
+    embedder.close()
+
+
+async def test_embed_texts_preserves_order_across_shards(pool: ProcessPoolEmbedder) -> None:
+    texts = ["a", "bb", "ccc", "dddd"]
+
+    vectors = await pool.embed_texts(texts)
+
+    assert [v[0] for v in vectors] == [len("passage: " + t) for t in texts]
+    assert all(v[1] != float(os.getpid()) for v in vectors)
+
+
+async def test_batch_is_sharded_across_workers(pool: ProcessPoolEmbedder) -> None:
+    vectors = await pool.embed_texts([f"text {i}" for i in range(40)])
+
+    assert len({v[1] for v in vectors}) == 2
+
+
+async def test_embed_query_uses_query_prefix(pool: ProcessPoolEmbedder) -> None:
+    assert (await pool.embed_query("hi"))[0] == float(len("query: hi"))
+
+
+def test_shards_never_smaller_than_batch_size(pool: ProcessPoolEmbedder) -> None:
+    assert pool._shards(3) == [(0, 2), (2, 3)]
+    assert pool._shards(10) == [(0, 5), (5, 10)]
+
+
+async def test_empty_batch_does_not_start_pool(pool: ProcessPoolEmbedder) -> None:
+    assert (await pool.embed_texts([])).shape == (0, pool.dimension)
+    assert pool._pool is None
@@ -0,0 +1,89 @@
+"""Unit tests for the HNSW index admin helpers."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.config.settings import Settings
+from src.domain.ports.dto import RetrievedChunk
+from src.infrastructure.persistence.indexes import (
+    check_dense_recall,
+    rebuild_dense_index,
+    recall_at_k,
+)
+
+
+def _hits(ids: list[uuid.UUID]) -> list[RetrievedChunk]:
+    return [
+        RetrievedChunk(
+            chunk_id=i, document_id=uuid.uuid4(), content="c", score=0.5, source_path="/kb"
+        )
+        for i in ids
+    ]
+
+
+def test_recall_at_k_counts_exact_hits_found() -> None:
+    assert recall_at_k(["a", "b", "x"], ["a", "b", "c", "d"]) == 0.5
+    assert recall_at_k([], []) == 1.0
+
+
+async def test_check_dense_recall_compares_against_exact_scan() -> None:
+    ids = [uuid.uuid4() for _ in range(4)]
+    store = MagicMock()
+    store.search = AsyncMock(side_effect=[_hits(ids[:2]), _hits([ids[0], ids[3]])])
+    store.exact_search = AsyncMock(side_effect=[_hits(ids[:2]), _hits(ids[:2])])
+
+    report = await check_dense_recall(store, [[1.0, 0.0], [0.0, 1.0]], top_k=2)
+
+    assert (report.queries, report.top_k) == (2, 2)
+    assert report.mean_recall == pytest.approx(0.75)
+    assert report.min_recall == pytest.approx(0.5)
+
+
+async def test_check_dense_recall_rejects_empty_queries() -> None:
+    with pytest.raises(ValueError):
+        await check_dense_recall(MagicMock(), [], top_k=5)
+
+
+async def test_rebuild_dense_index_keeps_only_configured_mode() -> None:
+    conn = AsyncMock()
+    autocommit = AsyncMock()
+    conn.execution_options = AsyncMock(return_value=autocommit)
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    settings = Settings(
+        llm={"api_key": "test"},  # type: ignore[arg-type]
+        vector_store={"embedding_quantization": "binary"},  # type: ignore[arg-type]
+    )
+
+    name = await rebuild_dense_index(engine, settings)
+
+    statements = [str(call.args[0]) for call in autocommit.execute.await_args_list]
+    assert name == "chunks_embedding_bit_hnsw_idx"
+    assert "bit_hamming_ops" in statements[0]
+    assert statements[1:] == [
+        "DROP INDEX CONCURRENTLY IF EXISTS chunks_embedding_hnsw_idx",
+        "DROP INDEX CONCURRENTLY IF EXISTS chunks_embedding_halfvec_hnsw_idx",
+    ]
+
+
+async def test_rebuild_dense_index_sizes_expression_for_lexical_sparse_mode() -> None:
+    conn = AsyncMock()
+    autocommit = AsyncMock()
+    conn.execution_options = AsyncMock(return_value=autocommit)
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__ = AsyncMock(return_value=conn)
+    engine.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    settings = Settings(
+        llm={"api_key": "test"},  # type: ignore[arg-type]
+        vector_store={"embedding_quantization": "halfvec", "sparse_mode": "lexical"},  # type: ignore[arg-type]
+    )
+
+    await rebuild_dense_index(engine, settings)
+
+    create = str(autocommit.execute.await_args_list[0].args[0])
+    assert "CAST(embedding AS halfvec(1024))" in create
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import os
 import uuid
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from src.config.settings import Settings
-from src.domain.ports.dto import ChunkWithEmbedding, RetrievedChunk
+from src.domain.ports.dto import ChunkWithEmbedding, HybridSearchQuery, RetrievedChunk
+from src.infrastructure.persistence.models import EMBEDDING_DIMENSION
 from src.infrastructure.persistence.vector_store import PGVectorStore
 
 pytestmark = pytest.mark.integration
@@ -43,8 +47,8 @@ def _make_retrieved_chunk(chunk_id: uuid.UUID | None = None) -> RetrievedChunk:
     )
 
 
-def _make_store(factory: MagicMock) -> PGVectorStore:
-    settings = Settings(llm={"api_key": "test"})  # type: ignore[arg-type]
+def _make_store(factory: MagicMock, **vector_store: object) -> PGVectorStore:
+    settings = Settings(llm={"api_key": "test"}, vector_store=vector_store)  # type: ignore[arg-type]
     return PGVectorStore(factory, settings)
 
 
@@ -57,6 +61,13 @@ def _mock_session_factory() -> tuple[MagicMock, AsyncMock]:
     return MagicMock(return_value=mock_cm), mock_session
 
 
+def _assert_write_then_generation_bump(mock_session: AsyncMock) -> None:
+    assert mock_session.execute.await_count == 2
+    bump = mock_session.execute.await_args_list[1].args[0]
+    assert "nextval('corpus_generation_seq')" in str(bump.compile(dialect=postgresql.dialect()))
+    assert mock_session.commit.await_count == 2
+
+
 async def test_upsert_empty_returns_zero() -> None:
     factory, _ = _mock_session_factory()
     store = _make_store(factory)
@@ -64,7 +75,31 @@ async def test_upsert_empty_returns_zero() -> None:
     factory.assert_not_called()
 
 
-async def test_upsert_single_chunk_returns_count() -> None:
+@pytest.fixture()
+def register_vector() -> Iterator[AsyncMock]:
+    with patch(
+        "src.infrastructure.persistence.vector_store.register_vector", new=AsyncMock()
+    ) as register:
+        yield register
+
+
+@pytest.fixture()
+def driver(register_vector: AsyncMock) -> Iterator[MagicMock]:
+    """Fake the dedicated asyncpg connection that upserts open."""
+    connection = MagicMock()
+    connection.execute = AsyncMock()
+    connection.executemany = AsyncMock()
+    connection.copy_records_to_table = AsyncMock()
+    connection.close = AsyncMock()
+    with patch(
+        "src.infrastructure.persistence.vector_store.asyncpg.connect",
+        new=AsyncMock(return_value=connection),
+    ) as connect:
+        connection.connect = connect
+        yield connection
+
+
+async def test_upsert_single_chunk_returns_count(driver: MagicMock) -> None:
     factory, mock_session = _mock_session_factory()
     mock_session.execute = AsyncMock()
     store = _make_store(factory)
@@ -72,32 +107,110 @@ async def test_upsert_single_chunk_returns_count() -> None:
     result = await store.upsert([_make_chunk()])
 
     assert result == 1
-    mock_session.execute.assert_awaited_once()
-    mock_session.commit.assert_awaited_once()
+    driver.executemany.assert_awaited_once()
+    # Only the generation bump goes through the ORM.
+    assert mock_session.execute.await_count == 1
+    assert mock_session.commit.await_count == 1
 
 
-async def test_upsert_multiple_chunks() -> None:
+async def test_upsert_never_installs_codecs_on_a_pooled_connection(driver: MagicMock) -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_session.execute = AsyncMock()
+    store = _make_store(
+        factory, database_url="postgresql+asyncpg://rag:secret@db:5432/ragdb", upsert_mode="copy"
+    )
+
+    await store.upsert([_make_chunk()])
+
+    driver.connect.assert_awaited_once_with("postgresql://rag:secret@db:5432/ragdb")
+    driver.close.assert_awaited_once()
+    mock_session.connection.assert_not_called()
+
+
+async def test_upsert_insert_mode_sends_vectors_through_binary_codec(
+    driver: MagicMock, register_vector: AsyncMock
+) -> None:
     factory, mock_session = _mock_session_factory()
     mock_session.execute = AsyncMock()
     store = _make_store(factory)
+    chunks = [_make_chunk() for _ in range(5)]
 
-    result = await store.upsert([_make_chunk() for _ in range(5)])
+    assert await store.upsert(chunks) == 5
 
-    assert result == 5
-    mock_session.execute.assert_awaited_once()
+    register_vector.assert_awaited_once_with(driver)
+    driver.transaction.assert_called_once()
+    sql, records = driver.executemany.await_args.args
+    assert "INSERT INTO chunks" in sql
+    assert "ON CONFLICT (id) DO UPDATE" in sql
+    assert [r[0] for r in records] == [c.id for c in chunks]
+    # The float32 array reaches pgvector's binary codec as-is, never as text.
+    assert records[0][-1] is chunks[0].embedding
+
+
+async def test_upsert_insert_mode_splits_into_batches(driver: MagicMock) -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_session.execute = AsyncMock()
+    store = _make_store(factory, upsert_batch_size=2)
+
+    assert await store.upsert([_make_chunk() for _ in range(5)]) == 5
+
+    # three executemany batches in one transaction, then the generation bump
+    assert [len(c.args[1]) for c in driver.executemany.await_args_list] == [2, 2, 1]
+    driver.transaction.assert_called_once()
+    assert mock_session.commit.await_count == 1
+
+
+async def test_upsert_copy_mode_stages_and_merges_each_batch(
+    driver: MagicMock, register_vector: AsyncMock
+) -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_session.execute = AsyncMock()
+    store = _make_store(factory, upsert_mode="copy", upsert_batch_size=2)
+    chunks = [_make_chunk() for _ in range(3)]
+
+    assert await store.upsert(chunks) == 3
+
+    register_vector.assert_awaited_once_with(driver)
+    driver.executemany.assert_not_called()
+    assert driver.copy_records_to_table.await_count == 2
+    first_call = driver.copy_records_to_table.await_args_list[0]
+    assert first_call.args == ("chunks_staging",)
+    assert first_call.kwargs["columns"][-1] == "embedding"
+    records = first_call.kwargs["records"]
+    assert [r[0] for r in records] == [chunks[0].id, chunks[1].id]
+    assert records[0][7] == "{}"
+    # The float32 array reaches pgvector's binary codec as-is, never as a list.
+    assert records[0][-1] is chunks[0].embedding
+    driver.transaction.assert_called_once()
+    statements = [c.args[0] for c in driver.execute.await_args_list]
+    assert "CREATE TEMP TABLE chunks_staging" in statements[0]
+    assert "embedding vector(384)" in statements[0]
+    assert "ON COMMIT DROP" in statements[0]
+    assert sum("INSERT INTO chunks" in sql for sql in statements) == 2
+    assert mock_session.commit.await_count == 1
+
+
+def _make_row(distance: float = 0.2, **overrides: object) -> MagicMock:
+    row = MagicMock()
+    row.id = uuid.uuid4()
+    row.document_id = uuid.uuid4()
+    row.content = "hello world"
+    row.source_path = "/path/doc.pdf"
+    row.chunk_metadata = {"page_number": 3, "section_heading": "Intro"}
+    row.distance = distance
+    for key, value in overrides.items():
+        setattr(row, key, value)
+    return row
 
 
 async def test_search_returns_mocked_results() -> None:
     factory, mock_session = _mock_session_factory()
     chunk_id = uuid.uuid4()
     doc_id = uuid.uuid4()
-    mock_orm = MagicMock()
-    mock_orm.id = chunk_id
-    mock_orm.document_id = doc_id
-    mock_orm.content = "hello world"
+    row = _make_row(0.2, id=chunk_id, document_id=doc_id)
 
     mock_result = MagicMock()
-    mock_result.all.return_value = [(mock_orm, "/path/doc.pdf", 0.2)]
+    mock_result.all.return_value = [row]
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     store = _make_store(factory)
@@ -108,6 +221,7 @@ async def test_search_returns_mocked_results() -> None:
     assert results[0].document_id == doc_id
     assert results[0].content == "hello world"
     assert results[0].source_path == "/path/doc.pdf"
+    assert results[0].metadata == {"page_number": 3, "section_heading": "Intro"}
     assert abs(results[0].score - 0.8) < 1e-6
 
 
@@ -123,13 +237,8 @@ async def test_search_empty_result() -> None:
 
 async def test_search_score_clamped_to_zero_for_large_distance() -> None:
     factory, mock_session = _mock_session_factory()
-    mock_orm = MagicMock()
-    mock_orm.id = uuid.uuid4()
-    mock_orm.document_id = uuid.uuid4()
-    mock_orm.content = "far away"
-
     mock_result = MagicMock()
-    mock_result.all.return_value = [(mock_orm, "/path/doc.pdf", 1.5)]
+    mock_result.all.return_value = [_make_row(1.5, content="far away")]
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     store = _make_store(factory)
@@ -205,15 +314,120 @@ async def test_hybrid_search_with_language_filter() -> None:
         query_vector=_make_vector(),
         top_k=store._settings.vector_store.top_k_dense,
         filters={"language": "fr"},
+        ef_search=None,
+        iterative_scan=None,
+        with_embeddings=False,
     )
     store._sparse_search.assert_awaited_once_with(
         query_text="query",
         top_k=store._settings.vector_store.top_k_sparse,
         language="fr",
+        query_sparse=None,
     )
     assert len(results) == 1
 
 
+async def test_hybrid_search_concurrent_mode_runs_legs_together() -> None:
+    import asyncio
+
+    factory, _ = _mock_session_factory()
+    store = _make_store(factory, hybrid_mode="concurrent")
+    shared = _make_retrieved_chunk()
+    sparse_only = _make_retrieved_chunk()
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def _leg(name: str, result: list[RetrievedChunk]) -> list[RetrievedChunk]:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return result
+
+    async def _dense(**_: object) -> list[RetrievedChunk]:
+        return await _leg("dense", [shared])
+
+    async def _sparse(**_: object) -> list[RetrievedChunk]:
+        return await _leg("sparse", [sparse_only, shared])
+
+    store.search = AsyncMock(side_effect=_dense)  # type: ignore[method-assign]
+    store._sparse_search_chunks = AsyncMock(side_effect=_sparse)  # type: ignore[method-assign]
+    store._fetch_chunks_by_ids = AsyncMock()  # type: ignore[method-assign]
+
+    results = await store.hybrid_search(
+        query_vector=_make_vector(), query_text="query", top_k=5, filters={"language": "en"}
+    )
+
+    assert [r.chunk_id for r in results] == [shared.chunk_id, sparse_only.chunk_id]
+    assert results[0].score > results[1].score
+    store._fetch_chunks_by_ids.assert_not_awaited()
+    store._sparse_search_chunks.assert_awaited_once_with(
+        query_text="query",
+        top_k=store._settings.vector_store.top_k_sparse,
+        language="en",
+        query_sparse=None,
+        with_embeddings=False,
+    )
+
+
+async def test_hybrid_search_records_per_leg_durations() -> None:
+    from src.shared.metrics import get_metrics_output
+
+    factory, _ = _mock_session_factory()
+    store = _make_store(factory)
+    store.search = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    store._sparse_search = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+    await store.hybrid_search(query_vector=_make_vector(), query_text="query", top_k=5)
+
+    output = get_metrics_output()
+    assert 'hybrid_search_leg_duration_seconds_count{leg="dense"}' in output
+    assert 'hybrid_search_leg_duration_seconds_count{leg="sparse"}' in output
+
+
+async def test_hybrid_search_sql_mode_single_round_trip() -> None:
+    factory, mock_session = _mock_session_factory()
+    row = _make_row(content="fused", score=0.032)
+    mock_result = MagicMock()
+    mock_result.all.return_value = [row]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hybrid_mode="sql")
+    store.search = AsyncMock()  # type: ignore[method-assign]
+    store._sparse_search = AsyncMock()  # type: ignore[method-assign]
+
+    results = await store.hybrid_search(
+        query_vector=_make_vector(), query_text="piscine", top_k=5, filters={"language": "fr"}
+    )
+
+    assert [r.chunk_id for r in results] == [row.id]
+    assert results[0].score == pytest.approx(0.032)
+    factory.assert_called_once()
+    mock_session.execute.assert_awaited_once()
+    store.search.assert_not_awaited()
+    store._sparse_search.assert_not_awaited()
+    stmt, params = mock_session.execute.await_args.args
+    assert "WITH dense AS" in str(stmt)
+    assert "documents" not in str(stmt)
+    assert "c.language = __[POSTCOMPILE_lang]" in str(stmt)
+    assert params["lang"] == "fr"
+    assert params["limit"] == 5
+
+
+async def test_hybrid_search_sql_mode_without_language_omits_filter() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hybrid_mode="sql")
+    assert await store.hybrid_search(_make_vector(), "query", top_k=5) == []
+
+    stmt, params = mock_session.execute.await_args.args
+    assert ":lang" not in str(stmt)
+    assert "lang" not in params
+
+
 async def test_delete_by_document_returns_rowcount() -> None:
     factory, mock_session = _mock_session_factory()
     mock_result = MagicMock()
@@ -222,8 +436,7 @@ async def test_delete_by_document_returns_rowcount() -> None:
 
     store = _make_store(factory)
     assert await store.delete_by_document(uuid.uuid4()) == 3
-    mock_session.execute.assert_awaited_once()
-    mock_session.commit.assert_awaited_once()
+    _assert_write_then_generation_bump(mock_session)
 
 
 async def test_delete_by_document_none_rowcount_returns_zero() -> None:
@@ -234,6 +447,7 @@ async def test_delete_by_document_none_rowcount_returns_zero() -> None:
 
     store = _make_store(factory)
     assert await store.delete_by_document(uuid.uuid4()) == 0
+    mock_session.execute.assert_awaited_once()
 
 
 async def test_delete_empty_list_is_noop() -> None:
@@ -250,8 +464,91 @@ async def test_delete_calls_execute() -> None:
     store = _make_store(factory)
     await store.delete([uuid.uuid4(), uuid.uuid4()])
 
+    _assert_write_then_generation_bump(mock_session)
+
+
+async def test_generation_reads_sequence_without_advancing() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.scalar_one.return_value = 7
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory)
+
+    assert await store.generation() == 7
+    sql = str(mock_session.execute.await_args.args[0])
+    assert "last_value FROM corpus_generation_seq" in sql
+    mock_session.commit.assert_not_called()
+
+
+async def test_upsert_writes_chunk_content_hash(driver: MagicMock) -> None:
+    factory, _ = _mock_session_factory()
+    store = _make_store(factory)
+    chunk = _make_chunk().model_copy(update={"content_hash": "f" * 64})
+
+    await store.upsert([chunk])
+
+    sql, records = driver.executemany.await_args.args
+    assert "content_hash = EXCLUDED.content_hash" in sql
+    assert records[0][8] == "f" * 64
+
+
+async def test_chunk_hashes_returns_stored_rows_by_position() -> None:
+    factory, mock_session = _mock_session_factory()
+    doc_id, chunk_id = uuid.uuid4(), uuid.uuid4()
+    row = MagicMock(id=chunk_id, position=3, content_hash="abc")
+    mock_session.execute = AsyncMock(return_value=[row])
+
+    stored = await _make_store(factory).chunk_hashes(doc_id)
+
+    assert [(s.id, s.position, s.content_hash) for s in stored] == [(chunk_id, 3, "abc")]
+    sql = str(mock_session.execute.await_args.args[0])
+    assert "WHERE chunks.document_id" in sql
+    assert "ORDER BY chunks.position" in sql
+
+
+async def test_hybrid_search_sql_mode_selects_embeddings_on_request() -> None:
+    factory, mock_session = _mock_session_factory()
+    vector = np.full(EMBEDDING_DIMENSION, 0.5, dtype=np.float32)
+    mock_result = MagicMock()
+    mock_result.all.return_value = [_make_row(score=0.03, embedding=vector)]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hybrid_mode="sql")
+    (result,) = await store.hybrid_search(_make_vector(), "query", top_k=5, with_embeddings=True)
+
+    assert result.embedding is not None
+    assert result.embedding.tolist() == [0.5] * EMBEDDING_DIMENSION
     mock_session.execute.assert_awaited_once()
-    mock_session.commit.assert_awaited_once()
+    stmt, _ = mock_session.execute.await_args.args
+    assert "f.score\n       , c.embedding" in str(stmt)
+    assert "embedding" in stmt.selected_columns
+
+
+async def test_search_selects_embedding_only_on_request() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+    store = _make_store(factory)
+
+    await store.search(_make_vector(), top_k=5)
+    plain = str(mock_session.execute.await_args.args[0])
+    await store.search(_make_vector(), top_k=5, with_embeddings=True)
+    with_embeddings = str(mock_session.execute.await_args.args[0])
+
+    assert "chunks.embedding," not in plain
+    assert "chunks.embedding," in with_embeddings
+
+
+async def test_contents_fetched_by_id() -> None:
+    factory, mock_session = _mock_session_factory()
+    known = uuid.uuid4()
+    mock_session.execute = AsyncMock(return_value=[MagicMock(id=known, content="hello")])
+
+    assert await _make_store(factory).contents([known, uuid.uuid4()]) == {known: "hello"}
+    sql = str(mock_session.execute.await_args.args[0])
+    assert "WHERE chunks.id IN" in sql
 
 
 async def test_count_returns_scalar() -> None:
@@ -264,6 +561,284 @@ async def test_count_returns_scalar() -> None:
     assert await store.count() == 42
 
 
+async def test_search_language_filter_targets_partial_index() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory)
+    await store.search(query_vector=_make_vector(), top_k=5, filters={"language": "fr"})
+
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "chunks.language = __[POSTCOMPILE_" in sql
+    assert "documents" not in sql
+    assert "chunks.embedding," not in sql
+
+
+async def test_upsert_writes_denormalized_columns(driver: MagicMock) -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_session.execute = AsyncMock()
+    store = _make_store(factory)
+
+    chunk = _make_chunk().model_copy(
+        update={"language": "ar", "metadata": {"page_number": 2, "chunk_index": 0}}
+    )
+    await store.upsert([chunk])
+
+    record = driver.executemany.await_args.args[1][0]
+    assert record[5:8] == ("/docs/test.pdf", "ar", '{"page_number": 2, "chunk_index": 0}')
+
+
+async def test_search_default_settings_send_no_hnsw_params() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory)
+    await store.search(query_vector=_make_vector(), top_k=5)
+
+    mock_session.execute.assert_awaited_once()
+
+
+async def test_search_applies_hnsw_settings_in_same_transaction() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hnsw_ef_search=64, hnsw_iterative_scan="relaxed_order")
+    await store.search(query_vector=_make_vector(), top_k=5, filters={"language": "ar"})
+
+    assert mock_session.execute.await_count == 2
+    set_stmt, params = mock_session.execute.await_args_list[0].args
+    assert "set_config('hnsw.ef_search', :ef_search, true)" in str(set_stmt)
+    assert "set_config('hnsw.iterative_scan', :iterative_scan, true)" in str(set_stmt)
+    assert params == {"ef_search": "64", "iterative_scan": "relaxed_order"}
+
+
+async def test_exact_search_disables_index_scans() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, embedding_quantization="binary")
+    await store.exact_search(query_vector=_make_vector(), top_k=5)
+
+    set_stmt = mock_session.execute.await_args_list[0].args[0]
+    search_stmt = mock_session.execute.await_args_list[1].args[0]
+    assert "set_config('enable_indexscan', 'off', true)" in str(set_stmt)
+    assert "binary_quantize" not in str(search_stmt.compile(dialect=postgresql.dialect()))
+
+
+async def test_search_per_call_override_wins_over_settings() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hnsw_ef_search=40)
+    await store.search(query_vector=_make_vector(), top_k=5, ef_search=200)
+
+    _, params = mock_session.execute.await_args_list[0].args
+    assert params == {"ef_search": "200"}
+
+
+async def test_search_halfvec_mode_rescores_candidates_exactly() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = [_make_row(distance=0.1)]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, embedding_quantization="halfvec", rescore_oversample=4)
+    results = await store.search(query_vector=_make_vector(), top_k=20)
+
+    assert results[0].score == pytest.approx(0.9)
+    _, params = mock_session.execute.await_args_list[0].args
+    assert params == {"ef_search": "80"}
+    search_stmt = mock_session.execute.await_args_list[1].args[0]
+    sql = str(search_stmt.compile(dialect=postgresql.dialect()))
+    inner, outer = sql.split(") AS candidates")
+    assert "ORDER BY CAST(chunks.embedding AS HALFVEC(384)) <=>" in inner
+    assert "ORDER BY candidates.embedding <=>" in outer
+
+
+async def test_search_binary_mode_ranks_candidates_by_hamming_distance() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, embedding_quantization="binary", hnsw_ef_search=500)
+    await store.search(query_vector=_make_vector(), top_k=5, filters={"language": "fr"})
+
+    _, params = mock_session.execute.await_args_list[0].args
+    assert params == {"ef_search": "500"}
+    compiled = mock_session.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect())
+    assert "CAST(binary_quantize(chunks.embedding) AS BIT(384)) <~>" in str(compiled)
+    assert "chunks.language =" in str(compiled)
+
+
+async def test_hybrid_search_sql_mode_quantized_dense_leg() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hybrid_mode="sql", embedding_quantization="binary")
+    await store.hybrid_search(query_vector=_make_vector(), query_text="q", top_k=5)
+
+    _, set_params = mock_session.execute.await_args_list[0].args
+    stmt, params = mock_session.execute.await_args_list[1].args
+    assert "binary_quantize(CAST(:query_vector AS vector))" in str(stmt)
+    assert params["k_candidates"] == store._settings.vector_store.top_k_dense * 4
+    assert set_params == {"ef_search": str(params["k_candidates"])}
+
+
+async def test_lexical_sparse_mode_sizes_quantized_casts_for_bge_m3() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(
+        factory, sparse_mode="lexical", hybrid_mode="sql", embedding_quantization="halfvec"
+    )
+    await store.search(query_vector=_make_vector(), top_k=5)
+    await store.hybrid_search(query_vector=_make_vector(), query_text="q", top_k=5)
+
+    sql = " ".join(
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in mock_session.execute.await_args_list
+    )
+    assert "HALFVEC(1024)" in sql
+    assert "halfvec(1024)" in sql
+    assert "384" not in sql
+
+
+async def test_hybrid_search_many_batches_queries_into_lateral_statements() -> None:
+    factory, mock_session = _mock_session_factory()
+    first, second = _make_row(ord=1, score=0.03), _make_row(ord=2, score=0.02)
+    batch_one, batch_two = MagicMock(), MagicMock()
+    batch_one.all.return_value = [second, first]
+    batch_two.all.return_value = []
+    mock_session.execute = AsyncMock(side_effect=[batch_one, batch_two])
+
+    store = _make_store(factory, hybrid_batch_size=2)
+    queries = [
+        HybridSearchQuery(query_vector=[0.5, -1.0], query_text="a", filters={"language": "fr"}),
+        HybridSearchQuery(query_vector=[0.1, 0.2], query_text="b"),
+        HybridSearchQuery(query_vector=[0.3, 0.4], query_text="c"),
+    ]
+    results = await store.hybrid_search_many(queries, top_k=5)
+
+    assert [len(r) for r in results] == [1, 1, 0]
+    assert results[0][0].score == pytest.approx(0.03)
+    assert mock_session.execute.await_count == 2
+    stmt, params = mock_session.execute.await_args_list[0].args
+    assert "CROSS JOIN LATERAL" in str(stmt)
+    assert "WITH ORDINALITY" in str(stmt)
+    assert params["vectors"] == ["[0.5,-1.0]", "[0.1,0.2]"]
+    assert params["langs"] == ["fr", None]
+    assert mock_session.execute.await_args_list[1].args[1]["queries"] == ["c"]
+
+
+async def test_hybrid_search_many_applies_per_call_hnsw_overrides() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hnsw_ef_search=40)
+    queries = [HybridSearchQuery(query_vector=[0.1, 0.2], query_text="a")]
+    await store.hybrid_search_many(queries, top_k=5, ef_search=300, iterative_scan="strict_order")
+
+    set_stmt, params = mock_session.execute.await_args_list[0].args
+    assert "set_config('hnsw.iterative_scan', :iterative_scan, true)" in str(set_stmt)
+    assert params == {"ef_search": "300", "iterative_scan": "strict_order"}
+
+
+async def test_hybrid_search_many_empty_is_noop() -> None:
+    factory, mock_session = _mock_session_factory()
+    store = _make_store(factory)
+
+    assert await store.hybrid_search_many([], top_k=5) == []
+    mock_session.execute.assert_not_called()
+
+
+async def test_sparse_search_uses_stored_tsvector_column() -> None:
+    factory, mock_session = _mock_session_factory()
+    chunk_id = uuid.uuid4()
+    row = MagicMock()
+    row.id = chunk_id
+    row.rank = 0.5
+    mock_session.execute = AsyncMock(return_value=[row])
+
+    store = _make_store(factory)
+    pairs = await store._sparse_search(query_text="piscine", top_k=5, language="en")
+
+    assert pairs == [(chunk_id, 0.5)]
+    sql = str(mock_session.execute.await_args.args[0])
+    assert "content_tsv @@" in sql
+    assert "to_tsvector" not in sql
+
+
+async def test_sparse_search_ranks_by_lexical_weights_when_given() -> None:
+    factory, mock_session = _mock_session_factory()
+    row = MagicMock()
+    row.id = uuid.uuid4()
+    row.ts = 0.27
+    mock_session.execute = AsyncMock(return_value=[row])
+
+    store = _make_store(factory)
+    pairs = await store._sparse_search(
+        query_text="piscine", top_k=5, language=None, query_sparse={6: 0.3, 42: 0.1}
+    )
+
+    assert pairs == [(row.id, 0.27)]
+    stmt, params = mock_session.execute.await_args.args
+    assert "sparse_embedding <#> CAST(:query_sparse AS sparsevec)" in str(stmt)
+    assert "content_tsv" not in str(stmt)
+    assert params["query_sparse"] == "{7:0.3,43:0.1}/250002"
+
+
+async def test_hybrid_search_sql_mode_lexical_sparse_leg() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory, hybrid_mode="sql")
+    await store.hybrid_search(_make_vector(), "piscine", top_k=5, query_sparse={6: 0.3})
+
+    stmt, params = mock_session.execute.await_args.args
+    assert "sparse_embedding <#>" in str(stmt)
+    assert "plainto_tsquery" not in str(stmt)
+    assert params["query_sparse"] == "{7:0.3}/250002"
+    assert "query" not in params
+
+
+async def test_hybrid_search_many_sends_lexical_weights_when_every_query_has_them() -> None:
+    factory, mock_session = _mock_session_factory()
+    mock_result = MagicMock()
+    mock_result.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    store = _make_store(factory)
+    queries = [
+        HybridSearchQuery(query_vector=[0.5, 1.0], query_text="a", query_sparse={0: 1.0}),
+        HybridSearchQuery(query_vector=[0.1, 0.2], query_text="b", query_sparse={}),
+    ]
+    await store.hybrid_search_many(queries, top_k=5)
+
+    stmt, params = mock_session.execute.await_args.args
+    assert "q.query_sparse" in str(stmt)
+    assert params["sparse"] == ["{1:1.0}/250002", "{}/250002"]
+
+
 _SKIP_INTEGRATION = pytest.mark.skipif(
     not os.getenv("RUN_INTEGRATION"),
     reason="RUN_INTEGRATION not set — skipping integration tests",
@@ -306,6 +881,34 @@ async def test_integration_upsert_and_count() -> None:
     await engine.dispose()
 
 
+@_SKIP_INTEGRATION
+@pytest.mark.parametrize("upsert_mode", ["insert", "copy"])
+async def test_integration_search_after_upsert_on_the_same_pooled_connection(
+    upsert_mode: str,
+) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from src.infrastructure.persistence.engine import create_session_factory
+
+    settings = Settings()
+    settings.vector_store.upsert_mode = upsert_mode  # type: ignore[assignment]
+    # One pooled connection: every statement below runs on it.
+    engine = create_async_engine(settings.vector_store.database_url, pool_size=1, max_overflow=0)
+    factory = create_session_factory(engine)
+    store = PGVectorStore(factory, settings)
+    chunk = _make_chunk().model_copy(update={"sparse_embedding": {7: 0.5}})
+
+    await store.upsert([chunk])
+    assert await store.search(query_vector=_make_vector(), top_k=5)
+    for mode in ("sequential", "concurrent", "sql"):
+        settings.vector_store.hybrid_mode = mode  # type: ignore[assignment]
+        assert await store.hybrid_search(_make_vector(), "test", top_k=5)
+        assert await store.hybrid_search(_make_vector(), "test", top_k=5, query_sparse={7: 1.0})
+
+    await store.delete_by_document(chunk.document_id)
+    await engine.dispose()
+
+
 @_SKIP_INTEGRATION
 async def test_integration_search_returns_results() -> None:
     from sqlalchemy.ext.asyncio import create_async_engine
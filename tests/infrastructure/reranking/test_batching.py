@@ -0,0 +1,102 @@
+"""Unit tests for the cross-request reranker pair batcher."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.reranking.batching import PairBatcher
+from src.shared.metrics import REGISTRY
+
+
+class _RecordingScorer:
+    """Token length = word count; score = passage length / 100."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batches: list[list[list[str]]] = []
+        self.tokenized: list[list[str]] = []
+        self.fail = fail
+
+    def pair_lengths(self, pairs: list[list[str]]) -> list[int]:
+        self.tokenized.extend(passage for _, passage in pairs)
+        return [len(f"{q} {p}".split()) for q, p in pairs]
+
+    def score_batch(self, pairs: list[list[str]]) -> list[float]:
+        self.batches.append(pairs)
+        if self.fail:
+            raise RuntimeError("model crashed")
+        return [len(passage) / 100 for _, passage in pairs]
+
+
+async def test_concurrent_requests_share_one_forward_pass() -> None:
+    scorer = _RecordingScorer()
+    batcher = PairBatcher(scorer, max_batch_tokens=1000, max_wait_ms=20, max_length=16)
+
+    first, second = await asyncio.gather(
+        batcher.score([["q1", "a"], ["q1", "bb"]]),
+        batcher.score([["q2", "cccc"]]),
+    )
+
+    assert len(scorer.batches) == 1
+    assert first == [pytest.approx(0.01), pytest.approx(0.02)]
+    assert second == [pytest.approx(0.04)]
+
+
+async def test_token_budget_splits_passes_and_serves_oldest_first() -> None:
+    scorer = _RecordingScorer()
+    batcher = PairBatcher(scorer, max_batch_tokens=6, max_wait_ms=20, max_length=512)
+    long_pair = ["q", "one two three four five"]
+
+    results = await asyncio.gather(
+        batcher.score([long_pair]),
+        batcher.score([["q", "x"], ["q", "y"], ["q", "z"]]),
+    )
+
+    assert scorer.batches[0] == [long_pair]
+    assert scorer.batches[1] == [["q", "x"], ["q", "y"], ["q", "z"]]
+    assert results[1] == [pytest.approx(0.01)] * 3
+    # Pairs left over from a pass are not tokenized again.
+    assert sorted(scorer.tokenized) == sorted([long_pair[1], "x", "y", "z"])
+
+
+async def test_full_queue_dispatches_without_waiting() -> None:
+    scorer = _RecordingScorer()
+    batcher = PairBatcher(scorer, max_batch_tokens=8, max_wait_ms=10_000, max_length=4)
+
+    scores = await asyncio.wait_for(batcher.score([["q", "a"], ["q", "b"]]), timeout=2)
+
+    assert scores == [pytest.approx(0.01)] * 2
+
+
+async def test_scorer_failure_propagates_to_every_caller() -> None:
+    batcher = PairBatcher(_RecordingScorer(fail=True), 1000, max_wait_ms=1, max_length=16)
+
+    results = await asyncio.gather(
+        batcher.score([["q", "a"]]), batcher.score([["q", "b"]]), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_queue_wait_and_occupancy_metrics_observed() -> None:
+    wait_before = REGISTRY.get_sample_value("reranker_batcher_queue_wait_seconds_count") or 0.0
+    occupancy_before = REGISTRY.get_sample_value("reranker_batcher_batch_occupancy_sum") or 0.0
+    batcher = PairBatcher(_RecordingScorer(), max_batch_tokens=8, max_wait_ms=1, max_length=16)
+
+    await asyncio.gather(batcher.score([["q", "a"]]), batcher.score([["q", "b"]]))
+
+    assert REGISTRY.get_sample_value("reranker_batcher_queue_wait_seconds_count") == (
+        wait_before + 2
+    )
+    # Two pairs of two tokens each fill half of the 8-token budget.
+    assert REGISTRY.get_sample_value("reranker_batcher_batch_occupancy_sum") == pytest.approx(
+        occupancy_before + 0.5
+    )
+    assert REGISTRY.get_sample_value("reranker_batcher_queue_depth") == 0.0
+
+
+async def test_empty_input_skips_scorer() -> None:
+    scorer = _RecordingScorer()
+    assert await PairBatcher(scorer, 1000, 1, 16).score([]) == []
+    assert scorer.batches == []
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+import numpy as np
 import pytest
 
 from src.config.settings import Settings
 from src.domain.ports.dto import RerankRequest, RetrievedChunk
+from src.infrastructure.cache.rerank_score_cache import RerankScoreCache
 from src.infrastructure.reranking.bge_reranker import BGEReranker
 
 
@@ -35,6 +38,13 @@ def test_model_not_loaded_at_init(reranker: BGEReranker) -> None:
     assert reranker._model is None
 
 
+async def test_warm_up_loads_model(reranker: BGEReranker) -> None:
+    with patch.object(reranker, "_ensure_model_loaded") as load:
+        await reranker.warm_up()
+
+    load.assert_called_once_with()
+
+
 async def test_rerank_sort_order(reranker: BGEReranker) -> None:
     chunks = [
         _chunk("low relevance"),
@@ -135,6 +145,34 @@ async def test_rerank_passes_batch_size_to_model(reranker: BGEReranker) -> None:
     assert call_kwargs.kwargs.get("batch_size") == reranker._settings.reranker.batch_size
 
 
+async def test_rerank_truncates_pairs_to_max_length(settings: Settings) -> None:
+    settings.reranker.max_length = 256
+    reranker = BGEReranker(settings)
+    mock_model = MagicMock()
+    mock_model.compute_score.return_value = [0.6]
+    reranker._model = mock_model
+
+    await reranker.rerank(RerankRequest(query="q", chunks=[_chunk("a")], top_k=1))
+
+    assert mock_model.compute_score.call_args.kwargs["max_length"] == 256
+
+
+async def test_onnx_backend_scores_with_cross_encoder_predict(settings: Settings) -> None:
+    settings.reranker.backend = "onnx"
+    reranker = BGEReranker(settings)
+    chunks = [_chunk("low"), _chunk("high")]
+    mock_model = MagicMock()
+    mock_model.predict.return_value = np.array([0.35, 0.92], dtype=np.float32)
+    reranker._model = mock_model
+
+    result = await reranker.rerank(RerankRequest(query="q", chunks=chunks, top_k=2))
+
+    mock_model.compute_score.assert_not_called()
+    assert [c.content for c in result] == ["high", "low"]
+    assert result[0].score == pytest.approx(0.92)
+    assert isinstance(result[0].score, float)
+
+
 async def test_rerank_scores_updated_on_returned_chunks(reranker: BGEReranker) -> None:
     original_score = 0.5
     chunks = [_chunk("doc a", score=original_score)]
@@ -149,6 +187,83 @@ async def test_rerank_scores_updated_on_returned_chunks(reranker: BGEReranker) -
     assert result[0].score != original_score
 
 
+async def test_rerank_length_bucketed_batches_keep_scores_aligned(settings: Settings) -> None:
+    settings.reranker.max_batch_tokens = 40
+    reranker = BGEReranker(settings)
+    chunks = [_chunk("long " * 30), _chunk("short"), _chunk("tiny")]
+    request = RerankRequest(query="q", chunks=chunks, top_k=3)
+    mock_model = MagicMock()
+    mock_model.tokenizer.side_effect = lambda queries, passages, **_: {
+        "input_ids": [[0] * len(p.split()) for p in passages]
+    }
+    mock_model.compute_score.side_effect = lambda pairs, **_: [
+        len(passage) / 200 for _, passage in pairs
+    ]
+    reranker._model = mock_model
+
+    result = await reranker.rerank(request)
+
+    batches = [c.args[0] for c in mock_model.compute_score.call_args_list]
+    assert [len(b) for b in batches] == [2, 1]
+    assert result[0].content == chunks[0].content
+    assert result[0].score == pytest.approx(150 / 200)
+
+
+async def test_score_cache_sends_only_unseen_pairs_to_model(settings: Settings) -> None:
+    reranker = BGEReranker(settings, score_cache=RerankScoreCache(max_entries=100))
+    seen, unseen = _chunk("seen passage"), _chunk("unseen passage")
+    mock_model = MagicMock()
+    mock_model.compute_score.side_effect = lambda pairs, **_: [0.8] * len(pairs)
+    reranker._model = mock_model
+    await reranker.rerank(RerankRequest(query="What is 1337?", chunks=[seen], top_k=1))
+
+    result = await reranker.rerank(
+        RerankRequest(query="  what is 1337? ", chunks=[unseen, seen], top_k=2)
+    )
+
+    second_call = mock_model.compute_score.call_args_list[1].args[0]
+    assert second_call == [["  what is 1337? ", "unseen passage"]]
+    assert {c.content for c in result} == {"seen passage", "unseen passage"}
+
+
+async def test_score_cache_skips_model_when_every_pair_is_cached(settings: Settings) -> None:
+    reranker = BGEReranker(settings, score_cache=RerankScoreCache(max_entries=100))
+    chunk = _chunk("passage")
+    mock_model = MagicMock()
+    mock_model.compute_score.return_value = [0.9]
+    reranker._model = mock_model
+    request = RerankRequest(query="q", chunks=[chunk], top_k=1)
+
+    first = await reranker.rerank(request)
+    second = await reranker.rerank(request)
+
+    assert first == second
+    mock_model.compute_score.assert_called_once()
+
+
+async def test_batching_merges_concurrent_requests_into_one_pass(settings: Settings) -> None:
+    settings.reranker.batching_enabled = True
+    settings.reranker.batching_max_wait_ms = 20
+    reranker = BGEReranker(settings)
+    mock_model = MagicMock()
+    mock_model.tokenizer.side_effect = lambda queries, passages, **_: {
+        "input_ids": [[0] * len(p.split()) for p in passages]
+    }
+    mock_model.compute_score.side_effect = lambda pairs, **_: [
+        0.5 + len(passage) / 100 for _, passage in pairs
+    ]
+    reranker._model = mock_model
+
+    first, second = await asyncio.gather(
+        reranker.rerank(RerankRequest(query="q1", chunks=[_chunk("a"), _chunk("bbb")], top_k=2)),
+        reranker.rerank(RerankRequest(query="q2", chunks=[_chunk("cc")], top_k=1)),
+    )
+
+    mock_model.compute_score.assert_called_once()
+    assert [c.content for c in first] == ["bbb", "a"]
+    assert second[0].score == pytest.approx(0.52)
+
+
 @pytest.mark.skipif(
     not os.getenv("RUN_INTEGRATION"),
     reason="Integration: requires FlagEmbedding + model download (set RUN_INTEGRATION=1)",
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.config.settings import Settings
+from src.domain.ports.dto import RerankRequest, RetrievedChunk
+from src.infrastructure.reranking.cascade import CascadeReranker, plan_cascade
+from src.shared.metrics import REGISTRY
+
+
+def _chunk(score: float) -> RetrievedChunk:
+    return RetrievedChunk(
+        chunk_id=uuid4(), document_id=uuid4(), content=f"c{score}", score=score, source_path="t"
+    )
+
+
+async def _reversed(request: RerankRequest) -> list[RetrievedChunk]:
+    return list(reversed(request.chunks))[: request.top_k]
+
+
+def _cascade(max_candidates: int = 4, exit_margin: float = 0.3) -> tuple[CascadeReranker, Any]:
+    settings = Settings()
+    settings.reranker.cascade_max_candidates = max_candidates
+    settings.reranker.cascade_exit_margin = exit_margin
+    inner = MagicMock()
+    inner.rerank = AsyncMock(side_effect=_reversed)
+    return CascadeReranker(inner, settings), inner
+
+
+@pytest.mark.parametrize(
+    ("scores", "expected"),
+    [
+        ([0.032, 0.031, 0.016, 0.015, 0.014], (2, 4)),  # two both-leg hits are clear
+        ([0.032, 0.030, 0.029, 0.028, 0.027], (0, 4)),  # flat: nothing is clear
+        ([0.032, 0.031], (0, 2)),  # not more than top_k
+    ],
+)
+def test_plan_cascade(scores: list[float], expected: tuple[int, int]) -> None:
+    assert plan_cascade(scores, top_k=2, max_candidates=4, exit_margin=0.3) == expected
+
+
+async def test_early_exit_sends_only_clear_top_k_to_inner_reranker() -> None:
+    cascade, inner = _cascade()
+    chunks = [_chunk(0.016), _chunk(0.032), _chunk(0.031), _chunk(0.015)]
+    before = REGISTRY.get_sample_value("reranker_cascade_early_exits_total") or 0.0
+
+    result = await cascade.rerank(RerankRequest(query="q", chunks=chunks, top_k=2))
+
+    (request,), _ = inner.rerank.await_args
+    assert [c.score for c in request.chunks] == [0.032, 0.031]
+    assert request.top_k == 2
+    assert [c.score for c in result] == [0.031, 0.032]
+    assert REGISTRY.get_sample_value("reranker_cascade_early_exits_total") == before + 1
+
+
+async def test_every_returned_chunk_comes_from_inner_reranker() -> None:
+    cascade, inner = _cascade(max_candidates=4)
+    scored = [_chunk(0.91), _chunk(0.42)]
+    # The inner reranker rescores and applies its own min_score threshold.
+    inner.rerank = AsyncMock(return_value=scored)
+    chunks = [_chunk(s) for s in (0.032, 0.017, 0.016, 0.015, 0.014, 0.013)]
+
+    result = await cascade.rerank(RerankRequest(query="q", chunks=chunks, top_k=3))
+
+    (request,), _ = inner.rerank.await_args
+    assert [c.score for c in request.chunks] == [0.032, 0.017, 0.016, 0.015]
+    assert request.top_k == 3
+    assert result == scored
+
+
+async def test_warm_up_loads_inner_model() -> None:
+    cascade, inner = _cascade()
+    inner.warm_up = AsyncMock()
+
+    await cascade.warm_up()
+
+    inner.warm_up.assert_awaited_once()
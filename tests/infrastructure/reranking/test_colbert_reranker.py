@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.config.settings import Settings
+from src.domain.ports.dto import RerankRequest, RetrievedChunk
+from src.infrastructure.reranking.colbert_reranker import ColBERTReranker, maxsim_scores
+from src.infrastructure.reranking.token_store import TokenVectorStore
+
+# Toy 4-dim token vectors: one axis per "word".
+_AXES = {"piscine": 0, "campus": 1, "hours": 2, "c": 3}
+
+
+def _tokens(text: str) -> np.ndarray:
+    rows = np.eye(4, dtype=np.float32)[[_AXES[w] for w in text.split() if w in _AXES]]
+    return rows if len(rows) else np.full((1, 4), 0.5, dtype=np.float32)
+
+
+def _chunk(content: str) -> RetrievedChunk:
+    return RetrievedChunk(
+        chunk_id=uuid4(), document_id=uuid4(), content=content, score=0.0, source_path="t.pdf"
+    )
+
+
+@pytest.fixture()
+def model() -> MagicMock:
+    def encode(texts: list[str], **_: Any) -> dict[str, list[np.ndarray]]:
+        return {"colbert_vecs": [_tokens(t) for t in texts]}
+
+    mock = MagicMock()
+    mock.encode.side_effect = encode
+    return mock
+
+
+@pytest.fixture()
+def reranker(tmp_path: Path, model: MagicMock) -> ColBERTReranker:
+    reranker = ColBERTReranker(Settings(), store=TokenVectorStore(tmp_path, dimension=4))
+    reranker._model = model
+    return reranker
+
+
+def test_maxsim_matches_per_passage_loop() -> None:
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal((3, 8)).astype(np.float32)
+    passages = [rng.standard_normal((n, 8)).astype(np.float32) for n in (5, 1, 0, 7)]
+
+    scores = maxsim_scores(query, passages)
+
+    expected = [(query @ p.T).max(axis=1).mean() if len(p) else 0.0 for p in passages]
+    np.testing.assert_allclose(scores, expected, rtol=1e-5)
+
+
+async def test_rerank_orders_by_maxsim(reranker: ColBERTReranker) -> None:
+    chunks = [_chunk("campus hours"), _chunk("piscine c"), _chunk("piscine campus")]
+
+    result = await reranker.rerank(RerankRequest(query="piscine c", chunks=chunks, top_k=2))
+
+    assert [c.content for c in result] == ["piscine c", "piscine campus"]
+    assert result[0].score == pytest.approx(1.0, abs=1e-2)
+    assert result[1].score == pytest.approx(0.5, abs=1e-2)
+
+
+async def test_indexed_passages_are_not_reencoded(
+    reranker: ColBERTReranker, model: MagicMock
+) -> None:
+    await reranker.index_passages(["piscine c", "campus hours"])
+    model.encode.reset_mock()
+
+    await reranker.rerank(
+        RerankRequest(query="hours", chunks=[_chunk("campus hours"), _chunk("piscine c")], top_k=2)
+    )
+
+    assert [call.args[0] for call in model.encode.call_args_list] == [["hours"]]
+
+
+async def test_forgotten_passages_are_reencoded(
+    reranker: ColBERTReranker, model: MagicMock
+) -> None:
+    await reranker.index_passages(["piscine c", "campus hours"])
+    await reranker.forget_passages(["piscine c"])
+    model.encode.reset_mock()
+
+    await reranker.rerank(
+        RerankRequest(query="hours", chunks=[_chunk("campus hours"), _chunk("piscine c")], top_k=2)
+    )
+
+    assert [call.args[0] for call in model.encode.call_args_list] == [["piscine c"], ["hours"]]
+
+
+async def test_min_score_filters_candidates(tmp_path: Path, model: MagicMock) -> None:
+    settings = Settings()
+    settings.reranker.colbert_min_score = 0.9
+    reranker = ColBERTReranker(settings, store=TokenVectorStore(tmp_path, dimension=4))
+    reranker._model = model
+
+    result = await reranker.rerank(
+        RerankRequest(query="piscine", chunks=[_chunk("piscine"), _chunk("campus")], top_k=2)
+    )
+
+    assert [c.content for c in result] == ["piscine"]
+
+
+async def test_rerank_empty_chunks(reranker: ColBERTReranker, model: MagicMock) -> None:
+    assert await reranker.rerank(RerankRequest(query="q", chunks=[], top_k=5)) == []
+    model.encode.assert_not_called()
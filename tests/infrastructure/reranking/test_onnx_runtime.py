@@ -0,0 +1,63 @@
+"""Unit tests for the reranker ONNX parity helpers."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.config.settings import Settings
+from src.infrastructure.reranking.onnx_runtime import score_drift
+
+
+def test_identical_scores_have_no_drift() -> None:
+    scores = [[0.9, 0.2, 0.5], [0.1, 0.7]]
+
+    report = score_drift(scores, scores)
+
+    assert report.queries == 2
+    assert report.pairs == 5
+    assert report.max_abs_diff == pytest.approx(0.0)
+    assert report.top1_agreement == pytest.approx(1.0)
+    assert report.mean_rank_correlation == pytest.approx(1.0)
+
+
+def test_small_noise_keeps_ranking_but_reports_diff() -> None:
+    reference = [np.array([0.9, 0.6, 0.3, 0.1])]
+    candidate = [np.array([0.88, 0.61, 0.29, 0.12])]
+
+    report = score_drift(reference, candidate)
+
+    assert report.max_abs_diff == pytest.approx(0.02)
+    assert report.mean_abs_diff == pytest.approx(0.015)
+    assert report.mean_rank_correlation == pytest.approx(1.0)
+
+
+def test_swapped_best_candidate_lowers_top1_agreement() -> None:
+    reference = [[0.9, 0.8, 0.1], [0.7, 0.2]]
+    candidate = [[0.8, 0.9, 0.1], [0.7, 0.2]]
+
+    report = score_drift(reference, candidate)
+
+    assert report.top1_agreement == pytest.approx(0.5)
+    assert report.mean_rank_correlation < 1.0
+
+
+def test_drift_leaves_caller_scores_untouched() -> None:
+    reference = [np.array([0.9, 0.6, 0.3])]
+    candidate = [np.array([0.8, 0.7, 0.3])]
+
+    score_drift(reference, candidate)
+
+    np.testing.assert_array_equal(reference[0], [0.9, 0.6, 0.3])
+    np.testing.assert_array_equal(candidate[0], [0.8, 0.7, 0.3])
+
+
+def test_reranker_onnx_quantization_is_opt_in() -> None:
+    assert Settings().reranker.onnx_quantization == "none"
+
+
+def test_mismatched_candidates_raise() -> None:
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        score_drift([[0.1, 0.2]], [[0.1]])
+    with pytest.raises(ValueError, match="Query count mismatch"):
+        score_drift([[0.1]], [])
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from src.infrastructure.reranking.token_store import (
+    TokenVectorStore,
+    dequantize_int8,
+    quantize_int8,
+)
+
+
+def test_int8_roundtrip_error_is_small() -> None:
+    tokens = np.random.default_rng(0).standard_normal((6, 32)).astype(np.float32)
+    tokens /= np.linalg.norm(tokens, axis=1, keepdims=True)
+
+    codes, scales = quantize_int8(tokens)
+
+    assert codes.dtype == np.int8
+    assert np.abs(dequantize_int8(codes, scales) - tokens).max() < scales.max() / 127
+
+
+def test_store_persists_variable_length_matrices(tmp_path: Path) -> None:
+    short = np.ones((1, 4), dtype=np.float32)
+    long = np.arange(12, dtype=np.float32).reshape(3, 4) / 11
+    TokenVectorStore(tmp_path, dimension=4).put_many([("a", short), ("b", long)])
+
+    found = TokenVectorStore(tmp_path, dimension=4).get_many(["a", "b", "missing"])
+
+    assert set(found) == {"a", "b"}
+    np.testing.assert_allclose(found["a"], short, atol=1e-2)
+    np.testing.assert_allclose(found["b"], long, atol=1e-2)
+
+
+def test_dimension_change_resets_store(tmp_path: Path) -> None:
+    TokenVectorStore(tmp_path, dimension=4).put_many([("a", np.ones((2, 4)))])
+
+    assert TokenVectorStore(tmp_path, dimension=8).get_many(["a"]) == {}
+
+
+def test_delete_many_drops_only_given_keys(tmp_path: Path) -> None:
+    store = TokenVectorStore(tmp_path, dimension=4)
+    store.put_many([("a", np.ones((1, 4))), ("b", np.ones((2, 4)))])
+
+    store.delete_many(["a", "missing"])
+
+    assert set(store.get_many(["a", "b"])) == {"b"}
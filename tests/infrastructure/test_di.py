@@ -1,20 +1,29 @@
 from __future__ import annotations
 
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.config.settings import Settings
+from src.infrastructure.cache.embedding_cache import CachingEmbedder
 from src.infrastructure.di import (
+    _embedding_model_id,
     _reset_caches,
     build_agent,
     build_embedder,
+    build_lexical_embedder,
     build_llm,
+    build_passage_indexer,
     build_reranker,
     build_settings,
+    build_vector_store,
 )
+from src.infrastructure.embeddings.bge_m3 import BGEM3Embedder
 from src.infrastructure.llm.gemini import GeminiLLM
 from src.infrastructure.llm.openai import OpenAILLM
+from src.infrastructure.reranking import BGEReranker, CascadeReranker, ColBERTReranker
+from src.infrastructure.vector_store.numpy_store import NumPyVectorStore
 
 
 @pytest.fixture(autouse=True)
@@ -86,3 +95,93 @@ def test_reset_caches_produces_fresh_settings(monkeypatch: pytest.MonkeyPatch) -
     s2 = build_settings()
     assert s1 is not s2
     assert s2.llm.provider == "openai"
+
+
+def test_build_vector_store_numpy_backend_is_singleton(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("RAG_VECTORSTORE__BACKEND", "numpy")
+    monkeypatch.setenv("RAG_VECTORSTORE__NUMPY_PATH", str(tmp_path))
+    _reset_caches()
+    store = build_vector_store()
+    assert isinstance(store, NumPyVectorStore)
+    assert build_vector_store() is store
+
+
+def test_build_embedder_wraps_in_disk_cache_when_enabled(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("RAG_CACHE__EMBEDDING_ENABLED", "true")
+    monkeypatch.setenv("RAG_CACHE__EMBEDDING_PATH", str(tmp_path))
+    _reset_caches()
+    embedder = build_embedder()
+    assert isinstance(embedder, CachingEmbedder)
+    assert embedder.dimension == 384
+
+
+def test_embedding_model_id_tells_backends_and_quantizations_apart() -> None:
+    torch = Settings(llm={"api_key": "test"})  # type: ignore[arg-type]
+    onnx = Settings(
+        llm={"api_key": "test"},  # type: ignore[arg-type]
+        embedding={"backend": "onnx"},  # type: ignore[arg-type]
+    )
+    int8 = Settings(
+        llm={"api_key": "test"},  # type: ignore[arg-type]
+        embedding={"backend": "onnx", "onnx_quantization": "avx2"},  # type: ignore[arg-type]
+    )
+
+    assert onnx.embedding.onnx_quantization == "none"
+    assert len({_embedding_model_id(s) for s in (torch, onnx, int8)}) == 3
+    assert _embedding_model_id(torch) == torch.embedding.model
+
+
+def test_lexical_sparse_mode_makes_bge_m3_the_only_embedder(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("RAG_VECTORSTORE__SPARSE_MODE", "lexical")
+    _reset_caches()
+    lexical = build_lexical_embedder()
+    assert isinstance(lexical, BGEM3Embedder)
+    assert lexical._model_id == "BAAI/bge-m3"
+    assert build_embedder() is lexical
+    assert build_embedder().dimension == 1024
+    assert _embedding_model_id(build_settings()) == "BAAI/bge-m3"
+
+
+def test_lexical_sparse_mode_runs_bge_m3_on_torch_with_onnx_backend(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("RAG_VECTORSTORE__SPARSE_MODE", "lexical")
+    monkeypatch.setenv("RAG_EMBEDDING__BACKEND", "onnx")
+    _reset_caches()
+    lexical = build_lexical_embedder()
+    assert isinstance(lexical, BGEM3Embedder)
+    assert lexical._backend == "torch"
+
+
+def test_build_lexical_embedder_is_none_by_default() -> None:
+    assert build_lexical_embedder() is None
+
+
+def test_colbert_mode_reranker_doubles_as_passage_indexer(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("RAG_RERANKER__MODE", "colbert")
+    monkeypatch.setenv("RAG_RERANKER__COLBERT_PATH", str(tmp_path))
+    _reset_caches()
+    reranker = build_reranker()
+    assert isinstance(reranker, ColBERTReranker)
+    assert build_passage_indexer() is reranker
+
+
+def test_cross_encoder_mode_has_no_passage_indexer() -> None:
+    assert isinstance(build_reranker(), BGEReranker)
+    assert build_passage_indexer() is None
+
+
+def test_cascade_wraps_configured_reranker(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RAG_RERANKER__CASCADE_ENABLED", "true")
+    _reset_caches()
+    reranker = build_reranker()
+    assert isinstance(reranker, CascadeReranker)
+    assert isinstance(reranker._inner, BGEReranker)
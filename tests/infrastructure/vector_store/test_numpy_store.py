@@ -0,0 +1,294 @@
+"""Unit tests for the in-process NumPyVectorStore."""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.config.settings import Settings
+from src.domain.ports.dto import ChunkWithEmbedding, HybridSearchQuery
+from src.infrastructure.vector_store.numpy_store import NumPyVectorStore
+
+
+def _make_store(path: Path | str = "", **vector_store: object) -> NumPyVectorStore:
+    settings = Settings(
+        llm={"api_key": "test"},  # type: ignore[arg-type]
+        vector_store={"numpy_path": str(path), **vector_store},  # type: ignore[arg-type]
+    )
+    return NumPyVectorStore(settings)
+
+
+def _make_chunk(
+    embedding: list[float],
+    content: str = "test content",
+    doc_id: uuid.UUID | None = None,
+    language: str = "en",
+) -> ChunkWithEmbedding:
+    return ChunkWithEmbedding(
+        id=uuid.uuid4(),
+        document_id=doc_id or uuid.uuid4(),
+        content=content,
+        embedding=embedding,
+        position=0,
+        token_count=len(content.split()),
+        source_path="/kb/doc.pdf",
+        language=language,
+        metadata={"page_number": 1},
+    )
+
+
+async def test_search_ranks_by_cosine_similarity() -> None:
+    store = _make_store()
+    near = _make_chunk([1.0, 0.1, 0.0])
+    far = _make_chunk([0.0, 1.0, 0.0])
+    await store.upsert([far, near])
+
+    results = await store.search([2.0, 0.0, 0.0], top_k=2)
+
+    assert [r.chunk_id for r in results] == [near.id, far.id]
+    assert results[0].score > results[1].score
+    assert results[0].source_path == "/kb/doc.pdf"
+    assert results[0].metadata == {"page_number": 1}
+
+
+async def test_search_applies_language_filter() -> None:
+    store = _make_store()
+    en = _make_chunk([1.0, 0.0], language="en")
+    fr = _make_chunk([1.0, 0.0], language="fr")
+    await store.upsert([en, fr])
+
+    results = await store.search([1.0, 0.0], top_k=5, filters={"language": "fr"})
+
+    assert [r.chunk_id for r in results] == [fr.id]
+
+
+async def test_hybrid_search_fuses_dense_and_sparse_legs() -> None:
+    store = _make_store()
+    dense_hit = _make_chunk([1.0, 0.0], content="campus opening hours")
+    keyword_hit = _make_chunk([0.0, 1.0], content="the piscine selection lasts four weeks")
+    both = _make_chunk([0.9, 0.1], content="piscine schedule")
+    await store.upsert([dense_hit, keyword_hit, both])
+
+    results = await store.hybrid_search([1.0, 0.0], "Piscine", top_k=3)
+
+    assert results[0].chunk_id == both.id
+    assert {r.chunk_id for r in results} == {dense_hit.id, keyword_hit.id, both.id}
+    assert results[0].score == pytest.approx(1 / 62 + 1 / 61)
+
+
+async def test_hybrid_search_many_matches_single_query_results() -> None:
+    store = _make_store()
+    await store.upsert(
+        [
+            _make_chunk([1.0, 0.0], content="piscine dates", language="en"),
+            _make_chunk([0.0, 1.0], content="dates de la piscine", language="fr"),
+            _make_chunk([0.7, 0.7], content="campus access"),
+        ]
+    )
+    queries = [
+        HybridSearchQuery(query_vector=[1.0, 0.1], query_text="piscine"),
+        HybridSearchQuery(
+            query_vector=[0.1, 1.0], query_text="piscine", filters={"language": "fr"}
+        ),
+    ]
+
+    batched = await store.hybrid_search_many(queries, top_k=2)
+
+    assert batched == [
+        await store.hybrid_search(q.query_vector, q.query_text, top_k=2, filters=q.filters)
+        for q in queries
+    ]
+
+
+async def test_hybrid_search_ranks_sparse_leg_by_lexical_weights(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    strong = _make_chunk([1.0, 0.0], content="alpha").model_copy(
+        update={"sparse_embedding": {7: 0.9, 11: 0.1}}
+    )
+    weak = _make_chunk([0.8, 0.6], content="beta").model_copy(update={"sparse_embedding": {7: 0.2}})
+    keyword_only = _make_chunk([0.6, 0.8], content="gamma")
+    await store.upsert([weak, strong, keyword_only])
+    await store.flush()
+
+    # Reopened so the lexical index is rebuilt from chunks.json.
+    results = await _make_store(tmp_path).hybrid_search(
+        [1.0, 0.0], "gamma", top_k=3, query_sparse={7: 1.0, 99: 0.4}
+    )
+
+    assert [r.chunk_id for r in results] == [strong.id, weak.id, keyword_only.id]
+    assert results[0].score == pytest.approx(2 / 61)
+    assert results[2].score == pytest.approx(1 / 63)
+
+
+async def test_upsert_replaces_existing_chunk() -> None:
+    store = _make_store()
+    chunk = _make_chunk([1.0, 0.0], content="old text")
+    await store.upsert([chunk])
+
+    await store.upsert([chunk.model_copy(update={"content": "new text"})])
+
+    assert await store.count() == 1
+    assert await store.hybrid_search([1.0, 0.0], "old", top_k=5) != []
+    results = await store.hybrid_search([0.0, 1.0], "new", top_k=5)
+    assert results[0].content == "new text"
+    assert await store.search([1.0, 0.0], top_k=5) == [results[0].model_copy(update={"score": 1.0})]
+
+
+async def test_delete_by_document_removes_only_its_chunks() -> None:
+    store = _make_store()
+    doc_id = uuid.uuid4()
+    await store.upsert(
+        [
+            _make_chunk([1.0, 0.0], doc_id=doc_id),
+            _make_chunk([0.5, 0.5], doc_id=doc_id),
+            _make_chunk([0.0, 1.0]),
+        ]
+    )
+
+    removed = await store.delete_by_document(doc_id)
+
+    assert removed == 2
+    assert await store.count() == 1
+    results = await store.search([1.0, 0.0], top_k=5)
+    assert all(r.document_id != doc_id for r in results)
+
+
+async def test_persists_and_reloads_memory_mapped(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    chunk = _make_chunk([0.6, 0.8], content="bonjour le monde", language="fr")
+    await store.upsert([chunk, _make_chunk([1.0, 0.0])])
+    await store.delete([chunk.id])
+    await store.upsert([chunk])
+    await store.flush()
+
+    reopened = _make_store(tmp_path)
+
+    assert isinstance(reopened._matrix, np.memmap)
+    assert await reopened.count() == 2
+    results = await reopened.hybrid_search([0.6, 0.8], "monde", top_k=1, filters={"language": "fr"})
+    assert results[0].chunk_id == chunk.id
+    assert results[0].document_id == chunk.document_id
+
+
+async def test_chunk_hashes_survive_reload(tmp_path: Path) -> None:
+    doc_id = uuid.uuid4()
+    first = _make_chunk([1.0, 0.0], doc_id=doc_id).model_copy(update={"content_hash": "h0"})
+    second = _make_chunk([0.0, 1.0], doc_id=doc_id).model_copy(
+        update={"position": 1, "content_hash": "h1"}
+    )
+    writer = _make_store(tmp_path)
+    await writer.upsert([second, first, _make_chunk([1.0, 1.0])])
+    await writer.flush()
+
+    stored = await _make_store(tmp_path).chunk_hashes(doc_id)
+
+    assert [(s.id, s.position, s.content_hash) for s in stored] == [
+        (first.id, 0, "h0"),
+        (second.id, 1, "h1"),
+    ]
+
+
+async def test_reader_picks_up_snapshot_written_by_another_instance(tmp_path: Path) -> None:
+    reader = _make_store(tmp_path)
+    assert await reader.count() == 0
+
+    writer = _make_store(tmp_path)
+    await writer.upsert([_make_chunk([1.0, 0.0])])
+    assert await reader.count() == 0
+
+    await writer.flush()
+
+    assert await reader.count() == 1
+    assert await reader.generation() == await writer.generation()
+
+
+async def test_writes_reach_disk_only_on_flush(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    await store.upsert([_make_chunk([1.0, 0.0])])
+    await store.upsert([_make_chunk([0.0, 1.0])])
+
+    assert not (tmp_path / "chunks.json").exists()
+
+    await store.flush()
+    mtime = (tmp_path / "chunks.json").stat().st_mtime_ns
+    await store.flush()
+
+    assert (tmp_path / "chunks.json").stat().st_mtime_ns == mtime
+    assert (tmp_path / "generation").read_text() == str(await store.generation())
+
+
+async def test_unflushed_writes_survive_a_newer_snapshot(tmp_path: Path) -> None:
+    store = _make_store(tmp_path)
+    other = _make_store(tmp_path)
+    await store.upsert([_make_chunk([0.0, 1.0])])
+
+    await other.upsert([_make_chunk([1.0, 0.0]), _make_chunk([1.0, 1.0])])
+    await other.flush()
+
+    assert await store.count() == 1
+
+
+async def test_generation_advances_on_every_write() -> None:
+    store = _make_store()
+    chunk = _make_chunk([1.0, 0.0])
+    start = await store.generation()
+
+    await store.upsert([chunk])
+    await store.delete_by_document(uuid.uuid4())
+    after_noop = await store.generation()
+    await store.delete([chunk.id])
+
+    assert after_noop == start + 1
+    assert await store.generation() == start + 2
+
+
+async def test_reposition_updates_stored_positions() -> None:
+    store = _make_store()
+    doc_id = uuid.uuid4()
+    chunk = _make_chunk([1.0, 0.0], doc_id=doc_id)
+    await store.upsert([chunk])
+    start = await store.generation()
+
+    await store.reposition({chunk.id: 3, uuid.uuid4(): 1})
+
+    assert [s.position for s in await store.chunk_hashes(doc_id)] == [3]
+    assert await store.generation() == start + 1
+
+
+async def test_hybrid_search_attaches_normalised_embeddings_on_request() -> None:
+    store = _make_store()
+    first, second = _make_chunk([3.0, 0.0, 0.0, 4.0]), _make_chunk([0.0, 1.0, 0.0, 0.0])
+    await store.upsert([first, second])
+
+    plain = await store.hybrid_search([0.6, 0.0, 0.0, 0.8], "test", top_k=2)
+    (many,) = await store.hybrid_search_many(
+        [HybridSearchQuery(query_vector=[0.6, 0.0, 0.0, 0.8], query_text="test")],
+        top_k=2,
+        with_embeddings=True,
+    )
+    results = await store.hybrid_search([0.6, 0.0, 0.0, 0.8], "test", top_k=2, with_embeddings=True)
+
+    assert all(r.embedding is None for r in plain)
+    for found in (results, many):
+        assert [r.chunk_id for r in found] == [first.id, second.id]
+        np.testing.assert_allclose(found[0].embedding, [0.6, 0.0, 0.0, 0.8], atol=1e-6)
+        np.testing.assert_allclose(found[1].embedding, [0.0, 1.0, 0.0, 0.0], atol=1e-6)
+
+
+async def test_contents_skip_unknown_and_deleted_ids() -> None:
+    store = _make_store()
+    kept, deleted = _make_chunk([1.0, 0.0]), _make_chunk([0.0, 1.0])
+    await store.upsert([kept, deleted])
+    await store.delete([deleted.id])
+
+    assert await store.contents([kept.id, deleted.id, uuid.uuid4()]) == {kept.id: kept.content}
+
+
+async def test_empty_store_returns_no_results() -> None:
+    store = _make_store()
+
+    assert await store.search([1.0, 0.0], top_k=5) == []
+    assert await store.hybrid_search([1.0, 0.0], "anything", top_k=5) == []
@@ -146,3 +146,157 @@ def test_evaluate_help():
     result = runner.invoke(app, ["evaluate", "--help"])
     assert result.exit_code == 0
     assert "dataset" in result.output.lower() or "DATASET" in result.output
+
+
+def test_create_language_index_success(monkeypatch):
+    from unittest.mock import AsyncMock, MagicMock
+
+    create = AsyncMock(return_value="chunks_embedding_hnsw_es_idx")
+    monkeypatch.setattr("src.interface.cli.main.create_language_index", create)
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.build_engine", lambda s=None: MagicMock())
+
+    result = runner.invoke(app, ["create-language-index", "es"])
+
+    assert result.exit_code == 0
+    assert "chunks_embedding_hnsw_es_idx" in result.output
+    assert create.await_args.args[1] == "es"
+
+
+def test_create_language_index_invalid_code_exits_nonzero(monkeypatch):
+    from unittest.mock import MagicMock
+
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.build_engine", lambda s=None: MagicMock())
+
+    result = runner.invoke(app, ["create-language-index", "xx"])
+
+    assert result.exit_code != 0
+
+
+def test_rebuild_dense_index_success(monkeypatch):
+    from unittest.mock import AsyncMock, MagicMock
+
+    rebuild = AsyncMock(return_value="chunks_embedding_bit_hnsw_idx")
+    monkeypatch.setattr("src.interface.cli.main.rebuild_dense_index", rebuild)
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.build_engine", lambda s=None: MagicMock())
+
+    result = runner.invoke(app, ["rebuild-dense-index"])
+
+    assert result.exit_code == 0
+    assert "chunks_embedding_bit_hnsw_idx" in result.output
+
+
+def test_dense_recall_below_threshold_exits_nonzero(monkeypatch, tmp_path):
+    import json
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.infrastructure.persistence.indexes import RecallReport
+    from src.infrastructure.persistence.vector_store import PGVectorStore
+
+    dataset = tmp_path / "golden.jsonl"
+    dataset.write_text(json.dumps({"query": "q1"}), encoding="utf-8")
+    embedder = MagicMock()
+    embedder.embed_query = AsyncMock(return_value=[0.1, 0.2])
+    report = RecallReport(queries=1, top_k=20, mean_recall=0.8, min_recall=0.8)
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr(
+        "src.interface.cli.main.build_vector_store", lambda s=None: MagicMock(spec=PGVectorStore)
+    )
+    monkeypatch.setattr("src.interface.cli.main.build_embedder", lambda s=None: embedder)
+    monkeypatch.setattr("src.interface.cli.main.check_dense_recall", AsyncMock(return_value=report))
+
+    result = runner.invoke(app, ["dense-recall", str(dataset), "--min-recall", "0.9"])
+
+    assert result.exit_code == 1
+    assert "recall@20 mean 0.8000" in result.output
+    embedder.embed_query.assert_awaited_once_with("q1")
+
+
+def test_embedding_parity_reports_drift(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from src.infrastructure.embeddings.onnx_runtime import ParityReport
+
+    report = ParityReport(texts=5, mean_cosine=0.998, min_cosine=0.995, max_abs_diff=0.01)
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.check_embedding_parity", lambda s: report)
+
+    result = runner.invoke(app, ["embedding-parity"])
+
+    assert result.exit_code == 0
+    assert "min cosine 0.99500" in result.output
+
+
+def test_embedding_parity_below_threshold_exits_nonzero(monkeypatch):
+    from unittest.mock import MagicMock
+
+    from src.infrastructure.embeddings.onnx_runtime import ParityReport
+
+    report = ParityReport(texts=5, mean_cosine=0.97, min_cosine=0.9, max_abs_diff=0.2)
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.check_embedding_parity", lambda s: report)
+
+    result = runner.invoke(app, ["embedding-parity", "--min-cosine", "0.95"])
+
+    assert result.exit_code == 1
+
+
+def test_reranker_parity_reports_drift(monkeypatch, tmp_path):
+    import json
+    from unittest.mock import MagicMock
+
+    from src.infrastructure.reranking.onnx_runtime import ScoreParityReport
+
+    dataset = tmp_path / "golden.jsonl"
+    rows = [
+        {"query": "q1", "ground_truth_contexts": ["a", "b"]},
+        {"query": "q2", "ground_truth_contexts": ["c"]},
+    ]
+    dataset.write_text("\n".join(json.dumps(r) for r in rows), encoding="utf-8")
+    report = ScoreParityReport(
+        queries=2,
+        pairs=5,
+        mean_abs_diff=0.004,
+        max_abs_diff=0.02,
+        top1_agreement=1.0,
+        mean_rank_correlation=0.99,
+    )
+    seen = {}
+
+    def _check(settings, cases):
+        seen["cases"] = cases
+        return report
+
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.check_reranker_parity", _check)
+
+    result = runner.invoke(app, ["reranker-parity", str(dataset), "--candidates", "3"])
+
+    assert result.exit_code == 0
+    assert "max |diff| 0.02000" in result.output
+    assert seen["cases"] == [("q1", ["a", "b", "c"]), ("q2", ["c", "a", "b"])]
+
+
+def test_reranker_parity_top1_disagreement_exits_nonzero(monkeypatch, tmp_path):
+    from unittest.mock import MagicMock
+
+    from src.infrastructure.reranking.onnx_runtime import ScoreParityReport
+
+    dataset = tmp_path / "golden.jsonl"
+    dataset.write_text('{"query": "q", "ground_truth_contexts": ["a"]}', encoding="utf-8")
+    report = ScoreParityReport(
+        queries=1,
+        pairs=1,
+        mean_abs_diff=0.01,
+        max_abs_diff=0.01,
+        top1_agreement=0.5,
+        mean_rank_correlation=0.9,
+    )
+    monkeypatch.setattr("src.interface.cli.main.build_settings", lambda: MagicMock())
+    monkeypatch.setattr("src.interface.cli.main.check_reranker_parity", lambda s, c: report)
+
+    result = runner.invoke(app, ["reranker-parity", str(dataset)])
+
+    assert result.exit_code == 1
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from src.shared.batching import padding_ratio, plan_token_batches, run_length_bucketed
+from src.shared.metrics import REGISTRY
+
+
+def test_plan_groups_similar_lengths_under_budget() -> None:
+    lengths = [500, 20, 480, 25, 22]
+
+    batches = plan_token_batches(lengths, max_batch_tokens=1000)
+
+    assert batches == [[1, 4, 3], [2, 0]]
+    assert all(len(b) * max(lengths[i] for i in b) <= 1000 for b in batches)
+
+
+def test_plan_gives_oversized_item_its_own_batch() -> None:
+    assert plan_token_batches([10, 5000, 10], max_batch_tokens=100) == [[0, 2], [1]]
+
+
+def test_plan_empty_input() -> None:
+    assert plan_token_batches([], max_batch_tokens=100) == []
+
+
+def test_padding_ratio_drops_with_bucketing() -> None:
+    lengths = [500, 20, 480, 25]
+    arrival_order = [[0, 1], [2, 3]]
+
+    bucketed = plan_token_batches(lengths, max_batch_tokens=1000)
+
+    assert padding_ratio(lengths, bucketed) < padding_ratio(lengths, arrival_order)
+    assert padding_ratio(lengths, []) == 0.0
+
+
+def test_run_restores_input_order_and_records_metric() -> None:
+    items = ["long text here", "a", "medium", "b"]
+    lengths = [len(i) for i in items]
+    seen: list[list[str]] = []
+
+    def run(batch: list[str]) -> list[str]:
+        seen.append(batch)
+        return [item.upper() for item in batch]
+
+    labels = {"component": "test"}
+    before = REGISTRY.get_sample_value("batch_padding_ratio_count", labels) or 0.0
+
+    results = run_length_bucketed(items, lengths, 12, run, "test")
+
+    assert results == ["LONG TEXT HERE", "A", "MEDIUM", "B"]
+    assert seen[0] == ["a", "b"]
+    assert REGISTRY.get_sample_value("batch_padding_ratio_count", labels) == before + 1
+
+
+def test_run_propagates_batch_errors() -> None:
+    def run(batch: list[str]) -> list[str]:
+        raise RuntimeError("model crashed")
+
+    with pytest.raises(RuntimeError):
+        run_length_bucketed(["x"], [1], 10, run, "test")
@@ -0,0 +1,35 @@
+"""Unit tests for maximal marginal relevance selection."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.shared.diversity import cosine_similarity_matrix, mmr_select
+
+
+def test_cosine_similarity_matrix_normalizes_rows() -> None:
+    sim = cosine_similarity_matrix([[2.0, 0.0], [1.0, 1.0], [0.0, 0.0]])
+
+    assert sim[0, 0] == pytest.approx(1.0)
+    assert sim[0, 1] == pytest.approx(np.sqrt(0.5))
+    assert sim[2].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_pure_relevance_keeps_input_ranking() -> None:
+    sim = cosine_similarity_matrix(np.random.default_rng(0).normal(size=(6, 8)))
+
+    assert mmr_select(sim, [0.9, 0.8, 0.7, 0.6, 0.5, 0.4], 4, 1.0, 1.01) == [0, 1, 2, 3]
+
+
+def test_redundant_candidate_loses_to_diverse_one() -> None:
+    # 1 is close to 0 (but no duplicate); 2 is unrelated and slightly less relevant.
+    sim = cosine_similarity_matrix([[1.0, 0.0], [0.9, 0.44], [0.0, 1.0]])
+
+    assert mmr_select(sim, [1.0, 0.95, 0.9], 2, 0.5, 0.99) == [0, 2]
+
+
+def test_near_duplicates_are_dropped_even_below_k() -> None:
+    sim = cosine_similarity_matrix([[1.0, 0.0], [1.0, 0.01], [0.0, 1.0]])
+
+    assert mmr_select(sim, [1.0, 0.9, 0.1], 3, 0.7, 0.95) == [0, 2]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.domain.ports.dto import ChunkWithEmbedding, HybridSearchQuery
+
+
+def _chunk(embedding: object) -> ChunkWithEmbedding:
+    return ChunkWithEmbedding(
+        id=uuid4(), document_id=uuid4(), content="text", embedding=embedding, position=0
+    )
+
+
+def test_float32_embedding_is_held_without_copy() -> None:
+    vector = np.arange(4, dtype=np.float32)
+
+    assert _chunk(vector).embedding is vector
+
+
+def test_list_embedding_is_coerced_to_float32_array() -> None:
+    query = HybridSearchQuery(query_vector=[0.5, 1.0], query_text="q")
+
+    assert query.query_vector.dtype == np.float32
+    assert query.query_vector.tolist() == [0.5, 1.0]
+
+
+def test_matrix_embedding_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        _chunk(np.zeros((2, 2), dtype=np.float32))
+
+
+def test_embedding_serializes_to_list() -> None:
+    dumped = _chunk(np.array([1.0, 2.0], dtype=np.float32)).model_dump(mode="json")
+
+    assert dumped["embedding"] == [1.0, 2.0]
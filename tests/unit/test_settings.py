@@ -8,6 +8,7 @@ from pydantic import ValidationError
 from src.config.settings import (
     AgentSettings,
     LLMSettings,
+    Settings,
     get_settings,
 )
 
@@ -49,3 +50,25 @@ def test_get_settings_lru_cache(monkeypatch: pytest.MonkeyPatch) -> None:
     s2 = get_settings()
     assert s1 is s2
     get_settings.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"embedding": {"pool_workers": 2}},
+        {"embedding": {"micro_batch_enabled": True}},
+        {"cache": {"embedding_enabled": True}},
+    ],
+)
+def test_lexical_sparse_mode_rejects_bypassed_embedder_wrappers(
+    overrides: dict[str, dict[str, object]],
+) -> None:
+    """The BGE-M3 lexical pass would skip the pool, micro-batcher and cache."""
+    with pytest.raises(ValidationError, match="lexical"):
+        Settings(vector_store={"sparse_mode": "lexical"}, **overrides)  # type: ignore[arg-type]
+
+
+def test_lexical_sparse_mode_accepts_plain_embedder() -> None:
+    """Lexical mode on its own validates."""
+    s = Settings(vector_store={"sparse_mode": "lexical"})  # type: ignore[arg-type]
+    assert s.vector_store.sparse_mode == "lexical"